@@ -1,11 +1,11 @@
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select, func, text
 from uuid import UUID
 import json
 
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.api.deps import get_current_user, get_current_active_superuser
 from app.models.ai_model import AIModel
 from app.models.user import User
@@ -18,29 +18,51 @@ from app.schemas.ai_model import (
     AIModelUpdate,
     AIModelWithStats
 )
-from app.services.cache_service import cache_service, CacheKeys, CacheTTL
+from app.services.cache_service import cache_service, CacheKeys, CacheTags, CacheTTL
+from app.services.cache_invalidation import cache_invalidator
 
 router = APIRouter()
 
 
+def _in_own_session(session_factory: async_sessionmaker[AsyncSession], load, *args):
+    """Bind a loader to a fresh session: cache refreshes can outlive the request"""
+    async def compute():
+        async with session_factory() as db:
+            return await load(db, *args)
+    return compute
+
+
 @router.get("/", response_model=List[AIModelSchema])
 async def get_models(
-    db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     category: Optional[str] = None,
     is_active: bool = True,
-    include_vulca: bool = Query(False, description="Include VULCA evaluation data")
+    include_vulca: bool = Query(False, description="Include VULCA evaluation data"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
 ) -> Any:
     """Get list of AI models with optional VULCA data"""
     # 构建缓存键
     cache_key = f"{CacheKeys.MODELS_ALL}:{skip}:{limit}:{category}:{is_active}:{include_vulca}"
     
-    # 尝试从缓存获取
-    cached_data = cache_service.get(cache_key)
-    if cached_data:
-        return cached_data
-    
+    # 缓存未命中时只查询一次（single-flight），过期后先返回旧值再后台刷新
+    return await cache_service.get_or_compute(
+        cache_key,
+        _in_own_session(session_factory, _load_models, skip, limit, category, is_active, include_vulca),
+        CacheTTL.MODELS,
+        [CacheTags.MODELS]
+    )
+
+
+async def _load_models(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    category: Optional[str],
+    is_active: bool,
+    include_vulca: bool
+) -> List[dict]:
+    """Query and convert a page of models (JSON-ready, as cached)"""
     query = select(AIModel)
     
     if category:
@@ -122,10 +144,7 @@ async def get_models(
                     except json.JSONDecodeError:
                         model_dict['vulca_cultural_perspectives'] = None
         
-        result_models.append(AIModelSchema.model_validate(model_dict))
-    
-    # 缓存结果
-    cache_service.set(cache_key, result_models, CacheTTL.MODELS)
+        result_models.append(AIModelSchema.model_validate(model_dict).model_dump(mode="json"))
     
     return result_models
 
@@ -133,16 +152,26 @@ async def get_models(
 @router.get("/{model_id}")
 async def get_model(
     model_id: str,  # 改为str以支持SQLite
-    db: AsyncSession = Depends(get_db),
-    include_vulca: bool = Query(True, description="Include VULCA evaluation data")
+    include_vulca: bool = Query(True, description="Include VULCA evaluation data"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
 ) -> Any:
     """Get AI model by ID with statistics, benchmark results and VULCA data"""
-    # 尝试从缓存获取
     cache_key = f"{CacheKeys.RANKINGS_MODEL.format(model_id=model_id)}:{include_vulca}"
-    cached_data = cache_service.get(cache_key)
-    if cached_data:
-        return cached_data
-    
+    cache_tags = [
+        CacheTags.RANKINGS,
+        CacheTags.MODEL.format(model_id=model_id),
+        CacheTags.VULCA.format(model_id=model_id)
+    ]
+    return await cache_service.get_or_compute(
+        cache_key,
+        _in_own_session(session_factory, _load_model, model_id, include_vulca),
+        CacheTTL.RANKINGS,
+        cache_tags
+    )
+
+
+async def _load_model(db: AsyncSession, model_id: str, include_vulca: bool) -> dict:
+    """Model detail with statistics, benchmark results and VULCA data"""
     # Use simpler query without potentially missing columns
     query = text("""
         SELECT * FROM ai_models
@@ -292,9 +321,6 @@ async def get_model(
         response_data["vulca_evaluation_date"] = model_data.get('vulca_evaluation_date')
         response_data["vulca_sync_status"] = model_data.get('vulca_sync_status', 'pending')
     
-    # 缓存结果
-    cache_service.set(cache_key, response_data, CacheTTL.RANKINGS)
-    
     return response_data
 
 
@@ -336,6 +362,7 @@ async def create_model(
     db.add(model)
     await db.commit()
     await db.refresh(model)
+    await cache_invalidator.invalidate_model_cache(str(model.id))
     
     return model
 
@@ -366,6 +393,7 @@ async def update_model(
     
     await db.commit()
     await db.refresh(model)
+    await cache_invalidator.invalidate_model_cache(model_id)
     
     return model
 
@@ -390,5 +418,6 @@ async def delete_model(
     
     await db.delete(model)
     await db.commit()
+    await cache_invalidator.invalidate_model_cache(model_id)
     
     return {"message": "Model deleted successfully"}
\ No newline at end of file
@@ -133,6 +133,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for handlers that open their own sessions (e.g. cache refreshes)"""
+    return AsyncSessionLocal
+
+
 async def init_db():
     """Initialize database tables and data (idempotent)"""
     # Ensure all models are registered in Base.metadata
@@ -31,10 +31,13 @@ IS_PRODUCTION = os.getenv("ENVIRONMENT") == "production"
 # B2B API clients need docs even in production — opt-in via env var
 ENABLE_API_DOCS = os.getenv("ENABLE_API_DOCS", "false").lower() in ("true", "1", "yes")
 
-# Digestion interval (default: 1 hour)
+# Digestion interval (default: 1 hour).  With VULCA_DIGEST_INCREMENTAL=1 a
+# cycle only processes sessions added since the previous one, so intervals
+# of a minute are cheap.
 DIGESTION_INTERVAL_SECONDS = int(os.getenv("DIGESTION_INTERVAL_SECONDS", "3600"))
 
 _digestion_logger = logging.getLogger("vulca.digestion")
+_digestion_evolver = None  # reused across cycles: keeps the incremental snapshot
 
 
 def _run_digestion_sync() -> dict:
@@ -42,19 +45,37 @@ def _run_digestion_sync() -> dict:
     from app.prototype.digestion.feature_extractor import backfill_missing_features
     from app.prototype.feedback.feedback_store import FeedbackStore
     from app.prototype.digestion.context_evolver import ContextEvolver
+    from app.prototype.digestion.snapshot import DigestSnapshot
+
+    global _digestion_evolver
+    if _digestion_evolver is None:
+        _digestion_evolver = ContextEvolver()
+    evolver = _digestion_evolver
+
+    if evolver.incremental and evolver.snapshot is not None:
+        # Only new sessions are read (and backfilled through the store)
+        previous = evolver.snapshot
+        snapshot = evolver.refresh_snapshot(backfill=True)
+        if snapshot is previous:
+            return {"actions": 0, "patterns": 0, "sessions": len(snapshot), "reason": "no new sessions"}
+    else:
+        try:
+            backfill_missing_features()
+        except Exception:
+            _digestion_logger.debug("Periodic pre-digestion backfill failed (non-fatal)")
+        # Sessions + trajectories are read once and shared by every consumer
+        snapshot = evolver.refresh_snapshot() if evolver.incremental else DigestSnapshot.load()
 
     try:
-        backfill_missing_features()
-        FeedbackStore.get().sync_from_sessions()
+        FeedbackStore.get().sync_from_sessions(snapshot.sessions)
     except Exception:
         _digestion_logger.debug("Periodic pre-digestion sync failed (non-fatal)")
 
-    evolver = ContextEvolver()
-    result = evolver.evolve()
+    result = evolver.evolve(snapshot)
 
     try:
         from app.prototype.digestion.few_shot_updater import FewShotUpdater
-        FewShotUpdater().update()
+        FewShotUpdater().update(snapshot)
     except Exception:
         _digestion_logger.debug("Periodic few-shot update failed (non-fatal)")
 
@@ -121,14 +142,24 @@ async def lifespan(app: FastAPI):
             _bootstrap_logger.info("No evolutions yet — running bootstrap backfill")
             _bf_count = backfill_missing_features()
             _bootstrap_logger.info("Backfilled %d sessions", _bf_count)
-            FeedbackStore.get().sync_from_sessions()
             from app.prototype.digestion.context_evolver import ContextEvolver
+            from app.prototype.digestion.snapshot import DigestSnapshot
+            _snapshot = DigestSnapshot.load()
+            FeedbackStore.get().sync_from_sessions(_snapshot.sessions)
             _evolver = ContextEvolver()
-            _evolver.evolve()
+            _evolver.evolve(_snapshot)
             _bootstrap_logger.info("Bootstrap evolution complete")
     except Exception as _bootstrap_exc:
         print(f"WARNING: Bootstrap backfill failed (non-fatal): {_bootstrap_exc}")
 
+    # Let the bundled vulca package share the process-wide image cache
+    try:
+        from app.prototype.tools.image_prep import get_image_prep
+        from vulca._image import register_image_prep
+        register_image_prep(get_image_prep())
+    except ImportError:
+        pass
+
     # Start periodic digestion background task
     digestion_task = asyncio.create_task(_periodic_digestion())
     print(f"Periodic digestion started (interval={DIGESTION_INTERVAL_SECONDS}s)")
@@ -8,11 +8,13 @@ The runtime is model-agnostic (via LiteLLM) and supports:
 - Dynamic tool selection by the LLM
 - Budget and step limits
 - Fallback to rule-based scoring on failure
+- Batched scoring of several layers in one multimodal call
+  (``evaluate_batch``), with no tool loop
 """
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import logging
 import re
@@ -24,6 +26,7 @@ from typing import Any
 from app.prototype.agents.layer_state import LayerState
 from app.prototype.agents.model_router import ModelRouter, ModelSpec
 from app.prototype.agents.tool_registry import ToolRegistry
+from app.prototype.tools.image_prep import get_image_prep
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +76,7 @@ class AgentResult:
     model_used: str = ""
     fallback_used: bool = False
     latency_ms: int = 0
+    batch_size: int = 0              # >0: scored with other layers in one call
 
     def to_dict(self) -> dict:
         return {
@@ -87,6 +91,7 @@ class AgentResult:
             "model_used": self.model_used,
             "fallback_used": self.fallback_used,
             "latency_ms": self.latency_ms,
+            "batch_size": self.batch_size,
         }
 
 
@@ -128,6 +133,24 @@ _BASE_SYSTEM_PROMPTS: dict[str, str] = {
 }
 
 
+_BATCH_LAYER_FOCUS: dict[str, str] = {
+    "visual_perception": "composition, color, form, and spatial arrangement",
+    "technical_analysis": "brushwork, medium, technique, and material quality",
+    "cultural_context": "historical accuracy, cultural grounding, and tradition adherence",
+    "critical_interpretation": "deeper meaning, symbolism, and critical discourse",
+    "philosophical_aesthetic": "worldview, aesthetic theory, and philosophical depth",
+}
+
+_BATCH_SYSTEM_PROMPT = (
+    "You are an expert art critic evaluating one artwork on several VULCA layers "
+    "at once. Score each requested layer independently on [0, 1] and state how "
+    "confident you are in that score on [0, 1]. Respond with a single JSON object "
+    "keyed by layer label, e.g. "
+    '{"L1": {"score": 0.72, "confidence": 0.8, "rationale": "..."}}, '
+    "and nothing else."
+)
+
+
 def _get_system_prompt(layer_id: str, tradition: str = "default") -> str:
     """Get system prompt with evolved context appended.
 
@@ -145,6 +168,17 @@ def _get_system_prompt(layer_id: str, tradition: str = "default") -> str:
     return base + evolved if evolved else base
 
 
+def _get_batch_system_prompt(tradition: str = "default") -> str:
+    """Batched-scoring prompt with the tradition's evolved context appended."""
+    try:
+        from app.prototype.cultural_pipelines.cultural_weights import get_evolved_prompt_context
+        evolved = get_evolved_prompt_context(tradition)
+    except Exception:
+        evolved = ""
+
+    return _BATCH_SYSTEM_PROMPT + evolved if evolved else _BATCH_SYSTEM_PROMPT
+
+
 # ---------------------------------------------------------------------------
 # AgentRuntime
 # ---------------------------------------------------------------------------
@@ -201,7 +235,11 @@ class AgentRuntime:
 
         # Build initial messages
         system_prompt = _get_system_prompt(ctx.layer_id, ctx.cultural_tradition)
-        user_content = self._build_user_message(ctx)
+        image_content = None
+        if requires_vlm and ctx.image_url:
+            # Reading and downscaling the image is blocking file/CPU work
+            image_content = await asyncio.to_thread(self._encode_image_content, ctx.image_url)
+        user_content = self._build_user_message(ctx, image_content)
 
         messages: list[dict[str, Any]] = [
             {"role": "system", "content": system_prompt},
@@ -256,17 +294,25 @@ class AgentRuntime:
 
                 messages.append(message)
 
+                # Run the step's tool calls concurrently; results are
+                # handled (and appended) in call order
+                calls: list[tuple[str, dict, str]] = []
                 for tc in tool_calls:
                     fn_name = tc.get("function", {}).get("name", "")
                     fn_args_str = tc.get("function", {}).get("arguments", "{}")
-                    tc_id = tc.get("id", "")
 
                     try:
                         fn_args = json.loads(fn_args_str)
                     except json.JSONDecodeError:
                         fn_args = {}
 
-                    tool_result = await self._tools.execute(fn_name, fn_args)
+                    calls.append((fn_name, fn_args, tc.get("id", "")))
+
+                tool_results = await self._tools.execute_many(
+                    [(fn_name, fn_args) for fn_name, fn_args, _ in calls]
+                )
+
+                for (fn_name, _fn_args, tc_id), tool_result in zip(calls, tool_results):
                     result.tool_calls_made += 1
 
                     # Check terminal submit_evaluation
@@ -337,6 +383,106 @@ class AgentRuntime:
         self._router.record_cost(result.cost_usd)
         return result
 
+    async def evaluate_batch(
+        self, contexts: list[AgentContext], min_confidence: float = 0.0,
+    ) -> dict[str, AgentResult]:
+        """Score several layers of one candidate in a single LLM call.
+
+        All contexts must describe the same candidate (shared subject,
+        summaries and image).  Returns an AgentResult per layer; layers the
+        model did not score come back with ``fallback_used=True``.  Only
+        scores with confidence >= *min_confidence* are written back to their
+        LayerState, like ``evaluate``; the others are left for the caller to
+        re-evaluate without the rejected score anchoring the next prompt
+        (see ``record_batch_result``).
+        """
+        t0 = time.monotonic()
+        results = {
+            ctx.layer_id: AgentResult(layer_id=ctx.layer_id, fallback_used=True, batch_size=len(contexts))
+            for ctx in contexts
+        }
+        if not contexts:
+            return results
+
+        first = contexts[0]
+        image_url = next((ctx.image_url for ctx in contexts if ctx.image_url), None)
+        model_spec = self._router.select_model(first.layer_id, requires_vlm=bool(image_url))
+        if model_spec is None:
+            logger.warning("No affordable model for batched %s — fallback to rules",
+                           [ctx.layer_label for ctx in contexts])
+            return results
+
+        parts = [
+            f"## Task: {first.task_id}",
+            f"**Subject**: {first.subject}",
+            f"**Cultural Tradition**: {first.cultural_tradition}",
+            "",
+            "### Candidate Summary",
+            first.candidate_summary or "(no summary available)",
+            "",
+            "### Scout Evidence",
+            first.evidence_summary or "(no evidence gathered yet)",
+            "",
+            "### Layers to Evaluate",
+        ]
+        for ctx in contexts:
+            line = f"- {ctx.layer_label} ({ctx.layer_id}): {_BATCH_LAYER_FOCUS.get(ctx.layer_id, ctx.layer_id)}"
+            if ctx.layer_state.score > 0:
+                line += f" [rule score {ctx.layer_state.score:.4f}]"
+            parts.append(line)
+        user_content: str | list[dict] = "\n".join(parts)
+        image_content = (
+            await asyncio.to_thread(self._encode_image_content, image_url) if image_url else None
+        )
+        if image_content:
+            user_content = [{"type": "text", "text": user_content}, image_content]
+
+        response = await self._call_llm(
+            model_spec,
+            [
+                {"role": "system", "content": _get_batch_system_prompt(first.cultural_tradition)},
+                {"role": "user", "content": user_content},
+            ],
+            tools=None,
+        )
+        self._router.record_cost(model_spec.cost_per_call_usd)
+        parsed = self._parse_batch_answer(
+            (response or {}).get("message", {}).get("content") or ""
+        )
+        latency_ms = int((time.monotonic() - t0) * 1000)
+        share = model_spec.cost_per_call_usd / len(contexts)
+
+        for ctx in contexts:
+            result = results[ctx.layer_id]
+            result.model_used = model_spec.litellm_id
+            result.llm_calls_made = 1
+            result.cost_usd = share
+            result.latency_ms = latency_ms
+            entry = parsed.get(ctx.layer_label) or parsed.get(ctx.layer_id)
+            if not isinstance(entry, dict):
+                continue
+            try:
+                score = min(1.0, max(0.0, float(entry["score"])))
+                confidence = min(1.0, max(0.0, float(entry.get("confidence", 0.5))))
+            except (KeyError, TypeError, ValueError):
+                continue
+            result.score = score
+            result.confidence = confidence
+            result.rationale = str(entry.get("rationale", ""))
+            result.fallback_used = False
+            ctx.layer_state.cost_spent_usd += share
+            if confidence >= min_confidence:
+                self.record_batch_result(ctx, result)
+
+        return results
+
+    @staticmethod
+    def record_batch_result(ctx: AgentContext, result: AgentResult) -> None:
+        """Write a batched *result*'s score back to ``ctx.layer_state`` (cost is already counted)."""
+        ctx.layer_state.record_score(result.score)
+        ctx.layer_state.confidence = result.confidence
+        ctx.layer_state.escalated = True
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -408,11 +554,12 @@ class AgentRuntime:
         return None
 
     @staticmethod
-    def _build_user_message(ctx: AgentContext) -> str | list[dict]:
+    def _build_user_message(ctx: AgentContext, image_content: dict | None = None) -> str | list[dict]:
         """Compose the initial user message from context.
 
-        For VLM layers (L1/L2) with an image_url, returns a multimodal
-        content list (text + image). Otherwise returns a plain string.
+        With *image_content* (the encoded image of a VLM layer, L1/L2),
+        returns a multimodal content list (text + image). Otherwise returns
+        a plain string.
         """
         parts = [
             f"## Task: {ctx.task_id}",
@@ -454,14 +601,11 @@ class AgentRuntime:
         text = "\n".join(parts)
 
         # VLM layers: attach image as multimodal content
-        is_vlm_layer = ctx.layer_id in ("visual_perception", "technical_analysis")
-        if is_vlm_layer and ctx.image_url:
-            image_content = AgentRuntime._encode_image_content(ctx.image_url)
-            if image_content:
-                return [
-                    {"type": "text", "text": text},
-                    image_content,
-                ]
+        if image_content:
+            return [
+                {"type": "text", "text": text},
+                image_content,
+            ]
 
         return text
 
@@ -472,7 +616,7 @@ class AgentRuntime:
         Supports:
         - data: URIs (pass through)
         - http/https URLs (pass through)
-        - Local file paths (encode as base64 data URI)
+        - Local file paths (downscaled base64 data URI, see ImagePrep)
         """
         if not image_url:
             return None
@@ -506,21 +650,8 @@ class AgentRuntime:
                 return None
 
         try:
-            raw = path.read_bytes()
-            # Detect MIME type from header bytes
-            if raw[:8].startswith(b"\x89PNG"):
-                mime = "image/png"
-            elif raw[:3] == b"\xff\xd8\xff":
-                mime = "image/jpeg"
-            elif raw[:4] == b"RIFF" and raw[8:12] == b"WEBP":
-                mime = "image/webp"
-            else:
-                mime = "image/png"  # fallback
-            b64 = base64.b64encode(raw).decode("ascii")
-            return {
-                "type": "image_url",
-                "image_url": {"url": f"data:{mime};base64,{b64}"},
-            }
+            # Cached by content, so every ReAct step reuses one downscaled encode
+            return get_image_prep().prepare_path(path).content_block()
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to encode image %s: %s", image_url, exc)
             return None
@@ -534,7 +665,7 @@ class AgentRuntime:
     ) -> dict | None:
         """Call LLM via LiteLLM. Returns the response choice dict or None."""
         try:
-            import litellm
+            from app.prototype.agents import llm_gateway
             logger.debug(
                 "LLM call: model=%s, tool_choice=%s, tools=%d, msgs=%d",
                 model_spec.litellm_id, tool_choice,
@@ -549,7 +680,7 @@ class AgentRuntime:
             if api_key:
                 extra_kwargs["api_key"] = api_key
 
-            response = await litellm.acompletion(
+            response = await llm_gateway.acompletion(
                 model=model_spec.litellm_id,
                 messages=messages,
                 tools=tools,
@@ -593,6 +724,20 @@ class AgentRuntime:
             logger.error("LLM call failed: %s", exc, exc_info=True)
             return None
 
+    @staticmethod
+    def _parse_batch_answer(content: str) -> dict:
+        """Parse the per-layer JSON object of a batched evaluation."""
+        if not content:
+            return {}
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(0))
+        except (json.JSONDecodeError, TypeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
     @staticmethod
     def _try_parse_final_answer(content: str) -> dict | None:
         """Try to parse a JSON evaluation from free-form LLM output."""
@@ -19,13 +19,15 @@ Usage:
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from app.prototype.tools.image_prep import get_image_prep
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -281,7 +283,7 @@ class AgenticVisionAnalyzer:
         insights = AgenticInsights()
 
         # Load and encode image
-        img_b64, mime_type = _load_image_b64(image_path)
+        img_b64, mime_type = await asyncio.to_thread(_load_image_b64, image_path)
         if not img_b64:
             logger.warning("Agentic vision: could not load image %s", image_path)
             return insights
@@ -412,7 +414,7 @@ class AgenticVisionAnalyzer:
 
         Returns parsed dict on success, empty dict on failure.
         """
-        import litellm
+        from app.prototype.agents import llm_gateway
 
         # Resolve API key from model_router if available
         extra_kwargs: dict[str, Any] = {}
@@ -432,7 +434,7 @@ class AgenticVisionAnalyzer:
             pass  # litellm will use env vars as fallback
 
         try:
-            response = await litellm.acompletion(
+            response = await llm_gateway.acompletion(
                 model=self.model,
                 messages=[{
                     "role": "user",
@@ -446,6 +448,7 @@ class AgenticVisionAnalyzer:
                         },
                     ],
                 }],
+                cache=True,
                 temperature=0.3,
                 max_tokens=2048,
                 timeout=45,
@@ -517,25 +520,10 @@ def _load_image_b64(path: str) -> tuple[str, str]:
         logger.debug("Image file not found: %s", path)
         return "", ""
 
-    mime_map = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-    }
-    mime_type = mime_map.get(p.suffix.lower(), "image/png")
-
     try:
-        data = p.read_bytes()
-        # Auto-detect from magic bytes
-        if data[:4] == b"\x89PNG":
-            mime_type = "image/png"
-        elif data[:2] == b"\xff\xd8":
-            mime_type = "image/jpeg"
-        elif data[:4] == b"RIFF" and len(data) > 12 and data[8:12] == b"WEBP":
-            mime_type = "image/webp"
-
-        return base64.b64encode(data).decode("ascii"), mime_type
+        # Shared, downscaled payload: every round reuses the same encode
+        prepared = get_image_prep().prepare_path(p)
+        return prepared.b64, prepared.mime_type
     except Exception:
         logger.exception("Failed to read image %s", path)
         return "", ""
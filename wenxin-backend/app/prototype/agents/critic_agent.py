@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Any
 
@@ -24,6 +26,8 @@ from app.prototype.checkpoints.critic_checkpoint import save_critic_checkpoint
 
 __all__ = [
     "CriticAgent",
+    "StreamingCritique",
+    "abuild_critique_output",
     "build_critique_output",
 ]
 
@@ -31,6 +35,7 @@ __all__ = [
 # Type alias for a scorer callable that both CriticRules.score() and
 # ParallelDimensionScorer.score_all_dimensions() satisfy.
 ScorerFn = Callable[..., list[DimensionScore]]
+AsyncScorerFn = Callable[..., Awaitable[list[DimensionScore]]]
 
 
 def build_critique_output(
@@ -55,66 +60,14 @@ def build_critique_output(
     score_fn : callable
         ``(candidate, evidence, cultural_tradition, subject, use_vlm) -> list[DimensionScore]``
     """
-    risk_tagger = RiskTagger()
-
     if not candidates:
-        elapsed_ms = int((time.monotonic() - t0) * 1000)
-        output = CritiqueOutput(
-            task_id=task_id, scored_candidates=[],
-            best_candidate_id=None, rerun_hint=[],
-            created_at=datetime.now(timezone.utc).isoformat(),
-            latency_ms=elapsed_ms, success=False,
-            error="no candidates provided",
-        )
-        save_critic_checkpoint(output)
-        return output
-
-    def _score_one(candidate: dict[str, Any]) -> CandidateScore:
-        """Score a single candidate (thread-safe)."""
-        dim_scores = score_fn(
-            candidate=candidate,
-            evidence=evidence,
-            cultural_tradition=cultural_tradition,
-            subject=subject,
-            use_vlm=cfg.use_vlm,
-        )
-
-        risk_tuples = risk_tagger.tag(
-            candidate=candidate,
-            evidence=evidence,
-            cultural_tradition=cultural_tradition,
-        )
-        risk_tag_names = [t[0] for t in risk_tuples]
-        risk_severities = {t[0]: t[1] for t in risk_tuples}
+        return _empty_output(task_id, t0)
 
-        weighted_total = sum(
-            cfg.weights.get(ds.dimension, 0.0) * ds.score
-            for ds in dim_scores
-        )
+    _score_one = _make_candidate_scorer(evidence, cultural_tradition, subject, cfg, score_fn)
 
-        rejected_reasons: list[str] = []
-        if weighted_total < cfg.pass_threshold:
-            rejected_reasons.append(
-                f"weighted_total {weighted_total:.4f} < threshold {cfg.pass_threshold}"
-            )
-        for ds in dim_scores:
-            if ds.score < cfg.min_dimension_score:
-                rejected_reasons.append(
-                    f"{ds.dimension} score {ds.score:.4f} < min {cfg.min_dimension_score}"
-                )
-        if cfg.critical_risk_blocks:
-            for tag_name, severity in risk_severities.items():
-                if severity == "critical":
-                    rejected_reasons.append(f"critical risk: {tag_name}")
-
-        return CandidateScore(
-            candidate_id=candidate.get("candidate_id", "unknown"),
-            dimension_scores=dim_scores,
-            weighted_total=weighted_total,
-            risk_tags=risk_tag_names,
-            gate_passed=len(rejected_reasons) == 0,
-            rejected_reasons=rejected_reasons,
-        )
+    # Let CLIP blending score all candidate images in one batched pass
+    if len(candidates) > 1:
+        CriticRules.register_image_batch(candidates, cultural_tradition)
 
     # Parallel scoring: each candidate scored independently via VLM/rule calls
     scored: list[CandidateScore] = []
@@ -137,13 +90,174 @@ def build_critique_output(
         if i in results:
             scored.append(results[i])
 
-    scored.sort(key=lambda s: s.weighted_total, reverse=True)
-    scored = scored[:cfg.top_k]
+    return _assemble_output(
+        task_id, candidates, scored, evidence, cultural_tradition, subject, cfg, t0,
+    )
+
+
+async def abuild_critique_output(
+    task_id: str,
+    candidates: list[dict[str, Any]],
+    evidence: dict[str, Any],
+    cultural_tradition: str,
+    subject: str,
+    cfg: CriticConfig,
+    ascore_fn: AsyncScorerFn,
+    t0: float,
+) -> CritiqueOutput:
+    """Awaitable ``build_critique_output``: candidates are scored concurrently
+    on the running loop and checkpoint IO runs in a worker thread."""
+    if not candidates:
+        return await asyncio.to_thread(_empty_output, task_id, t0)
+
+    risk_tagger = RiskTagger()
+    if len(candidates) > 1:
+        CriticRules.register_image_batch(candidates, cultural_tradition)
+
+    async def _ascore_one(candidate: dict[str, Any]) -> CandidateScore:
+        dim_scores = await ascore_fn(
+            candidate=candidate,
+            evidence=evidence,
+            cultural_tradition=cultural_tradition,
+            subject=subject,
+            use_vlm=cfg.use_vlm,
+        )
+        return _gate_candidate(candidate, dim_scores, risk_tagger, evidence, cultural_tradition, cfg)
+
+    results = await asyncio.gather(
+        *(_ascore_one(cand) for cand in candidates), return_exceptions=True,
+    )
+    scored: list[CandidateScore] = []
+    for idx, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error("Critic scoring failed for candidate %d: %s", idx, result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            scored.append(result)
+
+    scored = _rank(scored, cfg)
+    if cfg.enable_agentic_vision:
+        await _arun_agentic_vision(scored, candidates, cultural_tradition, subject, evidence)
+    return await asyncio.to_thread(_finish_output, task_id, scored, cultural_tradition, t0)
+
+
+def _empty_output(task_id: str, t0: float) -> CritiqueOutput:
+    elapsed_ms = int((time.monotonic() - t0) * 1000)
+    output = CritiqueOutput(
+        task_id=task_id, scored_candidates=[],
+        best_candidate_id=None, rerun_hint=[],
+        created_at=datetime.now(timezone.utc).isoformat(),
+        latency_ms=elapsed_ms, success=False,
+        error="no candidates provided",
+    )
+    save_critic_checkpoint(output)
+    return output
+
+
+def _make_candidate_scorer(
+    evidence: dict[str, Any],
+    cultural_tradition: str,
+    subject: str,
+    cfg: CriticConfig,
+    score_fn: ScorerFn,
+) -> Callable[[dict[str, Any]], CandidateScore]:
+    """Return a thread-safe ``candidate -> CandidateScore`` function."""
+    risk_tagger = RiskTagger()
+
+    def _score_one(candidate: dict[str, Any]) -> CandidateScore:
+        """Score a single candidate (thread-safe)."""
+        dim_scores = score_fn(
+            candidate=candidate,
+            evidence=evidence,
+            cultural_tradition=cultural_tradition,
+            subject=subject,
+            use_vlm=cfg.use_vlm,
+        )
+        return _gate_candidate(candidate, dim_scores, risk_tagger, evidence, cultural_tradition, cfg)
+
+    return _score_one
+
+
+def _gate_candidate(
+    candidate: dict[str, Any],
+    dim_scores: list[DimensionScore],
+    risk_tagger: RiskTagger,
+    evidence: dict[str, Any],
+    cultural_tradition: str,
+    cfg: CriticConfig,
+) -> CandidateScore:
+    """Apply risk tags, weighting and the gate to one candidate's scores."""
+    risk_tuples = risk_tagger.tag(
+        candidate=candidate,
+        evidence=evidence,
+        cultural_tradition=cultural_tradition,
+    )
+    risk_tag_names = [t[0] for t in risk_tuples]
+    risk_severities = {t[0]: t[1] for t in risk_tuples}
+
+    weighted_total = sum(
+        cfg.weights.get(ds.dimension, 0.0) * ds.score
+        for ds in dim_scores
+    )
+
+    rejected_reasons: list[str] = []
+    if weighted_total < cfg.pass_threshold:
+        rejected_reasons.append(
+            f"weighted_total {weighted_total:.4f} < threshold {cfg.pass_threshold}"
+        )
+    for ds in dim_scores:
+        if ds.score < cfg.min_dimension_score:
+            rejected_reasons.append(
+                f"{ds.dimension} score {ds.score:.4f} < min {cfg.min_dimension_score}"
+            )
+    if cfg.critical_risk_blocks:
+        for tag_name, severity in risk_severities.items():
+            if severity == "critical":
+                rejected_reasons.append(f"critical risk: {tag_name}")
+
+    return CandidateScore(
+        candidate_id=candidate.get("candidate_id", "unknown"),
+        dimension_scores=dim_scores,
+        weighted_total=weighted_total,
+        risk_tags=risk_tag_names,
+        gate_passed=len(rejected_reasons) == 0,
+        rejected_reasons=rejected_reasons,
+    )
+
+
+def _assemble_output(
+    task_id: str,
+    candidates: list[dict[str, Any]],
+    scored: list[CandidateScore],
+    evidence: dict[str, Any],
+    cultural_tradition: str,
+    subject: str,
+    cfg: CriticConfig,
+    t0: float,
+) -> CritiqueOutput:
+    """Rank scored candidates, pick the best, derive rerun hints and save."""
+    scored = _rank(scored, cfg)
 
     # --- Agentic Vision: deep Think→Act→Observe analysis (optional) ---
     if cfg.enable_agentic_vision:
         _run_agentic_vision(scored, candidates, cultural_tradition, subject, evidence)
 
+    return _finish_output(task_id, scored, cultural_tradition, t0)
+
+
+def _rank(scored: list[CandidateScore], cfg: CriticConfig) -> list[CandidateScore]:
+    scored = sorted(scored, key=lambda s: s.weighted_total, reverse=True)
+    return scored[:cfg.top_k]
+
+
+def _finish_output(
+    task_id: str,
+    scored: list[CandidateScore],
+    cultural_tradition: str,
+    t0: float,
+) -> CritiqueOutput:
+    """Pick the best of the ranked candidates, derive rerun hints and save."""
     best_id: str | None = None
     for s in scored:
         if s.gate_passed:
@@ -161,7 +275,6 @@ def build_critique_output(
     # Generate human-readable evaluation summary from best candidate scores
     eval_summary = ""
     try:
-        from app.prototype.agents.critic_rules import CriticRules
         best_scores = next((s.dimension_scores for s in scored if s.candidate_id == best_id), None)
         if best_scores:
             eval_summary = CriticRules.generate_evaluation_summary(best_scores, cultural_tradition)
@@ -182,18 +295,119 @@ def build_critique_output(
     return output
 
 
-def _run_agentic_vision(
+class StreamingCritique:
+    """Score Draft candidates one at a time, as soon as each image exists.
+
+    ``submit`` schedules scoring for a single candidate (pass it as
+    ``DraftAgent.run(on_candidate=...)``); ``finish`` waits for in-flight
+    scores and assembles the same ``CritiqueOutput`` as
+    ``build_critique_output``.
+
+    With *early_accept_threshold* set, the first candidate that passes the
+    gate with ``weighted_total >= early_accept_threshold`` early-accepts the
+    round: ``submit`` then returns False (telling Draft to stop) and scores
+    that have not started yet are skipped.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        evidence: dict[str, Any],
+        cultural_tradition: str,
+        subject: str,
+        cfg: CriticConfig,
+        score_fn: ScorerFn,
+        early_accept_threshold: float | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        self._task_id = task_id
+        self._evidence = evidence
+        self._cultural_tradition = cultural_tradition
+        self._subject = subject
+        self._cfg = cfg
+        self._early_accept_threshold = early_accept_threshold
+        self._t0 = time.monotonic()
+        self._score_one = _make_candidate_scorer(evidence, cultural_tradition, subject, cfg, score_fn)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="critic-stream")
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._accepted = threading.Event()
+        self.early_accepted_id: str | None = None
+
+    @property
+    def early_accepted(self) -> bool:
+        return self._accepted.is_set()
+
+    def submit(self, candidate: dict[str, Any]) -> bool:
+        """Start scoring *candidate*; returns False once the round is early-accepted."""
+        if self._accepted.is_set():
+            return False
+        future = self._pool.submit(self._score_and_check, candidate)
+        with self._lock:
+            self._futures[candidate.get("candidate_id", "unknown")] = future
+        return True
+
+    def _score_and_check(self, candidate: dict[str, Any]) -> CandidateScore | None:
+        if self._accepted.is_set():
+            return None  # round already accepted: skip the remaining scores
+        score = self._score_one(candidate)
+        threshold = self._early_accept_threshold
+        if threshold is not None and score.gate_passed and score.weighted_total >= threshold:
+            with self._lock:
+                if self.early_accepted_id is None:
+                    self.early_accepted_id = score.candidate_id
+            self._accepted.set()
+        return score
+
+    def finish(self, candidates: list[dict[str, Any]]) -> CritiqueOutput:
+        """Wait for submitted scores and assemble the critique.
+
+        *candidates* is the full Draft candidate list; its order is used for
+        deterministic tie-breaking, and candidates that were never submitted
+        or whose scoring was skipped are left out of the ranking.
+        """
+        with self._lock:
+            futures = dict(self._futures)
+        if self._accepted.is_set():
+            for future in futures.values():
+                future.cancel()
+        self._pool.shutdown(wait=True)
+
+        scored: list[CandidateScore] = []
+        for cand in candidates:
+            future = futures.get(cand.get("candidate_id", "unknown"))
+            if future is None or future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.error("Critic scoring failed for %s: %s", cand.get("candidate_id"), exc)
+                continue
+            if result is not None:
+                scored.append(result)
+
+        if not scored:
+            return _empty_output(self._task_id, self._t0)
+        return _assemble_output(
+            self._task_id, candidates, scored, self._evidence,
+            self._cultural_tradition, self._subject, self._cfg, self._t0,
+        )
+
+    def abort(self) -> None:
+        """Drop pending scores (e.g. Draft failed) without assembling output."""
+        with self._lock:
+            futures = list(self._futures.values())
+        for future in futures:
+            future.cancel()
+        self._pool.shutdown(wait=False)
+
+
+def _agentic_vision_targets(
     scored: list[CandidateScore],
     candidates: list[dict[str, Any]],
-    cultural_tradition: str,
-    subject: str,
     evidence: dict[str, Any],
-) -> None:
-    """Run AgenticVisionAnalyzer on scored candidates that have image_path.
-
-    Mutates ``scored`` in-place by attaching ``agentic_insights`` dicts.
-    Supplementary data only — does NOT change scores.
-    """
+) -> tuple[list[tuple[CandidateScore, str]], list[str]]:
+    """Pair scored candidates with their image paths and collect terminology hints."""
     # Build candidate_id → original candidate dict lookup
     cand_by_id: dict[str, dict[str, Any]] = {}
     for cand in candidates:
@@ -207,18 +421,46 @@ def _run_agentic_vision(
         if term:
             terminology_hints.append(term)
 
+    targets: list[tuple[CandidateScore, str]] = []
+    for cs in scored:
+        image_path = cand_by_id.get(cs.candidate_id, {}).get("image_path", "")
+        if image_path:
+            targets.append((cs, image_path))
+    return targets, terminology_hints
+
+
+def _attach_insights(cs: CandidateScore, insights: Any) -> None:
+    if insights and insights.analysis_steps > 0:
+        cs.agentic_insights = insights.to_dict()
+        logger.info(
+            "Agentic vision completed for %s: %d steps, %d observations",
+            cs.candidate_id,
+            insights.analysis_steps,
+            len(insights.observations),
+        )
+
+
+def _run_agentic_vision(
+    scored: list[CandidateScore],
+    candidates: list[dict[str, Any]],
+    cultural_tradition: str,
+    subject: str,
+    evidence: dict[str, Any],
+) -> None:
+    """Run AgenticVisionAnalyzer on scored candidates that have image_path.
+
+    Mutates ``scored`` in-place by attaching ``agentic_insights`` dicts.
+    Supplementary data only — does NOT change scores.
+    """
+    targets, terminology_hints = _agentic_vision_targets(scored, candidates, evidence)
+
     try:
         from app.prototype.agents.agentic_vision import AgenticVisionAnalyzer
         from app.prototype.utils.async_bridge import run_async_from_sync
 
         analyzer = AgenticVisionAnalyzer()
 
-        for cs in scored:
-            original = cand_by_id.get(cs.candidate_id, {})
-            image_path = original.get("image_path", "")
-            if not image_path:
-                continue
-
+        for cs, image_path in targets:
             try:
                 insights = run_async_from_sync(
                     analyzer.analyze(
@@ -229,14 +471,44 @@ def _run_agentic_vision(
                     ),
                     timeout=120,
                 )
-                if insights and insights.analysis_steps > 0:
-                    cs.agentic_insights = insights.to_dict()
-                    logger.info(
-                        "Agentic vision completed for %s: %d steps, %d observations",
-                        cs.candidate_id,
-                        insights.analysis_steps,
-                        len(insights.observations),
-                    )
+                _attach_insights(cs, insights)
+            except Exception:
+                logger.exception(
+                    "Agentic vision failed for candidate %s", cs.candidate_id,
+                )
+    except ImportError:
+        logger.warning("Agentic vision module not available")
+    except Exception:
+        logger.exception("Agentic vision integration error")
+
+
+async def _arun_agentic_vision(
+    scored: list[CandidateScore],
+    candidates: list[dict[str, Any]],
+    cultural_tradition: str,
+    subject: str,
+    evidence: dict[str, Any],
+) -> None:
+    """Awaitable ``_run_agentic_vision``."""
+    targets, terminology_hints = _agentic_vision_targets(scored, candidates, evidence)
+
+    try:
+        from app.prototype.agents.agentic_vision import AgenticVisionAnalyzer
+
+        analyzer = AgenticVisionAnalyzer()
+
+        for cs, image_path in targets:
+            try:
+                insights = await asyncio.wait_for(
+                    analyzer.analyze(
+                        image_path=image_path,
+                        tradition=cultural_tradition,
+                        subject=subject,
+                        terminology_hints=terminology_hints or None,
+                    ),
+                    timeout=120,
+                )
+                _attach_insights(cs, insights)
             except Exception:
                 logger.exception(
                     "Agentic vision failed for candidate %s", cs.candidate_id,
@@ -266,3 +538,16 @@ class CriticAgent:
             score_fn=self._rules.score,
             t0=time.monotonic(),
         )
+
+    async def arun(self, critique_input: CritiqueInput) -> CritiqueOutput:
+        """Awaitable ``run`` for callers already on an event loop."""
+        return await abuild_critique_output(
+            task_id=critique_input.task_id,
+            candidates=critique_input.candidates,
+            evidence=critique_input.evidence,
+            cultural_tradition=critique_input.cultural_tradition,
+            subject=critique_input.subject,
+            cfg=self._config,
+            ascore_fn=self._rules.ascore,
+            t0=time.monotonic(),
+        )
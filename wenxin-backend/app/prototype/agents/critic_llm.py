@@ -11,6 +11,12 @@ Flow per candidate per dimension:
        - NO  -> keep rule score
     3. Assemble CritiqueOutput (identical schema to CriticAgent)
 
+Batched escalation (default): the escalated dimensions of a candidate are
+first scored together in one multimodal call (AgentRuntime.evaluate_batch);
+only dimensions whose batched confidence stays below ``batch_min_confidence``
+go on to their own ReAct loop.  Set ``VULCA_CRITIC_BATCHED=0`` (or pass
+``batched=False``) to always run per-layer agents.
+
 Cost guardrails:
     - max_escalations=3 per candidate (of 5 dims)
     - max_steps=3 per Agent ReAct loop
@@ -20,10 +26,12 @@ Cost guardrails:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
 from datetime import datetime, timezone
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -66,6 +74,15 @@ _LAYER_LABELS: dict[str, str] = {
     "philosophical_aesthetic": "L5",
 }
 
+# Progressive mode evaluates layers in this order
+_SERIAL_DIM_ORDER = [
+    "visual_perception",
+    "technical_analysis",
+    "cultural_context",
+    "critical_interpretation",
+    "philosophical_aesthetic",
+]
+
 class CriticLLM:
     """Hybrid rule + LLM critic with the same interface as CriticAgent."""
 
@@ -76,6 +93,8 @@ class CriticLLM:
         max_agent_steps: int = 5,
         scout_service: Any = None,
         progressive: bool = False,
+        batched: bool | None = None,
+        batch_min_confidence: float = 0.6,
     ) -> None:
         self._config = config or CriticConfig()
         self._rules = CriticRules()
@@ -84,6 +103,10 @@ class CriticLLM:
         self._max_agent_steps = max_agent_steps
         self._scout_service = scout_service
         self._progressive = progressive  # v2: L1→L5 serial mode
+        if batched is None:
+            batched = os.environ.get("VULCA_CRITIC_BATCHED", "1") != "0"
+        self._batched = batched
+        self._batch_min_confidence = batch_min_confidence
         self._has_api_key: bool = self._check_api_keys()
 
         # Agent-ness metrics (cumulative across all candidates)
@@ -134,23 +157,10 @@ class CriticLLM:
         Returns CritiqueOutput with the same schema as CriticAgent.
         """
         t0 = time.monotonic()
-        cfg = self._config
 
         # Empty candidates -> immediate failure
         if not critique_input.candidates:
-            elapsed_ms = int((time.monotonic() - t0) * 1000)
-            output = CritiqueOutput(
-                task_id=critique_input.task_id,
-                scored_candidates=[],
-                best_candidate_id=None,
-                rerun_hint=[],
-                created_at=datetime.now(timezone.utc).isoformat(),
-                latency_ms=elapsed_ms,
-                success=False,
-                error="no candidates provided",
-            )
-            save_critic_checkpoint(output)
-            return output
+            return self._empty_output(critique_input, t0)
 
         # Check if any LLM API key is available
         has_api_key = self._has_any_api_key()
@@ -167,16 +177,7 @@ class CriticLLM:
                 use_vlm=self._config.use_vlm,
             )
 
-            # 2. Risk tags
-            risk_tuples = self._risk_tagger.tag(
-                candidate=candidate,
-                evidence=critique_input.evidence,
-                cultural_tradition=critique_input.cultural_tradition,
-            )
-            risk_tag_names = [t[0] for t in risk_tuples]
-            risk_severities = {t[0]: t[1] for t in risk_tuples}
-
-            # 3. Selective Agent escalation
+            # 2. Selective Agent escalation
             if has_api_key:
                 if self._progressive:
                     dim_scores = self._escalate_serial(
@@ -191,62 +192,124 @@ class CriticLLM:
                         critique_input=critique_input,
                     )
 
-            # 3b. Detect cross-layer signals
-            signals = self._detect_cross_layer_signals(dim_scores)
-            self.cross_layer_signals.extend(signals)
+            scored.append(self._score_candidate(candidate, dim_scores, critique_input))
+
+        return self._finish_output(critique_input, scored, t0)
+
+    async def arun(self, critique_input: CritiqueInput) -> CritiqueOutput:
+        """Awaitable ``run``: Agent escalations are awaited on the running loop.
+
+        Rule scoring goes through ``CriticRules.ascore`` and checkpoint IO
+        runs in a worker thread, so the caller's loop is never blocked.
+        """
+        t0 = time.monotonic()
+
+        if not critique_input.candidates:
+            return await asyncio.to_thread(self._empty_output, critique_input, t0)
 
-            self._total_dims_evaluated += len(dim_scores)
+        has_api_key = self._has_any_api_key()
+        scored: list[CandidateScore] = []
 
-            # 4. Weighted total
-            weighted_total = sum(
-                cfg.weights.get(ds.dimension, 0.0) * ds.score
-                for ds in dim_scores
+        for candidate in critique_input.candidates:
+            dim_scores = await self._rules.ascore(
+                candidate=candidate,
+                evidence=critique_input.evidence,
+                cultural_tradition=critique_input.cultural_tradition,
+                subject=critique_input.subject,
+                use_vlm=self._config.use_vlm,
             )
+            if has_api_key:
+                if self._progressive:
+                    dim_scores = await self._aescalate_serial(dim_scores, candidate, critique_input)
+                else:
+                    dim_scores = await self._aescalate_dimensions(dim_scores, candidate, critique_input)
+            scored.append(self._score_candidate(candidate, dim_scores, critique_input))
+
+        return await asyncio.to_thread(self._finish_output, critique_input, scored, t0)
 
-            # 5. Gate decision
-            rejected_reasons: list[str] = []
+    def _score_candidate(
+        self,
+        candidate: dict,
+        dim_scores: list[DimensionScore],
+        critique_input: CritiqueInput,
+    ) -> CandidateScore:
+        """Risk-tag, weight and gate one candidate's (possibly escalated) scores."""
+        cfg = self._config
+
+        # Risk tags
+        risk_tuples = self._risk_tagger.tag(
+            candidate=candidate,
+            evidence=critique_input.evidence,
+            cultural_tradition=critique_input.cultural_tradition,
+        )
+        risk_tag_names = [t[0] for t in risk_tuples]
+        risk_severities = {t[0]: t[1] for t in risk_tuples}
+
+        # Detect cross-layer signals
+        signals = self._detect_cross_layer_signals(dim_scores)
+        self.cross_layer_signals.extend(signals)
 
-            if weighted_total < cfg.pass_threshold:
+        self._total_dims_evaluated += len(dim_scores)
+
+        # Weighted total
+        weighted_total = sum(
+            cfg.weights.get(ds.dimension, 0.0) * ds.score
+            for ds in dim_scores
+        )
+
+        # Gate decision
+        rejected_reasons: list[str] = []
+
+        if weighted_total < cfg.pass_threshold:
+            rejected_reasons.append(
+                f"weighted_total {weighted_total:.4f} < threshold {cfg.pass_threshold}"
+            )
+
+        for ds in dim_scores:
+            if ds.score < cfg.min_dimension_score:
                 rejected_reasons.append(
-                    f"weighted_total {weighted_total:.4f} < threshold {cfg.pass_threshold}"
+                    f"{ds.dimension} score {ds.score:.4f} < min {cfg.min_dimension_score}"
                 )
 
-            for ds in dim_scores:
-                if ds.score < cfg.min_dimension_score:
-                    rejected_reasons.append(
-                        f"{ds.dimension} score {ds.score:.4f} < min {cfg.min_dimension_score}"
-                    )
+        if cfg.critical_risk_blocks:
+            for tag_name, severity in risk_severities.items():
+                if severity == "critical":
+                    rejected_reasons.append(f"critical risk: {tag_name}")
 
-            if cfg.critical_risk_blocks:
-                for tag_name, severity in risk_severities.items():
-                    if severity == "critical":
-                        rejected_reasons.append(f"critical risk: {tag_name}")
+        gate_passed = len(rejected_reasons) == 0
 
-            gate_passed = len(rejected_reasons) == 0
+        return CandidateScore(
+            candidate_id=candidate.get("candidate_id", "unknown"),
+            dimension_scores=dim_scores,
+            weighted_total=weighted_total,
+            risk_tags=risk_tag_names,
+            gate_passed=gate_passed,
+            rejected_reasons=rejected_reasons,
+        )
 
-            scored.append(CandidateScore(
-                candidate_id=candidate.get("candidate_id", "unknown"),
-                dimension_scores=dim_scores,
-                weighted_total=weighted_total,
-                risk_tags=risk_tag_names,
-                gate_passed=gate_passed,
-                rejected_reasons=rejected_reasons,
-            ))
+    def _finish_output(
+        self,
+        critique_input: CritiqueInput,
+        scored: list[CandidateScore],
+        t0: float,
+    ) -> CritiqueOutput:
+        """Rank, pick the best, derive hints/plans and save the checkpoint."""
+        cfg = self._config
 
-        # 6. Sort by weighted_total descending
+        # Sort by weighted_total descending
         scored.sort(key=lambda s: s.weighted_total, reverse=True)
 
-        # 7. Truncate to top_k
+        # Truncate to top_k
         scored = scored[:cfg.top_k]
 
-        # 8. Select best candidate (highest score that passed gate)
+        # Select best candidate (highest score that passed gate)
         best_id: str | None = None
         for s in scored:
             if s.gate_passed:
                 best_id = s.candidate_id
                 break
 
-        # 9. Rerun hint: dimensions with score < 0.3 across all candidates
+        # Rerun hint: dimensions with score < 0.3 across all candidates
         low_dims: set[str] = set()
         for s in scored:
             for ds in s.dimension_scores:
@@ -281,6 +344,22 @@ class CriticLLM:
         save_critic_checkpoint(output)
         return output
 
+    @staticmethod
+    def _empty_output(critique_input: CritiqueInput, t0: float) -> CritiqueOutput:
+        elapsed_ms = int((time.monotonic() - t0) * 1000)
+        output = CritiqueOutput(
+            task_id=critique_input.task_id,
+            scored_candidates=[],
+            best_candidate_id=None,
+            rerun_hint=[],
+            created_at=datetime.now(timezone.utc).isoformat(),
+            latency_ms=elapsed_ms,
+            success=False,
+            error="no candidates provided",
+        )
+        save_critic_checkpoint(output)
+        return output
+
     # ------------------------------------------------------------------
     # Agent-ness metrics
     # ------------------------------------------------------------------
@@ -672,7 +751,55 @@ class CriticLLM:
 
         Returns a new list of DimensionScore with escalated dims replaced.
         """
-        # Build LayerStates from rule scores
+        layer_states, dims_to_escalate = self._plan_escalation(dim_scores)
+        if not dims_to_escalate:
+            return dim_scores
+
+        # Run Agent evaluations
+        try:
+            agent_results = self._run_agent_evaluations(
+                dims_to_escalate=dims_to_escalate,
+                layer_states=layer_states,
+                candidate=candidate,
+                critique_input=critique_input,
+            )
+        except (TimeoutError, Exception) as exc:
+            logger.warning(
+                "Agent escalation failed (%s), falling back to rule scores: %s",
+                type(exc).__name__, exc,
+            )
+            return dim_scores
+
+        return self._merge_agent_results(dim_scores, agent_results)
+
+    async def _aescalate_dimensions(
+        self,
+        dim_scores: list[DimensionScore],
+        candidate: dict,
+        critique_input: CritiqueInput,
+    ) -> list[DimensionScore]:
+        """Awaitable ``_escalate_dimensions``."""
+        layer_states, dims_to_escalate = self._plan_escalation(dim_scores)
+        if not dims_to_escalate:
+            return dim_scores
+
+        try:
+            agent_results = await asyncio.wait_for(
+                self._aevaluate_agents(dims_to_escalate, layer_states, candidate, critique_input),
+                timeout=60,  # same budget as _run_async
+            )
+        except (TimeoutError, Exception) as exc:
+            logger.warning(
+                "Agent escalation failed (%s), falling back to rule scores: %s",
+                type(exc).__name__, exc,
+            )
+            return dim_scores
+
+        return self._merge_agent_results(dim_scores, agent_results)
+
+    @staticmethod
+    def _layer_states(dim_scores: list[DimensionScore]) -> dict[str, LayerState]:
+        """Build LayerStates from rule scores."""
         layer_states = init_layer_states()
         for ds in dim_scores:
             ls = layer_states.get(ds.dimension)
@@ -680,6 +807,13 @@ class CriticLLM:
                 ls.record_score(ds.score)
                 # Low confidence from rule scoring
                 ls.confidence = 0.3 if ds.score < 0.5 else 0.6
+        return layer_states
+
+    def _plan_escalation(
+        self, dim_scores: list[DimensionScore],
+    ) -> tuple[dict[str, LayerState], list[str]]:
+        """Return the layer states and the dimensions worth escalating."""
+        layer_states = self._layer_states(dim_scores)
 
         # Determine which dims to escalate, ranked by priority
         escalation_candidates: list[tuple[float, str]] = []
@@ -694,25 +828,13 @@ class CriticLLM:
         dims_to_escalate = [
             dim_id for _, dim_id in escalation_candidates[:self._max_escalations]
         ]
+        return layer_states, dims_to_escalate
 
-        if not dims_to_escalate:
-            return dim_scores
-
-        # Run Agent evaluations
-        try:
-            agent_results = self._run_agent_evaluations(
-                dims_to_escalate=dims_to_escalate,
-                layer_states=layer_states,
-                candidate=candidate,
-                critique_input=critique_input,
-            )
-        except (TimeoutError, Exception) as exc:
-            logger.warning(
-                "Agent escalation failed (%s), falling back to rule scores: %s",
-                type(exc).__name__, exc,
-            )
-            return dim_scores
-
+    def _merge_agent_results(
+        self,
+        dim_scores: list[DimensionScore],
+        agent_results: dict[str, AgentResult],
+    ) -> list[DimensionScore]:
         # Merge: replace rule scores with Agent scores where successful
         dim_score_map = {ds.dimension: ds for ds in dim_scores}
         for dim_id, agent_result in agent_results.items():
@@ -738,7 +860,7 @@ class CriticLLM:
                 score=_clamp(merged_score),
                 rationale=merged_rationale,
                 agent_metadata={
-                    "mode": "agent",
+                    "mode": "agent_batched" if agent_result.batch_size else "agent",
                     "rule_score": round(rule_score, 4),
                     "agent_score": round(agent_result.score, 4),
                     "confidence": round(agent_result.confidence, 4),
@@ -771,43 +893,69 @@ class CriticLLM:
         Each layer reads the analysis text of completed prior layers,
         building cumulative context for deeper understanding.
         """
-        # Build LayerStates from rule scores
-        layer_states = init_layer_states()
-        for ds in dim_scores:
-            ls = layer_states.get(ds.dimension)
-            if ls:
-                ls.record_score(ds.score)
-                ls.confidence = 0.3 if ds.score < 0.5 else 0.6
+        layer_states = self._layer_states(dim_scores)
+        runtime = self._agent_runtime(layer_states)
+        dim_score_map = {ds.dimension: ds for ds in dim_scores}
+
+        for ctx in self._serial_contexts(layer_states, candidate, critique_input):
+            try:
+                agent_result = self._run_async(runtime.evaluate(ctx))
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Serial Agent evaluation failed for %s: %s", ctx.layer_id, exc)
+                agent_result = AgentResult(layer_id=ctx.layer_id, fallback_used=True)
+            self._apply_serial_result(ctx.layer_id, ctx.layer_state, agent_result, dim_score_map)
+
+        return [dim_score_map[dim] for dim in DIMENSIONS]
 
-        # Build shared resources with layer_states for read_layer_analysis
+    async def _aescalate_serial(
+        self,
+        dim_scores: list[DimensionScore],
+        candidate: dict,
+        critique_input: CritiqueInput,
+    ) -> list[DimensionScore]:
+        """Awaitable ``_escalate_serial``."""
+        layer_states = self._layer_states(dim_scores)
+        runtime = self._agent_runtime(layer_states)
+        dim_score_map = {ds.dimension: ds for ds in dim_scores}
+
+        for ctx in self._serial_contexts(layer_states, candidate, critique_input):
+            try:
+                agent_result = await asyncio.wait_for(runtime.evaluate(ctx), timeout=60)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Serial Agent evaluation failed for %s: %s", ctx.layer_id, exc)
+                agent_result = AgentResult(layer_id=ctx.layer_id, fallback_used=True)
+            self._apply_serial_result(ctx.layer_id, ctx.layer_state, agent_result, dim_score_map)
+
+        return [dim_score_map[dim] for dim in DIMENSIONS]
+
+    def _agent_runtime(self, layer_states: dict[str, LayerState]) -> AgentRuntime:
+        """Build an AgentRuntime whose tools can read *layer_states*."""
         tool_registry = build_critic_tool_registry(
             scout_service=self._scout_service,
             layer_states=layer_states,
         )
-        model_router = ModelRouter()
-
-        runtime = AgentRuntime(
+        return AgentRuntime(
             tool_registry=tool_registry,
-            model_router=model_router,
+            model_router=ModelRouter(),
             max_steps=self._max_agent_steps,
         )
 
-        # Build candidate/evidence summaries
+    def _serial_contexts(
+        self,
+        layer_states: dict[str, LayerState],
+        candidate: dict,
+        critique_input: CritiqueInput,
+    ) -> Iterator[AgentContext]:
+        """Yield one AgentContext per escalated layer, L1→L5.
+
+        Lazy on purpose: each context is built only after the previous
+        layer's result was applied, so it sees that layer's analysis text.
+        """
         candidate_summary = self._build_candidate_summary(candidate)
         evidence_summary = self._build_evidence_summary(critique_input.evidence)
-
-        # L1→L5 serial evaluation
-        _DIM_ORDER = [
-            "visual_perception",
-            "technical_analysis",
-            "cultural_context",
-            "critical_interpretation",
-            "philosophical_aesthetic",
-        ]
-        dim_score_map = {ds.dimension: ds for ds in dim_scores}
         image_url = candidate.get("image_path") or candidate.get("image_url")
 
-        for dim_id in _DIM_ORDER:
+        for dim_id in _SERIAL_DIM_ORDER:
             ls = layer_states.get(dim_id)
             if not ls:
                 continue
@@ -825,7 +973,7 @@ class CriticLLM:
             if accumulated:
                 full_evidence = f"{evidence_summary}\n\n### Prior Layer Analyses\n{accumulated}"
 
-            ctx = AgentContext(
+            yield AgentContext(
                 task_id=critique_input.task_id,
                 layer_id=dim_id,
                 layer_label=_LAYER_LABELS.get(dim_id, dim_id),
@@ -837,55 +985,55 @@ class CriticLLM:
                 image_url=image_url,
             )
 
-            try:
-                agent_result = self._run_async(runtime.evaluate(ctx))
-            except Exception as exc:  # noqa: BLE001
-                logger.error("Serial Agent evaluation failed for %s: %s", dim_id, exc)
-                agent_result = AgentResult(layer_id=dim_id, fallback_used=True)
-
-            if not agent_result.fallback_used and agent_result.score is not None:
-                # Store analysis text for downstream layers
-                ls.analysis_text = agent_result.rationale or ""
-
-                rule_score = dim_score_map[dim_id].score
-                # Protect taboo overrides: L4 ≤ 0.3 = taboo_critical(0.0) or taboo_high(0.3)
-                if dim_id == "critical_interpretation" and rule_score <= 0.3:
-                    continue
-                merged_score = 0.3 * rule_score + 0.7 * agent_result.score
-                merged_rationale = (
-                    f"rule={rule_score:.3f}; agent={agent_result.score:.3f} "
-                    f"(model={agent_result.model_used}, tools={agent_result.tool_calls_made}); "
-                    f"merged={merged_score:.3f}; mode=progressive"
-                )
-                dim_score_map[dim_id] = DimensionScore(
-                    dimension=dim_id,
-                    score=_clamp(merged_score),
-                    rationale=merged_rationale,
-                    agent_metadata={
-                        "mode": "agent_progressive",
-                        "rule_score": round(rule_score, 4),
-                        "agent_score": round(agent_result.score, 4),
-                        "confidence": round(agent_result.confidence, 4),
-                        "model_used": agent_result.model_used,
-                        "tool_calls_made": agent_result.tool_calls_made,
-                        "llm_calls_made": agent_result.llm_calls_made,
-                        "cost_usd": round(agent_result.cost_usd, 6),
-                        "latency_ms": agent_result.latency_ms,
-                        "fallback_used": False,
-                    },
-                )
-                self._total_escalations += 1
-                self._total_tool_calls += agent_result.tool_calls_made
-                if abs(agent_result.score - rule_score) > 0.15:
-                    self._total_re_plans += 1
-            else:
-                # Fallback: still store rule analysis for downstream
-                ls.analysis_text = (
-                    f"Rule-based score: {ls.score:.3f}. "
-                    f"Rationale: {dim_score_map[dim_id].rationale}"
-                )
+    def _apply_serial_result(
+        self,
+        dim_id: str,
+        ls: LayerState,
+        agent_result: AgentResult,
+        dim_score_map: dict[str, DimensionScore],
+    ) -> None:
+        """Merge one progressive-mode Agent result into *dim_score_map*."""
+        if not agent_result.fallback_used and agent_result.score is not None:
+            # Store analysis text for downstream layers
+            ls.analysis_text = agent_result.rationale or ""
 
-        return [dim_score_map[dim] for dim in DIMENSIONS]
+            rule_score = dim_score_map[dim_id].score
+            # Protect taboo overrides: L4 ≤ 0.3 = taboo_critical(0.0) or taboo_high(0.3)
+            if dim_id == "critical_interpretation" and rule_score <= 0.3:
+                return
+            merged_score = 0.3 * rule_score + 0.7 * agent_result.score
+            merged_rationale = (
+                f"rule={rule_score:.3f}; agent={agent_result.score:.3f} "
+                f"(model={agent_result.model_used}, tools={agent_result.tool_calls_made}); "
+                f"merged={merged_score:.3f}; mode=progressive"
+            )
+            dim_score_map[dim_id] = DimensionScore(
+                dimension=dim_id,
+                score=_clamp(merged_score),
+                rationale=merged_rationale,
+                agent_metadata={
+                    "mode": "agent_progressive",
+                    "rule_score": round(rule_score, 4),
+                    "agent_score": round(agent_result.score, 4),
+                    "confidence": round(agent_result.confidence, 4),
+                    "model_used": agent_result.model_used,
+                    "tool_calls_made": agent_result.tool_calls_made,
+                    "llm_calls_made": agent_result.llm_calls_made,
+                    "cost_usd": round(agent_result.cost_usd, 6),
+                    "latency_ms": agent_result.latency_ms,
+                    "fallback_used": False,
+                },
+            )
+            self._total_escalations += 1
+            self._total_tool_calls += agent_result.tool_calls_made
+            if abs(agent_result.score - rule_score) > 0.15:
+                self._total_re_plans += 1
+        else:
+            # Fallback: still store rule analysis for downstream
+            ls.analysis_text = (
+                f"Rule-based score: {ls.score:.3f}. "
+                f"Rationale: {dim_score_map[dim_id].rationale}"
+            )
 
     def _run_agent_evaluations(
         self,
@@ -896,57 +1044,84 @@ class CriticLLM:
     ) -> dict[str, AgentResult]:
         """Run AgentRuntime.evaluate() for selected dimensions.
 
-        Handles sync/async boundary safely.
+        In batched mode all dimensions are first scored in one call; a
+        per-layer agent then runs only for dimensions the batch left
+        unscored or below ``batch_min_confidence`` (the batched score is
+        kept if that agent fails).  Handles sync/async boundary safely.
         """
-        results: dict[str, AgentResult] = {}
+        return self._run_async(self._aevaluate_agents(
+            dims_to_escalate, layer_states, candidate, critique_input,
+        ))
 
-        # Build shared resources
-        tool_registry = build_critic_tool_registry(
-            scout_service=self._scout_service,
-            layer_states=layer_states,
-        )
-        model_router = ModelRouter()
-
-        runtime = AgentRuntime(
-            tool_registry=tool_registry,
-            model_router=model_router,
-            max_steps=self._max_agent_steps,
-        )
+    async def _aevaluate_agents(
+        self,
+        dims_to_escalate: list[str],
+        layer_states: dict[str, LayerState],
+        candidate: dict,
+        critique_input: CritiqueInput,
+    ) -> dict[str, AgentResult]:
+        """Coroutine behind ``_run_agent_evaluations``; awaited directly by ``arun``."""
+        runtime = self._agent_runtime(layer_states)
 
         # Build candidate/evidence summaries
         candidate_summary = self._build_candidate_summary(candidate)
         evidence_summary = self._build_evidence_summary(critique_input.evidence)
 
-        async def _run_all() -> dict[str, AgentResult]:
-            dim_results: dict[str, AgentResult] = {}
-            for dim_id in dims_to_escalate:
-                # VLM layers (L1/L2) need image_url
-                image_url = candidate.get("image_path") or candidate.get("image_url")
-                ctx = AgentContext(
-                    task_id=critique_input.task_id,
-                    layer_id=dim_id,
-                    layer_label=_LAYER_LABELS.get(dim_id, dim_id),
-                    subject=critique_input.subject,
-                    cultural_tradition=critique_input.cultural_tradition,
-                    candidate_summary=candidate_summary,
-                    evidence_summary=evidence_summary,
-                    layer_state=layer_states.get(dim_id),
-                    image_url=image_url,
-                )
-                if ctx.layer_state is None:
-                    logger.warning("layer_states missing key %s, skipping escalation", dim_id)
-                    dim_results[dim_id] = AgentResult(layer_id=dim_id, fallback_used=True)
-                    continue
-                try:
-                    result = await runtime.evaluate(ctx)
-                except Exception as exc:  # noqa: BLE001
-                    logger.error("Agent evaluation failed for %s: %s", dim_id, exc)
-                    result = AgentResult(layer_id=dim_id, fallback_used=True)
-                dim_results[dim_id] = result
-            return dim_results
-
-        results = self._run_async(_run_all())
-        return results
+        dim_results: dict[str, AgentResult] = {}
+        contexts: list[AgentContext] = []
+        for dim_id in dims_to_escalate:
+            # VLM layers (L1/L2) need image_url
+            image_url = candidate.get("image_path") or candidate.get("image_url")
+            ctx = AgentContext(
+                task_id=critique_input.task_id,
+                layer_id=dim_id,
+                layer_label=_LAYER_LABELS.get(dim_id, dim_id),
+                subject=critique_input.subject,
+                cultural_tradition=critique_input.cultural_tradition,
+                candidate_summary=candidate_summary,
+                evidence_summary=evidence_summary,
+                layer_state=layer_states.get(dim_id),
+                image_url=image_url,
+            )
+            if ctx.layer_state is None:
+                logger.warning("layer_states missing key %s, skipping escalation", dim_id)
+                dim_results[dim_id] = AgentResult(layer_id=dim_id, fallback_used=True)
+                continue
+            contexts.append(ctx)
+
+        if self._batched and contexts:
+            try:
+                dim_results.update(await runtime.evaluate_batch(
+                    contexts, min_confidence=self._batch_min_confidence,
+                ))
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Batched agent evaluation failed: %s", exc)
+            contexts = [
+                ctx for ctx in contexts
+                if not self._batch_result_usable(dim_results.get(ctx.layer_id))
+            ]
+
+        for ctx in contexts:
+            try:
+                result = await runtime.evaluate(ctx)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Agent evaluation failed for %s: %s", ctx.layer_id, exc)
+                result = AgentResult(layer_id=ctx.layer_id, fallback_used=True)
+            batched = dim_results.get(ctx.layer_id)
+            if result.fallback_used and batched is not None and not batched.fallback_used:
+                # Keep the low-confidence batched score
+                AgentRuntime.record_batch_result(ctx, batched)
+                continue
+            dim_results[ctx.layer_id] = result
+        return dim_results
+
+    def _batch_result_usable(self, result: AgentResult | None) -> bool:
+        return (
+            result is not None
+            and not result.fallback_used
+            and result.score is not None
+            and result.confidence >= self._batch_min_confidence
+        )
 
     @staticmethod
     def _run_async(coro: Any) -> Any:
@@ -7,6 +7,7 @@ real self-correction in the Agent loop.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from app.prototype.agents.critic_config import DIMENSIONS
@@ -158,6 +159,69 @@ class CriticRules:
         Evolved context (focus points, evaluation guidance) influences
         scoring when available.
         """
+        scores = self._rule_scores(candidate, evidence, cultural_tradition)
+
+        # --- Image-aware blending (VLM preferred, CLIP fallback) ---
+        image_path = candidate.get("image_path", "")
+        if image_path and subject:
+            vlm_scores = None
+            if use_vlm:
+                vlm_scores = self._try_vlm_scoring(
+                    image_path, subject, cultural_tradition,
+                    prompt=candidate.get("prompt", ""), evidence=evidence,
+                )
+            if vlm_scores is not None:
+                scores = self._blend_vlm_scores(scores, vlm_scores)
+            else:
+                scores = self._blend_image_scores(
+                    scores, image_path, subject, cultural_tradition,
+                )
+
+        # --- Generate human-readable summaries ---
+        scores = self._add_summaries(scores, cultural_tradition)
+
+        return scores
+
+    async def ascore(
+        self,
+        candidate: dict,
+        evidence: dict,
+        cultural_tradition: str,
+        subject: str = "",
+        use_vlm: bool = True,
+    ) -> list[DimensionScore]:
+        """Awaitable ``score``.
+
+        The VLM call is awaited; rule scoring (reads evolved context from
+        disk) and CLIP blending run in worker threads.
+        """
+        scores = await asyncio.to_thread(self._rule_scores, candidate, evidence, cultural_tradition)
+
+        image_path = candidate.get("image_path", "")
+        if image_path and subject:
+            vlm_scores = None
+            if use_vlm:
+                vlm_scores = await self._atry_vlm_scoring(
+                    image_path, subject, cultural_tradition,
+                    prompt=candidate.get("prompt", ""), evidence=evidence,
+                )
+            if vlm_scores is not None:
+                scores = self._blend_vlm_scores(scores, vlm_scores)
+            else:
+                scores = await asyncio.to_thread(
+                    self._blend_image_scores,
+                    scores, image_path, subject, cultural_tradition,
+                )
+
+        return self._add_summaries(scores, cultural_tradition)
+
+    def _rule_scores(
+        self,
+        candidate: dict,
+        evidence: dict,
+        cultural_tradition: str,
+    ) -> list[DimensionScore]:
+        """Prompt/evidence-only L1-L5 scores, before any image blending."""
         prompt = candidate.get("prompt", "")
         prompt_lower = prompt.lower()
         steps = candidate.get("steps", 0)
@@ -364,25 +428,6 @@ class CriticRules:
                 )
             total_evo_bonus += insight_bonus
 
-        # --- Image-aware blending (VLM preferred, CLIP fallback) ---
-        image_path = candidate.get("image_path", "")
-        if image_path and subject:
-            vlm_scores = None
-            if use_vlm:
-                vlm_scores = self._try_vlm_scoring(
-                    image_path, subject, cultural_tradition,
-                    prompt=prompt, evidence=evidence,
-                )
-            if vlm_scores is not None:
-                scores = self._blend_vlm_scores(scores, vlm_scores)
-            else:
-                scores = self._blend_image_scores(
-                    scores, image_path, subject, cultural_tradition,
-                )
-
-        # --- Generate human-readable summaries ---
-        scores = self._add_summaries(scores, cultural_tradition)
-
         return scores
 
     # ------------------------------------------------------------------
@@ -455,6 +500,24 @@ class CriticRules:
         )
         return summary
 
+    @staticmethod
+    def register_image_batch(candidates: list[dict], cultural_tradition: str) -> None:
+        """Register a round's candidate images for batched CLIP scoring.
+
+        No-op for a single candidate.  Scoring itself stays lazy: nothing is
+        encoded unless ``_blend_image_scores`` is reached (i.e. VLM did not
+        take over).
+        """
+        paths = [c.get("image_path", "") for c in candidates if c.get("image_path")]
+        if len(paths) < 2:
+            return
+        try:
+            from app.prototype.agents.image_scorer import ImageScorer
+
+            ImageScorer.get().register_batch(paths, cultural_tradition)
+        except Exception as e:
+            logger.debug("Image batch registration skipped: %s", e)
+
     @staticmethod
     def _blend_image_scores(
         scores: list[DimensionScore],
@@ -462,12 +525,22 @@ class CriticRules:
         subject: str,
         cultural_tradition: str,
     ) -> list[DimensionScore]:
-        """Blend rule-based scores with CLIP image scores."""
+        """Blend rule-based scores with CLIP image scores.
+
+        When the candidate belongs to a registered multi-candidate round
+        (see ``register_image_batch``), all siblings are scored in one batched
+        CLIP pass and this candidate's row is used.
+        """
         try:
             from app.prototype.agents.image_scorer import ImageScorer
 
             scorer = ImageScorer.get()
-            image_scores = scorer.score_image(image_path, subject, cultural_tradition)
+            batch = scorer.batch_for(image_path, cultural_tradition)
+            if len(batch) > 1:
+                batch_scores = scorer.score_images(batch, cultural_tradition)
+                image_scores = batch_scores[batch.index(image_path)]
+            else:
+                image_scores = scorer.score_image(image_path, subject, cultural_tradition)
         except Exception as e:
             logger.debug("Image scorer unavailable: %s", e)
             return scores
@@ -542,6 +615,32 @@ class CriticRules:
             logger.debug("VLM scorer unavailable: %s", e)
             return None
 
+    @staticmethod
+    async def _atry_vlm_scoring(
+        image_path: str,
+        subject: str,
+        cultural_tradition: str,
+        prompt: str = "",
+        evidence: dict | None = None,
+    ) -> dict[str, float] | None:
+        """Awaitable ``_try_vlm_scoring``."""
+        try:
+            from app.prototype.agents.vlm_critic import VLMCritic
+
+            vlm = VLMCritic.get()
+            if not vlm.available:
+                return None
+            return await vlm.ascore_image(
+                image_path=image_path,
+                subject=subject,
+                cultural_tradition=cultural_tradition,
+                prompt=prompt,
+                evidence=evidence or {},
+            )
+        except Exception as e:
+            logger.debug("VLM scorer unavailable: %s", e)
+            return None
+
     @staticmethod
     def _blend_vlm_scores(
         scores: list[DimensionScore],
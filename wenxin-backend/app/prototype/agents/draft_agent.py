@@ -7,6 +7,7 @@ import logging
 import os
 import re
 import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
@@ -200,8 +201,8 @@ def _get_style_for_tradition(tradition: str, intent: str = "") -> dict[str, str]
     if tradition in _llm_style_cache:
         return _llm_style_cache[tradition]
     try:
-        import litellm
-        response = litellm.completion(
+        from app.prototype.agents import llm_gateway
+        response = llm_gateway.completion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -414,7 +415,12 @@ class DraftAgent:
     # Public API
     # ------------------------------------------------------------------
 
-    def run(self, draft_input: DraftInput, evidence_pack=None) -> DraftOutput:
+    def run(
+        self,
+        draft_input: DraftInput,
+        evidence_pack=None,
+        on_candidate: Callable[[DraftCandidate], bool] | None = None,
+    ) -> DraftOutput:
         """Execute the draft generation pipeline.
 
         Parameters
@@ -424,6 +430,12 @@ class DraftAgent:
         evidence_pack : EvidencePack | None
             Layer 1a structured evidence pack. If provided, uses enriched
             prompt construction; otherwise falls back to legacy path.
+        on_candidate : callable | None
+            Called with each candidate as soon as its image is written
+            (completion order).  Returning False stops generation: candidates
+            that have not started yet are cancelled, and ones still in flight
+            are dropped from the output when they finish, so every returned
+            candidate has been handed to *on_candidate*.
         """
         t0 = time.monotonic()
         config = draft_input.config or self._default_config
@@ -500,12 +512,29 @@ class DraftAgent:
 
         # Parallel generation: each candidate is an independent HTTP call
         max_workers = min(config.n_candidates, 4)
+        stopped_early = False
+        dropped: list[str] = []
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = {pool.submit(_generate_one, i): i for i in range(config.n_candidates)}
             results: dict[int, DraftCandidate | None] = {}
             for future in as_completed(futures):
+                if future.cancelled():
+                    continue
                 idx = futures[future]
-                results[idx] = future.result()
+                cand = future.result()
+                if stopped_early:
+                    # Finished after the stop: never seen by on_candidate
+                    if cand is not None:
+                        dropped.append(cand.candidate_id)
+                    continue
+                results[idx] = cand
+                if on_candidate is not None and cand is not None:
+                    if on_candidate(cand) is False:
+                        stopped_early = True
+                        for pending in futures:
+                            pending.cancel()
+        if dropped:
+            logger.info("Draft stopped early; dropped late candidates %s", dropped)
 
         # Collect in deterministic order (by candidate index)
         for i in range(config.n_candidates):
@@ -514,7 +543,7 @@ class DraftAgent:
                 candidates.append(cand)
 
         elapsed_ms = int((time.monotonic() - t0) * 1000)
-        success = len(candidates) == config.n_candidates
+        success = len(candidates) == config.n_candidates or (stopped_early and not errors)
 
         output = DraftOutput(
             task_id=draft_input.task_id,
@@ -524,6 +553,8 @@ class DraftAgent:
             model_ref=provider.model_ref,
             success=success,
             error="; ".join(errors) if errors else None,
+            # Late finishers were billed even though they are not returned
+            images_generated=len(candidates) + len(dropped),
         )
 
         save_draft_checkpoint(output)
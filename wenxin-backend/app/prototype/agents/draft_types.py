@@ -77,6 +77,7 @@ class DraftOutput:
     success: bool = True
     error: str | None = None
     sub_stage_results: list[dict] = field(default_factory=list)  # SubStageResult.to_dict() list
+    images_generated: int = 0         # images the provider produced, incl. ones dropped after early stop
 
     def to_dict(self) -> dict:
         return {
@@ -88,4 +89,5 @@ class DraftOutput:
             "success": self.success,
             "error": self.error,
             "sub_stage_results": self.sub_stage_results,
+            "images_generated": self.images_generated,
         }
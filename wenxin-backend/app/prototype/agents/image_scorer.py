@@ -5,7 +5,12 @@ that varies with each generated image — enabling real self-correction.
 
 Key design:
 - Singleton model loading (CLIP loads once, reused across calls)
-- Batch encoding: 1 image encode + 1 batch text encode per candidate
+- Reference-text embeddings served from the shared EmbeddingCache and
+  precomputed for every known tradition at model load, so scoring a
+  candidate costs 1 image encode and no text encodes
+- Batch scoring: ``score_images`` decodes all candidates in a thread pool,
+  encodes them as one tensor batch and scores every L-level with a single
+  matrix multiply; results are memoized per (path, mtime, tradition)
 - Graceful fallback: returns None when CLIP unavailable
 - CLIP raw scores normalized from [0.15, 0.35] -> [0.0, 1.0]
 - Tradition-specific reference texts for cultural context scoring
@@ -15,8 +20,12 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+from app.prototype.tools.embedding_cache import get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -30,6 +39,15 @@ __all__ = [
 _CLIP_LOW = 0.15   # maps to 0.0
 _CLIP_HIGH = 0.35  # maps to 1.0
 
+_CLIP_MODEL_NAME = "clip-ViT-B-32"
+
+# Bounds for the per-scorer batch memo / sibling registry and decode pool
+_MEMO_MAX_ENTRIES = 256
+_DECODE_WORKERS = 8
+
+# Reference text order used by the score matrix columns
+_SCORE_KEYS = ("L1", "L2", "L3", "L5")
+
 # Tradition-specific reference texts for CLIP scoring.
 # English descriptions capturing visual essence (CLIP trained on EN image-text pairs).
 _LEGACY_TRADITION_REFERENCES: dict[str, dict[str, str]] = {
@@ -145,6 +163,13 @@ class ImageScorer:
         self._model = None
         self._available: bool | None = None
         self._load_failed: bool = False
+        # (path, mtime_ns, size, tradition) -> score dict (or None)
+        self._memo: OrderedDict[tuple, dict[str, float] | None] = OrderedDict()
+        # (path, tradition) -> sibling paths scored together in one batch
+        self._batches: OrderedDict[tuple[str, str], tuple[str, ...]] = OrderedDict()
+        # memo key -> future of the batch currently scoring it
+        self._inflight: dict[tuple, Future] = {}
+        self._batch_lock = threading.Lock()
 
     @property
     def available(self) -> bool:
@@ -183,7 +208,7 @@ class ImageScorer:
 
             logger.info("Loading CLIP ViT-B/32 for image scoring...")
             try:
-                self._model = SentenceTransformer("clip-ViT-B-32")
+                self._model = SentenceTransformer(_CLIP_MODEL_NAME)
             except (NotImplementedError, RuntimeError) as e:
                 # Handle meta tensor error: "Cannot copy out of meta tensor"
                 # This occurs when torch loads model weights as meta tensors
@@ -195,7 +220,7 @@ class ImageScorer:
                     )
                     try:
                         self._model = SentenceTransformer(
-                            "clip-ViT-B-32", device="cpu"
+                            _CLIP_MODEL_NAME, device="cpu"
                         )
                     except Exception as e2:
                         logger.error(
@@ -219,10 +244,37 @@ class ImageScorer:
 
             if self._model is not None:
                 logger.info("CLIP ViT-B/32 loaded for image scoring")
+                self._warm_reference_embeddings()
             else:
                 self._load_failed = True
                 self._available = False
 
+    def _warm_reference_embeddings(self) -> None:
+        """Precompute reference-text embeddings for every known tradition.
+
+        Runs once right after the model loads; failures only cost the warm-up.
+        """
+        traditions = set(_LEGACY_TRADITION_REFERENCES)
+        try:
+            from app.prototype.cultural_pipelines.tradition_loader import get_known_traditions
+
+            traditions.update(get_known_traditions())
+        except Exception:
+            pass
+
+        texts = [_QUALITY_REF]
+        for tradition in sorted(traditions):
+            refs = _get_references_dynamic(tradition)
+            texts.extend(refs[k] for k in ("L1", "L3", "L5"))
+
+        cache = get_embedding_cache()
+        try:
+            n = cache.warm(_CLIP_MODEL_NAME, self._model, texts, convert_to_numpy=True)
+            logger.info("CLIP reference embeddings precomputed: %d new texts", n)
+            cache.save()
+        except Exception as e:
+            logger.debug("CLIP reference warm-up skipped: %s", e)
+
     def score_image(
         self,
         image_path: str,
@@ -237,59 +289,180 @@ class ImageScorer:
         Keys: "L1", "L2", "L3", "L5" (normalized)
               "_L1_raw", "_L2_raw", "_L3_raw", "_L5_raw" (raw CLIP cosine)
         """
-        if not self.available:
-            return None
+        return self.score_images([image_path], cultural_tradition)[0]
 
-        path = Path(image_path)
-        if not path.exists():
-            logger.debug("Image not found for scoring: %s", image_path)
-            return None
+    def register_batch(self, image_paths: list[str], cultural_tradition: str) -> None:
+        """Declare that *image_paths* are sibling candidates of one round.
 
-        refs = _get_references_dynamic(cultural_tradition)
+        ``batch_for`` then returns the whole group for any member, letting the
+        first caller score all of them in one forward pass.
+        """
+        group = tuple(dict.fromkeys(p for p in image_paths if p))
+        if len(group) < 2:
+            return
+        with self._batch_lock:
+            for path in group:
+                self._batches[(path, cultural_tradition)] = group
+                self._batches.move_to_end((path, cultural_tradition))
+            while len(self._batches) > _MEMO_MAX_ENTRIES:
+                self._batches.popitem(last=False)
+
+    def batch_for(self, image_path: str, cultural_tradition: str) -> list[str]:
+        """Return the registered sibling group containing *image_path* (or just it)."""
+        with self._batch_lock:
+            group = self._batches.get((image_path, cultural_tradition))
+        return list(group) if group else [image_path]
+
+    def score_images(
+        self,
+        image_paths: list[str],
+        cultural_tradition: str,
+    ) -> list[dict[str, float] | None]:
+        """Score several images in one CLIP forward pass.
+
+        Images are decoded in a thread pool, encoded as a single batch, and
+        all L1/L2/L3/L5 similarities come from one (N x D) @ (D x 4) matrix
+        multiply.  Results are memoized, and an image already being scored by
+        another thread is awaited rather than re-encoded, so concurrent
+        callers scoring the same round only pay for the batch once.  The lock
+        is only held to claim and publish keys, never across the forward
+        pass.  Entries are None for missing or unscorable images.
+        """
+        if not image_paths:
+            return []
+        if not self.available:
+            return [None] * len(image_paths)
 
         try:
-            from PIL import Image
-            import numpy as np
-
             self._load_model()
+        except Exception as e:
+            logger.warning("Image scoring failed to load CLIP: %s", e)
+            return [None] * len(image_paths)
+        # _load_model may have failed gracefully (sets _load_failed)
+        if self._model is None:
+            return [None] * len(image_paths)
+
+        keys = [self._memo_key(p, cultural_tradition) for p in image_paths]
+        found: dict[tuple, dict[str, float] | None] = {}
+        waiting: dict[tuple, Future] = {}
+        claimed: dict[tuple, str] = {}
+        with self._batch_lock:
+            for path, key in zip(image_paths, keys):
+                if key is None or key in found or key in waiting or key in claimed:
+                    continue
+                if key in self._memo:
+                    self._memo.move_to_end(key)
+                    found[key] = self._memo[key]
+                elif key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                else:
+                    claimed[key] = path
+                    self._inflight[key] = Future()
 
-            # _load_model may have failed gracefully (sets _load_failed)
-            if self._model is None:
-                return None
+        if claimed:
+            try:
+                computed = self._score_batch(list(claimed.values()), cultural_tradition)
+            except BaseException:
+                computed = [None] * len(claimed)
+                raise
+            finally:
+                with self._batch_lock:
+                    for key, result in zip(claimed, computed):
+                        if result is not None:  # failures are retried next time
+                            self._memo[key] = result
+                        self._inflight.pop(key).set_result(result)
+                    while len(self._memo) > _MEMO_MAX_ENTRIES:
+                        self._memo.popitem(last=False)
+            found.update(zip(claimed, computed))
+
+        for key, future in waiting.items():
+            found[key] = future.result()
+
+        results: list[dict[str, float] | None] = []
+        for path, key in zip(image_paths, keys):
+            if key is None:
+                logger.debug("Image not found for scoring: %s", path)
+                results.append(None)
+                continue
+            result = found.get(key)
+            results.append(dict(result) if result is not None else None)
+        return results
+
+    @staticmethod
+    def _memo_key(image_path: str, cultural_tradition: str) -> tuple | None:
+        try:
+            st = Path(image_path).stat()
+        except OSError:
+            return None
+        return (str(image_path), st.st_mtime_ns, st.st_size, cultural_tradition)
 
-            # Encode image ONCE
-            img = Image.open(path).convert("RGB")
-            img_emb = self._model.encode(img, convert_to_numpy=True)
-            img_norm = np.linalg.norm(img_emb)
-            if img_norm < 1e-8:
-                return None
+    def _score_batch(
+        self,
+        image_paths: list[str],
+        cultural_tradition: str,
+    ) -> list[dict[str, float] | None]:
+        """Decode + encode + score *image_paths* (all assumed to exist)."""
+        try:
+            import numpy as np
+            from PIL import Image
 
-            # Batch encode all reference texts at once (4 texts)
+            def _open(path: str):
+                try:
+                    with Image.open(path) as img:
+                        return img.convert("RGB")
+                except Exception as e:
+                    logger.warning("Image decode failed for %s: %s", path, e)
+                    return None
+
+            workers = min(len(image_paths), _DECODE_WORKERS)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    images = list(pool.map(_open, image_paths))
+            else:
+                images = [_open(p) for p in image_paths]
+
+            valid = [i for i, img in enumerate(images) if img is not None]
+            results: list[dict[str, float] | None] = [None] * len(image_paths)
+            if not valid:
+                return results
+
+            # Encode all images as ONE batch
+            img_embs = np.asarray(
+                self._model.encode(
+                    [images[i] for i in valid],
+                    convert_to_numpy=True,
+                    batch_size=len(valid),
+                ),
+                dtype=np.float32,
+            ).reshape(len(valid), -1)
+
+            # Reference texts come from the shared cache (precomputed at load)
+            refs = _get_references_dynamic(cultural_tradition)
             texts = [refs["L1"], _QUALITY_REF, refs["L3"], refs["L5"]]
-            txt_embs = self._model.encode(texts, convert_to_numpy=True)
-
-            # Compute cosine similarities
-            sims = []
-            for txt_emb in txt_embs:
-                txt_norm = np.linalg.norm(txt_emb)
-                if txt_norm < 1e-8:
-                    sims.append(0.0)
-                else:
-                    sims.append(float(np.dot(img_emb, txt_emb) / (img_norm * txt_norm)))
-
-            l1_raw, l2_raw, l3_raw, l5_raw = sims
-
-            return {
-                "L1": _normalize_clip(l1_raw),
-                "L2": _normalize_clip(l2_raw),
-                "L3": _normalize_clip(l3_raw),
-                "L5": _normalize_clip(l5_raw),
-                "_L1_raw": round(l1_raw, 4),
-                "_L2_raw": round(l2_raw, 4),
-                "_L3_raw": round(l3_raw, 4),
-                "_L5_raw": round(l5_raw, 4),
-            }
+            txt_embs = get_embedding_cache().encode(
+                _CLIP_MODEL_NAME, self._model, texts, convert_to_numpy=True,
+            )
+
+            img_norms = np.linalg.norm(img_embs, axis=1, keepdims=True)
+            txt_norms = np.linalg.norm(txt_embs, axis=1, keepdims=True)
+            img_unit = img_embs / np.maximum(img_norms, 1e-8)
+            txt_unit = np.where(txt_norms < 1e-8, 0.0, txt_embs / np.maximum(txt_norms, 1e-8))
+
+            # One matrix multiply: (N x D) @ (D x 4) -> (N x 4) cosine sims
+            sims = img_unit @ txt_unit.T
+
+            for row, idx in enumerate(valid):
+                if img_norms[row, 0] < 1e-8:
+                    continue
+                raw = [float(v) for v in sims[row]]
+                result: dict[str, float] = {}
+                for key, value in zip(_SCORE_KEYS, raw):
+                    result[key] = _normalize_clip(value)
+                for key, value in zip(_SCORE_KEYS, raw):
+                    result[f"_{key}_raw"] = round(value, 4)
+                results[idx] = result
+            return results
 
         except Exception as e:
-            logger.warning("Image scoring failed for %s: %s", image_path, e)
-            return None
+            logger.warning("Image scoring failed for %s: %s", image_paths, e)
+            return [None] * len(image_paths)
@@ -0,0 +1,231 @@
+"""LLM cassettes — record/replay transport for offline pipeline runs.
+
+With a cassette installed, every model call that goes through the LLM
+gateway (Critic VLM, Queen LLM, IntentAgent, skills, ...) and every NB2
+image generation is either recorded to disk or replayed from it:
+
+- ``record``: calls go to the live provider; each response is written to
+  the cassette directory together with its measured latency.
+- ``replay``: responses come from the cassette and no network is touched.
+  A request that was never recorded raises :class:`CassetteMiss`, which
+  call sites treat like any other provider error.
+
+Entries are keyed by a hash of the output-shaping request fields (see
+:func:`llm_gateway.request_key`), one JSON file per request, so cassettes
+can be recorded incrementally and diffed.  During replay a synthetic
+latency is applied — either the latency measured while recording, or a
+fixed value — so throughput/latency benchmarks of the real orchestration
+code run on a CPU-only box without network access.
+
+Providers still check for API keys before calling out; set a placeholder
+``GOOGLE_API_KEY`` when replaying.
+
+Environment variables:
+- ``VULCA_LLM_CASSETTE``: cassette directory (unset disables the transport)
+- ``VULCA_LLM_CASSETTE_MODE``: ``replay`` (default) or ``record``
+- ``VULCA_LLM_REPLAY_LATENCY``: ``recorded``, or a fixed latency in
+  milliseconds (default 0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "Cassette",
+    "CassetteMiss",
+    "get_cassette",
+    "install_cassette",
+]
+
+_MODES = ("record", "replay")
+
+
+class CassetteMiss(LookupError):
+    """A replayed request has no recorded response."""
+
+
+class Cassette:
+    """Directory of recorded model responses.
+
+    Usage::
+
+        cassette = Cassette("benchmarks/cassettes/ink", mode="record")
+        install_cassette(cassette)
+        ...  # run the pipeline against live providers once
+        install_cassette(Cassette("benchmarks/cassettes/ink", latency="recorded"))
+        ...  # replay it offline as often as needed
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        mode: str = "replay",
+        latency: float | str = 0.0,
+    ) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r} (use 'record' or 'replay')")
+        if latency != "recorded" and not isinstance(latency, (int, float)):
+            raise ValueError(f"latency must be 'recorded' or seconds, got {latency!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        if mode == "record":
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def call(
+        self,
+        kind: str,
+        request: dict[str, Any],
+        live: Callable[[], Any],
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+    ) -> Any:
+        """Replay or record one blocking call.
+
+        *request* identifies the call, *live* performs it, and
+        *encode*/*decode* convert the response to and from JSON data.
+        """
+        key = self._key(kind, request)
+        if self.mode == "replay":
+            entry = self._load(kind, key)
+            time.sleep(self._delay(entry))
+            return decode(entry["response"])
+
+        t0 = time.monotonic()
+        response = live()
+        self._save(kind, key, request, encode(response), time.monotonic() - t0)
+        return response
+
+    async def acall(
+        self,
+        kind: str,
+        request: dict[str, Any],
+        live: Callable[[], Any],
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+    ) -> Any:
+        """Async :meth:`call`; *live* returns an awaitable."""
+        key = self._key(kind, request)
+        if self.mode == "replay":
+            entry = self._load(kind, key)
+            await asyncio.sleep(self._delay(entry))
+            return decode(entry["response"])
+
+        t0 = time.monotonic()
+        response = await live()
+        self._save(kind, key, request, encode(response), time.monotonic() - t0)
+        return response
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(kind: str, request: dict[str, Any]) -> str:
+        from app.prototype.agents.llm_gateway import request_key
+
+        return request_key({"kind": kind, **request})
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.directory / f"{kind}-{key}.json"
+
+    def _load(self, kind: str, key: str) -> dict[str, Any]:
+        path = self._path(kind, key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            raise CassetteMiss(f"No recorded {kind} response for {key[:12]} in {self.directory}") from None
+        with self._lock:
+            self._hits += 1
+        return entry
+
+    def _save(self, kind: str, key: str, request: dict[str, Any], data: Any, elapsed: float) -> None:
+        entry = {
+            "kind": kind,
+            "model": request.get("model", ""),
+            "latency_ms": round(elapsed * 1000, 1),
+            "recorded_at": time.time(),
+            "response": data,
+        }
+        path = self._path(kind, key)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock:
+            self._recorded += 1
+
+    def _delay(self, entry: dict[str, Any]) -> float:
+        if self.latency == "recorded":
+            return float(entry.get("latency_ms", 0)) / 1000
+        return float(self.latency)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "directory": str(self.directory),
+                "hits": self._hits,
+                "misses": self._misses,
+                "recorded": self._recorded,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Singleton factory
+# ---------------------------------------------------------------------------
+_cassette: Cassette | None = None
+_cassette_loaded = False
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Cassette | None:
+    """Return the installed cassette, or the one configured from env (or None)."""
+    global _cassette, _cassette_loaded  # noqa: PLW0603
+    if not _cassette_loaded:
+        with _cassette_lock:
+            if not _cassette_loaded:
+                directory = os.environ.get("VULCA_LLM_CASSETTE", "")
+                if directory:
+                    latency = os.environ.get("VULCA_LLM_REPLAY_LATENCY", "0")
+                    _cassette = Cassette(
+                        directory,
+                        mode=os.environ.get("VULCA_LLM_CASSETTE_MODE", "replay"),
+                        latency=latency if latency == "recorded" else float(latency) / 1000,
+                    )
+                    logger.info("LLM cassette enabled: %s (%s)", directory, _cassette.mode)
+                _cassette_loaded = True
+    return _cassette
+
+
+def install_cassette(cassette: Cassette | None) -> Cassette | None:
+    """Install *cassette* process-wide (None disables); returns the previous one."""
+    global _cassette, _cassette_loaded  # noqa: PLW0603
+    previous = get_cassette()
+    with _cassette_lock:
+        _cassette = cassette
+        _cassette_loaded = True
+    return previous
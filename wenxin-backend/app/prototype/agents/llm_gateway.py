@@ -0,0 +1,387 @@
+"""LLM Gateway — single entry point for LiteLLM completions in the prototype.
+
+Every ``litellm.acompletion`` call site goes through :func:`acompletion`,
+which adds, process-wide:
+
+- **Per-provider concurrency limits** (provider = LiteLLM prefix, e.g.
+  ``gemini``), so bursts queue locally instead of tripping provider rate
+  limits.  The limit holds across event loops and threads, which matters
+  because sync callers reach the gateway through ``run_async_from_sync``
+  (a fresh loop per call).
+- **A deterministic response cache** for callers that pass ``cache=True``:
+  responses are keyed by a hash of everything that shapes the output
+  (model, messages including image payloads, temperature, max_tokens,
+  tools, ...), so re-evaluating the same image and prompt costs no API call.
+  Only complete answers are cached (non-empty content, ``finish_reason``
+  ``stop``); truncated, filtered or empty responses are returned but not
+  kept, so a transient bad answer is not replayed for the TTL.
+- **Single-flight coalescing** for the same ``cache=True`` requests:
+  identical requests already in flight share one API call.
+- **Record/replay** through an installed :mod:`llm_cassette`, for offline
+  benchmarking.
+
+Blocking callers (Queen LLM, draft style lookup, the digestion layer's
+insight / archetype / concept / feature extraction) use :func:`completion`,
+which applies the same limits and cassette but no cache.
+
+HTTP clients are pooled by LiteLLM itself (one client per provider/key);
+funnelling calls through one module keeps timeouts and limits uniform.
+Cached responses are shared between callers and must be treated as
+read-only.
+
+Environment variables:
+- ``VULCA_LLM_CACHE_SIZE``: max cached responses (default 256; 0 disables)
+- ``VULCA_LLM_CACHE_TTL``: seconds a cached response stays valid (default 3600)
+- ``VULCA_LLM_CONCURRENCY``: max in-flight calls per provider (default 8)
+- ``VULCA_LLM_CONCURRENCY_<PROVIDER>``: per-provider override, e.g.
+  ``VULCA_LLM_CONCURRENCY_GEMINI=4``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "LLMGateway",
+    "acompletion",
+    "completion",
+    "get_llm_gateway",
+    "provider_of",
+    "request_key",
+]
+
+_DEFAULT_CACHE_SIZE = 256
+_DEFAULT_CACHE_TTL = 3600.0
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_TIMEOUT = 60
+
+# Arguments that change how a request is sent, not what it returns
+_TRANSPORT_KWARGS = frozenset({
+    "api_key", "api_base", "timeout", "num_retries", "metadata", "stream_options",
+})
+
+
+def provider_of(model: str) -> str:
+    """LiteLLM provider prefix of *model* (``gemini/gemini-2.5-pro`` → ``gemini``)."""
+    return model.split("/", 1)[0].lower() if "/" in model else "openai"
+
+
+def request_key(kwargs: dict[str, Any]) -> str:
+    """Stable hash of the output-shaping part of a completion request.
+
+    Image payloads are part of ``messages`` (base64 data URIs), so the key
+    covers the image content as well as the prompt.
+    """
+    payload = {
+        k: v for k, v in kwargs.items()
+        if k not in _TRANSPORT_KWARGS and v is not None
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class _ProviderLimit:
+    """Counting semaphore that works across event loops and threads."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: deque[concurrent.futures.Future] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            waiter: concurrent.futures.Future = concurrent.futures.Future()
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled
+                self.release()
+            else:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+            raise
+
+    def acquire_blocking(self) -> None:
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return
+            waiter: concurrent.futures.Future = concurrent.futures.Future()
+            self._waiters.append(waiter)
+        waiter.result()
+
+    def release(self) -> None:
+        with self._lock:
+            # Hand the slot straight to the next live waiter
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.set_result(None)
+                    return
+                except concurrent.futures.InvalidStateError:
+                    continue  # cancelled while queued
+            self.active -= 1
+
+
+class LLMGateway:
+    """Concurrency-limited, caching, coalescing front for ``litellm.acompletion``."""
+
+    def __init__(
+        self,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        provider_concurrency: dict[str, int] | None = None,
+    ) -> None:
+        self._cache_size = max(0, cache_size)
+        self._cache_ttl = cache_ttl
+        self._concurrency = concurrency
+        self._provider_concurrency = {
+            k.lower(): v for k, v in (provider_concurrency or {}).items()
+        }
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, concurrent.futures.Future] = {}
+        self._limits: dict[str, _ProviderLimit] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._hits = 0
+        self._coalesced = 0
+        self._errors = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def acompletion(self, *, cache: bool = False, **kwargs: Any) -> Any:
+        """``litellm.acompletion(**kwargs)`` through the gateway.
+
+        With ``cache=True`` the request is treated as deterministic: a cached
+        response is returned if present, and identical concurrent requests
+        share one call.  Use it for evaluation/scoring calls, not for calls
+        whose callers expect varied (creative) output.
+        """
+        kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
+        if not cache:
+            return await self._call(kwargs)
+
+        key = request_key(kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = concurrent.futures.Future()
+            else:
+                self._coalesced += 1
+
+        if leader:
+            # A task, so the call completes for the followers even if the
+            # request that started it is cancelled
+            task = asyncio.ensure_future(self._lead(key, kwargs, flight))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            return await asyncio.shield(task)
+        return await asyncio.shield(asyncio.wrap_future(flight))
+
+    def completion(self, **kwargs: Any) -> Any:
+        """Blocking ``litellm.completion(**kwargs)`` through the gateway."""
+        import litellm
+
+        from app.prototype.agents.llm_cassette import get_cassette
+
+        kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
+        limit = self.limit_for(provider_of(str(kwargs.get("model", ""))))
+        limit.acquire_blocking()
+        try:
+            with self._lock:
+                self._calls += 1
+            cassette = get_cassette()
+            if cassette is None:
+                return litellm.completion(**kwargs)
+            return cassette.call(
+                "completion", kwargs, lambda: litellm.completion(**kwargs),
+                _dump_response, _load_response,
+            )
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            limit.release()
+
+    def limit_for(self, provider: str) -> _ProviderLimit:
+        with self._lock:
+            limit = self._limits.get(provider)
+            if limit is None:
+                limit = self._limits[provider] = _ProviderLimit(
+                    self._provider_concurrency.get(provider, self._concurrency)
+                )
+            return limit
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _lead(self, key: str, kwargs: dict[str, Any], flight: concurrent.futures.Future) -> Any:
+        try:
+            response = await self._call(kwargs)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            if _cacheable(response):
+                self._cache_put(key, response)
+            flight.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def _call(self, kwargs: dict[str, Any]) -> Any:
+        import litellm
+
+        from app.prototype.agents.llm_cassette import get_cassette
+
+        limit = self.limit_for(provider_of(str(kwargs.get("model", ""))))
+        await limit.acquire()
+        try:
+            with self._lock:
+                self._calls += 1
+            cassette = get_cassette()
+            if cassette is None:
+                return await litellm.acompletion(**kwargs)
+            return await cassette.acall(
+                "completion", kwargs, lambda: litellm.acompletion(**kwargs),
+                _dump_response, _load_response,
+            )
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            limit.release()
+
+    def _cache_get(self, key: str) -> Any | None:
+        if not self._cache_size:
+            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return response
+
+    def _cache_put(self, key: str, response: Any) -> None:
+        if not self._cache_size:
+            return
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self._cache_ttl, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "cache_hits": self._hits,
+                "coalesced": self._coalesced,
+                "errors": self._errors,
+                "cache_size": len(self._cache),
+                "max_cache_size": self._cache_size,
+                "in_flight": {p: lim.active for p, lim in self._limits.items()},
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._calls = self._hits = self._coalesced = self._errors = 0
+
+
+def _cacheable(response: Any) -> bool:
+    """True for a complete answer: every choice stopped normally with content."""
+    choices = getattr(response, "choices", None)
+    if not choices:
+        return False
+    for choice in choices:
+        message = getattr(choice, "message", None)
+        if getattr(choice, "finish_reason", None) != "stop" or not getattr(message, "content", None):
+            return False
+    return True
+
+
+def _dump_response(response: Any) -> Any:
+    return response.model_dump() if hasattr(response, "model_dump") else response
+
+
+def _load_response(data: Any) -> Any:
+    import litellm
+
+    return litellm.ModelResponse(**data)
+
+
+# ---------------------------------------------------------------------------
+# Singleton factory
+# ---------------------------------------------------------------------------
+_gateway: LLMGateway | None = None
+_gateway_lock = threading.Lock()
+
+_CONCURRENCY_PREFIX = "VULCA_LLM_CONCURRENCY_"
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return the process-wide LLMGateway (configured from env)."""
+    global _gateway  # noqa: PLW0603
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    cache_size=int(os.environ.get("VULCA_LLM_CACHE_SIZE", _DEFAULT_CACHE_SIZE)),
+                    cache_ttl=float(os.environ.get("VULCA_LLM_CACHE_TTL", _DEFAULT_CACHE_TTL)),
+                    concurrency=int(os.environ.get("VULCA_LLM_CONCURRENCY", _DEFAULT_CONCURRENCY)),
+                    provider_concurrency={
+                        name[len(_CONCURRENCY_PREFIX):]: int(value)
+                        for name, value in os.environ.items()
+                        if name.startswith(_CONCURRENCY_PREFIX)
+                    },
+                )
+    return _gateway
+
+
+async def acompletion(*, cache: bool = False, **kwargs: Any) -> Any:
+    """Module-level shortcut for ``get_llm_gateway().acompletion(...)``."""
+    return await get_llm_gateway().acompletion(cache=cache, **kwargs)
+
+
+def completion(**kwargs: Any) -> Any:
+    """Module-level shortcut for ``get_llm_gateway().completion(...)``."""
+    return get_llm_gateway().completion(**kwargs)
@@ -17,6 +17,7 @@ Usage in ablation:
 
 from __future__ import annotations
 
+import base64
 import io
 import logging
 import time
@@ -154,7 +155,7 @@ class NB2Provider(AbstractProvider):
         t0 = time.monotonic()
         thinking_text = ""
         try:
-            img_bytes, thinking_text = self._call_api(
+            img_bytes, thinking_text = self._request_image(
                 full_prompt, image_size, aspect_ratio
             )
         except Exception as exc:
@@ -180,6 +181,23 @@ class NB2Provider(AbstractProvider):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _request_image(
+        self, prompt: str, image_size: str, aspect_ratio: str
+    ) -> tuple[bytes, str]:
+        """Call NB2 via the installed cassette (record/replay), if any."""
+        from app.prototype.agents.llm_cassette import get_cassette
+
+        cassette = get_cassette()
+        if cassette is None:
+            return self._call_api(prompt, image_size, aspect_ratio)
+        return cassette.call(
+            "image",
+            {"model": self.MODEL_ID, "prompt": prompt, "image_size": image_size, "aspect_ratio": aspect_ratio},
+            lambda: self._call_api(prompt, image_size, aspect_ratio),
+            _encode_result,
+            _decode_result,
+        )
+
     def _call_api(
         self, prompt: str, image_size: str, aspect_ratio: str
     ) -> tuple[bytes, str]:
@@ -276,6 +294,15 @@ class NB2Provider(AbstractProvider):
         })
 
 
+def _encode_result(result: tuple[bytes, str]) -> dict:
+    img_bytes, thinking_text = result
+    return {"image_b64": base64.b64encode(img_bytes).decode("ascii"), "thinking": thinking_text}
+
+
+def _decode_result(data: dict) -> tuple[bytes, str]:
+    return base64.b64decode(data["image_b64"]), data.get("thinking", "")
+
+
 def _build_nb2_prompt(prompt: str, negative_prompt: str) -> str:
     """Merge positive prompt and negative_prompt into a single NB2-compatible string.
 
@@ -12,6 +12,7 @@ Part of Line D in the VULCA upgrade roadmap.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -103,30 +104,65 @@ class PromptEnhancer:
         str
             Enhanced prompt string, or original subject on failure.
         """
-        if not self._enabled:
-            return subject
-        if not self._model_spec:
-            logger.debug("PromptEnhancer: model %s not found, returning original", self._model_key)
-            return subject
-        if not self._model_spec.get_api_key():
-            logger.debug("PromptEnhancer: no API key for %s, returning original", self._model_key)
+        if not self._can_enhance():
             return subject
 
         try:
             result = self._run_async(
                 self._enhance_async(subject, cultural_tradition, evidence)
             )
-            if result and result.strip() != subject.strip():
-                logger.info(
-                    "Prompt enhanced: %d→%d chars",
-                    len(subject), len(result),
-                )
-                return result
+            return self._accept(subject, result)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Prompt enhancement failed, using original: %s", exc)
 
         return subject
 
+    async def aenhance(
+        self,
+        subject: str,
+        cultural_tradition: str,
+        evidence: dict | None = None,
+    ) -> str:
+        """Async counterpart of ``enhance`` for callers already on an event loop.
+
+        Awaits the LLM call directly instead of going through the sync→async
+        thread-pool bridge.  Same fallbacks: original subject on any failure.
+        """
+        if not self._can_enhance():
+            return subject
+
+        try:
+            result = await asyncio.wait_for(
+                self._enhance_async(subject, cultural_tradition, evidence),
+                timeout=30,
+            )
+            return self._accept(subject, result)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Prompt enhancement failed, using original: %s", exc)
+
+        return subject
+
+    def _can_enhance(self) -> bool:
+        if not self._enabled:
+            return False
+        if not self._model_spec:
+            logger.debug("PromptEnhancer: model %s not found, returning original", self._model_key)
+            return False
+        if not self._model_spec.get_api_key():
+            logger.debug("PromptEnhancer: no API key for %s, returning original", self._model_key)
+            return False
+        return True
+
+    @staticmethod
+    def _accept(subject: str, result: str | None) -> str:
+        if result and result.strip() != subject.strip():
+            logger.info(
+                "Prompt enhanced: %d→%d chars",
+                len(subject), len(result),
+            )
+            return result
+        return subject
+
     # ------------------------------------------------------------------
     # Async implementation
     # ------------------------------------------------------------------
@@ -138,7 +174,7 @@ class PromptEnhancer:
         evidence: dict | None,
     ) -> str:
         """Call LLM to enhance the prompt."""
-        import litellm
+        from app.prototype.agents import llm_gateway
 
         spec = self._model_spec
         if spec is None:
@@ -185,7 +221,7 @@ class PromptEnhancer:
             extra_kwargs["api_key"] = api_key
 
         t0 = time.monotonic()
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=spec.litellm_id,
             messages=messages,
             max_tokens=512,
@@ -20,6 +20,7 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -69,8 +70,7 @@ class QueenLLMConfig:
         }
 
 
-def _try_llm_call(model: str, messages: list[dict], temperature: float, max_tokens: int) -> str | None:
-    """Attempt an LLM call via LiteLLM (Gemini direct). Returns response text or None."""
+def _has_api_key() -> bool:
     api_key = (
         os.environ.get("GOOGLE_API_KEY")
         or os.environ.get("GEMINI_API_KEY")
@@ -78,11 +78,38 @@ def _try_llm_call(model: str, messages: list[dict], temperature: float, max_toke
     )
     if not api_key:
         logger.warning("No API key found (GOOGLE_API_KEY / GEMINI_API_KEY)")
+    return bool(api_key)
+
+
+def _try_llm_call(model: str, messages: list[dict], temperature: float, max_tokens: int) -> str | None:
+    """Attempt an LLM call via LiteLLM (Gemini direct). Returns response text or None."""
+    if not _has_api_key():
+        return None
+
+    try:
+        from app.prototype.agents import llm_gateway
+        resp = llm_gateway.completion(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=30.0,
+        )
+        return resp.choices[0].message.content
+    except Exception as exc:
+        logger.warning("LLM call failed (%s): %s", model, exc)
+
+    return None
+
+
+async def _atry_llm_call(model: str, messages: list[dict], temperature: float, max_tokens: int) -> str | None:
+    """Awaitable ``_try_llm_call``."""
+    if not _has_api_key():
         return None
 
     try:
-        import litellm
-        resp = litellm.completion(
+        from app.prototype.agents import llm_gateway
+        resp = await llm_gateway.acompletion(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -134,6 +161,46 @@ class QueenLLMAgent:
         4. Parse LLM response; if confidence < threshold → fallback to rules
         """
         t0 = time.monotonic()
+        best_id, best_score, best_gate, rule_reason = self._triage(critique_output_dict, plan_state)
+        if rule_reason is not None:
+            return self._rule_decide(critique_output_dict, plan_state, t0, rule_reason)
+
+        # --- Ambiguous range: try LLM ---
+        llm_decision = self._try_llm_decide(
+            critique_output_dict, plan_state, best_score, best_gate
+        )
+        return self._apply_decision(
+            critique_output_dict, plan_state, t0, best_id, best_score, best_gate, llm_decision,
+        )
+
+    async def adecide(
+        self,
+        critique_output_dict: dict,
+        plan_state: PlanState,
+    ) -> QueenOutput:
+        """Awaitable ``decide``: the LLM call is awaited on the running loop."""
+        t0 = time.monotonic()
+        best_id, best_score, best_gate, rule_reason = self._triage(critique_output_dict, plan_state)
+        if rule_reason is not None:
+            return self._rule_decide(critique_output_dict, plan_state, t0, rule_reason)
+
+        llm_decision = await self._atry_llm_decide(
+            critique_output_dict, plan_state, best_score, best_gate
+        )
+        return self._apply_decision(
+            critique_output_dict, plan_state, t0, best_id, best_score, best_gate, llm_decision,
+        )
+
+    def _triage(
+        self,
+        critique_output_dict: dict,
+        plan_state: PlanState,
+    ) -> tuple[str | None, float, bool, str | None]:
+        """Return (best_id, best_score, best_gate, rule_reason).
+
+        ``rule_reason`` is set when a guardrail or clear-cut score makes
+        the LLM unnecessary.
+        """
         cfg = self._config
 
         # Extract current state
@@ -156,19 +223,31 @@ class QueenLLMAgent:
         next_round = budget.rounds_used + 1
 
         if next_round > cfg.max_rounds:
-            return self._rule_decide(critique_output_dict, plan_state, t0, "max_rounds")
+            return best_id, best_score, best_gate, "max_rounds"
 
         if budget.total_cost_usd >= cfg.max_cost_usd:
-            return self._rule_decide(critique_output_dict, plan_state, t0, "budget_exhausted")
+            return best_id, best_score, best_gate, "budget_exhausted"
 
         # Clear-cut cases: no need for LLM
         if best_gate and best_score >= cfg.early_stop_threshold:
-            return self._rule_decide(critique_output_dict, plan_state, t0, "early_stop")
+            return best_id, best_score, best_gate, "early_stop"
 
-        # --- Ambiguous range: try LLM ---
-        llm_decision = self._try_llm_decide(
-            critique_output_dict, plan_state, best_score, best_gate
-        )
+        return best_id, best_score, best_gate, None
+
+    def _apply_decision(
+        self,
+        critique_output_dict: dict,
+        plan_state: PlanState,
+        t0: float,
+        best_id: str | None,
+        best_score: float,
+        best_gate: bool,
+        llm_decision: QueenDecision | None,
+    ) -> QueenOutput:
+        """Record an LLM decision in the plan state, or fall back to rules."""
+        cfg = self._config
+        budget = plan_state.budget
+        scored = critique_output_dict.get("scored_candidates", [])
 
         if llm_decision is not None:
             # Update budget state (same as rule-based)
@@ -240,6 +319,44 @@ class QueenLLMAgent:
         Returns QueenDecision if successful, None if should fall back.
         """
         lcfg = self._llm_config
+        messages = self._llm_messages(critique_output_dict, plan_state, best_score, best_gate)
+        response = _try_llm_call(
+            model=lcfg.model,
+            messages=messages,
+            temperature=lcfg.temperature,
+            max_tokens=lcfg.max_tokens,
+        )
+        return self._check_response(response, critique_output_dict)
+
+    async def _atry_llm_decide(
+        self,
+        critique_output_dict: dict,
+        plan_state: PlanState,
+        best_score: float,
+        best_gate: bool,
+    ) -> QueenDecision | None:
+        """Awaitable ``_try_llm_decide``; RAG retrieval runs in a worker thread."""
+        lcfg = self._llm_config
+        messages = await asyncio.to_thread(
+            self._llm_messages, critique_output_dict, plan_state, best_score, best_gate,
+        )
+        response = await _atry_llm_call(
+            model=lcfg.model,
+            messages=messages,
+            temperature=lcfg.temperature,
+            max_tokens=lcfg.max_tokens,
+        )
+        return self._check_response(response, critique_output_dict)
+
+    def _llm_messages(
+        self,
+        critique_output_dict: dict,
+        plan_state: PlanState,
+        best_score: float,
+        best_gate: bool,
+    ) -> list[dict]:
+        """Build the chat messages, with similar past trajectories as examples."""
+        lcfg = self._llm_config
 
         # Retrieve similar trajectories
         subject = ""
@@ -266,19 +383,16 @@ class QueenLLMAgent:
             critique_output_dict, plan_state, best_score, best_gate, examples_prompt
         )
 
-        # Call LLM
-        messages = [
+        return [
             {"role": "system", "content": self._system_prompt(tradition=tradition)},
             {"role": "user", "content": prompt},
         ]
 
-        response = _try_llm_call(
-            model=lcfg.model,
-            messages=messages,
-            temperature=lcfg.temperature,
-            max_tokens=lcfg.max_tokens,
-        )
-
+    def _check_response(
+        self, response: str | None, critique_output_dict: dict,
+    ) -> QueenDecision | None:
+        """Parse the LLM reply; None means fall back to rules."""
+        lcfg = self._llm_config
         if response is None:
             logger.info("LLM call failed, falling back to rules")
             return None
@@ -2,12 +2,29 @@
 
 Each tool has a JSON schema (for LLM function calling) and an executor
 that performs the actual operation using existing services.
+
+Synchronous executors (FAISS/JSON lookups) run on a small shared thread
+pool so they never block the event loop; trivial ones (``inline`` tools
+such as submit_evaluation) run directly on the loop.  A registry memoizes
+the results of side-effect-free tools, and identical calls already in
+flight share one execution: a registry is built per Critic run, so
+identical lookups made by different layers are answered once.
+
+Environment variables:
+- ``VULCA_TOOL_WORKERS``: threads for synchronous tool executors (default 4)
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Callable, Coroutine
 
 logger = logging.getLogger(__name__)
@@ -23,6 +40,21 @@ __all__ = [
     "build_critic_tool_registry",
 ]
 
+_TOOL_WORKERS = int(os.environ.get("VULCA_TOOL_WORKERS", "4"))
+_tool_executor: ThreadPoolExecutor | None = None
+_tool_executor_lock = threading.Lock()
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    global _tool_executor  # noqa: PLW0603
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(
+                    max_workers=_TOOL_WORKERS, thread_name_prefix="critic-tool",
+                )
+    return _tool_executor
+
 
 @dataclass
 class ToolDef:
@@ -32,6 +64,8 @@ class ToolDef:
     description: str
     parameters: dict[str, Any]
     executor: Callable[..., Coroutine[Any, Any, Any]] | Callable[..., Any]
+    memoize: bool = False            # result depends only on the arguments
+    inline: bool = False             # cheap and non-blocking: run on the event loop
 
     def to_openai_schema(self) -> dict:
         """Return OpenAI-compatible function tool schema."""
@@ -46,10 +80,19 @@ class ToolDef:
 
 
 class ToolRegistry:
-    """Registry of available tools for Agent runtime."""
+    """Registry of available tools for Agent runtime.
+
+    Results of ``memoize`` tools are kept for the registry's lifetime and
+    shared between callers — treat them as read-only.
+    """
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDef] = {}
+        self._memo: dict[tuple[str, str], Any] = {}
+        self._inflight: dict[tuple[str, str], concurrent.futures.Future] = {}
+        self._memo_lock = threading.Lock()
+        self._memo_hits = 0
+        self._coalesced = 0
 
     def register(self, tool: ToolDef) -> None:
         self._tools[tool.name] = tool
@@ -70,17 +113,66 @@ class ToolRegistry:
         if tool is None:
             logger.warning("Tool not found: %s (available: %s)", name, list(self._tools.keys()))
             return {"error": f"Unknown tool: {name}"}
+
+        if not tool.memoize:
+            result, _ = await self._run(tool, arguments)
+            return result
+
+        memo_key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        with self._memo_lock:
+            if memo_key in self._memo:
+                self._memo_hits += 1
+                return self._memo[memo_key]
+            flight = self._inflight.get(memo_key)
+            if flight is None:
+                flight = self._inflight[memo_key] = concurrent.futures.Future()
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+        if not leader:
+            # Futures, not tasks, so callers on other event loops can share it
+            return await asyncio.wrap_future(flight)
+
+        result: Any = {"error": "Tool execution cancelled"}
+        try:
+            result, ok = await self._run(tool, arguments)
+            if ok:
+                with self._memo_lock:
+                    self._memo[memo_key] = result
+            return result
+        finally:
+            with self._memo_lock:
+                self._inflight.pop(memo_key, None)
+            flight.set_result(result)
+
+    async def _run(self, tool: ToolDef, arguments: dict) -> tuple[Any, bool]:
+        """Run *tool*; returns ``(result, succeeded)`` with an error dict on failure."""
         try:
-            import asyncio
             if asyncio.iscoroutinefunction(tool.executor):
                 result = await tool.executor(**arguments)
-            else:
+            elif tool.inline:
                 result = tool.executor(**arguments)
-            logger.debug("Tool %s executed successfully (args=%s)", name, list(arguments.keys()))
-            return result
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    _get_tool_executor(), partial(tool.executor, **arguments),
+                )
+            logger.debug("Tool %s executed successfully (args=%s)", tool.name, list(arguments.keys()))
         except Exception as exc:  # noqa: BLE001
-            logger.error("Tool %s execution failed: %s", name, exc, exc_info=True)
-            return {"error": f"Tool execution failed: {exc}"}
+            logger.error("Tool %s execution failed: %s", tool.name, exc, exc_info=True)
+            return {"error": f"Tool execution failed: {exc}"}, False
+        return result, True
+
+    async def execute_many(self, calls: list[tuple[str, dict]]) -> list[Any]:
+        """Execute ``(name, arguments)`` calls concurrently; results in call order."""
+        return list(await asyncio.gather(
+            *(self.execute(name, arguments) for name, arguments in calls)
+        ))
+
+    def memo_stats(self) -> dict[str, int]:
+        with self._memo_lock:
+            return {"hits": self._memo_hits, "coalesced": self._coalesced, "size": len(self._memo)}
 
 
 # ---------------------------------------------------------------------------
@@ -230,6 +322,7 @@ def build_critic_tool_registry(
         ),
         parameters=SEARCH_CULTURAL_REFERENCES_SCHEMA,
         executor=_search_cultural_references,
+        memoize=True,
     ))
 
     # --- lookup_terminology ---
@@ -253,6 +346,7 @@ def build_critic_tool_registry(
         ),
         parameters=LOOKUP_TERMINOLOGY_SCHEMA,
         executor=_lookup_terminology,
+        memoize=True,
     ))
 
     # --- check_cultural_sensitivity ---
@@ -273,6 +367,7 @@ def build_critic_tool_registry(
         ),
         parameters=CHECK_CULTURAL_SENSITIVITY_SCHEMA,
         executor=_check_cultural_sensitivity,
+        memoize=True,
     ))
 
     # --- read_layer_analysis ---
@@ -314,6 +409,7 @@ def build_critic_tool_registry(
         ),
         parameters=READ_LAYER_ANALYSIS_SCHEMA,
         executor=_read_layer_analysis,
+        inline=True,
     ))
 
     # --- submit_evaluation ---
@@ -339,6 +435,7 @@ def build_critic_tool_registry(
         ),
         parameters=SUBMIT_EVALUATION_SCHEMA,
         executor=_submit_evaluation,
+        inline=True,
     ))
 
     return registry
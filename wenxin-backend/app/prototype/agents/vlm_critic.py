@@ -14,7 +14,7 @@ Part of Line A in the VULCA upgrade roadmap.
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import logging
 import time
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Any
 
 from app.prototype.agents.model_router import MODELS, ModelSpec
+from app.prototype.tools.image_prep import get_image_prep
 from app.prototype.utils.async_bridge import run_async_from_sync
 
 logger = logging.getLogger(__name__)
@@ -146,13 +147,8 @@ class VLMCritic:
 
         Returns None if VLM unavailable or image not found.
         """
-        if not self.available:
-            logger.debug("VLM critic unavailable (no API key)")
-            return None
-
-        path = Path(image_path)
-        if not path.exists():
-            logger.debug("Image not found for VLM scoring: %s", image_path)
+        path = self._scorable_path(image_path)
+        if path is None:
             return None
 
         try:
@@ -165,25 +161,71 @@ class VLMCritic:
                     evidence=evidence,
                 )
             )
-            self._consecutive_failures = 0  # Reset on success
-            return result
         except Exception as exc:  # noqa: BLE001
-            self._consecutive_failures += 1
-            logger.warning(
-                "VLM scoring failed for %s (%d/%d): %s",
-                image_path, self._consecutive_failures,
-                self._max_consecutive_failures, exc,
+            self._record_failure(image_path, exc)
+            return None
+        self._consecutive_failures = 0  # Reset on success
+        return result
+
+    async def ascore_image(
+        self,
+        image_path: str,
+        subject: str,
+        cultural_tradition: str,
+        prompt: str = "",
+        evidence: dict | None = None,
+    ) -> dict[str, float] | None:
+        """Awaitable ``score_image`` for callers already on an event loop."""
+        path = self._scorable_path(image_path)
+        if path is None:
+            return None
+
+        try:
+            result = await asyncio.wait_for(
+                self._score_async(
+                    image_path=str(path),
+                    subject=subject,
+                    tradition=cultural_tradition,
+                    prompt=prompt,
+                    evidence=evidence,
+                ),
+                timeout=30,  # same budget as the sync bridge
             )
-            # Disable after N consecutive failures to avoid repeated timeouts.
-            # Singleton is reset between ablation conditions by run_ablation.
-            if self._consecutive_failures >= self._max_consecutive_failures:
-                import time as _time
-                logger.error("VLM disabled after %d consecutive failures (will retry in %.0fs)",
-                             self._consecutive_failures, self._circuit_break_cooldown_sec)
-                self._available = False
-                self._circuit_break_time = _time.monotonic()
+        except Exception as exc:  # noqa: BLE001
+            self._record_failure(image_path, exc)
+            return None
+        self._consecutive_failures = 0  # Reset on success
+        return result
+
+    def _scorable_path(self, image_path: str) -> Path | None:
+        """Return the image path if VLM scoring can be attempted, else None."""
+        if not self.available:
+            logger.debug("VLM critic unavailable (no API key)")
             return None
 
+        path = Path(image_path)
+        if not path.exists():
+            logger.debug("Image not found for VLM scoring: %s", image_path)
+            return None
+        return path
+
+    def _record_failure(self, image_path: str, exc: Exception) -> None:
+        """Count a failed call and trip the circuit breaker after N in a row."""
+        self._consecutive_failures += 1
+        logger.warning(
+            "VLM scoring failed for %s (%d/%d): %s",
+            image_path, self._consecutive_failures,
+            self._max_consecutive_failures, exc,
+        )
+        # Disable after N consecutive failures to avoid repeated timeouts.
+        # Singleton is reset between ablation conditions by run_ablation.
+        if self._consecutive_failures >= self._max_consecutive_failures:
+            import time as _time
+            logger.error("VLM disabled after %d consecutive failures (will retry in %.0fs)",
+                         self._consecutive_failures, self._circuit_break_cooldown_sec)
+            self._available = False
+            self._circuit_break_time = _time.monotonic()
+
     # ------------------------------------------------------------------
     # Async implementation
     # ------------------------------------------------------------------
@@ -197,14 +239,14 @@ class VLMCritic:
         evidence: dict | None = None,
     ) -> dict[str, float] | None:
         """Call VLM to score the image."""
-        import litellm
+        from app.prototype.agents import llm_gateway
 
         spec = self._model_spec
         if spec is None:
             return None
 
-        # Encode image to base64
-        image_b64, mime_type = self._encode_image(image_path)
+        # Encode image to base64 (file read + resize, kept off the event loop)
+        image_b64, mime_type = await asyncio.to_thread(self._encode_image, image_path)
         if not image_b64:
             return None
 
@@ -287,9 +329,10 @@ class VLMCritic:
             extra_kwargs["api_key"] = api_key
 
         t0 = time.monotonic()
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=spec.litellm_id,
             messages=messages,
+            cache=True,  # same image + prompt -> same scores
             max_tokens=4096,  # Gemini 2.5 Flash thinking tokens count toward limit
             temperature=0.1,  # low temp for consistent scoring
             timeout=55,  # must finish before ThreadPoolExecutor's 60s timeout
@@ -313,29 +356,10 @@ class VLMCritic:
 
     @staticmethod
     def _encode_image(image_path: str) -> tuple[str, str]:
-        """Encode image to base64 with MIME type detection."""
-        path = Path(image_path)
-        suffix = path.suffix.lower()
-
-        mime_map = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".webp": "image/webp",
-        }
-        mime_type = mime_map.get(suffix, "image/png")
-
+        """Encode image to base64 (downscaled, cached) with MIME type detection."""
         try:
-            data = path.read_bytes()
-            # Auto-detect from magic bytes
-            if data[:4] == b"\x89PNG":
-                mime_type = "image/png"
-            elif data[:2] == b"\xff\xd8":
-                mime_type = "image/jpeg"
-            elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
-                mime_type = "image/webp"
-
-            return base64.b64encode(data).decode("ascii"), mime_type
+            prepared = get_image_prep().prepare_path(image_path)
+            return prepared.b64, prepared.mime_type
         except Exception as exc:
             logger.warning("Failed to encode image %s: %s", image_path, exc)
             return "", ""
@@ -12,10 +12,8 @@ import asyncio
 import json
 import logging
 import os
-import threading
 import time
 import uuid
-from threading import Thread
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
@@ -23,6 +21,7 @@ from pydantic import BaseModel, Field
 
 from app.prototype.api.auth import verify_api_key
 from app.prototype.digestion.feature_extractor import extract_cultural_features
+from app.prototype.orchestrator.event_bus import TERMINAL_EVENTS, EventBus
 from app.prototype.orchestrator.events import EventType, PipelineEvent
 from app.prototype.session.store import SessionStore
 from app.prototype.session.types import RoundSnapshot, SessionDigest
@@ -40,7 +39,7 @@ create_router = APIRouter(prefix="/api/v1", tags=["create"])
 async def _extract_cultural_features_async(intent: str, tradition: str = "default") -> dict:
     """Tier-2: Extract semantic cultural features via LLM.
 
-    Uses litellm.acompletion() with gemini-2.0-flash to extract:
+    Uses the LLM gateway with gemini-2.0-flash to extract:
     - style_elements: list of style elements (e.g., "水墨留白", "geometric patterns")
     - emotional_tone: list of emotional tones (e.g., "serene", "dramatic")
     - technique_markers: list of technique markers (e.g., "wet-on-wet", "impasto")
@@ -52,7 +51,7 @@ async def _extract_cultural_features_async(intent: str, tradition: str = "defaul
         return {}
 
     try:
-        import litellm
+        from app.prototype.agents import llm_gateway
 
         prompt = (
             "You are a cultural art analyst. Given the following creation intent and cultural tradition, "
@@ -75,7 +74,7 @@ async def _extract_cultural_features_async(intent: str, tradition: str = "defaul
 
         from app.prototype.agents.model_router import MODEL_FAST
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
@@ -138,9 +137,9 @@ async def _enrich_cultural_features_background(
         )
 
 
-# In-memory event buffers for SSE (mirrors routes.py pattern)
-_create_event_buffers: dict[str, list[PipelineEvent]] = {}
-_create_buffer_lock = threading.Lock()
+# Push-based SSE event channels (mirrors routes.py pattern)
+_create_event_bus = EventBus(closed_ttl_sec=300)  # session_id -> event channel
+_create_background_runs: set[asyncio.Future] = set()  # strong refs to running pipelines
 
 
 class CreateRequest(BaseModel):
@@ -402,7 +401,7 @@ async def _run_create_mode_sync(
     candidate_image_urls: dict[str, str] = {}
     state: dict = {"best_candidate_id": "", "total_rounds": 0, "total_cost": 0.0}
 
-    for event in orchestrator.run_stream(pipeline_input):
+    async for event in orchestrator.arun_stream(pipeline_input):
         _process_pipeline_event(event, rounds, candidate_image_urls, final_scores, state)
 
     best_candidate_id = state["best_candidate_id"]
@@ -453,6 +452,39 @@ async def _run_create_mode_sync(
     )
 
 
+async def _fail_stream_run(
+    channel,
+    session_id: str,
+    tradition: str,
+    exc: Exception,
+    t0: float,
+) -> None:
+    """Publish a terminal failure event and record the run as failed.
+
+    Used when ``arun_stream`` itself raises, so SSE subscribers are not left
+    waiting for a terminal event until they time out.
+    """
+    from app.prototype.checkpoints.pipeline_checkpoint import update_runs_index
+
+    elapsed_ms = int((time.monotonic() - t0) * 1000)
+    error = f"{type(exc).__name__}: {exc}"
+    if not channel.closed:
+        channel.publish(PipelineEvent(
+            event_type=EventType.PIPELINE_FAILED,
+            payload={"task_id": session_id, "success": False, "error": error},
+            timestamp_ms=elapsed_ms,
+        ))
+    try:
+        await asyncio.to_thread(update_runs_index, session_id, {
+            "status": "failed",
+            "tradition": tradition,
+            "error": error,
+            "total_latency_ms": elapsed_ms,
+        })
+    except Exception as index_exc:
+        logger.warning("Failed to record failed run %s: %s", session_id, index_exc)
+
+
 def _run_create_mode_stream(
     req: CreateRequest,
     session_id: str,
@@ -487,20 +519,25 @@ def _run_create_mode_stream(
         cultural_tradition=req.tradition,
     )
 
-    with _create_buffer_lock:
-        _create_event_buffers[session_id] = []
+    channel = _create_event_bus.open(session_id)
 
-    def _run_in_background() -> None:
+    async def _run_in_background() -> None:
         t0 = time.monotonic()
         rounds: list[RoundSnapshot] = []
         final_scores: dict[str, float] = {}
         candidate_image_urls: dict[str, str] = {}
         state: dict = {"best_candidate_id": "", "total_rounds": 0, "total_cost": 0.0}
 
-        for event in orchestrator.run_stream(pipeline_input):
-            with _create_buffer_lock:
-                _create_event_buffers.setdefault(session_id, []).append(event)
-            _process_pipeline_event(event, rounds, candidate_image_urls, final_scores, state)
+        try:
+            async for event in orchestrator.arun_stream(pipeline_input):
+                channel.publish(event)
+                _process_pipeline_event(event, rounds, candidate_image_urls, final_scores, state)
+        except Exception as exc:
+            logger.exception("Create (stream mode) pipeline %s failed", session_id)
+            await _fail_stream_run(channel, session_id, req.tradition, exc, t0)
+            return
+        finally:
+            channel.close()
 
         best_candidate_id = state["best_candidate_id"]
         best_image_url = candidate_image_urls.get(best_candidate_id, "")
@@ -527,46 +564,34 @@ def _run_create_mode_stream(
             final_scores=final_scores,
             risk_flags=[],
         )
-        SessionStore.get().append(digest)
+        await asyncio.to_thread(SessionStore.get().append, digest)
 
-        # Tier-2 LLM enrichment (within background thread, need new event loop)
+        # Tier-2 LLM enrichment (same event loop, no extra thread)
         try:
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(_enrich_cultural_features_background(
+            await _enrich_cultural_features_background(
                 digest, intent=req.intent, tradition=req.tradition,
-            ))
-            loop.close()
+            )
         except Exception as exc:
             logger.warning("Streaming mode Tier-2 enrichment failed: %s", exc)
 
-    thread = Thread(target=_run_in_background, daemon=True)
-    thread.start()
+    task = asyncio.ensure_future(_run_in_background())
+    _create_background_runs.add(task)
+    task.add_done_callback(_create_background_runs.discard)
 
     async def generate():
         # First emit session metadata
         meta = {"session_id": session_id, "mode": "create", "tradition": req.tradition}
         yield f"data: {json.dumps(meta)}\n\n"
 
-        seen = 0
         max_wait = 300
-        start = time.monotonic()
-
-        while time.monotonic() - start < max_wait:
-            with _create_buffer_lock:
-                buffer = list(_create_event_buffers.get(session_id, []))
-            while seen < len(buffer):
-                event = buffer[seen]
-                seen += 1
-                data = json.dumps(event.to_dict(), ensure_ascii=False)
-                yield f"data: {data}\n\n"
-
-                if event.event_type in (EventType.PIPELINE_COMPLETED, EventType.PIPELINE_FAILED):
-                    # Cleanup buffer
-                    with _create_buffer_lock:
-                        _create_event_buffers.pop(session_id, None)
-                    return
-
-            await asyncio.sleep(0.1)
+
+        async for _seq, event in channel.subscribe(timeout=max_wait):
+            data = json.dumps(event.to_dict(), ensure_ascii=False)
+            yield f"data: {data}\n\n"
+
+            if event.event_type in TERMINAL_EVENTS:
+                _create_event_bus.discard(session_id)
+                return
 
         yield f"data: {json.dumps({'event_type': 'timeout', 'payload': {}})}\n\n"
 
@@ -510,8 +510,7 @@ async def _call_vlm_tradition(vlm: object, image_path: str, tradition_list: str)
     import base64
     from pathlib import Path
 
-    import litellm
-
+    from app.prototype.agents import llm_gateway
     from app.prototype.agents.model_router import MODELS
 
     spec = MODELS.get("gemini_direct")
@@ -557,9 +556,10 @@ async def _call_vlm_tradition(vlm: object, image_path: str, tradition_list: str)
     if api_key:
         extra["api_key"] = api_key
 
-    response = await litellm.acompletion(
+    response = await llm_gateway.acompletion(
         model=spec.litellm_id,
         messages=messages,
+        cache=True,
         max_tokens=4096,
         temperature=0.1,
         timeout=55,
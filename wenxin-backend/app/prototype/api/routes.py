@@ -13,14 +13,13 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-import threading
 import time
 import uuid
 from threading import Thread
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.prototype.api.auth import verify_api_key
@@ -36,8 +35,9 @@ from app.prototype.api.schemas import (
     ValidateTopologyRequest,
     ValidationResponse,
 )
-from app.prototype.checkpoints.pipeline_checkpoint import load_pipeline_output
-from app.prototype.orchestrator.events import EventType, PipelineEvent
+from app.prototype.checkpoints.pipeline_checkpoint import load_pipeline_output, query_runs_index
+from app.prototype.orchestrator.event_bus import TERMINAL_EVENTS, EventBus
+from app.prototype.orchestrator.events import PipelineEvent
 from app.prototype.orchestrator.orchestrator import PipelineOrchestrator
 from app.prototype.orchestrator.run_state import RunStatus
 from app.prototype.pipeline.pipeline_types import PipelineInput
@@ -64,9 +64,9 @@ router = APIRouter(prefix="/api/v1/prototype", tags=["prototype"])
 # In-memory stores (sufficient for prototype stage)
 _orchestrators: dict[str, PipelineOrchestrator] = {}
 _run_metadata: dict[str, dict] = {}   # task_id -> {subject, tradition, created_at, ...}
-_event_buffers: dict[str, list[PipelineEvent]] = {}
+_event_bus = EventBus()  # task_id -> event channel (SSE fan-out)
 _idempotency_map: dict[str, str] = {}  # idempotency_key -> task_id
-_buffer_lock = threading.Lock()  # Protects _event_buffers writes/reads
+_background_runs: set[asyncio.Task] = set()  # strong refs to running pipeline tasks
 
 # Guest rate limit (simple counter)
 _guest_runs_today: dict[str, int] = {}  # date_str -> count
@@ -98,8 +98,7 @@ def _cleanup_expired_runs() -> None:
     for tid in expired:
         _orchestrators.pop(tid, None)
         _run_metadata.pop(tid, None)
-        with _buffer_lock:
-            _event_buffers.pop(tid, None)
+        _event_bus.discard(tid)
 
 
 @router.post("/runs")
@@ -203,35 +202,32 @@ async def create_run(req: CreateRunRequest) -> RunStatusResponse:
         "created_at": time.time(),
         "node_params": req.node_params,
     }
-    with _buffer_lock:
-        _event_buffers[task_id] = []
+    _event_bus.open(task_id)
 
     if req.idempotency_key:
         _idempotency_map[req.idempotency_key] = task_id
 
-    # Run pipeline in background thread
+    # Run pipeline in the background
     pipeline_input = PipelineInput(
         task_id=task_id, subject=req.subject, cultural_tradition=req.tradition,
     )
 
-    def _run_in_background() -> None:
-      try:
-        from app.prototype.api.create_routes import _build_implicit_feedback, _process_pipeline_event
-        from app.prototype.digestion.feature_extractor import extract_cultural_features
-        from app.prototype.session.store import SessionStore
-        from app.prototype.session.types import RoundSnapshot, SessionDigest
-
-        rounds: list[RoundSnapshot] = []
-        final_scores: dict[str, float] = {}
-        candidate_image_urls: dict[str, str] = {}
-        state: dict = {"best_candidate_id": "", "total_rounds": 0, "total_cost": 0.0}
-        t0 = time.monotonic()
-
-        for event in orchestrator.run_stream(pipeline_input):
-            with _buffer_lock:
-                _event_buffers.setdefault(task_id, []).append(event)
-            _process_pipeline_event(event, rounds, candidate_image_urls, final_scores, state)
+    from app.prototype.api.create_routes import _build_implicit_feedback, _process_pipeline_event
+    from app.prototype.digestion.feature_extractor import extract_cultural_features
+    from app.prototype.session.store import SessionStore
+    from app.prototype.session.types import RoundSnapshot, SessionDigest
+
+    rounds: list[RoundSnapshot] = []
+    final_scores: dict[str, float] = {}
+    candidate_image_urls: dict[str, str] = {}
+    state: dict = {"best_candidate_id": "", "total_rounds": 0, "total_cost": 0.0}
+    t0 = time.monotonic()
 
+    def _on_event(event: PipelineEvent) -> None:
+        _event_bus.publish(task_id, event)
+        _process_pipeline_event(event, rounds, candidate_image_urls, final_scores, state)
+
+    def _finish_run() -> None:
         # Mark this run as completed so cleanup won't remove it prematurely
         if task_id in _run_metadata:
             _run_metadata[task_id]["completed"] = True
@@ -280,13 +276,38 @@ async def create_run(req: CreateRunRequest) -> RunStatusResponse:
 
         # Cleanup expired runs after pipeline completes
         _cleanup_expired_runs()
-      except Exception:
-        logging.getLogger("vulca.pipeline").exception(
-            "Background pipeline %s crashed", task_id,
-        )
 
-    thread = Thread(target=_run_in_background, daemon=True)
-    thread.start()
+    async def _run_on_loop() -> None:
+        try:
+            async for event in orchestrator.arun_stream(pipeline_input):
+                _on_event(event)
+            await asyncio.to_thread(_finish_run)
+        except Exception:
+            logging.getLogger("vulca.pipeline").exception(
+                "Background pipeline %s crashed", task_id,
+            )
+
+    def _run_in_background() -> None:
+        try:
+            for event in orchestrator.run_stream(pipeline_input):
+                _on_event(event)
+            _finish_run()
+        except Exception:
+            logging.getLogger("vulca.pipeline").exception(
+                "Background pipeline %s crashed", task_id,
+            )
+
+    if hasattr(orchestrator, "arun_stream"):
+        # PipelineOrchestrator: driven by this event loop, no thread per run
+        task = asyncio.create_task(_run_on_loop())
+        _background_runs.add(task)
+        task.add_done_callback(_background_runs.discard)
+        # Let the task start so its RunState exists before we respond
+        await asyncio.sleep(0)
+    else:
+        # GraphOrchestrator only has the synchronous stream
+        thread = Thread(target=_run_in_background, daemon=True)
+        thread.start()
 
     return RunStatusResponse(
         task_id=task_id,
@@ -371,6 +392,35 @@ async def validate_topology(req: ValidateTopologyRequest) -> ValidationResponse:
         return ValidationResponse(valid=False, errors=[str(e)])
 
 
+@router.get("/runs")
+async def list_runs(
+    status: str | None = None,
+    tradition: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+):
+    """List recorded pipeline runs, newest first, one page at a time.
+
+    Query params:
+        status / tradition: Exact-match filters (optional).
+        since / until:      ISO-8601 bounds on created_at (inclusive / exclusive).
+        limit:              Page size (default 50, max 1000).
+        cursor:             ``next_cursor`` from the previous page.
+    """
+    try:
+        # Keyset page on the runs index; only this page is read
+        page = await asyncio.to_thread(
+            query_runs_index,
+            status=status, tradition=tradition, since=since, until=until,
+            limit=limit, cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"items": page.entries, "next_cursor": page.next_cursor}
+
+
 @router.get("/runs/{task_id}")
 async def get_run_status(task_id: str) -> RunStatusResponse:
     """Get the current status of a pipeline run."""
@@ -378,30 +428,27 @@ async def get_run_status(task_id: str) -> RunStatusResponse:
 
 
 @router.get("/runs/{task_id}/events")
-async def stream_events(task_id: str) -> StreamingResponse:
-    """SSE event stream for a pipeline run."""
+async def stream_events(task_id: str, request: Request) -> StreamingResponse:
+    """SSE event stream for a pipeline run.
+
+    Events are pushed as soon as they are published.  Each carries an SSE
+    ``id`` (its sequence number), so a reconnecting EventSource resumes via
+    ``Last-Event-ID`` instead of replaying the whole run.
+    """
     if task_id not in _orchestrators and task_id not in _run_metadata:
         raise HTTPException(404, f"Run {task_id} not found")
+    channel = _event_bus.get(task_id) or _event_bus.open(task_id)
+    cursor = _resume_cursor(request.headers.get("last-event-id"))
 
     async def generate():
-        seen = 0
         max_wait = 300  # 5 minutes timeout
-        start = time.monotonic()
-
-        while time.monotonic() - start < max_wait:
-            with _buffer_lock:
-                buffer = list(_event_buffers.get(task_id, []))
-            while seen < len(buffer):
-                event = buffer[seen]
-                seen += 1
-                data = json.dumps(event.to_dict(), ensure_ascii=False)
-                yield f"data: {data}\n\n"
 
-                if event.event_type in (EventType.PIPELINE_COMPLETED, EventType.PIPELINE_FAILED):
-                    return
+        async for seq, event in channel.subscribe(cursor, timeout=max_wait):
+            data = json.dumps(event.to_dict(), ensure_ascii=False)
+            yield f"id: {seq}\ndata: {data}\n\n"
 
-            # Brief async sleep
-            await asyncio.sleep(0.1)
+            if event.event_type in TERMINAL_EVENTS:
+                return
 
         yield f"data: {json.dumps({'event_type': 'timeout', 'payload': {}})}\n\n"
 
@@ -416,6 +463,14 @@ async def stream_events(task_id: str) -> StreamingResponse:
     )
 
 
+def _resume_cursor(last_event_id: str | None) -> int:
+    """Cursor following the SSE ``Last-Event-ID`` header (0 if absent/invalid)."""
+    try:
+        return int(last_event_id) + 1 if last_event_id else 0
+    except ValueError:
+        return 0
+
+
 @router.post("/runs/{task_id}/action")
 async def submit_action(task_id: str, req: SubmitActionRequest) -> SubmitActionResponse:
     """Submit a human-in-the-loop action."""
@@ -453,17 +508,11 @@ def _build_status_response(task_id: str) -> RunStatusResponse:
     if orchestrator:
         run_state = orchestrator.get_run_state(task_id)
         if run_state:
-            # Check event buffer for completion
-            with _buffer_lock:
-                buffer = list(_event_buffers.get(task_id, []))
-            completion_event = None
-            for ev in reversed(buffer):
-                if ev.event_type in (EventType.PIPELINE_COMPLETED, EventType.PIPELINE_FAILED):
-                    completion_event = ev
-                    break
-
-            if completion_event:
-                p = completion_event.payload
+            # Check event stream for completion (terminal events come last)
+            channel = _event_bus.get(task_id)
+            last_event = channel.last_event() if channel is not None else None
+            if last_event is not None and last_event.event_type in TERMINAL_EVENTS:
+                p = last_event.payload
                 return RunStatusResponse(
                     task_id=task_id,
                     status=run_state.status.value,
@@ -593,19 +642,25 @@ async def list_gallery(
     """
     from app.prototype.session.store import SessionStore
 
-    store = SessionStore.get()
-    sessions = store.get_all()
+    # Gallery sort keys -> session index columns
+    sort_key_map = {
+        "newest": "created_at",
+        "score": "weighted_total",
+        "rounds": "total_rounds",
+    }
+    # Filter, sort and paginate on the session index; only the page is read
+    sessions, total = SessionStore.get().list_scored(
+        tradition=tradition or None,
+        sort_by=sort_key_map.get(sort_by, "created_at"),
+        descending=sort_order != "asc",
+        limit=limit,
+        offset=offset,
+    )
 
-    # Build full list of gallery-eligible items (unsliced)
-    gallery_items = []
+    paginated = []
     for s in sessions:
-        if s.get("final_weighted_total") is None and not s.get("final_scores"):
-            continue
-        if tradition and s.get("tradition") != tradition:
-            continue
-
         scores = s.get("final_scores", {})
-        gallery_items.append({
+        paginated.append({
             "id": s.get("session_id", ""),
             "subject": s.get("subject", s.get("intent", "Untitled")),
             "tradition": s.get("tradition", "default"),
@@ -618,21 +673,6 @@ async def list_gallery(
             "created_at": s.get("created_at", 0),
         })
 
-    # Sort
-    sort_key_map = {
-        "newest": "created_at",
-        "score": "overall",
-        "rounds": "total_rounds",
-    }
-    key_field = sort_key_map.get(sort_by, "created_at")
-    reverse = sort_order != "asc"
-    gallery_items.sort(key=lambda x: x.get(key_field, 0), reverse=reverse)
-
-    total = len(gallery_items)
-
-    # Paginate
-    paginated = gallery_items[offset : offset + limit]
-
     return {"items": paginated, "total": total}
 
 
@@ -663,13 +703,7 @@ async def get_evolution_stats():
     stats["total_sessions"] = store.count()
 
     # Active traditions from sessions
-    all_sessions = store.get_all()
-    traditions = set()
-    for s in all_sessions:
-        t = s.get("tradition")
-        if t and t != "default":
-            traditions.add(t)
-    stats["traditions_active"] = sorted(traditions)
+    stats["traditions_active"] = [t for t in store.traditions() if t != "default"]
 
     # Evolved context
     if evolved_path.exists():
@@ -0,0 +1,231 @@
+"""Checkpoint codec — compact, deduplicated encoding for pipeline stages.
+
+Stage checkpoints used to be ``json.dumps(data, indent=2)`` of the full
+evidence dict, every candidate and the embedded ``evidence_pack`` — the
+same large evidence payload rewritten on every round.  This codec:
+
+- serializes with compact JSON (``orjson`` when installed, stdlib otherwise)
+- compresses with ``zstandard`` when installed, else zlib (level 1)
+- moves large top-level values into content-addressed blob files
+  (``blobs/<sha256>.bin``), so a payload repeated across rounds or stages
+  is written once and referenced by hash afterwards
+- decodes into a ``LazyCheckpoint`` that only reads and parses a blob when
+  that field is first accessed
+
+File layout: ``MAGIC (4 bytes) | compression id (1 byte) | body``.  Blob
+files use the same framing.
+
+Environment variables:
+- ``VULCA_CHECKPOINT_COMPRESSION``: ``zstd`` | ``zlib`` | ``none``
+  (default: zstd if available, else zlib)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from app.prototype.checkpoints.utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CheckpointDecodeError",
+    "LazyCheckpoint",
+    "decode_checkpoint",
+    "encode_checkpoint",
+    "is_encoded",
+]
+
+MAGIC = b"VCK1"
+
+_COMP_NONE = 0
+_COMP_ZLIB = 1
+_COMP_ZSTD = 2
+
+# Top-level values whose encoded form is at least this large become blobs
+_BLOB_MIN_BYTES = 2048
+_BLOB_REF_KEY = "__blob__"
+
+try:  # optional fast JSON
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+try:  # optional zstd
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on environment
+    _zstd = None
+
+# ZstdError subclasses Exception, not ValueError
+_BODY_ERRORS: tuple[type[Exception], ...] = (zlib.error, ValueError) + (
+    (_zstd.ZstdError,) if _zstd is not None else ()
+)
+
+
+class CheckpointDecodeError(ValueError):
+    """Raised when a checkpoint or blob file is truncated or corrupted."""
+
+
+# ---------------------------------------------------------------------------
+# Primitive encode / decode
+# ---------------------------------------------------------------------------
+
+
+def _dumps(value: Any) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value)
+        except TypeError:
+            pass  # non-str keys etc. — stdlib is more lenient
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _default_compression() -> int:
+    name = os.environ.get("VULCA_CHECKPOINT_COMPRESSION", "").lower()
+    if name == "none":
+        return _COMP_NONE
+    if name == "zlib" or _zstd is None:
+        return _COMP_ZLIB
+    return _COMP_ZSTD
+
+
+def _frame(body: bytes, compression: int) -> bytes:
+    if compression == _COMP_ZSTD:
+        body = _zstd.ZstdCompressor(level=3).compress(body)
+    elif compression == _COMP_ZLIB:
+        body = zlib.compress(body, 1)
+    return MAGIC + bytes([compression]) + body
+
+
+def _unframe(raw: bytes) -> bytes:
+    if len(raw) < 5 or raw[:4] != MAGIC:
+        raise CheckpointDecodeError("not a checkpoint (bad magic)")
+    compression, body = raw[4], raw[5:]
+    if compression == _COMP_NONE:
+        return body
+    if compression == _COMP_ZSTD and _zstd is None:
+        raise CheckpointDecodeError("checkpoint is zstd-compressed but zstandard is not installed")
+    try:
+        if compression == _COMP_ZLIB:
+            return zlib.decompress(body)
+        if compression == _COMP_ZSTD:
+            return _zstd.ZstdDecompressor().decompress(body)
+    except _BODY_ERRORS as exc:
+        raise CheckpointDecodeError(f"corrupted checkpoint body: {exc}") from exc
+    raise CheckpointDecodeError(f"unknown compression id {compression}")
+
+
+def is_encoded(raw: bytes) -> bool:
+    return raw[:4] == MAGIC
+
+
+# ---------------------------------------------------------------------------
+# Stage encode / decode
+# ---------------------------------------------------------------------------
+
+
+def encode_checkpoint(
+    data: Mapping[str, Any],
+    blob_dir: Path | None,
+    compression: int | None = None,
+) -> bytes:
+    """Encode *data*, spilling large top-level values into *blob_dir*.
+
+    Blobs are named by the SHA-256 of their encoded JSON, so an identical
+    value saved again (next round, next stage) only costs a hash and a
+    ``stat``.  Pass ``blob_dir=None`` to keep everything inline.
+    """
+    if compression is None:
+        compression = _default_compression()
+
+    head: dict[str, Any] = {}
+    for key, value in data.items():
+        if blob_dir is not None and isinstance(value, (dict, list)) and value:
+            encoded = _dumps(value)
+            if len(encoded) >= _BLOB_MIN_BYTES:
+                digest = hashlib.sha256(encoded).hexdigest()
+                blob_path = blob_dir / f"{digest}.bin"
+                if not blob_path.exists():
+                    atomic_write_bytes(blob_path, _frame(encoded, compression))
+                head[key] = {_BLOB_REF_KEY: digest}
+                continue
+        head[key] = value
+    return _frame(_dumps(head), compression)
+
+
+def decode_checkpoint(raw: bytes, blob_dir: Path | None) -> LazyCheckpoint:
+    """Decode a checkpoint written by ``encode_checkpoint`` (blobs stay lazy)."""
+    head = _loads(_unframe(raw))
+    if not isinstance(head, dict):
+        raise CheckpointDecodeError("checkpoint root is not an object")
+    return LazyCheckpoint(head, blob_dir)
+
+
+def _is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and _BLOB_REF_KEY in value
+
+
+class LazyCheckpoint(Mapping[str, Any]):
+    """Read-only mapping over a decoded checkpoint.
+
+    Small fields are available immediately; blob-backed fields are read,
+    decompressed and parsed on first access and then cached.  Use
+    ``to_dict()`` for a plain, fully materialized dict.
+    """
+
+    def __init__(self, head: dict[str, Any], blob_dir: Path | None) -> None:
+        self._head = head
+        self._blob_dir = blob_dir
+        self._resolved: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._resolved:
+            return self._resolved[key]
+        value = self._head[key]
+        if _is_blob_ref(value):
+            value = self._load_blob(value[_BLOB_REF_KEY])
+            self._resolved[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._head)
+
+    def __len__(self) -> int:
+        return len(self._head)
+
+    def is_loaded(self, key: str) -> bool:
+        """True if *key* is inline or its blob has already been read."""
+        return key in self._resolved or not _is_blob_ref(self._head.get(key))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: self[key] for key in self._head}
+
+    def blob_digests(self) -> set[str]:
+        """Digests of every blob this checkpoint references (none are read)."""
+        return {value[_BLOB_REF_KEY] for value in self._head.values() if _is_blob_ref(value)}
+
+    def _load_blob(self, digest: str) -> Any:
+        if self._blob_dir is None:
+            raise CheckpointDecodeError(f"blob {digest[:12]} referenced but no blob directory")
+        path = self._blob_dir / f"{digest}.bin"
+        try:
+            raw = path.read_bytes()
+        except OSError as exc:
+            raise CheckpointDecodeError(f"missing checkpoint blob {path}: {exc}") from exc
+        body = _unframe(raw)
+        if hashlib.sha256(body).hexdigest() != digest:
+            raise CheckpointDecodeError(f"checkpoint blob {path} failed hash check")
+        return _loads(body)
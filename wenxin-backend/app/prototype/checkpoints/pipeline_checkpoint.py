@@ -2,54 +2,160 @@
 
 from __future__ import annotations
 
-import fcntl
 import json
 import logging
 import os
+import threading
+from collections.abc import Mapping
 from pathlib import Path
-
+from typing import Any
+
+from app.prototype.checkpoints.codec import (
+    CheckpointDecodeError,
+    LazyCheckpoint,
+    decode_checkpoint,
+    encode_checkpoint,
+)
+from app.prototype.checkpoints.runs_index import RunsIndex, RunsPage
 from app.prototype.checkpoints.utils import atomic_write as _atomic_write
+from app.prototype.checkpoints.utils import atomic_write_bytes as _atomic_write_bytes
 from app.prototype.checkpoints.utils import safe_task_id as _safe
 
 logger = logging.getLogger(__name__)
 
 _CHECKPOINT_ROOT = Path(__file__).resolve().parent / "pipeline"
 
+_runs_index_instance: RunsIndex | None = None
+_runs_index_lock = threading.Lock()
+
+
+def _stage_paths(task_id: str, stage: str) -> tuple[Path, Path, Path]:
+    """Return (compact checkpoint, legacy JSON checkpoint, blob dir) paths."""
+    task_dir = _CHECKPOINT_ROOT / _safe(task_id)
+    return task_dir / f"stage_{stage}.ckpt", task_dir / f"stage_{stage}.json", task_dir / "blobs"
+
 
 def save_pipeline_stage(task_id: str, stage: str, data: dict) -> str:
     """Save checkpoint for a specific pipeline stage.
 
     Layout::
 
-        checkpoints/pipeline/{task_id}/stage_{stage}.json
+        checkpoints/pipeline/{task_id}/stage_{stage}.ckpt
+        checkpoints/pipeline/{task_id}/blobs/{sha256}.bin
+
+    Large values (evidence, candidates, evidence_pack) go to shared
+    content-addressed blobs, so re-saving the same evidence on a later
+    round writes nothing new.  Set ``VULCA_CHECKPOINT_FORMAT=json`` to
+    write the legacy indented ``stage_{stage}.json`` instead.
 
     Returns the path to the saved file.
     """
-    task_dir = _CHECKPOINT_ROOT / _safe(task_id)
-    task_dir.mkdir(parents=True, exist_ok=True)
-    path = task_dir / f"stage_{stage}.json"
-    _atomic_write(path, json.dumps(data, indent=2, ensure_ascii=False))
-    return str(path)
+    ckpt_path, json_path, blob_dir = _stage_paths(task_id, stage)
+    ckpt_path.parent.mkdir(parents=True, exist_ok=True)
+    if os.environ.get("VULCA_CHECKPOINT_FORMAT", "").lower() == "json":
+        _atomic_write(json_path, json.dumps(data, indent=2, ensure_ascii=False))
+        ckpt_path.unlink(missing_ok=True)
+        return str(json_path)
+    _atomic_write_bytes(ckpt_path, encode_checkpoint(data, blob_dir))
+    json_path.unlink(missing_ok=True)  # never leave a stale legacy copy behind
+    return str(ckpt_path)
+
+
+def open_pipeline_stage(task_id: str, stage: str) -> Mapping[str, Any] | None:
+    """Open a stage checkpoint for lazy reading, or None if missing/corrupted.
+
+    Blob-backed fields are only read when accessed, so e.g. fetching
+    ``["candidates"]`` from a draft checkpoint never touches the evidence.
+    Legacy JSON checkpoints are returned as plain dicts.
+    """
+    ckpt_path, json_path, blob_dir = _stage_paths(task_id, stage)
+    try:
+        if ckpt_path.exists():
+            return decode_checkpoint(ckpt_path.read_bytes(), blob_dir)
+        if json_path.exists():
+            return json.loads(json_path.read_text(encoding="utf-8"))
+    except (CheckpointDecodeError, json.JSONDecodeError, OSError) as exc:
+        logger.warning("Corrupted checkpoint for %s/%s: %s", task_id, stage, exc)
+    return None
 
 
 def load_pipeline_stage(task_id: str, stage: str) -> dict | None:
     """Load checkpoint for a specific pipeline stage, or None if missing."""
-    path = _CHECKPOINT_ROOT / _safe(task_id) / f"stage_{stage}.json"
-    if not path.exists():
-        return None
+    ckpt = open_pipeline_stage(task_id, stage)
+    if ckpt is None or isinstance(ckpt, dict):
+        return ckpt
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
-        logger.warning("Corrupted checkpoint %s: %s", path, exc)
+        return ckpt.to_dict()
+    except CheckpointDecodeError as exc:
+        logger.warning("Corrupted checkpoint for %s/%s: %s", task_id, stage, exc)
         return None
 
 
+def has_pipeline_stage(task_id: str, stage: str) -> bool:
+    """True if a checkpoint exists for *stage* (does not read it)."""
+    ckpt_path, json_path, _ = _stage_paths(task_id, stage)
+    return ckpt_path.exists() or json_path.exists()
+
+
+def verify_pipeline_stage(task_id: str, stage: str) -> bool:
+    """True if *stage* has a checkpoint that decodes and whose blobs all exist.
+
+    Used to validate resume: the checkpoint header is decoded and every
+    referenced blob is ``stat``-ed, but blob bodies are not read.
+    """
+    ckpt = open_pipeline_stage(task_id, stage)
+    if ckpt is None:
+        return False
+    if isinstance(ckpt, LazyCheckpoint):
+        _, _, blob_dir = _stage_paths(task_id, stage)
+        missing = [d for d in ckpt.blob_digests() if not (blob_dir / f"{d}.bin").is_file()]
+        if missing:
+            logger.warning(
+                "Checkpoint %s/%s references %d missing blob(s)", task_id, stage, len(missing),
+            )
+            return False
+    return True
+
+
+def collect_pipeline_blobs(task_id: str) -> int:
+    """Delete blobs of *task_id* that no stage checkpoint references.
+
+    Stage checkpoints are overwritten every round, orphaning the blobs of
+    values that changed.  If any checkpoint cannot be decoded, nothing is
+    deleted (its references are unknown).  Returns the number removed.
+    """
+    task_dir = _CHECKPOINT_ROOT / _safe(task_id)
+    blob_dir = task_dir / "blobs"
+    if not blob_dir.is_dir():
+        return 0
+    live: set[str] = set()
+    for ckpt_path in task_dir.glob("stage_*.ckpt"):
+        try:
+            live |= decode_checkpoint(ckpt_path.read_bytes(), blob_dir).blob_digests()
+        except (CheckpointDecodeError, ValueError, OSError) as exc:
+            logger.warning("Skipping blob GC for %s: %s", task_id, exc)
+            return 0
+    removed = 0
+    for blob in blob_dir.glob("*.bin"):
+        if blob.stem not in live:
+            blob.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
 def save_pipeline_output(task_id: str, data: dict) -> str:
-    """Save the final pipeline output."""
+    """Save the final pipeline output.
+
+    The run is finished at this point, so blobs orphaned by overwritten
+    stage checkpoints are collected.
+    """
     task_dir = _CHECKPOINT_ROOT / _safe(task_id)
     task_dir.mkdir(parents=True, exist_ok=True)
     path = task_dir / "pipeline_output.json"
     _atomic_write(path, json.dumps(data, indent=2, ensure_ascii=False))
+    removed = collect_pipeline_blobs(task_id)
+    if removed:
+        logger.debug("Collected %d orphaned checkpoint blob(s) for %s", removed, task_id)
     return str(path)
 
 
@@ -65,40 +171,60 @@ def load_pipeline_output(task_id: str) -> dict | None:
         return None
 
 
+def _runs_index() -> RunsIndex:
+    """Return the RunsIndex for the current ``_CHECKPOINT_ROOT``."""
+    global _runs_index_instance  # noqa: PLW0603
+    db_path = _CHECKPOINT_ROOT / "runs_index.db"
+    inst = _runs_index_instance
+    if inst is None or inst.path != db_path:
+        with _runs_index_lock:
+            inst = _runs_index_instance
+            if inst is None or inst.path != db_path:
+                inst = RunsIndex(db_path, legacy_json=_CHECKPOINT_ROOT / "runs_index.json")
+                _runs_index_instance = inst
+    return inst
+
+
 def update_runs_index(task_id: str, entry: dict) -> None:
     """Update the runs index with a new or updated entry.
 
-    Maintains ``checkpoints/runs_index.json`` as a lightweight metadata
-    store mapping task_id to status, decision, cost, latency, etc.
-    Uses file locking to prevent read-modify-write races.
+    Maintains ``checkpoints/pipeline/runs_index.db`` as a lightweight
+    metadata store mapping task_id to status, decision, cost, latency, etc.
+    Each call is a single indexed upsert, safe under concurrent writers.
     """
-    _CHECKPOINT_ROOT.mkdir(parents=True, exist_ok=True)
-    index_path = _CHECKPOINT_ROOT / "runs_index.json"
-    lock_path = _CHECKPOINT_ROOT / ".runs_index.lock"
+    _runs_index().upsert(task_id, entry)
 
-    with open(lock_path, "w") as lock_file:
-        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
-        try:
-            index: dict = {}
-            if index_path.exists():
-                try:
-                    index = json.loads(index_path.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, OSError):
-                    index = {}
-            index[task_id] = entry
-            _atomic_write(index_path, json.dumps(index, indent=2, ensure_ascii=False))
-        finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-
-
-def load_runs_index() -> dict:
-    """Load the full runs index."""
-    index_path = _CHECKPOINT_ROOT / "runs_index.json"
-    if not index_path.exists():
-        return {}
-    try:
-        return json.loads(index_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
 
+def load_runs_index(
+    status: str | None = None,
+    tradition: str | None = None,
+    limit: int | None = None,
+) -> dict:
+    """Load the runs index as ``{task_id: entry}``, newest first.
 
+    With no arguments this returns every run; use *status* / *tradition*
+    to filter and *limit* to cap the result, or ``query_runs_index`` to
+    page through large indexes.
+    """
+    index = _runs_index()
+    filters = {"status": status, "tradition": tradition}
+    if limit is not None:
+        entries = index.query(limit=limit, **filters).entries
+    else:
+        entries = index.iter_all(**filters)
+    return {e["task_id"]: e for e in entries}
+
+
+def query_runs_index(
+    status: str | None = None,
+    tradition: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> RunsPage:
+    """Return one page of runs matching the filters (see ``RunsIndex.query``)."""
+    return _runs_index().query(
+        status=status, tradition=tradition, since=since, until=until,
+        limit=limit, cursor=cursor,
+    )
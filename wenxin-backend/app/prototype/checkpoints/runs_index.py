@@ -0,0 +1,298 @@
+"""Runs index — SQLite-backed metadata store for pipeline runs.
+
+Replaces the monolithic ``runs_index.json`` (parsed and rewritten in full,
+under an exclusive lock, on every run) with a single-table SQLite database
+in WAL mode:
+
+- ``upsert`` is one indexed ``INSERT ... ON CONFLICT`` statement, so the
+  cost of recording a run no longer grows with the number of past runs
+- WAL lets readers proceed while a writer commits, and concurrent writers
+  (threads or worker processes) wait on ``busy_timeout`` instead of a
+  global file lock
+- ``status``, ``tradition`` and ``created_at`` are indexed columns, and
+  ``query`` pages through matches with a keyset cursor
+
+A legacy ``runs_index.json`` found next to the database is imported once,
+the first time the database is created.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "RunsIndex",
+    "RunsPage",
+]
+
+_SCHEMA_VERSION = 1
+_BUSY_TIMEOUT_S = 30.0
+_MAX_PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    task_id    TEXT PRIMARY KEY,
+    status     TEXT NOT NULL DEFAULT '',
+    tradition  TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status, created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_runs_tradition ON runs (tradition, created_at, task_id);
+"""
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class RunsPage:
+    """One page of runs, newest first.
+
+    Each entry is the stored run dict plus ``task_id`` and (unless the
+    entry already carries them) ``created_at`` / ``updated_at``.  Pass ``next_cursor`` back to ``query`` for the next
+    page; it is None on the last page.
+    """
+
+    entries: list[dict] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class RunsIndex:
+    """Indexed, concurrently writable store of per-run metadata.
+
+    Usage::
+
+        index = RunsIndex(Path("checkpoints/pipeline/runs_index.db"))
+        index.upsert("task-1", {"status": "completed", "tradition": "default"})
+        page = index.query(status="completed", limit=50)
+        more = index.query(status="completed", limit=50, cursor=page.next_cursor)
+    """
+
+    def __init__(self, db_path: Path, legacy_json: Path | None = None) -> None:
+        self._db_path = Path(db_path)
+        self._legacy_json = legacy_json
+        self._local = threading.local()
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    @property
+    def path(self) -> Path:
+        return self._db_path
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self._db_path),
+                timeout=_BUSY_TIMEOUT_S,
+                isolation_level=None,  # autocommit; explicit BEGIN where needed
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection (others close on GC)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            if version < _SCHEMA_VERSION:
+                self._import_legacy(conn)
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """One-shot import of a pre-SQLite ``runs_index.json``."""
+        if self._legacy_json is None or not self._legacy_json.exists():
+            return
+        try:
+            legacy = json.loads(self._legacy_json.read_text(encoding="utf-8"))
+            stamp = datetime.fromtimestamp(
+                self._legacy_json.stat().st_mtime, tz=timezone.utc,
+            ).isoformat()
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Legacy runs index %s unreadable: %s", self._legacy_json, exc)
+            return
+        if not isinstance(legacy, dict):
+            return
+        rows = [
+            (
+                str(task_id),
+                str(entry.get("status", "")),
+                str(entry.get("tradition", "")),
+                stamp,
+                stamp,
+                json.dumps(entry, ensure_ascii=False),
+            )
+            for task_id, entry in legacy.items()
+            if isinstance(entry, dict)
+        ]
+        conn.executemany(
+            "INSERT OR IGNORE INTO runs "
+            "(task_id, status, tradition, created_at, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        logger.info("Imported %d runs from legacy %s", len(rows), self._legacy_json)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, task_id: str, entry: dict) -> None:
+        """Insert or replace the entry for *task_id*.
+
+        ``created_at`` is kept from the first insert; the stored dict,
+        ``status``, ``tradition`` and ``updated_at`` are replaced.  A
+        missing ``tradition`` keeps the previously recorded one.
+        """
+        now = _now_iso()
+        self._conn().execute(
+            "INSERT INTO runs (task_id, status, tradition, created_at, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(task_id) DO UPDATE SET "
+            "status = excluded.status, "
+            "tradition = CASE WHEN excluded.tradition = '' "
+            "THEN runs.tradition ELSE excluded.tradition END, "
+            "updated_at = excluded.updated_at, "
+            "data = excluded.data",
+            (
+                task_id,
+                str(entry.get("status", "")),
+                str(entry.get("tradition", "")),
+                now,
+                now,
+                json.dumps(entry, ensure_ascii=False),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, task_id: str) -> dict | None:
+        """Return the stored entry for *task_id*, or None."""
+        row = self._conn().execute(
+            "SELECT data FROM runs WHERE task_id = ?", (task_id,),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(
+        self,
+        status: str | None = None,
+        tradition: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> int:
+        """Number of runs matching the filters."""
+        where, params = self._where(status, tradition, since, until)
+        sql = "SELECT COUNT(*) FROM runs" + (f" WHERE {where}" if where else "")
+        return self._conn().execute(sql, params).fetchone()[0]
+
+    def query(
+        self,
+        status: str | None = None,
+        tradition: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> RunsPage:
+        """Return one page of runs, newest ``created_at`` first.
+
+        *since* / *until* are ISO-8601 timestamps bounding ``created_at``
+        (inclusive / exclusive).  Pagination is keyset-based, so deep pages
+        cost the same as the first one.
+        """
+        limit = max(1, min(int(limit), _MAX_PAGE_SIZE))
+        where, params = self._where(status, tradition, since, until)
+        if cursor:
+            try:
+                cur_created, cur_task = json.loads(cursor)
+            except (ValueError, TypeError) as exc:
+                raise ValueError(f"invalid runs index cursor: {cursor!r}") from exc
+            clause = "(created_at < ? OR (created_at = ? AND task_id < ?))"
+            where = f"{where} AND {clause}" if where else clause
+            params.extend([cur_created, cur_created, cur_task])
+
+        sql = (
+            "SELECT task_id, created_at, updated_at, data FROM runs"
+            + (f" WHERE {where}" if where else "")
+            + " ORDER BY created_at DESC, task_id DESC LIMIT ?"
+        )
+        rows = self._conn().execute(sql, [*params, limit + 1]).fetchall()
+
+        page = RunsPage()
+        for task_id, created_at, updated_at, data in rows[:limit]:
+            entry = {"created_at": created_at, "updated_at": updated_at, **json.loads(data)}
+            entry["task_id"] = task_id
+            page.entries.append(entry)
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            page.next_cursor = json.dumps([last[1], last[0]])
+        return page
+
+    def iter_all(self, page_size: int = 500, **filters: str | None) -> Iterator[dict]:
+        """Yield every matching run, fetching *page_size* rows at a time."""
+        cursor: str | None = None
+        while True:
+            page = self.query(limit=page_size, cursor=cursor, **filters)
+            yield from page.entries
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    @staticmethod
+    def _where(
+        status: str | None,
+        tradition: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list[str]]:
+        clauses: list[str] = []
+        params: list[str] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if tradition is not None:
+            clauses.append("tradition = ?")
+            params.append(tradition)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        return " AND ".join(clauses), params
@@ -16,10 +16,15 @@ def atomic_write(path: Path, content: str) -> None:
     Guarantees that *path* is never left in a half-written state, even
     on crash or power loss (assuming the filesystem honours ``fsync``).
     """
+    atomic_write_bytes(path, content.encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Binary counterpart of ``atomic_write``."""
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
+        with os.fdopen(fd, "wb") as f:
             f.write(content)
             f.flush()
             os.fsync(f.fileno())
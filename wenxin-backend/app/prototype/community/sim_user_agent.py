@@ -220,14 +220,7 @@ class SimUserAgent(BaseAgent):
 
         # Check SessionStore for this session's digest
         from app.prototype.session.store import SessionStore
-        store = SessionStore.get()
-        all_sessions = store.get_all()
-
-        session_data = None
-        for s in all_sessions:
-            if s.get("session_id") == session_id:
-                session_data = s
-                break
+        session_data = SessionStore.get().get_session(session_id)
 
         if session_data is None:
             return {
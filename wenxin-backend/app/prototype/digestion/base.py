@@ -44,6 +44,10 @@ class DigestContext:
 
     Additional typed fields (``sessions``, ``patterns``, ``clusters``,
     ``actions``) carry intermediate results between pipeline steps.
+    ``snapshot`` is the immutable columnar ``DigestSnapshot`` of the
+    cycle; steps read from it instead of going back to the session store.
+    In incremental mode ``aggregates`` holds the ``RunningAggregates``
+    already folded up to this cycle, so statistic steps skip the full pass.
     The ``evolver`` reference allows step adapters to call private
     methods on the ``ContextEvolver`` instance when needed.
     """
@@ -57,6 +61,8 @@ class DigestContext:
     patterns: list = field(default_factory=list)
     clusters: list = field(default_factory=list)
     actions: list = field(default_factory=list)
+    snapshot: Any = None
+    aggregates: Any = None
 
     # Reference to the ContextEvolver instance (for steps that wrap
     # private methods like _extract_layer_focus, _extract_trajectory_insights,
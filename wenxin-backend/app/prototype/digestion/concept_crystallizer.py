@@ -136,9 +136,9 @@ class ConceptCrystallizer:
 
         for attempt in range(self._LLM_MAX_RETRIES):
             try:
-                import litellm
+                from app.prototype.agents import llm_gateway
 
-                response = litellm.completion(
+                response = llm_gateway.completion(
                     model=MODEL_FAST,
                     messages=[
                         {"role": "system", "content": self._SYSTEM_MSG},
@@ -8,6 +8,15 @@ Two-phase evolution:
    system prompts.  This is the MemRL core: frozen model + evolving context.
 
 Falls back to rule-only mode when no API key is configured.
+
+Incremental mode (``incremental=True`` or ``VULCA_DIGEST_INCREMENTAL=1``):
+per-tradition statistics are kept as persisted ``RunningAggregates``
+(``digest_aggregates.json`` next to the context file) with a session-store
+watermark, and each cycle folds in only the sessions appended since;
+sessions updated since (feedback appends, backfills) are applied as deltas
+(old version out, new version in) rather than forcing a full refold.  A
+cycle with no new or updated sessions returns immediately, so digestion
+can run every minute instead of every hour.
 """
 
 from __future__ import annotations
@@ -16,6 +25,7 @@ import json
 import logging
 import os
 import tempfile
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -23,6 +33,8 @@ from app.prototype.digestion.aggregator import DigestAggregator
 from app.prototype.digestion.base import BaseDigester, DigestContext
 from app.prototype.digestion.pattern_detector import Pattern, PatternDetector
 from app.prototype.digestion.preference_learner import PreferenceLearner
+from app.prototype.digestion.running_aggregates import RunningAggregates
+from app.prototype.digestion.snapshot import DigestSnapshot, load_trajectories
 from app.prototype.session.store import SessionStore
 
 logger = logging.getLogger("vulca")
@@ -58,6 +70,8 @@ _DIM_ALIASES = _LAYER_NAME_MAP
 _DEFAULT_CONTEXT_PATH = os.path.join(
     os.path.dirname(__file__), os.pardir, "data", "evolved_context.json"
 )
+_AGGREGATES_FILENAME = "digest_aggregates.json"
+_NO_NEW_SESSIONS = "No new sessions since last digestion"
 
 
 @dataclass
@@ -106,19 +120,94 @@ class ContextEvolver:
         self,
         store: SessionStore | None = None,
         context_path: str | None = None,
+        incremental: bool | None = None,
     ) -> None:
         self._store = store or SessionStore.get()
         self._context_path = Path(context_path or _DEFAULT_CONTEXT_PATH).resolve()
         self._detector = PatternDetector(DigestAggregator(self._store))
-
-    def evolve(self) -> EvolutionResult:
+        if incremental is None:
+            incremental = os.environ.get("VULCA_DIGEST_INCREMENTAL", "").lower() in ("1", "true", "yes")
+        self._incremental = incremental
+        self._aggregates_path = self._context_path.with_name(_AGGREGATES_FILENAME)
+        self._snapshot: DigestSnapshot | None = None
+        self._snapshot_watermark = ""
+
+    @property
+    def incremental(self) -> bool:
+        return self._incremental
+
+    @property
+    def snapshot(self) -> DigestSnapshot | None:
+        """Snapshot produced by the last ``refresh_snapshot`` call."""
+        return self._snapshot
+
+    def refresh_snapshot(self, backfill: bool = False) -> DigestSnapshot:
+        """Bring the cached snapshot up to date, reading only what changed.
+
+        Sessions appended since the previous call (and trajectory files not
+        seen yet) are parsed and appended via ``DigestSnapshot.concat``, and
+        sessions updated since are swapped in via ``DigestSnapshot.replace``;
+        if the store was rewritten the snapshot is rebuilt.  When nothing
+        changed the previous snapshot object is returned as-is.  With
+        *backfill*, new sessions get their cultural_features filled in
+        (through the store) before they enter the snapshot.
+        """
+        delta = self._store.since(self._snapshot_watermark or None)
+        if self._snapshot is None or not delta.is_delta:
+            trajectories = load_trajectories()
+            self._snapshot = DigestSnapshot.from_sessions(
+                delta.records, trajectories.values(), trajectories.keys(),
+            )
+            self._snapshot_watermark = delta.watermark
+            return self._snapshot
+
+        if backfill and delta.records:
+            from app.prototype.digestion.feature_extractor import backfill_sessions
+            if backfill_sessions(delta.records, self._store):
+                delta = self._store.since(self._snapshot_watermark)
+        if delta.updated:
+            self._snapshot = self._snapshot.replace(delta.updated)
+        trajectories = load_trajectories(skip=self._snapshot.trajectory_names)
+        if delta.records or trajectories:
+            self._snapshot = self._snapshot.concat(DigestSnapshot.from_sessions(
+                delta.records, trajectories.values(), trajectories.keys(),
+            ))
+        self._snapshot_watermark = delta.watermark
+        return self._snapshot
+
+    def _fold_new_sessions(self) -> RunningAggregates | None:
+        """Fold sessions changed since the persisted watermark into the aggregates.
+
+        Appended sessions are folded in; updated ones replace their
+        as-of-watermark version.  Returns None when nothing changed.  The
+        caller saves the aggregates once the cycle has completed.
+        """
+        aggregates = RunningAggregates.load(self._aggregates_path)
+        delta = self._store.since(aggregates.watermark or None)
+        if delta.is_delta and not delta.records and not delta.updated:
+            return None
+        if not delta.is_delta:
+            aggregates.reset()
+        if delta.replaced:
+            aggregates.unfold(DigestSnapshot.from_sessions(delta.replaced))
+        aggregates.fold(DigestSnapshot.from_sessions(delta.records + delta.updated))
+        aggregates.watermark = delta.watermark
+        return aggregates
+
+    def evolve(self, snapshot: DigestSnapshot | None = None) -> EvolutionResult:
         """Run full evolution cycle: detect -> learn -> adjust -> save.
 
         Uses the step adapter pipeline (``BaseDigester.get_ordered_digesters``)
         for pluggable digestion steps, with inline orchestration for weight
         adjustments and preference boosts that depend on cross-step data.
+
+        Sessions and trajectories are read once into a ``DigestSnapshot``
+        shared by every step; pass *snapshot* to reuse one the caller
+        already loaded.  In incremental mode only sessions appended since
+        the last cycle are folded into the persisted aggregates, and the
+        cycle is skipped when there are none.
         """
-        session_count = self._store.count()
+        session_count = len(snapshot) if snapshot is not None else self._store.count()
 
         if session_count < _MIN_SESSIONS_TO_EVOLVE:
             return EvolutionResult(
@@ -126,6 +215,12 @@ class ContextEvolver:
                 skipped_reason=f"Need {_MIN_SESSIONS_TO_EVOLVE} sessions, have {session_count}",
             )
 
+        aggregates: RunningAggregates | None = None
+        if self._incremental:
+            aggregates = self._fold_new_sessions()
+            if aggregates is None:
+                return EvolutionResult(sessions_analyzed=session_count, skipped_reason=_NO_NEW_SESSIONS)
+
         # Load current context
         context = self._load_context()
 
@@ -139,8 +234,10 @@ class ContextEvolver:
             except Exception:
                 logger.warning("ContextEvolver: could not initialize tradition_weights from cultural_weights")
 
-        # Gather all sessions for pipeline steps
-        all_sessions = self._store.get_all()
+        # Read sessions + trajectories once for all pipeline steps
+        if snapshot is None:
+            snapshot = self.refresh_snapshot() if self._incremental else DigestSnapshot.load(self._store)
+        all_sessions = snapshot.sessions
 
         # Build shared DigestContext
         ctx = DigestContext(
@@ -148,6 +245,8 @@ class ContextEvolver:
             session_count=session_count,
             sessions=all_sessions,
             evolver=self,
+            snapshot=snapshot,
+            aggregates=aggregates,
         )
 
         # --- Run registered pipeline steps ---
@@ -256,6 +355,8 @@ class ContextEvolver:
         )
         if actions or has_new_data:
             self._save_context(context)
+        if aggregates is not None:
+            aggregates.save()
 
         result = EvolutionResult(
             actions=actions,
@@ -492,7 +593,7 @@ Generate agent insights and tradition-specific guidance based on this data."""
         if not self._has_api_key():
             return None
 
-        import litellm
+        from app.prototype.agents import llm_gateway
         from app.prototype.agents.model_router import MODEL_FAST
 
         # Build context summary for LLM
@@ -532,7 +633,7 @@ Generate agent insights and tradition-specific guidance based on this data."""
             weight_summary="\n".join(weight_lines) or "none",
         )
 
-        response = litellm.completion(
+        response = llm_gateway.completion(
             model=MODEL_FAST,
             messages=[
                 {"role": "system", "content": self._INSIGHTS_SYSTEM},
@@ -709,7 +810,7 @@ Generate agent insights and tradition-specific guidance based on this data."""
     # Trajectory-based learning
     # ------------------------------------------------------------------
 
-    def _extract_trajectory_insights(self) -> dict | None:
+    def _extract_trajectory_insights(self, records: Sequence | None = None) -> dict | None:
         """Extract learning signals from recorded pipeline trajectories.
 
         Analyzes trajectory files to learn:
@@ -717,21 +818,26 @@ Generate agent insights and tradition-specific guidance based on this data."""
         - common_weak_dimensions: Dimensions most frequently flagged by Critic
         - repair_success_rate: How often rerun improves the flagged dimension
         - per-tradition efficiency patterns
+
+        *records* are the already-loaded trajectories of the digestion
+        snapshot; when omitted they are read from the recorder.
         """
         from collections import Counter, defaultdict
 
-        try:
-            from app.prototype.trajectory.trajectory_recorder import TrajectoryRecorder
-            recorder = TrajectoryRecorder()
-        except Exception:
-            return None
+        if records is None:
+            try:
+                from app.prototype.trajectory.trajectory_recorder import TrajectoryRecorder
+                recorder = TrajectoryRecorder()
+            except Exception:
+                return None
 
-        if recorder.count() < 3:
-            return None  # Not enough data
+            if recorder.count() < 3:
+                return None  # Not enough data
 
-        records = recorder.load_all()
-        if not records:
-            return None
+            records = recorder.load_all()
+
+        if len(records) < 3:
+            return None  # Not enough data
 
         # Aggregate stats
         rounds_per_accept: list[int] = []
@@ -1,12 +1,13 @@
 """Shared cultural feature extraction — used by both create_routes and bootstrap.
 
 Tier-1 rule-based extraction: numeric features only, zero-latency, synchronous.
-Tier-2 LLM extraction: semantic features via litellm, used during backfill.
+Tier-2 LLM extraction: semantic features via the LLM gateway, used during backfill.
 """
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -79,7 +80,7 @@ def extract_cultural_features(
 def _extract_semantic_features_llm(intent: str, tradition: str) -> dict[str, Any]:
     """Tier-2: Extract semantic cultural features via LLM (synchronous).
 
-    Uses litellm.completion() with MODEL_FAST to extract:
+    Uses the LLM gateway's completion() with MODEL_FAST to extract:
     - style_elements, emotional_tone, technique_markers, cultural_references
 
     On any failure, returns empty dict (graceful degradation).
@@ -88,7 +89,7 @@ def _extract_semantic_features_llm(intent: str, tradition: str) -> dict[str, Any
         return {}
 
     try:
-        import litellm  # noqa: E402
+        from app.prototype.agents import llm_gateway
 
         prompt = (
             "You are a cultural art analyst. Given the following creation intent "
@@ -112,7 +113,7 @@ def _extract_semantic_features_llm(intent: str, tradition: str) -> dict[str, Any
 
         from app.prototype.agents.model_router import MODEL_FAST
 
-        response = litellm.completion(
+        response = llm_gateway.completion(
             model=MODEL_FAST,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
@@ -147,6 +148,49 @@ def _extract_semantic_features_llm(intent: str, tradition: str) -> dict[str, Any
         return {}
 
 
+def _backfilled_features(session: dict, use_llm: bool) -> dict | None:
+    """Return *session*'s cultural_features with missing tiers filled, or None if unchanged."""
+    cf = dict(session.get("cultural_features") or {})
+    has_tier1 = cf.get("avg_score") is not None
+    has_tier2 = bool(cf.get("style_elements"))
+
+    # Skip if both tiers are already populated
+    if has_tier1 and has_tier2:
+        return None
+
+    tradition = session.get("tradition", "default")
+    changed = False
+
+    # --- Tier-1: rule-based numeric features ---
+    if not has_tier1:
+        final_scores = session.get("final_scores") or session.get("dimension_scores") or {}
+
+        # Also try round_snapshots for scores
+        if not final_scores:
+            rounds = session.get("round_snapshots", [])
+            if rounds:
+                last_round = rounds[-1] if isinstance(rounds[-1], dict) else {}
+                final_scores = last_round.get("dimension_scores", {})
+
+        risk_flags = session.get("risk_flags", [])
+
+        tier1 = extract_cultural_features(tradition, final_scores, risk_flags)
+        if tier1:
+            cf.update(tier1)
+            changed = True
+
+    # --- Tier-2: LLM semantic features ---
+    if use_llm and not has_tier2:
+        intent = session.get("intent", "")
+        if intent:
+            tier2 = _extract_semantic_features_llm(intent, tradition)
+            if tier2:
+                cf.update(tier2)
+                changed = True
+
+    return cf if changed else None
+
+
 def backfill_missing_features(use_llm: bool = True) -> int:
     """Scan sessions.jsonl for entries with empty/incomplete cultural_features and backfill.
 
@@ -177,46 +221,8 @@ def backfill_missing_features(use_llm: bool = True) -> int:
             new_lines.append(line)
             continue
 
-        cf = session.get("cultural_features") or {}
-        has_tier1 = cf.get("avg_score") is not None
-        has_tier2 = bool(cf.get("style_elements"))
-
-        # Skip if both tiers are already populated
-        if has_tier1 and has_tier2:
-            new_lines.append(line)
-            continue
-
-        tradition = session.get("tradition", "default")
-        changed = False
-
-        # --- Tier-1: rule-based numeric features ---
-        if not has_tier1:
-            final_scores = session.get("final_scores") or session.get("dimension_scores") or {}
-
-            # Also try round_snapshots for scores
-            if not final_scores:
-                rounds = session.get("round_snapshots", [])
-                if rounds:
-                    last_round = rounds[-1] if isinstance(rounds[-1], dict) else {}
-                    final_scores = last_round.get("dimension_scores", {})
-
-            risk_flags = session.get("risk_flags", [])
-
-            tier1 = extract_cultural_features(tradition, final_scores, risk_flags)
-            if tier1:
-                cf.update(tier1)
-                changed = True
-
-        # --- Tier-2: LLM semantic features ---
-        if use_llm and not has_tier2:
-            intent = session.get("intent", "")
-            if intent:
-                tier2 = _extract_semantic_features_llm(intent, tradition)
-                if tier2:
-                    cf.update(tier2)
-                    changed = True
-
-        if changed:
+        cf = _backfilled_features(session, use_llm)
+        if cf is not None:
             session["cultural_features"] = cf
             new_lines.append(json.dumps(session, ensure_ascii=False))
             updated += 1
@@ -228,3 +234,28 @@ def backfill_missing_features(use_llm: bool = True) -> int:
         logger.info("Backfilled cultural_features for %d sessions", updated)
 
     return updated
+
+
+def backfill_sessions(sessions: Iterable[dict], store: Any = None, use_llm: bool = True) -> int:
+    """Backfill cultural_features for the given (e.g. newly appended) sessions.
+
+    Unlike :func:`backfill_missing_features` this does not rewrite
+    sessions.jsonl: each changed session is updated in place through the
+    ``SessionStore``, so incremental digestion only touches new records.
+
+    Returns the number of sessions updated.
+    """
+    if store is None:
+        from app.prototype.session.store import SessionStore
+        store = SessionStore.get()
+    updated = 0
+    for session in sessions:
+        sid = session.get("session_id")
+        if not sid:
+            continue
+        cf = _backfilled_features(session, use_llm)
+        if cf is not None and store.update(sid, cultural_features=cf) is not None:
+            updated += 1
+    if updated:
+        logger.info("Backfilled cultural_features for %d new sessions", updated)
+    return updated
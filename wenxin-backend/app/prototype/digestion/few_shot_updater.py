@@ -11,6 +11,10 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.prototype.digestion.snapshot import DigestSnapshot
 
 logger = logging.getLogger("vulca")
 
@@ -35,12 +39,15 @@ class FewShotUpdater:
         self._sessions_path = Path(sessions_path).resolve() if sessions_path else _SESSIONS_PATH
         self._evolved_path = Path(evolved_path).resolve() if evolved_path else _EVOLVED_PATH
 
-    def update(self) -> int:
+    def update(self, snapshot: DigestSnapshot | None = None) -> int:
         """Select best sessions as few-shot examples.
 
+        Uses the sessions of *snapshot* when given (one digestion cycle
+        shares a single read), otherwise loads ``sessions.jsonl``.
+
         Returns the count of examples selected and saved.
         """
-        sessions = self._load_sessions()
+        sessions = snapshot.sessions if snapshot is not None else self._load_sessions()
         if not sessions:
             logger.debug("FewShotUpdater: no sessions found")
             return 0
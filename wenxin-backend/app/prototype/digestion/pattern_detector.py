@@ -11,6 +11,7 @@ import logging
 from dataclasses import dataclass, field
 
 from app.prototype.digestion.aggregator import DigestAggregator, TraditionStats
+from app.prototype.digestion.snapshot import DigestSnapshot
 
 logger = logging.getLogger("vulca")
 
@@ -47,9 +48,18 @@ class PatternDetector:
     def __init__(self, aggregator: DigestAggregator | None = None) -> None:
         self._aggregator = aggregator or DigestAggregator()
 
-    def detect(self) -> list[Pattern]:
-        """Run pattern detection on current aggregate data."""
-        stats = self._aggregator.aggregate()
+    def detect(
+        self,
+        snapshot: DigestSnapshot | None = None,
+        stats: dict[str, TraditionStats] | None = None,
+    ) -> list[Pattern]:
+        """Run pattern detection on current aggregate data.
+
+        *stats* (e.g. from incrementally maintained ``RunningAggregates``)
+        skips the aggregation pass.
+        """
+        if stats is None:
+            stats = self._aggregator.aggregate(snapshot)
         patterns: list[Pattern] = []
 
         for tradition, ts in stats.items():
@@ -150,7 +150,7 @@ class PromptDistiller:
 
     def _distill_llm(self, high_scoring: list[dict]) -> list[PromptArchetype]:
         """Use LLM to analyze high-scoring sessions and produce rich archetypes."""
-        import litellm
+        from app.prototype.agents import llm_gateway
         from app.prototype.agents.model_router import MODEL_FAST
 
         # Group sessions by tradition for focused analysis
@@ -180,7 +180,7 @@ class PromptDistiller:
             )
 
             try:
-                response = litellm.completion(
+                response = llm_gateway.completion(
                     model=MODEL_FAST,
                     messages=[
                         {"role": "system", "content": _DISTILL_SYSTEM},
@@ -12,6 +12,7 @@ from app.prototype.digestion.aggregator import DigestAggregator
 from app.prototype.digestion.context_evolver import ContextEvolver
 from app.prototype.digestion.pattern_detector import PatternDetector
 from app.prototype.digestion.preference_learner import PreferenceLearner
+from app.prototype.digestion.snapshot import DigestSnapshot
 from app.prototype.session.store import SessionStore
 
 logger = logging.getLogger("vulca")
@@ -100,26 +101,32 @@ async def run_digestion() -> dict:
 
     try:
         backfill_missing_features()
-        FeedbackStore.get().sync_from_sessions()
+    except Exception:
+        logger.debug("Pre-digestion backfill failed (non-fatal)")
+
+    # One read of sessions + trajectories shared by the whole cycle
+    snapshot = DigestSnapshot.load()
+    try:
+        FeedbackStore.get().sync_from_sessions(snapshot.sessions)
     except Exception:
         logger.debug("Pre-digestion sync failed (non-fatal)")
 
     evolver = ContextEvolver()
-    result = evolver.evolve()
+    result = evolver.evolve(snapshot)
 
     # Update few-shot examples from high-scoring sessions
     few_shot_count = 0
     try:
         from app.prototype.digestion.few_shot_updater import FewShotUpdater
-        few_shot_count = FewShotUpdater().update()
+        few_shot_count = FewShotUpdater().update(snapshot)
     except Exception:
         logger.debug("Few-shot update failed (non-fatal)")
 
     detector = PatternDetector()
-    patterns = detector.detect()
+    patterns = detector.detect(snapshot)
 
     learner = PreferenceLearner()
-    preferences = learner.learn()
+    preferences = learner.learn(snapshot)
 
     return {
         "evolution": result.to_dict(),
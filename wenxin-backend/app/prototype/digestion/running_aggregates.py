@@ -0,0 +1,234 @@
+"""RunningAggregates — persisted running sums behind incremental digestion.
+
+Per-tradition statistics (session and mode counts, weighted-total sums,
+per-dimension count / sum / sum of squares, thumbs tallies) and the
+preference-learning tallies are all sums, so a batch of new sessions can
+be folded in without revisiting old ones.  ``DigestAggregator`` and
+``PreferenceLearner`` fold a whole snapshot into a fresh instance; the
+incremental ``ContextEvolver`` keeps one on disk together with the session
+store watermark it has folded up to, and folds in only newer sessions.  An
+updated session (e.g. a feedback append) is applied as a delta: its old
+version is ``unfold``-ed and the new one folded in.
+
+State file (JSON, default ``data/digest_aggregates.json``)::
+
+    {"version": 1, "watermark": "[generation, seq]", "traditions": {
+        "<tradition>": {"sessions": n, "modes": {...}, "wt_n": n, "wt_sum": x,
+                        "thumbs_up": n, "thumbs_down": n,
+                        "dims": {"L1": [n, sum, sumsq], ...},
+                        "feedback_sessions": n, "positive": n, "negative": n,
+                        "pref": {"L1": [n_pos, pos_sum, n_neg, neg_sum], ...}}}}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from pathlib import Path
+
+import numpy as np
+
+from app.prototype.digestion.snapshot import DigestSnapshot
+
+logger = logging.getLogger("vulca")
+
+__all__ = ["RunningAggregates"]
+
+_STATE_VERSION = 1
+_PREF_MIN_SAMPLES = 3
+_PREF_MARGIN = 0.1
+
+
+def _new_tradition() -> dict:
+    return {
+        "sessions": 0, "modes": {}, "wt_n": 0, "wt_sum": 0.0,
+        "thumbs_up": 0, "thumbs_down": 0, "dims": {},
+        "feedback_sessions": 0, "positive": 0, "negative": 0, "pref": {},
+    }
+
+
+def _signal_weights(snapshot: DigestSnapshot, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row ``(positive count, positive score weight, negative count)``.
+
+    Explicit thumbs plus implicit signals (WU-10): a download or a fast
+    selection (< 5s) is positive, a slow one (> 30s) is indecision, a slight
+    negative.  Each signal counts the session's dimension scores once; fast
+    picks get a 1.1 boost.
+    """
+    up = snapshot.thumbs_up[rows]
+    down = snapshot.thumbs_down[rows]
+    downloaded = snapshot.downloaded[rows].astype(np.int64)
+    time_ms = snapshot.time_to_select_ms[rows]
+    fast = ((time_ms > 0) & (time_ms < 5000)).astype(np.int64)
+    slow = (time_ms > 30000).astype(np.int64)
+    return up + downloaded + fast, up + downloaded + 1.1 * fast, down + slow
+
+
+class RunningAggregates:
+    """Foldable per-tradition sums, optionally persisted to a JSON file."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self._path = Path(path) if path else None
+        self.watermark: str = ""
+        self._traditions: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: str | Path) -> RunningAggregates:
+        """Load persisted state; a missing or unreadable file starts empty."""
+        agg = cls(path)
+        try:
+            state = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return agg
+        except (OSError, ValueError) as exc:
+            logger.warning("RunningAggregates: ignoring unreadable %s: %s", path, exc)
+            return agg
+        if state.get("version") != _STATE_VERSION:
+            return agg
+        agg.watermark = state.get("watermark", "")
+        agg._traditions = state.get("traditions", {})
+        return agg
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        from app.prototype.checkpoints.utils import atomic_write
+        atomic_write(self._path, json.dumps({
+            "version": _STATE_VERSION,
+            "watermark": self.watermark,
+            "traditions": self._traditions,
+        }, ensure_ascii=False))
+
+    def reset(self) -> None:
+        """Drop all folded sessions (the watermark is cleared too)."""
+        self.watermark = ""
+        self._traditions = {}
+
+    @property
+    def session_count(self) -> int:
+        return sum(t["sessions"] for t in self._traditions.values())
+
+    # ------------------------------------------------------------------
+    # Folding
+    # ------------------------------------------------------------------
+
+    def fold(self, snapshot: DigestSnapshot) -> RunningAggregates:
+        """Add every session of *snapshot* to the running sums; returns self."""
+        return self._apply(snapshot, 1)
+
+    def unfold(self, snapshot: DigestSnapshot) -> RunningAggregates:
+        """Subtract sessions previously folded in (e.g. an old version); returns self."""
+        return self._apply(snapshot, -1)
+
+    def _apply(self, snapshot: DigestSnapshot, sign: int) -> RunningAggregates:
+        for tradition, rows in snapshot.tradition_groups.items():
+            state = self._traditions.setdefault(tradition, _new_tradition())
+            state["sessions"] += sign * int(rows.size)
+
+            modes = state["modes"]
+            for mode in snapshot.mode[rows].tolist():
+                modes[mode] = modes.get(mode, 0) + sign
+                if not modes[mode]:
+                    del modes[mode]
+
+            # Unscored / zero totals are excluded from the weighted-total mean
+            totals = snapshot.weighted_total[rows]
+            totals = totals[~np.isnan(totals) & (totals != 0)]
+            state["wt_n"] += sign * int(totals.size)
+            state["wt_sum"] += sign * float(totals.sum())
+
+            for dim, (n, total, sumsq) in snapshot.dim_sums(rows).items():
+                cell = state["dims"].setdefault(dim, [0, 0.0, 0.0])
+                cell[0] += sign * n
+                cell[1] += sign * total
+                cell[2] += sign * sumsq
+                if not cell[0]:
+                    del state["dims"][dim]
+
+            state["thumbs_up"] += sign * int(snapshot.thumbs_up[rows].sum())
+            state["thumbs_down"] += sign * int(snapshot.thumbs_down[rows].sum())
+
+            self._fold_preferences(state, snapshot, rows[snapshot.has_feedback[rows]], sign)
+            if state["sessions"] <= 0:
+                del self._traditions[tradition]
+        return self
+
+    @staticmethod
+    def _fold_preferences(state: dict, snapshot: DigestSnapshot, rows: np.ndarray, sign: int) -> None:
+        # Only sessions with feedback contribute to preference learning
+        if not rows.size:
+            return
+        pos_count, pos_weight, neg_count = _signal_weights(snapshot, rows)
+        state["feedback_sessions"] += sign * int(rows.size)
+        state["positive"] += sign * int(pos_count.sum())
+        state["negative"] += sign * int(neg_count.sum())
+        for dim, column in snapshot.dim_scores.items():
+            scores = column[rows]
+            present = ~np.isnan(scores)
+            n_pos = int(pos_count[present].sum())
+            n_neg = int(neg_count[present].sum())
+            if not n_pos and not n_neg:
+                continue
+            cell = state["pref"].setdefault(dim, [0, 0.0, 0, 0.0])
+            cell[0] += sign * n_pos
+            cell[1] += sign * float((scores[present] * pos_weight[present]).sum())
+            cell[2] += sign * n_neg
+            cell[3] += sign * float((scores[present] * neg_count[present]).sum())
+            if not cell[0] and not cell[2]:
+                del state["pref"][dim]
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def tradition_stats(self) -> dict:
+        """Per-tradition ``TraditionStats`` from the running sums."""
+        from app.prototype.digestion.aggregator import TraditionStats
+
+        result: dict[str, TraditionStats] = {}
+        for tradition, state in self._traditions.items():
+            means: dict[str, float] = {}
+            stds: dict[str, float] = {}
+            for dim, (n, total, sumsq) in state["dims"].items():
+                if n:
+                    mean = total / n
+                    means[dim] = mean
+                    stds[dim] = math.sqrt(max(0.0, sumsq / n - mean * mean))
+            result[tradition] = TraditionStats(
+                tradition=tradition,
+                session_count=state["sessions"],
+                avg_weighted_total=state["wt_sum"] / state["wt_n"] if state["wt_n"] else 0.0,
+                mode_counts=dict(state["modes"]),
+                avg_scores_by_dim=means,
+                std_scores_by_dim=stds,
+                thumbs_up=state["thumbs_up"],
+                thumbs_down=state["thumbs_down"],
+            )
+        return result
+
+    def preference_profiles(self) -> dict:
+        """Per-tradition ``PreferenceProfile`` from the running tallies."""
+        from app.prototype.digestion.preference_learner import PreferenceProfile
+
+        profiles: dict[str, PreferenceProfile] = {}
+        for tradition, state in self._traditions.items():
+            if not state["feedback_sessions"]:
+                continue
+            profile = PreferenceProfile(
+                key=tradition,
+                total_positive=state["positive"],
+                total_negative=state["negative"],
+            )
+            # Find dimensions that are higher in positive-rated sessions
+            for dim, (n_pos, pos_sum, n_neg, neg_sum) in state["pref"].items():
+                if n_pos + n_neg < _PREF_MIN_SAMPLES:
+                    continue
+                pos_avg = pos_sum / n_pos if n_pos else 0.0
+                neg_avg = neg_sum / n_neg if n_neg else 0.0
+                if pos_avg > neg_avg + _PREF_MARGIN:
+                    profile.preferred_dimensions.append(dim)
+                elif neg_avg > pos_avg + _PREF_MARGIN:
+                    profile.avoided_dimensions.append(dim)
+            profiles[tradition] = profile
+        return profiles
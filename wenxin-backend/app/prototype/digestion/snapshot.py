@@ -0,0 +1,298 @@
+"""DigestSnapshot — one immutable, columnar view of sessions for a digestion cycle.
+
+A digestion cycle used to re-read ``sessions.jsonl`` once per consumer
+(aggregator, preference learner, every step, few-shot updater, feedback
+sync) and reload every trajectory file.  ``DigestSnapshot.load()`` reads
+sessions and trajectories once; the numeric fields the digesters
+aggregate over are unpacked into read-only NumPy columns so per-tradition
+statistics are array reductions instead of repeated dict walks.
+
+The snapshot is immutable: columns are non-writeable arrays, ``sessions``
+and ``trajectories`` are tuples.  The session dicts themselves are shared
+with every step and must be treated as read-only.  ``concat`` builds the
+next snapshot from newly appended sessions without re-reading old ones;
+``replace`` swaps in updated versions of sessions it already holds.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger("vulca")
+
+__all__ = ["DigestSnapshot", "load_trajectories"]
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.setflags(write=False)
+    return arr
+
+
+def _as_float(value: Any, default: float = np.nan) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return default
+
+
+def _feedback_items(feedback: Any) -> list[dict]:
+    # Inline feedback is a list of dicts; older sessions carry a single dict
+    if isinstance(feedback, list):
+        return [f for f in feedback if isinstance(f, dict)]
+    if isinstance(feedback, dict):
+        return [feedback]
+    return []
+
+
+@dataclass(frozen=True, eq=False)
+class DigestSnapshot:
+    """Sessions and trajectories of one digestion cycle, plus columnar arrays.
+
+    Row ``i`` of every column describes ``sessions[i]``.  Missing or
+    non-numeric values are ``NaN`` in float columns.
+    """
+
+    sessions: tuple[dict, ...]
+    trajectories: tuple = ()
+    # Trajectory file names already loaded (for incremental refresh)
+    trajectory_names: frozenset[str] = frozenset()
+
+    session_id: np.ndarray = field(repr=False, default=None)
+    tradition: np.ndarray = field(repr=False, default=None)
+    mode: np.ndarray = field(repr=False, default=None)
+    weighted_total: np.ndarray = field(repr=False, default=None)
+    created_at: np.ndarray = field(repr=False, default=None)
+    # One float column per numeric key seen in ``final_scores`` (L1..L5 or
+    # full dimension names), in first-seen order
+    dim_scores: Mapping[str, np.ndarray] = field(repr=False, default=None)
+    thumbs_up: np.ndarray = field(repr=False, default=None)
+    thumbs_down: np.ndarray = field(repr=False, default=None)
+    has_feedback: np.ndarray = field(repr=False, default=None)
+    downloaded: np.ndarray = field(repr=False, default=None)
+    time_to_select_ms: np.ndarray = field(repr=False, default=None)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, store: Any = None, include_trajectories: bool = True) -> DigestSnapshot:
+        """Read all sessions from *store* (and trajectories) exactly once."""
+        if store is None:
+            from app.prototype.session.store import SessionStore
+            store = SessionStore.get()
+        trajectories = load_trajectories() if include_trajectories else {}
+        return cls.from_sessions(store.get_all(), trajectories.values(), trajectories.keys())
+
+    @classmethod
+    def from_sessions(
+        cls,
+        sessions: Iterable[dict],
+        trajectories: Iterable = (),
+        trajectory_names: Iterable[str] = (),
+    ) -> DigestSnapshot:
+        """Build a snapshot from already-loaded session dicts."""
+        rows = tuple(s for s in sessions if isinstance(s, dict))
+        n = len(rows)
+
+        session_id: list[str] = []
+        tradition: list[Any] = []
+        mode: list[Any] = []
+        weighted_total = np.full(n, np.nan)
+        created_at = np.full(n, np.nan)
+        thumbs_up = np.zeros(n, dtype=np.int64)
+        thumbs_down = np.zeros(n, dtype=np.int64)
+        has_feedback = np.zeros(n, dtype=bool)
+        downloaded = np.zeros(n, dtype=bool)
+        time_to_select_ms = np.zeros(n)
+        dim_cells: dict[str, tuple[list[int], list[float]]] = {}
+
+        for i, s in enumerate(rows):
+            session_id.append(s.get("session_id", ""))
+            tradition.append(s.get("tradition", "default"))
+            mode.append(s.get("mode", "unknown"))
+            weighted_total[i] = _as_float(s.get("final_weighted_total"))
+            created_at[i] = _as_float(s.get("created_at"))
+
+            scores = s.get("final_scores") or {}
+            if isinstance(scores, dict):
+                for dim, score in scores.items():
+                    if isinstance(score, (int, float)):
+                        idx, vals = dim_cells.setdefault(dim, ([], []))
+                        idx.append(i)
+                        vals.append(float(score))
+
+            feedback = s.get("feedback")
+            has_feedback[i] = bool(feedback)
+            for fb in _feedback_items(feedback):
+                rating = fb.get("rating", "")
+                if rating == "thumbs_up":
+                    thumbs_up[i] += 1
+                elif rating == "thumbs_down":
+                    thumbs_down[i] += 1
+            downloaded[i] = bool(s.get("downloaded", False))
+            time_to_select_ms[i] = _as_float(s.get("time_to_select_ms"), 0.0)
+
+        dim_scores: dict[str, np.ndarray] = {}
+        for dim, (idx, vals) in dim_cells.items():
+            col = np.full(n, np.nan)
+            col[idx] = vals
+            dim_scores[dim] = _readonly(col)
+
+        return cls(
+            sessions=rows,
+            trajectories=tuple(trajectories),
+            trajectory_names=frozenset(trajectory_names),
+            session_id=_readonly(np.array(session_id, dtype=object)),
+            tradition=_readonly(np.array(tradition, dtype=object)),
+            mode=_readonly(np.array(mode, dtype=object)),
+            weighted_total=_readonly(weighted_total),
+            created_at=_readonly(created_at),
+            dim_scores=dim_scores,
+            thumbs_up=_readonly(thumbs_up),
+            thumbs_down=_readonly(thumbs_down),
+            has_feedback=_readonly(has_feedback),
+            downloaded=_readonly(downloaded),
+            time_to_select_ms=_readonly(time_to_select_ms),
+        )
+
+    def concat(self, other: DigestSnapshot) -> DigestSnapshot:
+        """Snapshot with *other*'s sessions and trajectories appended to these."""
+        n, m = len(self), len(other)
+        dim_scores: dict[str, np.ndarray] = {}
+        for dim in [*self.dim_scores, *(d for d in other.dim_scores if d not in self.dim_scores)]:
+            head = self.dim_scores.get(dim)
+            tail = other.dim_scores.get(dim)
+            dim_scores[dim] = _readonly(np.concatenate([
+                head if head is not None else np.full(n, np.nan),
+                tail if tail is not None else np.full(m, np.nan),
+            ]))
+
+        def _cat(name: str) -> np.ndarray:
+            return _readonly(np.concatenate([getattr(self, name), getattr(other, name)]))
+
+        merged = DigestSnapshot(
+            sessions=self.sessions + other.sessions,
+            trajectories=self.trajectories + other.trajectories,
+            trajectory_names=self.trajectory_names | other.trajectory_names,
+            session_id=_cat("session_id"),
+            tradition=_cat("tradition"),
+            mode=_cat("mode"),
+            weighted_total=_cat("weighted_total"),
+            created_at=_cat("created_at"),
+            dim_scores=dim_scores,
+            thumbs_up=_cat("thumbs_up"),
+            thumbs_down=_cat("thumbs_down"),
+            has_feedback=_cat("has_feedback"),
+            downloaded=_cat("downloaded"),
+            time_to_select_ms=_cat("time_to_select_ms"),
+        )
+        # Extend the row groups instead of regrouping every row
+        groups = dict(self.tradition_groups)
+        for t, rows in other.tradition_groups.items():
+            head = groups.get(t)
+            groups[t] = _readonly(rows + n if head is None else np.concatenate([head, rows + n]))
+        merged.__dict__["tradition_groups"] = groups
+        return merged
+
+    def replace(self, records: Iterable[dict]) -> DigestSnapshot:
+        """Snapshot with the latest row of each record's ``session_id`` replaced.
+
+        Records whose session is not in this snapshot are ignored.
+        """
+        rows: list[int] = []
+        updates: list[dict] = []
+        for record in records:
+            hits = np.flatnonzero(self.session_id == record.get("session_id", ""))
+            if hits.size:
+                rows.append(int(hits[-1]))
+                updates.append(record)
+        if not rows:
+            return self
+        other = DigestSnapshot.from_sessions(updates)
+        idx = np.asarray(rows, dtype=np.intp)
+        n = len(self)
+
+        def _swap(head: np.ndarray | None, tail: np.ndarray | None) -> np.ndarray:
+            col = np.full(n, np.nan) if head is None else head.copy()
+            col[idx] = np.nan if tail is None else tail
+            return _readonly(col)
+
+        sessions = list(self.sessions)
+        for i, record in zip(rows, updates):
+            sessions[i] = record
+        dim_scores = {
+            dim: _swap(self.dim_scores.get(dim), other.dim_scores.get(dim))
+            for dim in [*self.dim_scores, *(d for d in other.dim_scores if d not in self.dim_scores)]
+        }
+
+        def _col(name: str) -> np.ndarray:
+            return _swap(getattr(self, name), getattr(other, name))
+
+        replaced = DigestSnapshot(
+            sessions=tuple(sessions),
+            trajectories=self.trajectories,
+            trajectory_names=self.trajectory_names,
+            session_id=_col("session_id"),
+            tradition=_col("tradition"),
+            mode=_col("mode"),
+            weighted_total=_col("weighted_total"),
+            created_at=_col("created_at"),
+            dim_scores=dim_scores,
+            thumbs_up=_col("thumbs_up"),
+            thumbs_down=_col("thumbs_down"),
+            has_feedback=_col("has_feedback"),
+            downloaded=_col("downloaded"),
+            time_to_select_ms=_col("time_to_select_ms"),
+        )
+        # Keep the row groups when no updated session changed tradition
+        if (self.tradition[idx] == other.tradition).all():
+            replaced.__dict__["tradition_groups"] = self.tradition_groups
+        return replaced
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    @cached_property
+    def tradition_groups(self) -> dict[str, np.ndarray]:
+        """Row indices per tradition, in order of first appearance."""
+        groups: dict[str, list[int]] = {}
+        for i, t in enumerate(self.tradition):
+            groups.setdefault(t, []).append(i)
+        return {t: _readonly(np.asarray(idx, dtype=np.intp)) for t, idx in groups.items()}
+
+    def dim_sums(self, rows: np.ndarray) -> dict[str, tuple[int, float, float]]:
+        """``(count, sum, sum of squares)`` of every score column over *rows*.
+
+        Missing values are skipped; dimensions are ordered by the first row
+        in which they appear.
+        """
+        found: list[tuple[int, str, tuple[int, float, float]]] = []
+        for dim, col in self.dim_scores.items():
+            vals = col[rows]
+            present = ~np.isnan(vals)
+            if present.any():
+                vals = vals[present]
+                sums = (int(vals.size), float(vals.sum()), float(np.square(vals).sum()))
+                found.append((int(np.argmax(present)), dim, sums))
+        found.sort(key=lambda item: item[0])
+        return {dim: sums for _, dim, sums in found}
+
+
+def load_trajectories(skip: Iterable[str] = ()) -> dict:
+    """Trajectory records keyed by file name, skipping the names in *skip*."""
+    try:
+        from app.prototype.trajectory.trajectory_recorder import TrajectoryRecorder
+        return TrajectoryRecorder().load_by_name(frozenset(skip))
+    except Exception as exc:
+        logger.debug("DigestSnapshot: trajectories unavailable: %s", exc)
+        return {}
@@ -25,7 +25,8 @@ class PatternStep(BaseDigester):
                 ctx.evolver._store if ctx.evolver else None,
             )
             detector = PatternDetector(aggregator)
-            ctx.patterns = detector.detect()
+            stats = ctx.aggregates.tradition_stats() if ctx.aggregates is not None else None
+            ctx.patterns = detector.detect(ctx.snapshot, stats=stats)
             ctx.changed = True
         except Exception as exc:
             logger.debug("PatternStep skipped: %s", exc)
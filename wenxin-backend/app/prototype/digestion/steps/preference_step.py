@@ -23,7 +23,10 @@ class PreferenceStep(BaseDigester):
             learner = PreferenceLearner(
                 ctx.evolver._store if ctx.evolver else None,
             )
-            preferences = learner.learn()
+            if ctx.aggregates is not None:
+                preferences = ctx.aggregates.preference_profiles()
+            else:
+                preferences = learner.learn(ctx.snapshot)
             if preferences:
                 ctx.data["_preferences"] = preferences
                 ctx.changed = True
@@ -22,7 +22,8 @@ class TrajectoryStep(BaseDigester):
             if evolver is None:
                 logger.debug("TrajectoryStep skipped: no evolver reference")
                 return ctx
-            insights = evolver._extract_trajectory_insights()
+            records = ctx.snapshot.trajectories if ctx.snapshot is not None else None
+            insights = evolver._extract_trajectory_insights(records)
             if insights:
                 ctx.data.setdefault("trajectory_insights", {}).update(insights)
                 ctx.changed = True
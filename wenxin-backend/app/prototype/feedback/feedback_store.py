@@ -6,6 +6,7 @@ import json
 import os
 import threading
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from app.prototype.feedback.types import FeedbackRecord, FeedbackStats
@@ -78,14 +79,19 @@ class FeedbackStore:
         records = self._read_all()
         return records[-limit:]
 
-    def sync_from_sessions(self) -> int:
+    def sync_from_sessions(self, sessions: Iterable[dict] | None = None) -> int:
         """Sync inline feedback from sessions.jsonl to feedback.jsonl.
 
+        *sessions* lets a digestion cycle pass the session dicts it already
+        loaded; by default ``sessions.jsonl`` next to the feedback file is read.
+
         Returns count of new feedback entries synced.
         """
-        sessions_path = self._path.parent / "sessions.jsonl"
-        if not sessions_path.exists():
-            return 0
+        if sessions is None:
+            sessions_path = self._path.parent / "sessions.jsonl"
+            if not sessions_path.exists():
+                return 0
+            sessions = self._iter_sessions(sessions_path)
 
         # Load existing feedback evaluation_ids to avoid duplicates
         existing_ids: set[str] = set()
@@ -99,14 +105,7 @@ class FeedbackStore:
                         pass
 
         synced = 0
-        for line in sessions_path.read_text().strip().split("\n"):
-            if not line.strip():
-                continue
-            try:
-                session = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
+        for session in sessions:
             sid = session.get("session_id", "")
             if not sid or sid in existing_ids:
                 continue
@@ -157,6 +156,16 @@ class FeedbackStore:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _iter_sessions(path: Path) -> Iterator[dict]:
+        for line in path.read_text().strip().split("\n"):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
     def _read_all(self) -> list[FeedbackRecord]:
         if not self._path.exists():
             return []
@@ -31,6 +31,7 @@ from typing import Any
 from app.prototype.checkpoints.pipeline_checkpoint import (
     load_pipeline_stage,
     save_pipeline_stage,
+    verify_pipeline_stage,
 )
 from app.prototype.cultural_pipelines.dynamic_weights import compute_dynamic_weights
 from app.prototype.graph.pipeline_graph import build_default_graph
@@ -146,11 +147,10 @@ class GraphOrchestrator:
             if resume_from and resume_from in _STAGE_ORDER:
                 resume_idx = _STAGE_ORDER.index(resume_from)
                 for prior_stage in _STAGE_ORDER[:resume_idx]:
-                    ckpt = load_pipeline_stage(task_id, prior_stage)
-                    if ckpt is None:
+                    if not verify_pipeline_stage(task_id, prior_stage):
                         raise RuntimeError(
                             f"Cannot resume from '{resume_from}': "
-                            f"checkpoint for '{prior_stage}' not found"
+                            f"checkpoint for '{prior_stage}' not found or invalid"
                         )
                 logger.info(
                     "Resuming task %s from stage '%s' (skipping %s)",
@@ -11,8 +11,7 @@ import json
 import logging
 from typing import ClassVar
 
-import litellm
-
+from app.prototype.agents import llm_gateway
 from app.prototype.agents.model_router import MODELS
 from app.prototype.intent.types import IntentResult
 
@@ -87,12 +86,13 @@ class IntentAgent:
             if api_key:
                 extra["api_key"] = api_key
 
-            response = await litellm.acompletion(
+            response = await llm_gateway.acompletion(
                 model=spec.litellm_id,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": intent},
                 ],
+                cache=True,
                 max_tokens=256,
                 temperature=0.1,
                 timeout=30,
@@ -3,7 +3,7 @@
 Each handler follows the StageHandler protocol:
     async (stage_def: SubStageDef, context: dict) -> SubStageArtifact
 
-Handlers call ``litellm.acompletion`` via MODEL_FAST for text/JSON generation.
+Handlers call ``llm_gateway.acompletion`` via MODEL_FAST for text/JSON generation.
 When NB2 (Gemini image generation) is available, key handlers also produce
 visual artifacts alongside their text outputs.
 
@@ -17,8 +17,7 @@ import json
 import logging
 from typing import Any
 
-import litellm
-
+from app.prototype.agents import llm_gateway
 from app.prototype.agents.model_router import MODEL_FAST, MODEL_VLM
 from app.prototype.media.types import SubStageArtifact, SubStageDef
 from app.prototype.media.visual_renderer import render_visual, get_substage_output_dir
@@ -97,7 +96,7 @@ async def handle_mood_palette(stage_def: SubStageDef, context: dict[str, Any]) -
 
     try:
         tradition_clause = f" in the '{tradition}' cultural/artistic tradition" if tradition and tradition != "default" else ""
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -172,7 +171,7 @@ async def handle_composition_sketch(stage_def: SubStageDef, context: dict[str, A
         if previous:
             mood_info = f"\n\nPrevious stage outputs:\n{previous}\n"
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -256,7 +255,7 @@ async def handle_element_studies(stage_def: SubStageDef, context: dict[str, Any]
             "Keep each element study to 50-80 words."
         )
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -327,7 +326,7 @@ async def handle_style_reference(stage_def: SubStageDef, context: dict[str, Any]
             "Keep the response to 150-250 words."
         )
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -419,7 +418,7 @@ async def handle_storyboard(stage_def: SubStageDef, context: dict[str, Any]) ->
             "This plan will guide the final rendering. Be specific and actionable (200-400 words)."
         )
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -498,7 +497,7 @@ async def handle_final_render(stage_def: SubStageDef, context: dict[str, Any]) -
             "Return ONLY the generation prompt text, nothing else."
         )
 
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -12,8 +12,7 @@ import json
 import logging
 from typing import Any
 
-import litellm
-
+from app.prototype.agents import llm_gateway
 from app.prototype.agents.model_router import MODEL_FAST
 from app.prototype.media.types import SubStageArtifact, SubStageDef
 from app.prototype.media.visual_renderer import render_visual, get_substage_output_dir
@@ -85,7 +84,7 @@ async def handle_script(stage_def: SubStageDef, context: dict[str, Any]) -> SubS
             f" rooted in the '{tradition}' artistic tradition"
             if tradition and tradition != "default" else ""
         )
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -247,7 +246,7 @@ async def handle_style_frame(stage_def: SubStageDef, context: dict[str, Any]) ->
 
     try:
         tradition_clause = f" in the '{tradition}' tradition" if tradition and tradition != "default" else ""
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -310,7 +309,7 @@ async def handle_final_compose(stage_def: SubStageDef, context: dict[str, Any])
     previous = _gather_previous_outputs(context)
 
     try:
-        response = await litellm.acompletion(
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[{
                 "role": "user",
@@ -0,0 +1,227 @@
+"""EventBus — push-based fan-out of pipeline events to SSE subscribers.
+
+Each run gets a ``RunEventChannel``: a bounded, append-only log of events
+with absolute sequence numbers.  Publishers (the pipeline driver, on the
+event loop or in a GraphOrchestrator thread) append; subscribers iterate
+``channel.subscribe(cursor)`` and are woken the moment an event lands, so
+nothing polls.
+
+- cursor-based replay: a subscriber that connects late (or reconnects with
+  ``Last-Event-ID``) first receives every retained event from its cursor
+- bounded retention: at most ``max_events`` per run are kept; a subscriber
+  whose cursor fell out of the window resumes from the oldest retained one
+- many subscribers per run, each with its own cursor
+- channels close on PIPELINE_COMPLETED / PIPELINE_FAILED and are pruned
+  ``closed_ttl_sec`` later (or explicitly via ``discard``)
+
+Environment variables:
+- ``VULCA_EVENT_BUS_MAX_EVENTS``: events retained per run (default 1024)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+
+from app.prototype.orchestrator.events import EventType, PipelineEvent
+
+__all__ = [
+    "EventBus",
+    "RunEventChannel",
+    "TERMINAL_EVENTS",
+]
+
+TERMINAL_EVENTS = frozenset({EventType.PIPELINE_COMPLETED, EventType.PIPELINE_FAILED})
+
+_DEFAULT_MAX_EVENTS = int(os.environ.get("VULCA_EVENT_BUS_MAX_EVENTS", "1024"))
+_DEFAULT_CLOSED_TTL_SEC = 3600.0
+
+
+class RunEventChannel:
+    """Event log of a single run with async, cursor-based subscribers."""
+
+    def __init__(self, max_events: int = _DEFAULT_MAX_EVENTS) -> None:
+        self._events: deque[PipelineEvent] = deque(maxlen=max(1, max_events))
+        self._next_seq = 0
+        self._closed_at: float | None = None
+        self._lock = threading.Lock()
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed_at is not None
+
+    @property
+    def closed_at(self) -> float | None:
+        return self._closed_at
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next published event will get."""
+        return self._next_seq
+
+    def publish(self, event: PipelineEvent) -> int:
+        """Append *event* and wake all subscribers. Returns its sequence number.
+
+        Safe to call from any thread.  Terminal events close the channel.
+        """
+        with self._lock:
+            seq = self._next_seq
+            self._events.append(event)
+            self._next_seq += 1
+            if event.event_type in TERMINAL_EVENTS and self._closed_at is None:
+                self._closed_at = time.monotonic()
+            waiters, self._waiters = self._waiters, set()
+        _wake_all(waiters)
+        return seq
+
+    def close(self) -> None:
+        """Close without a terminal event; subscribers drain and stop."""
+        with self._lock:
+            if self._closed_at is None:
+                self._closed_at = time.monotonic()
+            waiters, self._waiters = self._waiters, set()
+        _wake_all(waiters)
+
+    def snapshot(self, cursor: int = 0) -> list[PipelineEvent]:
+        """Retained events with sequence number >= *cursor* (non-blocking)."""
+        with self._lock:
+            return self._read(cursor)[1]
+
+    def last_event(self) -> PipelineEvent | None:
+        with self._lock:
+            return self._events[-1] if self._events else None
+
+    def _read(self, cursor: int) -> tuple[int, list[PipelineEvent]]:
+        # Caller holds self._lock
+        first = self._next_seq - len(self._events)
+        cursor = max(cursor, first)
+        return cursor, list(itertools.islice(self._events, cursor - first, None))
+
+    async def subscribe(
+        self, cursor: int = 0, timeout: float | None = None,
+    ) -> AsyncIterator[tuple[int, PipelineEvent]]:
+        """Yield ``(seq, event)`` from *cursor* on, as events are published.
+
+        Ends once the channel is closed and drained, or when *timeout*
+        seconds have passed since subscribing.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            waiter = None
+            with self._lock:
+                cursor, batch = self._read(cursor)
+                closed = self._closed_at is not None
+                if not batch and not closed:
+                    waiter = loop.create_future()
+                    self._waiters.add((loop, waiter))
+
+            for event in batch:
+                yield cursor, event
+                cursor += 1
+            if batch:
+                continue
+            if closed:
+                return
+
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                if remaining is not None and remaining <= 0:
+                    return
+                await asyncio.wait_for(waiter, timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            finally:
+                with self._lock:
+                    self._waiters.discard((loop, waiter))
+
+
+def _wake_all(waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future]]) -> None:
+    for loop, waiter in waiters:
+        try:
+            loop.call_soon_threadsafe(_wake, waiter)
+        except RuntimeError:
+            pass  # loop already closed; the subscriber is gone with it
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class EventBus:
+    """Registry of per-run event channels, keyed by task / session id."""
+
+    def __init__(
+        self,
+        max_events: int = _DEFAULT_MAX_EVENTS,
+        closed_ttl_sec: float = _DEFAULT_CLOSED_TTL_SEC,
+    ) -> None:
+        self._max_events = max_events
+        self._closed_ttl_sec = closed_ttl_sec
+        self._channels: dict[str, RunEventChannel] = {}
+        self._lock = threading.Lock()
+
+    def open(self, run_id: str) -> RunEventChannel:
+        """Create (or replace) the channel for *run_id*."""
+        channel = RunEventChannel(self._max_events)
+        with self._lock:
+            self._prune_locked()
+            old = self._channels.get(run_id)
+            self._channels[run_id] = channel
+        if old is not None:
+            old.close()
+        return channel
+
+    def get(self, run_id: str) -> RunEventChannel | None:
+        with self._lock:
+            return self._channels.get(run_id)
+
+    def publish(self, run_id: str, event: PipelineEvent) -> int:
+        """Publish to *run_id*, opening its channel on first use."""
+        with self._lock:
+            channel = self._channels.get(run_id)
+            if channel is None:
+                channel = self._channels[run_id] = RunEventChannel(self._max_events)
+        return channel.publish(event)
+
+    def snapshot(self, run_id: str, cursor: int = 0) -> list[PipelineEvent]:
+        channel = self.get(run_id)
+        return channel.snapshot(cursor) if channel is not None else []
+
+    def discard(self, run_id: str) -> None:
+        """Drop the channel for *run_id*; live subscribers drain and stop."""
+        with self._lock:
+            channel = self._channels.pop(run_id, None)
+        if channel is not None:
+            channel.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            channels, self._channels = list(self._channels.values()), {}
+        for channel in channels:
+            channel.close()
+
+    def __contains__(self, run_id: object) -> bool:
+        with self._lock:
+            return run_id in self._channels
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._channels)
+
+    def _prune_locked(self) -> None:
+        # Caller holds self._lock
+        now = time.monotonic()
+        expired = [
+            run_id for run_id, channel in self._channels.items()
+            if channel.closed_at is not None and now - channel.closed_at > self._closed_ttl_sec
+        ]
+        for run_id in expired:
+            del self._channels[run_id]
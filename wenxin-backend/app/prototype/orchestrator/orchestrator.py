@@ -11,20 +11,26 @@ Supports both synchronous and streaming (generator) modes.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import dataclasses
+import functools
 import logging
+import os
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.prototype.agents.archivist_types import ArchivistInput
-from app.prototype.agents.critic_agent import build_critique_output
+from app.prototype.agents.critic_agent import StreamingCritique, build_critique_output
 from app.prototype.agents.critic_config import CriticConfig, DIMENSIONS
 from app.prototype.agents.critic_types import CandidateScore, CritiqueInput, CritiqueOutput
 from app.prototype.agents.draft_config import DraftConfig
-from app.prototype.agents.draft_types import DraftInput
+from app.prototype.agents.draft_types import DraftInput, DraftOutput
 from app.prototype.agents.layer_state import LocalRerunRequest
 from app.prototype.agents.queen_config import QueenConfig
 from app.prototype.agents.queen_types import PlanState
@@ -37,11 +43,14 @@ if TYPE_CHECKING:
     from app.prototype.agents.draft_agent import DraftAgent
     from app.prototype.agents.queen_agent import QueenAgent
     from app.prototype.agents.queen_llm import QueenLLMAgent
+from app.prototype.checkpoints.codec import CheckpointDecodeError
 from app.prototype.checkpoints.pipeline_checkpoint import (
     load_pipeline_stage,
+    open_pipeline_stage,
     save_pipeline_output,
     save_pipeline_stage,
     update_runs_index,
+    verify_pipeline_stage,
 )
 from app.prototype.orchestrator.events import EventType, PipelineEvent
 from app.prototype.orchestrator.run_state import HumanAction, RunState, RunStatus
@@ -74,6 +83,55 @@ _COST_PER_IMAGE: dict[str, float] = {
 _MAX_COST_PER_RUN_USD = 2.00
 _DRAFT_CHECKPOINT_ROOT = (Path(__file__).resolve().parent.parent / "checkpoints" / "draft").resolve()
 
+# Worker threads shared by every arun_stream() for blocking stage calls
+_STAGE_WORKERS = int(os.environ.get("VULCA_PIPELINE_STAGE_WORKERS", "32"))
+_stage_executor: ThreadPoolExecutor | None = None
+_stage_executor_lock = threading.Lock()
+
+
+def _get_stage_executor() -> ThreadPoolExecutor:
+    global _stage_executor  # noqa: PLW0603
+    if _stage_executor is None:
+        with _stage_executor_lock:
+            if _stage_executor is None:
+                _stage_executor = ThreadPoolExecutor(
+                    max_workers=_STAGE_WORKERS, thread_name_prefix="pipeline-stage",
+                )
+    return _stage_executor
+
+
+@dataclasses.dataclass
+class _BlockingCall:
+    """A slow step of ``_pipeline_steps``; run inline or off the event loop."""
+
+    fn: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict = dataclasses.field(default_factory=dict)
+    async_fn: Callable[..., Awaitable[Any]] | None = None
+
+
+@dataclasses.dataclass
+class _AwaitHuman:
+    """A HITL pause of ``_pipeline_steps``."""
+
+    run_state: RunState
+    timeout: float | None = None
+
+
+def _blocking(
+    fn: Callable[..., Any],
+    *args: Any,
+    async_fn: Callable[..., Awaitable[Any]] | None = None,
+    **kwargs: Any,
+) -> _BlockingCall:
+    return _BlockingCall(fn=fn, args=args, kwargs=kwargs, async_fn=async_fn)
+
+
+def _load_draft_candidates(task_id: str) -> list:
+    """Read only the candidates of the draft checkpoint (evidence blobs stay unread)."""
+    draft_ckpt = open_pipeline_stage(task_id, "draft")
+    return draft_ckpt.get("candidates", []) if draft_ckpt else []
+
 
 class PipelineOrchestrator:
     """Unified pipeline execution engine.
@@ -90,6 +148,11 @@ class PipelineOrchestrator:
         If True, pause at Queen decisions for human input.
     enable_archivist : bool
         If True, run Archivist after pipeline completes.
+    enable_streaming_critic : bool
+        If True, score each Draft candidate as soon as its image is written
+        instead of waiting for the whole batch, and stop the round early once
+        a candidate reaches Queen's early-stop threshold.  Applies to the
+        rule-based and parallel Critic paths without Draft HITL.
     """
 
     def __init__(
@@ -107,6 +170,7 @@ class PipelineOrchestrator:
         enable_parallel_critic: bool = False,
         enable_skill_hook: bool = False,
         skill_hook_names: list[str] | None = None,
+        enable_streaming_critic: bool = False,
     ) -> None:
         self.d_cfg = draft_config or DraftConfig(provider="nb2", n_candidates=4, seed_base=42)
         self.cr_cfg = critic_config or CriticConfig()
@@ -121,6 +185,7 @@ class PipelineOrchestrator:
         self.enable_parallel_critic = enable_parallel_critic
         self.enable_skill_hook = enable_skill_hook
         self.skill_hook_names = skill_hook_names
+        self.enable_streaming_critic = enable_streaming_critic
 
         # Lazy import to avoid circular dependency
         from app.prototype.observability.langfuse_observer import LangfuseObserver
@@ -143,6 +208,65 @@ class PipelineOrchestrator:
         """Get the RunState for an active run."""
         return self._runs.get(task_id)
 
+    def _use_streaming_critic(self) -> bool:
+        # Draft HITL must see the whole batch before Critic runs, and the LLM
+        # critic reasons across candidates, so both keep the batched path.
+        return (
+            self.enable_streaming_critic
+            and not self.enable_hitl
+            and not self.enable_agent_critic
+            and not self.d_cfg.enable_sub_stages
+        )
+
+    def _draft_with_streaming_critic(
+        self,
+        draft_agent: Any,
+        draft_input: DraftInput,
+        evidence_pack: Any,
+        critic_cfg: CriticConfig,
+        evidence: dict,
+        subject: str,
+    ) -> tuple[DraftOutput, CritiqueOutput]:
+        """Run Draft, handing each candidate to Critic as soon as it exists."""
+        if self.enable_parallel_critic:
+            from app.prototype.agents.parallel_scorer import ParallelDimensionScorer
+            score_fn = ParallelDimensionScorer(max_workers=5).score_all_dimensions
+        else:
+            from app.prototype.agents.critic_rules import CriticRules
+            score_fn = CriticRules().score
+
+        stream = StreamingCritique(
+            task_id=draft_input.task_id,
+            evidence=evidence,
+            cultural_tradition=draft_input.cultural_tradition,
+            subject=subject,
+            cfg=critic_cfg,
+            score_fn=score_fn,
+            early_accept_threshold=self.q_cfg.early_stop_threshold,
+        )
+        try:
+            draft_output = draft_agent.run(
+                draft_input,
+                evidence_pack=evidence_pack,
+                on_candidate=lambda cand: stream.submit(cand.to_dict()),
+            )
+        except BaseException:
+            stream.abort()
+            raise
+        critique_output = stream.finish([c.to_dict() for c in draft_output.candidates])
+        if stream.early_accepted:
+            # Candidates whose scoring was skipped after the accept are
+            # dropped, so Draft and Critic output describe the same set.
+            scored_ids = {s.candidate_id for s in critique_output.scored_candidates}
+            draft_output.candidates = [
+                c for c in draft_output.candidates if c.candidate_id in scored_ids
+            ]
+            logger.info(
+                "Streaming critic early-accepted %s after %d/%d candidates",
+                stream.early_accepted_id, len(draft_output.candidates), draft_input.config.n_candidates,
+            )
+        return draft_output, critique_output
+
     def _run_skill_hook(
         self, image_path: str, tradition: str, stage: str = "post_critic",
     ) -> list[dict]:
@@ -208,6 +332,77 @@ class PipelineOrchestrator:
         Supports ``resume_from`` to skip stages before the resume point,
         loading their outputs from checkpoints.
         """
+        steps = self._pipeline_steps(pipeline_input)
+        reply: Any = None
+        error: Exception | None = None
+        try:
+            while True:
+                try:
+                    step = steps.throw(error) if error is not None else steps.send(reply)
+                except StopIteration:
+                    return
+                reply, error = None, None
+                if isinstance(step, PipelineEvent):
+                    yield step
+                elif isinstance(step, _AwaitHuman):
+                    reply = step.run_state.wait_for_human(timeout=step.timeout)
+                else:
+                    try:
+                        reply = step.fn(*step.args, **step.kwargs)
+                    except Exception as exc:  # re-raised inside the pipeline
+                        error = exc
+        finally:
+            steps.close()
+
+    async def arun_stream(self, pipeline_input: PipelineInput) -> AsyncIterator[PipelineEvent]:
+        """Async-generator variant of ``run_stream`` with identical events.
+
+        HITL pauses suspend the coroutine instead of parking a thread, and
+        steps with a native async implementation (prompt enhancement, Critic
+        and CriticLLM scoring, the LLM Queen) are awaited directly.  The
+        remaining sync-only calls (Scout retrieval, Draft providers, the
+        streaming/parallel critics, rule Queen, Archivist, checkpoint IO)
+        still run on a shared bounded executor.
+        """
+        loop = asyncio.get_running_loop()
+        steps = self._pipeline_steps(pipeline_input)
+        reply: Any = None
+        error: Exception | None = None
+        try:
+            while True:
+                try:
+                    step = steps.throw(error) if error is not None else steps.send(reply)
+                except StopIteration:
+                    return
+                reply, error = None, None
+                if isinstance(step, PipelineEvent):
+                    yield step
+                elif isinstance(step, _AwaitHuman):
+                    reply = await step.run_state.await_human(timeout=step.timeout)
+                else:
+                    try:
+                        if step.async_fn is not None:
+                            reply = await step.async_fn(*step.args, **step.kwargs)
+                        else:
+                            ctx = contextvars.copy_context()
+                            reply = await loop.run_in_executor(
+                                _get_stage_executor(),
+                                functools.partial(ctx.run, step.fn, *step.args, **step.kwargs),
+                            )
+                    except Exception as exc:  # re-raised inside the pipeline
+                        error = exc
+        finally:
+            steps.close()
+
+    def _pipeline_steps(
+        self, pipeline_input: PipelineInput,
+    ) -> Generator[PipelineEvent | _BlockingCall | _AwaitHuman, Any, None]:
+        """The pipeline itself, written once for both drivers.
+
+        Yields PipelineEvents to forward, ``_BlockingCall`` for slow calls
+        (the driver sends back the result or throws the exception in), and
+        ``_AwaitHuman`` for HITL pauses (the driver sends back the action).
+        """
         t0 = time.monotonic()
         task_id = pipeline_input.task_id
         stages: list[StageResult] = []
@@ -231,11 +426,10 @@ class PipelineOrchestrator:
             if resume_from and resume_from in _STAGE_ORDER:
                 resume_idx = _STAGE_ORDER.index(resume_from)
                 for prior_stage in _STAGE_ORDER[:resume_idx]:
-                    ckpt = load_pipeline_stage(task_id, prior_stage)
-                    if ckpt is None:
+                    if not verify_pipeline_stage(task_id, prior_stage):
                         raise RuntimeError(
                             f"Cannot resume from '{resume_from}': "
-                            f"checkpoint for '{prior_stage}' not found"
+                            f"checkpoint for '{prior_stage}' not found or invalid"
                         )
 
             # Layer 2: Trajectory recorder
@@ -245,8 +439,8 @@ class PipelineOrchestrator:
             # ==== SCOUT ====
             if resume_from and resume_from in _STAGE_ORDER and _STAGE_ORDER.index(resume_from) > 0:
                 # Skip scout — load from checkpoint
-                evidence_dict = load_pipeline_stage(task_id, "scout") or {}
-                scout_svc = get_scout_service()  # needed for supplementary evidence loop
+                evidence_dict = (yield _blocking(load_pipeline_stage, task_id, "scout")) or {}
+                scout_svc = yield _blocking(get_scout_service)  # needed for supplementary evidence loop
                 # Reconstruct evidence_pack from checkpoint (E-2 fix)
                 if "evidence_pack" in evidence_dict:
                     try:
@@ -263,8 +457,9 @@ class PipelineOrchestrator:
                 run_state.current_stage = "scout"
 
                 st = time.monotonic()
-                scout_svc = get_scout_service()
-                evidence = scout_svc.gather_evidence(
+                scout_svc = yield _blocking(get_scout_service)
+                evidence = yield _blocking(
+                    scout_svc.gather_evidence,
                     subject=pipeline_input.subject,
                     cultural_tradition=pipeline_input.cultural_tradition,
                 )
@@ -272,7 +467,8 @@ class PipelineOrchestrator:
                 evidence_dict["evidence_coverage"] = scout_svc.compute_evidence_coverage(evidence)
 
                 # Layer 1a: Build structured EvidencePack
-                evidence_pack = scout_svc.build_evidence_pack(
+                evidence_pack = yield _blocking(
+                    scout_svc.build_evidence_pack,
                     subject=pipeline_input.subject,
                     tradition=pipeline_input.cultural_tradition,
                     evidence=evidence,
@@ -280,7 +476,7 @@ class PipelineOrchestrator:
                 evidence_dict["evidence_pack"] = evidence_pack.to_dict()
 
                 scout_ms = int((time.monotonic() - st) * 1000)
-                save_pipeline_stage(task_id, "scout", evidence_dict)
+                yield _blocking(save_pipeline_stage, task_id, "scout", evidence_dict)
 
                 stages.append(StageResult(
                     stage="scout", status="completed", latency_ms=scout_ms,
@@ -302,7 +498,7 @@ class PipelineOrchestrator:
                         "stage": "scout",
                         "evidence": evidence_dict,
                     })
-                    human_action = run_state.wait_for_human(timeout=300)
+                    human_action = yield _AwaitHuman(run_state, timeout=300)
                     if human_action is not None:
                         yield self._event(EventType.HUMAN_RECEIVED, "scout", 0, t0, {
                             "action": human_action.action,
@@ -332,7 +528,7 @@ class PipelineOrchestrator:
 
             # ==== CRITIC → QUEEN LOOP ====
             plan_state = PlanState(task_id=task_id)
-            queen = create_agent("queen", config=self.q_cfg)
+            queen = yield _blocking(create_agent, "queen", config=self.q_cfg)
             queen_output = None  # set after Queen stage each round
             final_decision = "stop"
             best_candidate_id: str | None = None
@@ -350,6 +546,8 @@ class PipelineOrchestrator:
             # R6-1: Skip Draft after successful rerun_local — the refined
             # image is already in draft_candidates, go straight to Critic.
             _skip_draft_after_refine = False
+            # Critique produced during Draft by the streaming critic, if any
+            streamed_critique: CritiqueOutput | None = None
 
             while True:
                 round_num += 1
@@ -382,8 +580,13 @@ class PipelineOrchestrator:
                         )
                 elif _skip_draft_first_round and round_num == 1:
                     # Skip draft — load from checkpoint
-                    draft_ckpt = load_pipeline_stage(task_id, "draft")
-                    draft_candidates = draft_ckpt.get("candidates", []) if draft_ckpt else []
+                    try:
+                        draft_candidates = yield _blocking(_load_draft_candidates, task_id)
+                    except CheckpointDecodeError as exc:
+                        raise RuntimeError(
+                            f"Cannot resume from '{resume_from}': "
+                            f"checkpoint for 'draft' not found or invalid ({exc})"
+                        ) from exc
                     stages.append(StageResult(stage="draft", status="skipped"))
                     _skip_draft_first_round = False  # Only skip once
                     rerun_prompt_delta = ""  # Defensive: clear in case of future changes
@@ -402,7 +605,7 @@ class PipelineOrchestrator:
                         height=self.d_cfg.height,
                         provider_model=self.d_cfg.provider_model,
                     )
-                    draft_agent = create_agent("draft", config=round_cfg)
+                    draft_agent = yield _blocking(create_agent, "draft", config=round_cfg)
                     # Apply FixItPlan prompt_delta from previous round's Critic
                     effective_subject = pipeline_input.subject
                     if rerun_prompt_delta:
@@ -414,7 +617,9 @@ class PipelineOrchestrator:
                     if self.enable_prompt_enhancer and round_num == 1:
                         pre_enhance = effective_subject
                         enhancer = PromptEnhancer(enabled=True)
-                        effective_subject = enhancer.enhance(
+                        effective_subject = yield _blocking(
+                            enhancer.enhance,
+                            async_fn=enhancer.aenhance,
                             subject=effective_subject,
                             cultural_tradition=pipeline_input.cultural_tradition,
                             evidence=evidence_dict,
@@ -437,11 +642,20 @@ class PipelineOrchestrator:
 
                     st = time.monotonic()
                     # Layer 1a: Pass EvidencePack to Draft for enriched prompts
-                    draft_output = draft_agent.run(draft_input, evidence_pack=evidence_pack)
+                    if self._use_streaming_critic():
+                        draft_output, streamed_critique = yield _blocking(
+                            self._draft_with_streaming_critic,
+                            draft_agent, draft_input, evidence_pack,
+                            routed_critic_cfg, evidence_dict, pipeline_input.subject,
+                        )
+                    else:
+                        draft_output = yield _blocking(draft_agent.run, draft_input, evidence_pack=evidence_pack)
                     draft_candidates = [c.to_dict() for c in draft_output.candidates]
                     self._attach_candidate_image_urls(draft_candidates)
                     draft_ms = int((time.monotonic() - st) * 1000)
-                    images_generated += len(draft_candidates)
+                    # Count what the provider produced, not the candidates kept
+                    # after a streaming early-accept
+                    images_generated += draft_output.images_generated
 
                     # Cost check
                     cost_per_image = _COST_PER_IMAGE.get(self.d_cfg.provider, 0.0)
@@ -456,7 +670,7 @@ class PipelineOrchestrator:
                     }
                     if self.enable_prompt_enhancer and round_num == 1:
                         draft_ckpt_data["prompt_enhanced"] = prompt_enhanced
-                    save_pipeline_stage(task_id, "draft", draft_ckpt_data)
+                    yield _blocking(save_pipeline_stage, task_id, "draft", draft_ckpt_data)
                     stages.append(StageResult(
                         stage="draft", status="completed", latency_ms=draft_ms,
                         output_summary={
@@ -477,7 +691,7 @@ class PipelineOrchestrator:
                             "stage": "draft",
                             "candidates": draft_candidates,
                         })
-                        human_action = run_state.wait_for_human(timeout=300)
+                        human_action = yield _AwaitHuman(run_state, timeout=300)
                         if human_action is not None:
                             yield self._event(EventType.HUMAN_RECEIVED, "draft", round_num, t0, {
                                 "action": human_action.action,
@@ -523,8 +737,14 @@ class PipelineOrchestrator:
 
                 dyn_weights = None  # initialized before conditional assignment
                 st = time.monotonic()
-                if self.enable_agent_critic:
-                    critic = create_agent("critic_llm", config=routed_critic_cfg)
+                streamed = streamed_critique is not None
+                if streamed:
+                    # Already scored candidate-by-candidate while Draft ran
+                    critique_output = streamed_critique
+                    streamed_critique = None
+                    critic = None
+                elif self.enable_agent_critic:
+                    critic = yield _blocking(create_agent, "critic_llm", config=routed_critic_cfg)
                     critique_input = CritiqueInput(
                         task_id=task_id,
                         subject=pipeline_input.subject,
@@ -532,12 +752,13 @@ class PipelineOrchestrator:
                         evidence=evidence_dict,
                         candidates=draft_candidates,
                     )
-                    critique_output = critic.run(critique_input)
+                    critique_output = yield _blocking(critic.run, critique_input, async_fn=critic.arun)
                 elif self.enable_parallel_critic:
                     # Parallel L1-L5 scoring via ThreadPoolExecutor
                     from app.prototype.agents.parallel_scorer import ParallelDimensionScorer
                     scorer = ParallelDimensionScorer(max_workers=5)
-                    critique_output = build_critique_output(
+                    critique_output = yield _blocking(
+                        build_critique_output,
                         task_id=task_id,
                         candidates=draft_candidates,
                         evidence=evidence_dict,
@@ -549,7 +770,7 @@ class PipelineOrchestrator:
                     )
                     critic = None  # no CriticAgent instance in parallel path
                 else:
-                    critic = create_agent("critic", config=routed_critic_cfg)
+                    critic = yield _blocking(create_agent, "critic", config=routed_critic_cfg)
                     critique_input = CritiqueInput(
                         task_id=task_id,
                         subject=pipeline_input.subject,
@@ -557,7 +778,7 @@ class PipelineOrchestrator:
                         evidence=evidence_dict,
                         candidates=draft_candidates,
                     )
-                    critique_output = critic.run(critique_input)
+                    critique_output = yield _blocking(critic.run, critique_input, async_fn=critic.arun)
                 # R7-2: Replace (not extend) cross_layer_signals each round
                 # to prevent stale signals from prior rounds distorting
                 # dynamic weight modulation.
@@ -600,9 +821,11 @@ class PipelineOrchestrator:
                 if hitl_constraints:
                     critique_dict["hitl_constraints"] = hitl_constraints
                 critic_ms = int((time.monotonic() - st) * 1000)
+                if streamed:
+                    critic_ms = critique_output.latency_ms
                 prev_dimension_scores = self._snapshot_dimension_scores(critique_output)
 
-                save_pipeline_stage(task_id, "critic", critique_dict)
+                yield _blocking(save_pipeline_stage, task_id, "critic", critique_dict)
                 critique_dicts.append(critique_dict)
 
                 stages.append(StageResult(
@@ -615,6 +838,7 @@ class PipelineOrchestrator:
                         ),
                         "rerun_hint": critique_output.rerun_hint,
                         "hitl_constraints_applied": bool(hitl_constraints),
+                        "streamed": streamed,
                     },
                 ))
                 # Build enhanced critic event payload (Phase 2)
@@ -657,7 +881,7 @@ class PipelineOrchestrator:
                         "stage": "critic",
                         "scored_candidates": [sc.to_dict() for sc in critique_output.scored_candidates],
                     })
-                    human_action = run_state.wait_for_human(timeout=300)
+                    human_action = yield _AwaitHuman(run_state, timeout=300)
                     if human_action is not None:
                         yield self._event(EventType.HUMAN_RECEIVED, "critic", round_num, t0, {
                             "action": human_action.action,
@@ -678,7 +902,8 @@ class PipelineOrchestrator:
                         and evidence_pack is not None
                         and round_num <= 2):  # max 2 supplementary rounds
                     try:
-                        evidence_pack = scout_svc.gather_supplementary(
+                        evidence_pack = yield _blocking(
+                            scout_svc.gather_supplementary,
                             need=critic.need_more_evidence,
                             existing_pack=evidence_pack,
                             target_layers=critic.need_more_evidence.target_layers or None,
@@ -716,7 +941,8 @@ class PipelineOrchestrator:
                         if cand.get("candidate_id") == critique_output.best_candidate_id:
                             cand_path = cand.get("image_path", "")
                             if cand_path:
-                                skill_results = self._run_skill_hook(
+                                skill_results = yield _blocking(
+                                    self._run_skill_hook,
                                     cand_path,
                                     pipeline_input.cultural_tradition,
                                     stage="post_critic",
@@ -732,12 +958,15 @@ class PipelineOrchestrator:
                 st = time.monotonic()
                 # Layer 3: Use LLM Queen when enabled, fall back to rule-based
                 if self._queen_llm is not None:
-                    queen_output = self._queen_llm.decide(critique_dict, plan_state)
+                    queen_output = yield _blocking(
+                        self._queen_llm.decide, critique_dict, plan_state,
+                        async_fn=self._queen_llm.adecide,
+                    )
                 else:
-                    queen_output = queen.decide(critique_dict, plan_state)
+                    queen_output = yield _blocking(queen.decide, critique_dict, plan_state)
                 queen_ms = int((time.monotonic() - st) * 1000)
 
-                save_pipeline_stage(task_id, "queen", queen_output.to_dict())
+                yield _blocking(save_pipeline_stage, task_id, "queen", queen_output.to_dict())
                 queen_dicts.append(queen_output.to_dict())
 
                 stages.append(StageResult(
@@ -798,7 +1027,7 @@ class PipelineOrchestrator:
                         "plan_state": plan_state.to_dict(),
                     })
 
-                    human_action = run_state.wait_for_human(timeout=300)
+                    human_action = yield _AwaitHuman(run_state, timeout=300)
                     if human_action is not None:
                         yield self._event(EventType.HUMAN_RECEIVED, "queen", round_num, t0, {
                             "action": human_action.action,
@@ -857,7 +1086,7 @@ class PipelineOrchestrator:
                         critic_fix_plan = getattr(critic, "fix_it_plan", None) if (self.enable_agent_critic and self.enable_fix_it_plan) else None
                         if critic_fix_plan is not None:
                             # Use FixItPlan-guided rerun
-                            draft_agent = create_agent("draft", config=self.d_cfg)
+                            draft_agent = yield _blocking(create_agent, "draft", config=self.d_cfg)
                             inpaint_name = self._resolve_inpaint_provider_name(
                                 queen_output.decision.rerun_dimensions,
                             )
@@ -866,7 +1095,8 @@ class PipelineOrchestrator:
                                 (c.get("prompt", "") for c in draft_candidates if c.get("candidate_id") == best_candidate_id),
                                 draft_candidates[0].get("prompt", "") if draft_candidates else pipeline_input.subject,
                             )
-                            refined = draft_agent.rerun_with_fix(
+                            refined = yield _blocking(
+                                draft_agent.rerun_with_fix,
                                 original_prompt=best_prompt,
                                 fix_plan=critic_fix_plan,
                                 evidence_pack=evidence_pack,
@@ -898,8 +1128,9 @@ class PipelineOrchestrator:
                             inpaint_name = self._resolve_inpaint_provider_name(
                                 queen_output.decision.rerun_dimensions,
                             )
-                            draft_agent = create_agent("draft", config=self.d_cfg)
-                            refined = draft_agent.refine_candidate(
+                            draft_agent = yield _blocking(create_agent, "draft", config=self.d_cfg)
+                            refined = yield _blocking(
+                                draft_agent.refine_candidate,
                                 local_rerun_request=local_rerun,
                                 base_image_path=base_image_path,
                                 inpaint_provider_name=inpaint_name,
@@ -913,7 +1144,7 @@ class PipelineOrchestrator:
                         images_generated += 1
                         # R7-1: Persist refined image to draft checkpoint so
                         # crash-resume picks up the refined (not original) candidates.
-                        save_pipeline_stage(task_id, "draft", {
+                        yield _blocking(save_pipeline_stage, task_id, "draft", {
                             "candidates": draft_candidates,
                             "source": "rerun_local",
                             "round": round_num,
@@ -984,8 +1215,8 @@ class PipelineOrchestrator:
                     critic_config_dict=routed_critic_cfg.to_dict(),
                     queen_config_dict=self.q_cfg.to_dict(),
                 )
-                archivist = create_agent("archivist")
-                arch_out = archivist.run(arch_input)
+                archivist = yield _blocking(create_agent, "archivist")
+                arch_out = yield _blocking(archivist.run, arch_input)
 
                 stages.append(StageResult(
                     stage="archivist",
@@ -1028,9 +1259,10 @@ class PipelineOrchestrator:
                 total_rounds=round_num,
                 success=True,
             )
-            save_pipeline_output(task_id, output.to_dict())
-            update_runs_index(task_id, {
+            yield _blocking(save_pipeline_output, task_id, output.to_dict())
+            yield _blocking(update_runs_index, task_id, {
                 "status": "completed",
+                "tradition": pipeline_input.cultural_tradition,
                 "final_decision": final_decision,
                 "total_rounds": round_num,
                 "total_cost_usd": round(total_cost, 6),
@@ -1057,9 +1289,10 @@ class PipelineOrchestrator:
                 success=False,
                 error=str(exc),
             )
-            save_pipeline_output(task_id, output.to_dict())
-            update_runs_index(task_id, {
+            yield _blocking(save_pipeline_output, task_id, output.to_dict())
+            yield _blocking(update_runs_index, task_id, {
                 "status": "failed",
+                "tradition": pipeline_input.cultural_tradition,
                 "error": str(exc),
                 "total_latency_ms": total_ms,
             })
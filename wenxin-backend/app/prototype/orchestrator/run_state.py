@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from enum import Enum
-from threading import Event
+from threading import Event, Lock
 
 
 class RunStatus(Enum):
@@ -40,6 +41,10 @@ class RunState:
     # HITL synchronization
     _human_event: Event = field(default_factory=Event, repr=False)
     _human_action: HumanAction | None = field(default=None, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _async_waiter: tuple[asyncio.AbstractEventLoop, asyncio.Future] | None = field(
+        default=None, repr=False,
+    )
 
     def wait_for_human(self, timeout: float | None = None) -> HumanAction | None:
         """Block until a human action is submitted (or timeout)."""
@@ -65,7 +70,53 @@ class RunState:
         self.status = RunStatus.RUNNING
         return None
 
-    def submit_human_action(self, action: HumanAction) -> None:
-        """Submit a human action to unblock the pipeline."""
-        self._human_action = action
-        self._human_event.set()
+    async def await_human(self, timeout: float | None = None) -> HumanAction | None:
+        """Async counterpart of ``wait_for_human``.
+
+        Suspends the calling coroutine (no thread is held) until an action is
+        submitted from any thread or the event loop, or until *timeout*.
+        """
+        self.status = RunStatus.WAITING_HUMAN
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            action = self._take_action()
+            if action is None:
+                waiter = loop.create_future()
+                self._async_waiter = (loop, waiter)
+        if action is None:
+            try:
+                await asyncio.wait_for(waiter, timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    self._async_waiter = None
+                    action = self._take_action()
+        self.status = RunStatus.RUNNING
+        return action
+
+    def _take_action(self) -> HumanAction | None:
+        # Caller holds self._lock
+        action = self._human_action
+        if action is not None:
+            self._human_action = None
+            self._human_event.clear()
+        return action
+
+    def submit_human_action(self, action: HumanAction) -> None:
+        """Submit a human action to unblock the pipeline."""
+        with self._lock:
+            self._human_action = action
+            self._human_event.set()
+            async_waiter = self._async_waiter
+        if async_waiter is not None:
+            loop, waiter = async_waiter
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # loop already closed; the waiter is gone with it
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,654 @@
+"""Session index — SQLite sidecar offset index over ``sessions.jsonl``.
+
+``sessions.jsonl`` stays the append-only source of truth (several modules
+and external tools read it directly).  Next to it, ``sessions.idx.db``
+records for every line its byte offset and length plus the columns callers
+filter and sort on (``session_id``, ``tradition``, ``mode``,
+``created_at``, ``final_weighted_total``, ``total_rounds``).  Lookups,
+filters and pagination run against the index and then read only the
+matching lines with ``seek``.
+
+- appends made through the index are indexed in the same transaction
+- lines appended by anything else (another process, a test fixture) are
+  picked up incrementally from the last indexed offset
+- if the file was rewritten or truncated (size/mtime no longer match and
+  the last indexed line changed), the index is rebuilt from scratch
+- ``update`` rewrites a record in place when the new JSON fits in the old
+  line (padding with spaces), otherwise blanks the old line and appends
+  the new version; readers of the raw file already skip blank lines
+- ``since(watermark)`` returns only the records appended after a previous
+  call, plus the rows it already covered that were updated since (current
+  and as-of-watermark versions, so callers can apply them as deltas).
+  Every insert/update stamps the row with a new ``rev``; ``update`` keeps
+  the version it replaces in ``revisions`` (the last
+  ``VULCA_SESSION_REVISIONS`` updates, default 4096).  A watermark is stale
+  (callers then get the full set) once revisions it needs were pruned, or
+  the index was rebuilt (which bumps ``generation``)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SessionDelta",
+    "SessionIndex",
+    "SessionPage",
+]
+
+_SCHEMA_VERSION = 3
+_BUSY_TIMEOUT_S = 30.0
+_MAX_PAGE_SIZE = 1000
+_MAX_REVISIONS = int(os.environ.get("VULCA_SESSION_REVISIONS", "4096"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    seq            INTEGER PRIMARY KEY,
+    offset         INTEGER NOT NULL,
+    length         INTEGER NOT NULL,
+    session_id     TEXT NOT NULL DEFAULT '',
+    tradition      TEXT NOT NULL DEFAULT '',
+    mode           TEXT NOT NULL DEFAULT '',
+    created_at     REAL NOT NULL DEFAULT 0,
+    weighted_total REAL,
+    total_rounds   INTEGER NOT NULL DEFAULT 0,
+    scored         INTEGER NOT NULL DEFAULT 0,
+    rev            INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_rev ON sessions (rev);
+CREATE INDEX IF NOT EXISTS idx_sessions_offset ON sessions (offset);
+CREATE INDEX IF NOT EXISTS idx_sessions_id ON sessions (session_id, offset);
+CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions (created_at, seq);
+CREATE INDEX IF NOT EXISTS idx_sessions_tradition ON sessions (tradition, created_at, seq);
+CREATE TABLE IF NOT EXISTS revisions (
+    rev    INTEGER PRIMARY KEY,
+    seq    INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_revisions_seq ON revisions (seq, rev);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Sort keys accepted by ``list_scored``
+_SORT_COLUMNS = {
+    "created_at": "created_at",
+    "weighted_total": "COALESCE(weighted_total, 0)",
+    "total_rounds": "total_rounds",
+}
+
+
+@dataclass
+class SessionPage:
+    """One page of session records, newest ``created_at`` first.
+
+    Pass ``next_cursor`` back to ``query`` for the next page; it is None on
+    the last page.
+    """
+
+    records: list[dict] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+@dataclass
+class SessionDelta:
+    """Records added since a watermark, plus the watermark to resume from.
+
+    ``updated`` holds the current version of records the watermark already
+    covered that were updated since, and ``replaced`` the same records as
+    they were at the watermark (same order).  ``is_delta`` is False when the
+    given watermark was missing or stale (the file was rewritten, or the
+    revisions it needs were pruned); ``records`` then holds every record, in
+    file order, and ``updated`` / ``replaced`` are empty.
+    """
+
+    records: list[dict] = field(default_factory=list)
+    watermark: str = ""
+    is_delta: bool = False
+    updated: list[dict] = field(default_factory=list)
+    replaced: list[dict] = field(default_factory=list)
+
+
+def _parse_watermark(watermark: str | None) -> tuple[int, int, int] | None:
+    if not watermark:
+        return None
+    try:
+        generation, seq, rev = json.loads(watermark)
+        return int(generation), int(seq), int(rev)
+    except (ValueError, TypeError):
+        return None
+
+
+def _columns(record: dict) -> tuple[str, str, str, float, float | None, int, int]:
+    """Indexed column values extracted from a session record."""
+    weighted_total = record.get("final_weighted_total")
+    if not isinstance(weighted_total, (int, float)):
+        weighted_total = None
+    created_at = record.get("created_at")
+    total_rounds = record.get("total_rounds")
+    return (
+        str(record.get("session_id", "") or ""),
+        str(record.get("tradition", "") or ""),
+        str(record.get("mode", "") or ""),
+        float(created_at) if isinstance(created_at, (int, float)) else 0.0,
+        weighted_total,
+        int(total_rounds) if isinstance(total_rounds, (int, float)) else 0,
+        int(weighted_total is not None or bool(record.get("final_scores"))),
+    )
+
+
+def _parse(raw: bytes) -> dict | None:
+    text = raw.strip()
+    if not text:
+        return None
+    try:
+        record = json.loads(text)
+    except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _encode(record: dict) -> bytes:
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+class SessionIndex:
+    """Offset index and record I/O for a session JSONL file."""
+
+    def __init__(self, jsonl_path: Path, db_path: Path | None = None) -> None:
+        self._path = Path(jsonl_path)
+        self._db_path = Path(db_path) if db_path else self._path.with_suffix(".idx.db")
+        self._local = threading.local()
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self._db_path),
+                timeout=_BUSY_TIMEOUT_S,
+                isolation_level=None,  # autocommit; explicit BEGIN where needed
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection (others close on GC)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version and version != _SCHEMA_VERSION:
+                # The index is a cache of the JSONL file: rebuild it
+                conn.execute("DROP TABLE IF EXISTS sessions")
+                conn.execute("DROP TABLE IF EXISTS revisions")
+                conn.execute("DROP TABLE IF EXISTS meta")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _write_txn(self):
+        return _Transaction(self._conn())
+
+    # ------------------------------------------------------------------
+    # Synchronisation with the JSONL file
+    # ------------------------------------------------------------------
+
+    def _meta(self, conn: sqlite3.Connection) -> dict[str, int]:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def _set_meta(self, conn: sqlite3.Connection, **values: int) -> None:
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            list(values.items()),
+        )
+
+    def _is_current(self, conn: sqlite3.Connection) -> bool:
+        meta = self._meta(conn)
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return meta.get("size", 0) == 0 and meta.get("indexed_end", 0) == 0
+        return meta.get("size") == st.st_size and meta.get("mtime_ns") == st.st_mtime_ns
+
+    def sync(self) -> None:
+        """Bring the index up to date with the file (cheap when unchanged)."""
+        if self._is_current(self._conn()):
+            return
+        with self._write_txn() as conn:
+            self._sync_locked(conn)
+
+    def _sync_locked(self, conn: sqlite3.Connection) -> None:
+        # Caller holds a write transaction
+        if self._is_current(conn):
+            return
+        meta = self._meta(conn)
+        indexed_end = meta.get("indexed_end", 0)
+        if not self._path.exists():
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM revisions")
+            self._set_meta(
+                conn, indexed_end=0, tail_offset=0, tail_crc=0, size=0, mtime_ns=0,
+                generation=meta.get("generation", 0) + 1,
+            )
+            return
+
+        size = self._path.stat().st_size
+        appended_only = size >= indexed_end and self._tail_crc(
+            meta.get("tail_offset", 0), indexed_end,
+        ) == meta.get("tail_crc", 0)
+        if not appended_only:
+            logger.info("Session index: %s was rewritten, rebuilding", self._path)
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM revisions")
+            self._set_meta(conn, generation=meta.get("generation", 0) + 1)
+            indexed_end, tail_offset = 0, 0
+        else:
+            tail_offset = meta.get("tail_offset", 0)
+        self._scan_from(conn, indexed_end, tail_offset)
+
+    def _scan_from(self, conn: sqlite3.Connection, start: int, tail_offset: int) -> None:
+        rows = []
+        pos = start
+        with open(self._path, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                record = _parse(raw)
+                if not raw.endswith(b"\n") and record is None:
+                    break  # partial line still being written
+                if record is not None:
+                    rows.append((pos, len(raw), *_columns(record)))
+                tail_offset = pos
+                pos += len(raw)
+        first_rev = self._next_rev(conn, len(rows))
+        conn.executemany(
+            "INSERT INTO sessions (offset, length, session_id, tradition, mode, "
+            "created_at, weighted_total, total_rounds, scored, rev) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*row, first_rev + i) for i, row in enumerate(rows)],
+        )
+        self._mark_synced(conn, pos, tail_offset)
+
+    def _tail_crc(self, tail_offset: int, end: int) -> int:
+        if end <= tail_offset:
+            return 0
+        with open(self._path, "rb") as f:
+            f.seek(tail_offset)
+            return zlib.crc32(f.read(end - tail_offset))
+
+    def _mark_synced(self, conn: sqlite3.Connection, indexed_end: int, tail_offset: int) -> None:
+        st = os.stat(self._path)
+        self._set_meta(
+            conn,
+            indexed_end=indexed_end,
+            tail_offset=tail_offset,
+            tail_crc=self._tail_crc(tail_offset, indexed_end),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict) -> None:
+        """Append *record* as a JSONL line and index it atomically."""
+        line = _encode(record) + b"\n"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._write_txn() as conn:
+            self._sync_locked(conn)
+            with open(self._path, "ab") as f:
+                offset = f.tell()
+                if offset and not self._ends_with_newline(offset):
+                    f.write(b"\n")
+                    offset += 1
+                f.write(line)
+            self._insert(conn, offset, len(line), record)
+            self._mark_synced(conn, offset + len(line), offset)
+
+    def update(self, session_id: str, fields: dict[str, Any]) -> dict | None:
+        """Merge *fields* into the latest record for *session_id*.
+
+        Returns the updated record, or None if the session is unknown.
+        """
+        with self._write_txn() as conn:
+            self._sync_locked(conn)
+            row = conn.execute(
+                "SELECT seq, offset, length FROM sessions WHERE session_id = ? "
+                "ORDER BY offset DESC LIMIT 1",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            seq, offset, length = row
+            with open(self._path, "r+b") as f:
+                f.seek(offset)
+                previous = f.read(length)
+                record = _parse(previous)
+                if record is None:
+                    return None
+                record.update(fields)
+                encoded = _encode(record)
+                if len(encoded) + 1 <= length:
+                    # Fits: overwrite in place, pad to the old length
+                    f.seek(offset)
+                    f.write(encoded + b" " * (length - 1 - len(encoded)) + b"\n")
+                    new_offset, new_length = offset, length
+                else:
+                    # Blank the old line, append the new version
+                    f.seek(offset)
+                    f.write(b" " * (length - 1) + b"\n")
+                    new_offset = f.seek(0, os.SEEK_END)
+                    if new_offset:
+                        f.seek(new_offset - 1)
+                        if f.read(1) != b"\n":
+                            f.write(b"\n")
+                            new_offset += 1
+                    f.write(encoded + b"\n")
+                    new_length = len(encoded) + 1
+                end = f.seek(0, os.SEEK_END)
+
+            conn.execute(
+                "UPDATE sessions SET offset = ?, length = ?, session_id = ?, tradition = ?, "
+                "mode = ?, created_at = ?, weighted_total = ?, total_rounds = ?, scored = ? "
+                "WHERE seq = ?",
+                (new_offset, new_length, *_columns(record), seq),
+            )
+            rev = self._next_rev(conn)
+            conn.execute("UPDATE sessions SET rev = ? WHERE seq = ?", (rev, seq))
+            self._keep_revision(conn, rev, seq, previous)
+            meta = self._meta(conn)
+            tail_offset = new_offset if new_offset != offset else meta.get("tail_offset", 0)
+            self._mark_synced(conn, end, tail_offset)
+            return record
+
+    def _insert(self, conn: sqlite3.Connection, offset: int, length: int, record: dict) -> None:
+        conn.execute(
+            "INSERT INTO sessions (offset, length, session_id, tradition, mode, "
+            "created_at, weighted_total, total_rounds, scored, rev) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (offset, length, *_columns(record), self._next_rev(conn)),
+        )
+
+    def _keep_revision(self, conn: sqlite3.Connection, rev: int, seq: int, previous: bytes) -> None:
+        """Record the version update *rev* replaced, pruning the oldest ones."""
+        conn.execute(
+            "INSERT INTO revisions (rev, seq, record) VALUES (?, ?, ?)",
+            (rev, seq, previous.strip().decode("utf-8")),
+        )
+        floor = conn.execute(
+            "SELECT rev FROM revisions ORDER BY rev DESC LIMIT 1 OFFSET ?", (_MAX_REVISIONS,),
+        ).fetchone()
+        if floor is not None:
+            conn.execute("DELETE FROM revisions WHERE rev <= ?", (floor[0],))
+            # Watermarks before this rev may miss a pruned revision
+            self._set_meta(conn, revisions_floor=floor[0])
+
+    def _next_rev(self, conn: sqlite3.Connection, count: int = 1) -> int:
+        """Reserve *count* revision numbers; returns the first."""
+        rev = self._meta(conn).get("rev", 0) + 1
+        self._set_meta(conn, rev=rev + count - 1)
+        return rev
+
+    def _ends_with_newline(self, size: int) -> bool:
+        with open(self._path, "rb") as f:
+            f.seek(size - 1)
+            return f.read(1) == b"\n"
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _read(self, rows: list[tuple[int, int]]) -> list[dict]:
+        """Read the records at ``(offset, length)`` positions, in order."""
+        if not rows:
+            return []
+        records: list[dict] = []
+        try:
+            with open(self._path, "rb") as f:
+                for offset, length in rows:
+                    f.seek(offset)
+                    record = _parse(f.read(length))
+                    if record is not None:
+                        records.append(record)
+        except FileNotFoundError:
+            return []
+        return records
+
+    def _select(self, sql: str, params: list | tuple = ()) -> list[dict]:
+        self.sync()
+        rows = self._conn().execute(sql, params).fetchall()
+        return self._read([(r[0], r[1]) for r in rows])
+
+    def all(self) -> list[dict]:
+        """Every record, in file order."""
+        return self._select("SELECT offset, length FROM sessions ORDER BY offset")
+
+    def since(self, watermark: str | None = None) -> SessionDelta:
+        """Records appended after *watermark* (returned by an earlier call).
+
+        Covered records updated since are returned in ``updated`` /
+        ``replaced``.  Without a watermark, or when it is stale, every record
+        is returned with ``is_delta=False``.
+        """
+        self.sync()
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            meta = self._meta(conn)
+            generation, rev = meta.get("generation", 0), meta.get("rev", 0)
+            last_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sessions").fetchone()[0]
+            mark = _parse_watermark(watermark)
+            is_delta = (
+                mark is not None
+                and mark[0] == generation
+                and mark[1] <= last_seq
+                and mark[2] >= meta.get("revisions_floor", 0)
+            )
+            updated_rows: list[tuple[int, int]] = []
+            replaced: list[dict] = []
+            if is_delta:
+                rows = conn.execute(
+                    "SELECT offset, length FROM sessions WHERE seq > ? ORDER BY seq", (mark[1],),
+                ).fetchall()
+                # Rows the watermark covered that were updated since, with the
+                # version each had at the watermark (its first later revision)
+                for offset, length, record in conn.execute(
+                    "SELECT s.offset, s.length, r.record FROM sessions s JOIN revisions r "
+                    "ON r.rev = (SELECT MIN(rev) FROM revisions WHERE seq = s.seq AND rev > ?) "
+                    "WHERE s.rev > ? AND s.seq <= ? ORDER BY s.seq",
+                    (mark[2], mark[2], mark[1]),
+                ):
+                    previous = _parse(record.encode("utf-8"))
+                    if previous is not None:
+                        updated_rows.append((offset, length))
+                        replaced.append(previous)
+            else:
+                rows = conn.execute("SELECT offset, length FROM sessions ORDER BY offset").fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return SessionDelta(
+            records=self._read(rows),
+            watermark=json.dumps([generation, last_seq, rev]),
+            is_delta=is_delta,
+            updated=self._read(updated_rows),
+            replaced=replaced,
+        )
+
+    def get(self, session_id: str) -> dict | None:
+        records = self._select(
+            "SELECT offset, length FROM sessions WHERE session_id = ? "
+            "ORDER BY offset DESC LIMIT 1",
+            (session_id,),
+        )
+        return records[0] if records else None
+
+    def recent(self, limit: int) -> list[dict]:
+        """The last *limit* records in file order (newest last)."""
+        records = self._select(
+            "SELECT offset, length FROM sessions ORDER BY offset DESC LIMIT ?",
+            (max(0, int(limit)),),
+        )
+        records.reverse()
+        return records
+
+    def by_tradition(self, tradition: str) -> list[dict]:
+        return self._select(
+            "SELECT offset, length FROM sessions WHERE tradition = ? ORDER BY offset",
+            (tradition,),
+        )
+
+    def count(self, tradition: str | None = None) -> int:
+        self.sync()
+        if tradition is None:
+            return self._conn().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM sessions WHERE tradition = ?", (tradition,),
+        ).fetchone()[0]
+
+    def traditions(self) -> list[str]:
+        """Distinct non-empty traditions, sorted."""
+        self.sync()
+        rows = self._conn().execute(
+            "SELECT DISTINCT tradition FROM sessions WHERE tradition != '' ORDER BY tradition",
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def query(
+        self,
+        tradition: str | None = None,
+        mode: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> SessionPage:
+        """One page of records, newest ``created_at`` first (keyset pagination).
+
+        *since* / *until* are epoch seconds bounding ``created_at``
+        (inclusive / exclusive).
+        """
+        limit = max(1, min(int(limit), _MAX_PAGE_SIZE))
+        clauses, params = self._where(tradition, mode, since, until)
+        if cursor:
+            try:
+                cur_created, cur_seq = json.loads(cursor)
+            except (ValueError, TypeError) as exc:
+                raise ValueError(f"invalid session cursor: {cursor!r}") from exc
+            clauses.append("(created_at < ? OR (created_at = ? AND seq < ?))")
+            params.extend([cur_created, cur_created, cur_seq])
+
+        self.sync()
+        rows = self._conn().execute(
+            "SELECT offset, length, created_at, seq FROM sessions"
+            + (f" WHERE {' AND '.join(clauses)}" if clauses else "")
+            + " ORDER BY created_at DESC, seq DESC LIMIT ?",
+            [*params, limit + 1],
+        ).fetchall()
+
+        page = SessionPage(records=self._read([(r[0], r[1]) for r in rows[:limit]]))
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            page.next_cursor = json.dumps([last[2], last[3]])
+        return page
+
+    def list_scored(
+        self,
+        tradition: str | None = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """Records that carry final scores, sorted, plus their total count.
+
+        *sort_by* is ``created_at``, ``weighted_total`` or ``total_rounds``;
+        ties keep file order (like a stable ``list.sort``).
+        """
+        order_col = _SORT_COLUMNS.get(sort_by, "created_at")
+        direction = "DESC" if descending else "ASC"
+        clauses, params = self._where(tradition, None, None, None)
+        where = " AND ".join(["scored = 1", *clauses])
+
+        self.sync()
+        conn = self._conn()
+        total = conn.execute(f"SELECT COUNT(*) FROM sessions WHERE {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT offset, length FROM sessions WHERE {where} "
+            f"ORDER BY {order_col} {direction}, offset ASC LIMIT ? OFFSET ?",
+            [*params, max(0, int(limit)), max(0, int(offset))],
+        ).fetchall()
+        return self._read([(r[0], r[1]) for r in rows]), total
+
+    @staticmethod
+    def _where(
+        tradition: str | None,
+        mode: str | None,
+        since: float | None,
+        until: float | None,
+    ) -> tuple[list[str], list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if tradition is not None:
+            clauses.append("tradition = ?")
+            params.append(tradition)
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(mode)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        return clauses, params
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` / ``ROLLBACK`` context manager."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
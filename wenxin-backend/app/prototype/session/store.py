@@ -1,14 +1,27 @@
-"""JSONL-backed session digest storage with thread-safe append and singleton access."""
+"""JSONL-backed session digest storage with thread-safe append and singleton access.
+
+``sessions.jsonl`` remains the source of truth; a sidecar SQLite offset
+index (``sessions.idx.db``, see ``session.index``) serves lookups by
+session_id / tradition / created_at, pagination and in-place updates
+without re-reading the whole file.  If the index cannot be opened the
+store falls back to scanning the file.
+"""
 
 from __future__ import annotations
 
 import json
+import logging
 import os
+import sqlite3
 import threading
 from pathlib import Path
+from typing import Any
 
+from app.prototype.session.index import SessionDelta, SessionIndex, SessionPage
 from app.prototype.session.types import SessionDigest
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_PATH = os.path.join(
     os.path.dirname(__file__), os.pardir, "data", "sessions.jsonl"
 )
@@ -26,6 +39,11 @@ class SessionStore:
     def __init__(self, path: str | None = None) -> None:
         self._path = Path(path or _DEFAULT_PATH).resolve()
         self._write_lock = threading.Lock()
+        self._index: SessionIndex | None = None
+        try:
+            self._index = SessionIndex(self._path)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Session index unavailable for %s, scanning file: %s", self._path, exc)
 
     @classmethod
     def get(cls, path: str | None = None) -> SessionStore:
@@ -38,12 +56,130 @@ class SessionStore:
     def append(self, digest: SessionDigest) -> None:
         """Append a single session digest to the JSONL file (thread-safe)."""
         with self._write_lock:
+            if self._index is not None:
+                self._index.append(digest.to_dict())
+                return
             self._path.parent.mkdir(parents=True, exist_ok=True)
             with open(self._path, "a", encoding="utf-8") as f:
                 f.write(json.dumps(digest.to_dict(), ensure_ascii=False) + "\n")
 
+    def update(self, session_id: str, **fields: Any) -> dict | None:
+        """Set *fields* on a stored session in place; returns the new record.
+
+        Returns None if *session_id* is unknown (or the index is unavailable).
+        """
+        if self._index is None:
+            return None
+        with self._write_lock:
+            return self._index.update(session_id, fields)
+
     def get_all(self) -> list[dict]:
         """Read all session digests as dicts."""
+        if self._index is not None:
+            return self._index.all()
+        return self._scan()
+
+    def since(self, watermark: str | None = None) -> SessionDelta:
+        """Sessions appended after *watermark* plus the watermark to pass next time.
+
+        Sessions the watermark covered that were updated since come back in
+        ``updated`` (with their as-of-watermark versions in ``replaced``).
+        ``is_delta`` is False (and ``records`` holds everything) when
+        *watermark* is None or stale, or when the index is unavailable.
+        """
+        if self._index is not None:
+            return self._index.since(watermark)
+        return SessionDelta(records=self._scan(), watermark="", is_delta=False)
+
+    def get_session(self, session_id: str) -> dict | None:
+        """Return the digest for *session_id*, or None."""
+        if self._index is not None:
+            return self._index.get(session_id)
+        matches = [r for r in self._scan() if r.get("session_id") == session_id]
+        return matches[-1] if matches else None
+
+    def get_recent(self, limit: int = 50) -> list[dict]:
+        """Return the last *limit* session digests (newest last)."""
+        if self._index is not None:
+            return self._index.recent(limit)
+        records = self._scan()
+        return records[-limit:]
+
+    def get_by_tradition(self, tradition: str) -> list[dict]:
+        """Return all sessions for a given tradition."""
+        if self._index is not None:
+            return self._index.by_tradition(tradition)
+        return [r for r in self._scan() if r.get("tradition") == tradition]
+
+    def query(
+        self,
+        tradition: str | None = None,
+        mode: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> SessionPage:
+        """Page through sessions, newest ``created_at`` first.
+
+        Pass ``page.next_cursor`` back as *cursor* for the next page.
+        """
+        if self._index is not None:
+            return self._index.query(tradition, mode, since, until, limit, cursor)
+        records = [
+            r for r in self._scan()
+            if (tradition is None or r.get("tradition") == tradition)
+            and (mode is None or r.get("mode") == mode)
+            and (since is None or r.get("created_at", 0) >= since)
+            and (until is None or r.get("created_at", 0) < until)
+        ]
+        records.sort(key=lambda r: r.get("created_at", 0), reverse=True)
+        start = int(cursor) if cursor else 0
+        end = start + limit
+        return SessionPage(
+            records=records[start:end],
+            next_cursor=str(end) if end < len(records) else None,
+        )
+
+    def list_scored(
+        self,
+        tradition: str | None = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """Sessions with final scores (Gallery items), sorted; plus total count.
+
+        *sort_by* is ``created_at``, ``weighted_total`` or ``total_rounds``.
+        """
+        if self._index is not None:
+            return self._index.list_scored(tradition, sort_by, descending, limit, offset)
+        key_field = {"weighted_total": "final_weighted_total"}.get(sort_by, sort_by)
+        records = [
+            r for r in self._scan()
+            if (r.get("final_weighted_total") is not None or r.get("final_scores"))
+            and (tradition is None or r.get("tradition") == tradition)
+        ]
+        records.sort(key=lambda r: r.get(key_field) or 0, reverse=descending)
+        return records[offset:offset + limit], len(records)
+
+    def traditions(self) -> list[str]:
+        """Distinct traditions that have at least one session."""
+        if self._index is not None:
+            return self._index.traditions()
+        return sorted({r["tradition"] for r in self._scan() if r.get("tradition")})
+
+    def count(self, tradition: str | None = None) -> int:
+        """Return total number of stored sessions (optionally for one tradition)."""
+        if self._index is not None:
+            return self._index.count(tradition)
+        if tradition is not None:
+            return len(self.get_by_tradition(tradition))
+        return len(self._scan())
+
+    def _scan(self) -> list[dict]:
+        """Full-file read, used when the index is unavailable."""
         if not self._path.exists():
             return []
         records: list[dict] = []
@@ -57,23 +193,3 @@ class SessionStore:
                 except (json.JSONDecodeError, ValueError):
                     continue
         return records
-
-    def get_recent(self, limit: int = 50) -> list[dict]:
-        """Return the last *limit* session digests (newest last)."""
-        records = self.get_all()
-        return records[-limit:]
-
-    def get_by_tradition(self, tradition: str) -> list[dict]:
-        """Return all sessions for a given tradition."""
-        return [r for r in self.get_all() if r.get("tradition") == tradition]
-
-    def count(self) -> int:
-        """Return total number of stored sessions."""
-        if not self._path.exists():
-            return 0
-        count = 0
-        with open(self._path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    count += 1
-        return count
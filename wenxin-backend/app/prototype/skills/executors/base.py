@@ -1,16 +1,15 @@
 """Base skill executor with shared Gemini calling infrastructure."""
 
-import base64
+import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import ClassVar
 
-import litellm
-
+from app.prototype.agents import llm_gateway
 from app.prototype.agents.model_router import MODEL_FAST
 from app.prototype.skills.types import SkillResult
+from app.prototype.tools.image_prep import get_image_prep
 
 
 class BaseSkillExecutor(ABC):
@@ -57,32 +56,21 @@ class BaseSkillExecutor(ABC):
 
     async def _call_gemini(self, image_path: str, prompt: str) -> str:
         """Shared Gemini call helper using LiteLLM."""
-        img_bytes = Path(image_path).read_bytes()
-        img_b64 = base64.b64encode(img_bytes).decode()
-        suffix = Path(image_path).suffix.lower().lstrip(".")
-        mime = {
-            "jpg": "image/jpeg",
-            "jpeg": "image/jpeg",
-            "png": "image/png",
-            "webp": "image/webp",
-        }.get(suffix, "image/png")
-
-        response = await litellm.acompletion(
+        # Decoding/downscaling runs off the event loop; repeats are cache hits
+        image = await asyncio.to_thread(get_image_prep().prepare_path, image_path)
+
+        response = await llm_gateway.acompletion(
             model=MODEL_FAST,
             messages=[
                 {
                     "role": "user",
                     "content": [
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{mime};base64,{img_b64}",
-                            },
-                        },
+                        image.content_block(),
                         {"type": "text", "text": prompt},
                     ],
                 }
             ],
+            cache=True,
             max_tokens=1024,
             temperature=0.2,
             timeout=30,
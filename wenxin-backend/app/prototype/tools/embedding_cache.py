@@ -0,0 +1,273 @@
+"""EmbeddingCache — process-wide LRU cache of text embeddings.
+
+Shared by every text encoder in the prototype (MiniLM in FaissIndexService,
+CLIP in FaissIndexService and ImageScorer) so identical query and reference
+strings are encoded once per process instead of once per call.
+
+Entries are keyed by ``(model_name, encode_flags, normalized_text)`` where
+normalization is Unicode NFC plus whitespace collapsing.  Only *query* /
+reference texts should go through the cache; corpus encodes are persisted
+separately by ``FaissIndexStore``.
+
+Environment variables:
+- ``VULCA_EMBED_CACHE_SIZE``: max cached vectors (default 8192)
+- ``VULCA_EMBED_CACHE_PATH``: optional ``.npz`` file to load on start and
+  write on ``save()``
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "normalize_text",
+]
+
+_DEFAULT_MAX_ENTRIES = 8192
+
+_CacheKey = tuple[str, str, str]
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys: NFC + collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _flags_key(encode_kwargs: dict[str, Any]) -> str:
+    return json.dumps(encode_kwargs, sort_keys=True, default=str)
+
+
+class EmbeddingCache:
+    """Thread-safe, size-bounded LRU of text embeddings with hit/miss counters.
+
+    Usage::
+
+        cache = get_embedding_cache()
+        embs = cache.encode("clip-ViT-B-32", model, texts, convert_to_numpy=True)
+        cache.stats()  # {"hits": ..., "misses": ..., "size": ..., ...}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        persist_path: str | Path | None = None,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._persist_path = Path(persist_path) if persist_path else None
+        self._entries: OrderedDict[_CacheKey, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Lookup / insert
+    # ------------------------------------------------------------------
+
+    def get(self, model_name: str, text: str, **encode_kwargs: Any) -> np.ndarray | None:
+        """Return the cached embedding for *text*, or None (counts hit/miss)."""
+        key = (model_name, _flags_key(encode_kwargs), normalize_text(text))
+        with self._lock:
+            emb = self._entries.get(key)
+            if emb is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return emb
+
+    def put(self, model_name: str, text: str, embedding: np.ndarray, **encode_kwargs: Any) -> None:
+        key = (model_name, _flags_key(encode_kwargs), normalize_text(text))
+        emb = np.array(embedding, dtype=np.float32)
+        emb.setflags(write=False)
+        with self._lock:
+            self._insert(key, emb)
+
+    def encode(
+        self,
+        model_name: str,
+        model: Any,
+        texts: list[str],
+        **encode_kwargs: Any,
+    ) -> np.ndarray:
+        """Encode *texts* with *model*, serving repeats from the cache.
+
+        All misses are encoded in a single ``model.encode`` call.  Returns a
+        float32 array of shape ``(len(texts), dim)`` in input order.
+        """
+        flags = _flags_key(encode_kwargs)
+        keys = [(model_name, flags, normalize_text(t)) for t in texts]
+        found: dict[_CacheKey, np.ndarray] = {}
+        missing: list[_CacheKey] = []
+        missing_set: set[_CacheKey] = set()
+        missing_texts: list[str] = []
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in missing_set:
+                    continue
+                emb = self._entries.get(key)
+                if emb is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = emb
+                    self._hits += 1
+                else:
+                    missing.append(key)
+                    missing_set.add(key)
+                    missing_texts.append(text)
+                    self._misses += 1
+
+        if missing_texts:
+            encoded = np.asarray(model.encode(missing_texts, **encode_kwargs), dtype=np.float32)
+            if encoded.ndim != 2 or encoded.shape[0] != len(missing_texts):
+                raise ValueError(
+                    f"encoder returned shape {encoded.shape} for {len(missing_texts)} texts"
+                )
+            with self._lock:
+                for key, emb in zip(missing, encoded):
+                    emb = emb.copy()
+                    emb.setflags(write=False)
+                    found[key] = emb
+                    self._insert(key, emb)
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([found[k] for k in keys])
+
+    def warm(self, model_name: str, model: Any, texts: list[str], **encode_kwargs: Any) -> int:
+        """Precompute embeddings for *texts*; returns how many were newly encoded."""
+        before = self._misses
+        self.encode(model_name, model, list(dict.fromkeys(texts)), **encode_kwargs)
+        return self._misses - before
+
+    def _insert(self, key: _CacheKey, emb: np.ndarray) -> None:
+        # Caller holds self._lock
+        self._entries[key] = emb
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path | None = None) -> bool:
+        """Write all entries to an ``.npz`` file. Returns False if no path is set."""
+        target = Path(path) if path else self._persist_path
+        if target is None:
+            return False
+
+        with self._lock:
+            items = list(self._entries.items())
+
+        groups: dict[tuple[str, str, int], list[tuple[str, np.ndarray]]] = {}
+        for (model_name, flags, text), emb in items:
+            groups.setdefault((model_name, flags, emb.shape[0]), []).append((text, emb))
+
+        arrays: dict[str, np.ndarray] = {}
+        manifest = []
+        for i, ((model_name, flags, _dim), rows) in enumerate(groups.items()):
+            manifest.append({"model": model_name, "flags": flags, "texts": [t for t, _ in rows]})
+            arrays[f"vecs_{i}"] = np.stack([e for _, e in rows])
+        arrays["manifest"] = np.array(json.dumps(manifest, ensure_ascii=False))
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(target.parent), suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, str(target))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        logger.info("Embedding cache saved: %d entries -> %s", len(items), target)
+        return True
+
+    def load(self, path: str | Path | None = None) -> int:
+        """Load entries from an ``.npz`` written by ``save()``. Returns count loaded."""
+        source = Path(path) if path else self._persist_path
+        if source is None or not source.exists():
+            return 0
+        try:
+            with np.load(source, allow_pickle=False) as data:
+                manifest = json.loads(str(data["manifest"]))
+                loaded = 0
+                with self._lock:
+                    for i, group in enumerate(manifest):
+                        vecs = data[f"vecs_{i}"]
+                        for text, emb in zip(group["texts"], vecs):
+                            emb = np.array(emb, dtype=np.float32)
+                            emb.setflags(write=False)
+                            self._insert((group["model"], group["flags"], text), emb)
+                            loaded += 1
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Embedding cache %s unreadable: %s", source, exc)
+            return 0
+        logger.info("Embedding cache loaded: %d entries from %s", loaded, source)
+        return loaded
+
+
+# ---------------------------------------------------------------------------
+# Singleton factory
+# ---------------------------------------------------------------------------
+_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide EmbeddingCache (configured from env)."""
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cache = EmbeddingCache(
+                    max_entries=int(
+                        os.environ.get("VULCA_EMBED_CACHE_SIZE", _DEFAULT_MAX_ENTRIES)
+                    ),
+                    persist_path=os.environ.get("VULCA_EMBED_CACHE_PATH") or None,
+                )
+                cache.load()
+                _cache = cache
+    return _cache
@@ -2,6 +2,10 @@
 
 Lazy-loads sentence-transformers and faiss-cpu on first use. Falls back gracefully
 when either dependency is unavailable (available == False).
+
+Embeddings and indices are cached on disk by ``FaissIndexStore`` keyed by a
+content hash of the source JSON, so warm starts skip re-encoding entirely.
+Query strings go through the shared ``EmbeddingCache``.
 """
 
 from __future__ import annotations
@@ -13,12 +17,25 @@ from pathlib import Path
 
 import numpy as np
 
+from app.prototype.tools.embedding_cache import EmbeddingCache, get_embedding_cache
+from app.prototype.tools.faiss_index_store import (
+    FaissIndexStore,
+    PartitionedIndex,
+    StoredIndex,
+    get_index_store,
+)
+
 logger = logging.getLogger(__name__)
 
 _DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 _SAMPLE_INDEX_FILE = _DATA_DIR / "samples" / "index.v1.json"
 _TERMS_FILE = _DATA_DIR / "terminology" / "terms.v1.json"
 
+_TEXT_MODEL_NAME = "all-MiniLM-L6-v2"
+_CLIP_MODEL_NAME = "clip-ViT-B-32"
+
+SEARCH_KINDS = ("samples", "terms", "visual")
+
 
 @dataclass
 class _FaissHit:
@@ -42,27 +59,38 @@ class FaissIndexService:
             hits = svc.search_samples("ink wash landscape", "chinese_xieyi", top_k=5)
         if svc.clip_available:
             hits = svc.search_by_visual("a misty mountain landscape", "chinese_xieyi")
+        # Batched: one encoder pass per model, one FAISS search per partition
+        batch = svc.search_many(["ink wash", "lotus pond"], ("samples", "terms"), "chinese_xieyi")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        store: FaissIndexStore | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
+        self._store = store
+        self._embedding_cache = embedding_cache
         self._model = None
         self._clip_model = None
         self._faiss = None
 
         # Sample index state (MiniLM)
         self._sample_index = None
+        self._sample_parts: PartitionedIndex | None = None
         self._sample_ids: list[str] = []
         self._sample_traditions: list[str] = []
         self._sample_texts: list[str] = []
 
         # Sample visual index state (CLIP)
         self._visual_index = None
+        self._visual_parts: PartitionedIndex | None = None
         self._visual_sample_ids: list[str] = []
         self._visual_sample_traditions: list[str] = []
         self._visual_sample_texts: list[str] = []
 
         # Term index state
         self._term_index = None
+        self._term_parts: PartitionedIndex | None = None
         self._term_ids: list[str] = []
         self._term_traditions: list[str] = []
         self._term_texts: list[str] = []
@@ -70,6 +98,9 @@ class FaissIndexService:
         # Trajectory index state
         self._trajectory_index = None
         self._trajectory_records: list = []
+        self._trajectory_ids: set[str] = set()
+        self._trajectory_stored: StoredIndex | None = None
+        self._trajectory_hasher = None
 
         self._initialized = False
         self._clip_initialized = False
@@ -115,8 +146,8 @@ class FaissIndexService:
         from sentence_transformers import SentenceTransformer
 
         # Load model (lazy, ~80MB download on first call)
-        logger.info("Loading sentence-transformers model all-MiniLM-L6-v2 ...")
-        self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        logger.info("Loading sentence-transformers model %s ...", _TEXT_MODEL_NAME)
+        self._model = SentenceTransformer(_TEXT_MODEL_NAME)
         self._faiss = faiss
 
         # Build sample index
@@ -144,13 +175,13 @@ class FaissIndexService:
         if not self._sample_texts:
             return
 
-        embeddings = self._model.encode(self._sample_texts, normalize_embeddings=True)
-        embeddings = np.asarray(embeddings, dtype=np.float32)
-
-        dim = embeddings.shape[1]
-        self._sample_index = self._faiss.IndexFlatIP(dim)
-        self._sample_index.add(embeddings)
-        logger.info("FAISS sample index built: %d vectors, dim=%d", len(self._sample_ids), dim)
+        stored = self._load_or_build(
+            "samples-minilm", _SAMPLE_INDEX_FILE, _TEXT_MODEL_NAME, self._model,
+            self._sample_ids, self._sample_traditions, self._sample_texts,
+        )
+        self._sample_index = stored.index
+        self._sample_parts = PartitionedIndex(stored, self._get_store().build)
+        logger.info("FAISS sample index ready: %d vectors", stored.size)
 
     def _build_term_index(self) -> None:
         """Build FAISS IndexFlatIP over terminology embeddings."""
@@ -172,13 +203,49 @@ class FaissIndexService:
         if not self._term_texts:
             return
 
-        embeddings = self._model.encode(self._term_texts, normalize_embeddings=True)
+        stored = self._load_or_build(
+            "terms-minilm", _TERMS_FILE, _TEXT_MODEL_NAME, self._model,
+            self._term_ids, self._term_traditions, self._term_texts,
+        )
+        self._term_index = stored.index
+        self._term_parts = PartitionedIndex(stored, self._get_store().build)
+        logger.info("FAISS term index ready: %d vectors", stored.size)
+
+    def _encode_queries(self, model_name: str, model, queries: list[str]) -> np.ndarray:
+        """Encode query strings through the shared embedding cache."""
+        if self._embedding_cache is None:
+            self._embedding_cache = get_embedding_cache()
+        return self._embedding_cache.encode(model_name, model, queries, normalize_embeddings=True)
+
+    def _get_store(self) -> FaissIndexStore:
+        if self._store is None:
+            self._store = get_index_store()
+        return self._store
+
+    def _load_or_build(
+        self,
+        name: str,
+        source: Path,
+        model_name: str,
+        model,
+        ids: list[str],
+        traditions: list[str],
+        texts: list[str],
+    ) -> StoredIndex:
+        """Load a cached index for *source*, or encode *texts* and persist one."""
+        store = self._get_store()
+        key = FaissIndexStore.content_key(source, model_name=model_name)
+        stored = store.load(name, key)
+        if stored is not None and stored.column("id") == ids:
+            return stored
+
+        embeddings = model.encode(texts, normalize_embeddings=True)
         embeddings = np.asarray(embeddings, dtype=np.float32)
-
-        dim = embeddings.shape[1]
-        self._term_index = self._faiss.IndexFlatIP(dim)
-        self._term_index.add(embeddings)
-        logger.info("FAISS term index built: %d vectors, dim=%d", len(self._term_ids), dim)
+        rows = [
+            {"id": i, "tradition": t, "text": x}
+            for i, t, x in zip(ids, traditions, texts)
+        ]
+        return store.save(name, key, embeddings, rows)
 
     def search_samples(
         self,
@@ -186,37 +253,112 @@ class FaissIndexService:
         tradition: str,
         top_k: int = 5,
     ) -> list[_FaissHit]:
-        """Semantic search over sample index, filtered by tradition (with default fallback)."""
+        """Semantic search over the tradition + ``default`` sample partitions."""
         self._lazy_init()
-        if self._sample_index is None or self._model is None:
+        if self._sample_parts is None or self._model is None:
             return []
 
-        q_emb = self._model.encode([query], normalize_embeddings=True)
-        q_emb = np.asarray(q_emb, dtype=np.float32)
+        q_emb = self._encode_queries(_TEXT_MODEL_NAME, self._model, [query])
 
-        # Search more than top_k to allow tradition filtering
-        search_k = min(len(self._sample_ids), top_k * 3)
-        scores, indices = self._sample_index.search(q_emb, search_k)
+        return self._collect_hits(
+            self._sample_parts, q_emb, tradition, top_k,
+            self._sample_ids, self._sample_traditions, self._sample_texts,
+        )[0]
 
-        hits: list[_FaissHit] = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0:
-                continue
-            sid = self._sample_ids[idx]
-            trad = self._sample_traditions[idx]
-            # Filter: same tradition or default
-            if trad != tradition and trad != "default" and tradition != "default":
-                continue
-            hits.append(_FaissHit(
-                doc_id=sid,
-                similarity=float(max(0.0, min(1.0, score))),
-                tradition=trad,
-                text_snippet=self._sample_texts[idx][:120],
-            ))
-            if len(hits) >= top_k:
-                break
+    @staticmethod
+    def _collect_hits(
+        parts: PartitionedIndex,
+        q_emb: np.ndarray,
+        tradition: str,
+        top_k: int,
+        ids: list[str],
+        traditions: list[str],
+        texts: list[str],
+    ) -> list[list[_FaissHit]]:
+        """Search *parts* for every row of *q_emb*; one hit list per query."""
+        scores, indices = parts.search(q_emb, tradition, top_k)
+        results: list[list[_FaissHit]] = []
+        for row_scores, row_indices in zip(scores, indices):
+            hits: list[_FaissHit] = []
+            for score, idx in zip(row_scores, row_indices):
+                if idx < 0:
+                    continue
+                hits.append(_FaissHit(
+                    doc_id=ids[idx],
+                    similarity=float(max(0.0, min(1.0, score))),
+                    tradition=traditions[idx],
+                    text_snippet=texts[idx][:120],
+                ))
+            results.append(hits)
+        return results
 
-        return hits
+    def search_many(
+        self,
+        queries: list[str],
+        kinds: tuple[str, ...] | list[str] = ("samples", "terms"),
+        tradition: str = "default",
+        top_k: int = 5,
+    ) -> dict[str, list[list[_FaissHit]]]:
+        """Batched search: all *queries* against every index in *kinds*.
+
+        Unique query strings are encoded in one forward pass per model
+        (MiniLM for ``"samples"``/``"terms"``, CLIP for ``"visual"``) and
+        each partition is searched once with the full query matrix.
+
+        Returns ``{kind: [hits_for_query_0, hits_for_query_1, ...]}`` aligned
+        with *queries*.  Kinds whose model or index is unavailable map to
+        empty hit lists.
+        """
+        unknown = [k for k in kinds if k not in SEARCH_KINDS]
+        if unknown:
+            raise ValueError(f"Unknown search kinds: {unknown}; expected {SEARCH_KINDS}")
+
+        results: dict[str, list[list[_FaissHit]]] = {
+            kind: [[] for _ in queries] for kind in kinds
+        }
+        if not queries:
+            return results
+
+        index_of: dict[str, int] = {}
+        for q in queries:
+            index_of.setdefault(q, len(index_of))
+        unique = list(index_of)
+        position = [index_of[q] for q in queries] if len(unique) < len(queries) else None
+
+        def _assign(kind: str, per_unique: list[list[_FaissHit]]) -> None:
+            if position is None:
+                results[kind] = per_unique
+            else:
+                results[kind] = [list(per_unique[p]) for p in position]
+
+        text_kinds = [k for k in kinds if k in ("samples", "terms")]
+        if text_kinds:
+            self._lazy_init()
+            parts = {"samples": self._sample_parts, "terms": self._term_parts}
+            if self._model is not None and any(parts[k] is not None for k in text_kinds):
+                q_emb = self._encode_queries(_TEXT_MODEL_NAME, self._model, unique)
+                if "samples" in text_kinds and self._sample_parts is not None:
+                    _assign("samples", self._collect_hits(
+                        self._sample_parts, q_emb, tradition, top_k,
+                        self._sample_ids, self._sample_traditions, self._sample_texts,
+                    ))
+                if "terms" in text_kinds and self._term_parts is not None:
+                    _assign("terms", self._collect_hits(
+                        self._term_parts, q_emb, tradition, top_k,
+                        self._term_ids, self._term_traditions, self._term_texts,
+                    ))
+
+        if "visual" in kinds:
+            self._lazy_init_clip()
+            if self._clip_model is not None and self._visual_parts is not None:
+                q_emb = self._encode_queries(_CLIP_MODEL_NAME, self._clip_model, unique)
+                _assign("visual", self._collect_hits(
+                    self._visual_parts, q_emb, tradition, top_k,
+                    self._visual_sample_ids, self._visual_sample_traditions,
+                    self._visual_sample_texts,
+                ))
+
+        return results
 
     # ------------------------------------------------------------------
     # CLIP visual search
@@ -231,11 +373,10 @@ class FaissIndexService:
         if not self.clip_available:
             return
 
-        import faiss
         from sentence_transformers import SentenceTransformer
 
         logger.info("Loading CLIP ViT-B/32 model ...")
-        self._clip_model = SentenceTransformer("clip-ViT-B-32")
+        self._clip_model = SentenceTransformer(_CLIP_MODEL_NAME)
 
         # Build visual index over sample texts (text-to-image cross-modal)
         with open(_SAMPLE_INDEX_FILE, encoding="utf-8") as f:
@@ -256,18 +397,14 @@ class FaissIndexService:
         if not self._visual_sample_texts:
             return
 
-        embeddings = self._clip_model.encode(
-            self._visual_sample_texts, normalize_embeddings=True,
-        )
-        embeddings = np.asarray(embeddings, dtype=np.float32)
-
-        dim = embeddings.shape[1]  # 512 for CLIP ViT-B/32
-        self._visual_index = faiss.IndexFlatIP(dim)
-        self._visual_index.add(embeddings)
-        logger.info(
-            "CLIP visual index built: %d vectors, dim=%d",
-            len(self._visual_sample_ids), dim,
+        stored = self._load_or_build(
+            "samples-clip", _SAMPLE_INDEX_FILE, _CLIP_MODEL_NAME, self._clip_model,
+            self._visual_sample_ids, self._visual_sample_traditions,
+            self._visual_sample_texts,
         )
+        self._visual_index = stored.index
+        self._visual_parts = PartitionedIndex(stored, self._get_store().build)
+        logger.info("CLIP visual index ready: %d vectors", stored.size)
 
     def search_by_visual(
         self,
@@ -282,41 +419,37 @@ class FaissIndexService:
         MiniLM text search may miss.
         """
         self._lazy_init_clip()
-        if self._visual_index is None or self._clip_model is None:
+        if self._visual_parts is None or self._clip_model is None:
             return []
 
-        q_emb = self._clip_model.encode([query_text], normalize_embeddings=True)
-        q_emb = np.asarray(q_emb, dtype=np.float32)
+        q_emb = self._encode_queries(_CLIP_MODEL_NAME, self._clip_model, [query_text])
 
-        search_k = min(len(self._visual_sample_ids), top_k * 3)
-        scores, indices = self._visual_index.search(q_emb, search_k)
-
-        hits: list[_FaissHit] = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0:
-                continue
-            sid = self._visual_sample_ids[idx]
-            trad = self._visual_sample_traditions[idx]
-            if trad != tradition and trad != "default" and tradition != "default":
-                continue
-            hits.append(_FaissHit(
-                doc_id=sid,
-                similarity=float(max(0.0, min(1.0, score))),
-                tradition=trad,
-                text_snippet=self._visual_sample_texts[idx][:120],
-            ))
-            if len(hits) >= top_k:
-                break
-
-        return hits
+        return self._collect_hits(
+            self._visual_parts, q_emb, tradition, top_k,
+            self._visual_sample_ids, self._visual_sample_traditions,
+            self._visual_sample_texts,
+        )[0]
 
     # ------------------------------------------------------------------
     # Layer 2: Trajectory search
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _hash_trajectories(hasher, records: list):
+        """Feed each record's id and search text into the index content hash."""
+        return FaissIndexStore.hash_texts(
+            hasher, (x for r in records for x in (r.trajectory_id, r.to_search_text())),
+        )
+
     def build_trajectory_index(self, records: list) -> int:
         """Build a FAISS index over trajectory search texts.
 
+        The cache key hashes every indexed record's id and search text, so an
+        edited trajectory invalidates the cache.  Records already present in
+        the on-disk cache (matched by ``trajectory_id``, with unchanged text)
+        are not re-encoded; only new records are embedded and appended as a
+        new segment.  Duplicate ids keep their first occurrence.
+
         Parameters
         ----------
         records : list[TrajectoryRecord]
@@ -330,19 +463,81 @@ class FaissIndexService:
         self._lazy_init()
         if self._model is None or not self.available:
             return 0
+        if not records:
+            return 0
 
-        texts = [r.to_search_text() for r in records]
-        if not texts:
+        store = self._get_store()
+        name = "trajectories-minilm"
+        by_id: dict[str, object] = {}
+        for r in records:
+            by_id.setdefault(r.trajectory_id, r)
+        records = list(by_id.values())
+
+        stored = None
+        known = store.stored_ids(name)
+        if known and len(set(known)) == len(known) and set(known) <= by_id.keys():
+            known_records = [by_id[tid] for tid in known]
+            hasher = self._hash_trajectories(
+                FaissIndexStore.content_hasher(model_name=_TEXT_MODEL_NAME), known_records,
+            )
+            stored = store.load(name, hasher.hexdigest())
+        if stored is not None:
+            self._trajectory_stored = stored
+            self._trajectory_hasher = hasher
+            self._trajectory_records = known_records
+            self._trajectory_ids = set(known)
+            self._trajectory_index = stored.index
+            self.add_trajectories([r for r in records if r.trajectory_id not in self._trajectory_ids])
+        else:
+            hasher = self._hash_trajectories(
+                FaissIndexStore.content_hasher(model_name=_TEXT_MODEL_NAME), records,
+            )
+            embeddings = self._model.encode(
+                [r.to_search_text() for r in records], normalize_embeddings=True,
+            )
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            rows = [{"id": r.trajectory_id, "tradition": r.tradition} for r in records]
+            self._trajectory_stored = store.save(name, hasher.hexdigest(), embeddings, rows)
+            self._trajectory_hasher = hasher
+            self._trajectory_index = self._trajectory_stored.index
+            self._trajectory_records = records
+            self._trajectory_ids = set(by_id)
+
+        logger.info("Trajectory index ready: %d vectors", len(self._trajectory_records))
+        return len(self._trajectory_records)
+
+    def add_trajectories(self, records: list) -> int:
+        """Append *records* to an existing trajectory index without rebuilding.
+
+        Records whose ``trajectory_id`` is already indexed (or repeated within
+        *records*) are skipped.  Falls back to ``build_trajectory_index`` when
+        no index exists yet.  Returns the number of records added.
+        """
+        if not records:
+            return 0
+        if self._trajectory_stored is None:
+            return self.build_trajectory_index(records)
+
+        fresh: dict[str, object] = {}
+        for r in records:
+            if r.trajectory_id not in self._trajectory_ids:
+                fresh.setdefault(r.trajectory_id, r)
+        records = list(fresh.values())
+        if not records:
             return 0
 
-        embeddings = self._model.encode(texts, normalize_embeddings=True)
+        embeddings = self._model.encode(
+            [r.to_search_text() for r in records], normalize_embeddings=True,
+        )
         embeddings = np.asarray(embeddings, dtype=np.float32)
-
-        dim = embeddings.shape[1]
-        self._trajectory_index = self._faiss.IndexFlatIP(dim)
-        self._trajectory_index.add(embeddings)
-        self._trajectory_records = records
-        logger.info("Trajectory index built: %d vectors, dim=%d", len(records), dim)
+        rows = [{"id": r.trajectory_id, "tradition": r.tradition} for r in records]
+        key = self._hash_trajectories(self._trajectory_hasher, records).hexdigest()
+        stored = self._get_store().append(
+            self._trajectory_stored, "trajectories-minilm", embeddings, rows, key=key,
+        )
+        self._trajectory_index = stored.index
+        self._trajectory_records.extend(records)
+        self._trajectory_ids.update(fresh)
         return len(records)
 
     def search_trajectories(
@@ -360,8 +555,7 @@ class FaissIndexService:
         if self._model is None:
             return []
 
-        q_emb = self._model.encode([query], normalize_embeddings=True)
-        q_emb = np.asarray(q_emb, dtype=np.float32)
+        q_emb = self._encode_queries(_TEXT_MODEL_NAME, self._model, [query])
 
         records = getattr(self, "_trajectory_records", [])
         search_k = min(len(records), top_k)
@@ -384,32 +578,14 @@ class FaissIndexService:
         tradition: str,
         top_k: int = 5,
     ) -> list[_FaissHit]:
-        """Semantic search over terminology index, filtered by tradition (with default fallback)."""
+        """Semantic search over the tradition + ``default`` terminology partitions."""
         self._lazy_init()
-        if self._term_index is None or self._model is None:
+        if self._term_parts is None or self._model is None:
             return []
 
-        q_emb = self._model.encode([query], normalize_embeddings=True)
-        q_emb = np.asarray(q_emb, dtype=np.float32)
-
-        search_k = min(len(self._term_ids), top_k * 3)
-        scores, indices = self._term_index.search(q_emb, search_k)
+        q_emb = self._encode_queries(_TEXT_MODEL_NAME, self._model, [query])
 
-        hits: list[_FaissHit] = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0:
-                continue
-            tid = self._term_ids[idx]
-            trad = self._term_traditions[idx]
-            if trad != tradition and trad != "default" and tradition != "default":
-                continue
-            hits.append(_FaissHit(
-                doc_id=tid,
-                similarity=float(max(0.0, min(1.0, score))),
-                tradition=trad,
-                text_snippet=self._term_texts[idx][:120],
-            ))
-            if len(hits) >= top_k:
-                break
-
-        return hits
+        return self._collect_hits(
+            self._term_parts, q_emb, tradition, top_k,
+            self._term_ids, self._term_traditions, self._term_texts,
+        )[0]
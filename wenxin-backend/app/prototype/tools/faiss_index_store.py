@@ -0,0 +1,579 @@
+"""FaissIndexStore — on-disk cache of embeddings and FAISS indices.
+
+Avoids re-encoding the sample / terminology / trajectory corpora with MiniLM
+or CLIP on every process start.  Each named index lives in its own directory::
+
+    <root>/<name>/
+        manifest.json      # content key, dim, index kind, segment list
+        meta.jsonl         # one row of metadata (id, tradition, text) per vector
+        seg-00000.npy      # float32 embeddings, memory-mapped on load
+        seg-00001.npy      # ... further segments written by append()
+        index.faiss        # serialized FAISS index over the first ``indexed`` rows
+
+The content key is a SHA-256 over the source files plus the model name, so
+editing ``index.v1.json`` or ``terms.v1.json`` (or switching models)
+invalidates the cache automatically.  ``append()`` writes a new segment and
+appends metadata rows without touching existing segments, which lets the
+trajectory index grow incrementally.  ``index.faiss`` is only rewritten once
+``flush_rows`` vectors have accumulated past it (or on ``flush()``); ``load()``
+adds the unflushed tail back from the segments.
+
+``PartitionedIndex`` splits a stored index into per-tradition sub-indexes so
+a query only scans its own tradition plus the shared ``default`` partition.
+
+Once a corpus passes ``ann_threshold`` vectors, the exact ``IndexFlatIP`` is
+replaced by an approximate HNSW or IVF index (``ann_kind``).
+
+Environment variables:
+- ``VULCA_FAISS_CACHE_DIR``: cache root (default ``app/prototype/data/faiss_cache``)
+- ``VULCA_FAISS_CACHE``: set to ``0`` to disable on-disk caching
+- ``VULCA_FAISS_ANN_THRESHOLD``: vector count at which to switch to ANN (default 50000)
+- ``VULCA_FAISS_ANN_KIND``: ``"hnsw"`` (default) or ``"ivf"``
+- ``VULCA_FAISS_FLUSH_ROWS``: appended vectors before ``index.faiss`` is
+  rewritten (default 1024)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.prototype.checkpoints.utils import atomic_write as _atomic_write
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "FaissIndexStore",
+    "PartitionedIndex",
+    "StoredIndex",
+    "build_faiss_index",
+    "get_index_store",
+]
+
+_DEFAULT_ROOT = Path(__file__).resolve().parent.parent / "data" / "faiss_cache"
+_MANIFEST_VERSION = 1
+_DEFAULT_ANN_THRESHOLD = 50_000
+_DEFAULT_FLUSH_ROWS = 1024
+_HNSW_M = 32
+_HNSW_EF_SEARCH = 64
+_IVF_NPROBE = 16
+
+
+@dataclass
+class StoredIndex:
+    """A loaded (or freshly built) index together with its row metadata."""
+
+    key: str
+    index: Any  # faiss.Index
+    segments: list[np.ndarray] = field(default_factory=list)
+    rows: list[dict] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.rows)
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """All embeddings as one (N, dim) array (memory-mapped if single-segment)."""
+        if not self.segments:
+            return np.zeros((0, 0), dtype=np.float32)
+        if len(self.segments) == 1:
+            return self.segments[0]
+        return np.concatenate(self.segments, axis=0)
+
+    def column(self, name: str) -> list:
+        """Return one metadata column (e.g. ``"id"``, ``"tradition"``) as a list."""
+        return [row.get(name, "") for row in self.rows]
+
+
+def build_faiss_index(
+    faiss: Any,
+    embeddings: np.ndarray,
+    ann_threshold: int = _DEFAULT_ANN_THRESHOLD,
+    ann_kind: str = "hnsw",
+) -> Any:
+    """Build an inner-product FAISS index sized for *embeddings*.
+
+    Exact ``IndexFlatIP`` below *ann_threshold* vectors; HNSW or IVF above.
+    """
+    n, dim = embeddings.shape
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    if n < ann_threshold:
+        index = faiss.IndexFlatIP(dim)
+    elif ann_kind == "ivf":
+        nlist = max(1, int(math.sqrt(n)))
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+        index.train(embeddings)
+        index.nprobe = min(_IVF_NPROBE, nlist)
+    else:
+        index = faiss.IndexHNSWFlat(dim, _HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efSearch = _HNSW_EF_SEARCH
+
+    if n:
+        index.add(embeddings)
+    return index
+
+
+class PartitionedIndex:
+    """Per-tradition sub-indexes over a StoredIndex, plus the global index.
+
+    A query for tradition ``T`` searches partition ``T`` and the shared
+    ``default`` partition and merges their top-k; a query for ``default``
+    searches the global index.  Results always hold ``min(top_k, eligible)``
+    hits, however rare the tradition.
+    """
+
+    def __init__(self, stored: StoredIndex, build: Any) -> None:
+        self._global = stored.index
+        self._size = stored.size
+        groups: dict[str, list[int]] = {}
+        for i, tradition in enumerate(stored.column("tradition")):
+            groups.setdefault(tradition, []).append(i)
+
+        embeddings = stored.embeddings
+        self._parts: dict[str, tuple[Any, np.ndarray]] = {}
+        for tradition, rows in groups.items():
+            row_ids = np.asarray(rows, dtype=np.int64)
+            self._parts[tradition] = (build(np.asarray(embeddings[row_ids])), row_ids)
+
+    @property
+    def traditions(self) -> list[str]:
+        return sorted(self._parts)
+
+    def partition_size(self, tradition: str) -> int:
+        part = self._parts.get(tradition)
+        return 0 if part is None else len(part[1])
+
+    def search(
+        self,
+        queries: np.ndarray,
+        tradition: str,
+        top_k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """FAISS-style search: returns ``(scores, row_ids)`` of shape (nq, top_k).
+
+        Row ids index the original StoredIndex rows; unfilled slots are -1.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+        nq = queries.shape[0]
+        scores = np.full((nq, top_k), -np.inf, dtype=np.float32)
+        ids = np.full((nq, top_k), -1, dtype=np.int64)
+        if nq == 0 or top_k <= 0:
+            return scores, ids
+
+        if tradition == "default":
+            k = min(top_k, self._size)
+            if k:
+                s, i = self._global.search(queries, k)
+                scores[:, :k], ids[:, :k] = s, i
+            return scores, ids
+
+        names = [tradition] if tradition in self._parts else []
+        if "default" in self._parts:
+            names.append("default")
+        all_scores, all_ids = [], []
+        for name in names:
+            index, row_ids = self._parts[name]
+            k = min(top_k, len(row_ids))
+            s, local = index.search(queries, k)
+            all_scores.append(s)
+            all_ids.append(np.where(local >= 0, row_ids[np.clip(local, 0, None)], -1))
+        if not all_scores:
+            return scores, ids
+
+        merged_s = np.concatenate(all_scores, axis=1)
+        merged_i = np.concatenate(all_ids, axis=1)
+        merged_s = np.where(merged_i >= 0, merged_s, -np.inf)
+        order = np.argsort(-merged_s, axis=1, kind="stable")[:, :top_k]
+        k = order.shape[1]
+        scores[:, :k] = np.take_along_axis(merged_s, order, axis=1)
+        ids[:, :k] = np.take_along_axis(merged_i, order, axis=1)
+        return scores, ids
+
+
+def _index_kind(faiss: Any, index: Any) -> str:
+    if isinstance(index, faiss.IndexHNSWFlat):
+        return "hnsw"
+    if isinstance(index, faiss.IndexIVF):
+        return "ivf"
+    return "flat"
+
+
+class FaissIndexStore:
+    """Persist embeddings + FAISS indices keyed by corpus content hash.
+
+    Usage::
+
+        store = get_index_store()
+        key = FaissIndexStore.content_key(_SAMPLE_INDEX_FILE, model_name="all-MiniLM-L6-v2")
+        stored = store.load("samples-minilm", key)
+        if stored is None:
+            emb = model.encode(texts, normalize_embeddings=True)
+            stored = store.save("samples-minilm", key, emb, rows)
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        ann_threshold: int | None = None,
+        ann_kind: str | None = None,
+        enabled: bool | None = None,
+        flush_rows: int | None = None,
+    ) -> None:
+        self._root = Path(root or os.environ.get("VULCA_FAISS_CACHE_DIR") or _DEFAULT_ROOT)
+        if ann_threshold is None:
+            ann_threshold = int(
+                os.environ.get("VULCA_FAISS_ANN_THRESHOLD", _DEFAULT_ANN_THRESHOLD)
+            )
+        self._ann_threshold = ann_threshold
+        self._ann_kind = (ann_kind or os.environ.get("VULCA_FAISS_ANN_KIND", "hnsw")).lower()
+        if enabled is None:
+            enabled = os.environ.get("VULCA_FAISS_CACHE", "1") != "0"
+        self._enabled = enabled
+        if flush_rows is None:
+            flush_rows = int(os.environ.get("VULCA_FAISS_FLUSH_ROWS", _DEFAULT_FLUSH_ROWS))
+        self._flush_rows = max(1, flush_rows)
+        self._faiss = None
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def ann_threshold(self) -> int:
+        return self._ann_threshold
+
+    @property
+    def ann_kind(self) -> str:
+        return self._ann_kind
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def content_hasher(*sources: str | Path, model_name: str) -> Any:
+        """Running SHA-256 over *sources* plus *model_name*.
+
+        Missing source files contribute only their path, so a later-created
+        file still changes the key.  Callers indexing in-memory corpora can
+        keep feeding it with :meth:`hash_texts` as the corpus grows.
+        """
+        h = hashlib.sha256()
+        h.update(f"v{_MANIFEST_VERSION}:{model_name}".encode("utf-8"))
+        for src in sources:
+            path = Path(src)
+            h.update(b"\0" + path.name.encode("utf-8") + b"\0")
+            try:
+                h.update(path.read_bytes())
+            except OSError:
+                pass
+        return h
+
+    @staticmethod
+    def hash_texts(hasher: Any, texts: Iterable[str]) -> Any:
+        """Feed *texts* (in order) into a :meth:`content_hasher`; returns it."""
+        for text in texts:
+            hasher.update(b"\1" + text.encode("utf-8"))
+        return hasher
+
+    @staticmethod
+    def content_key(
+        *sources: str | Path,
+        model_name: str,
+        texts: Iterable[str] = (),
+    ) -> str:
+        """SHA-256 over the bytes of *sources*, *model_name* and *texts*."""
+        h = FaissIndexStore.content_hasher(*sources, model_name=model_name)
+        return FaissIndexStore.hash_texts(h, texts).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def build(self, embeddings: np.ndarray) -> Any:
+        """Build an in-memory index for *embeddings* using this store's ANN policy."""
+        return build_faiss_index(
+            self._get_faiss(), embeddings, self._ann_threshold, self._ann_kind,
+        )
+
+    def stored_ids(self, name: str) -> list[str] | None:
+        """Row ids of the persisted index *name*, in index order (None if absent).
+
+        Lets callers whose content key depends on which rows are cached
+        compute that key before calling :meth:`load`.
+        """
+        if not self._enabled:
+            return None
+        index_dir = self._root / name
+        manifest = self._read_manifest(index_dir)
+        if manifest is None:
+            return None
+        try:
+            rows = self._read_rows(index_dir / "meta.jsonl", manifest["count"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return None if rows is None else [row.get("id", "") for row in rows]
+
+    def load(self, name: str, key: str) -> StoredIndex | None:
+        """Load index *name* if its stored content key equals *key*, else None."""
+        if not self._enabled:
+            return None
+        index_dir = self._root / name
+        manifest = self._read_manifest(index_dir)
+        if manifest is None or manifest.get("key") != key:
+            return None
+
+        faiss = self._get_faiss()
+        try:
+            segments = [
+                np.load(index_dir / seg, mmap_mode="r") for seg in manifest["segments"]
+            ]
+            rows = self._read_rows(index_dir / "meta.jsonl", manifest["count"])
+            index = faiss.read_index(str(index_dir / "index.faiss"))
+        except (OSError, ValueError, RuntimeError, KeyError) as exc:
+            logger.warning("FAISS cache %s unreadable, rebuilding: %s", name, exc)
+            return None
+
+        indexed = manifest.get("indexed", manifest["count"])
+        if (
+            rows is None
+            or index.ntotal != indexed
+            or sum(len(seg) for seg in segments) != len(rows)
+            or indexed > len(rows)
+        ):
+            logger.warning("FAISS cache %s inconsistent, rebuilding", name)
+            return None
+        if indexed < len(rows):
+            index.add(np.ascontiguousarray(self._tail(segments, indexed), dtype=np.float32))
+
+        logger.info("FAISS cache hit: %s (%d vectors)", name, len(rows))
+        return StoredIndex(key=key, index=index, segments=segments, rows=rows)
+
+    def save(
+        self,
+        name: str,
+        key: str,
+        embeddings: np.ndarray,
+        rows: list[dict],
+    ) -> StoredIndex:
+        """Build an index over *embeddings* and (if enabled) persist it under *name*."""
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        index = self.build(embeddings)
+        stored = StoredIndex(key=key, index=index, segments=[embeddings], rows=list(rows))
+        if not self._enabled:
+            return stored
+
+        index_dir = self._root / name
+        try:
+            index_dir.mkdir(parents=True, exist_ok=True)
+            for stale in index_dir.glob("seg-*.npy"):
+                stale.unlink()
+            self._write_segment(index_dir / "seg-00000.npy", embeddings)
+            _atomic_write(
+                index_dir / "meta.jsonl",
+                "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows),
+            )
+            self._write_index(index_dir, index)
+            self._write_manifest(index_dir, key, embeddings.shape[1], ["seg-00000.npy"],
+                                 len(rows), _index_kind(self._get_faiss(), index),
+                                 indexed=len(rows))
+        except OSError as exc:
+            logger.warning("Failed to persist FAISS cache %s: %s", name, exc)
+        return stored
+
+    def append(
+        self,
+        stored: StoredIndex,
+        name: str,
+        embeddings: np.ndarray,
+        rows: list[dict],
+        key: str | None = None,
+    ) -> StoredIndex:
+        """Add *embeddings* to *stored* in place and persist as a new segment.
+
+        Existing segments are never rewritten, and ``index.faiss`` only once
+        ``flush_rows`` vectors are pending (or the index kind changes).  If
+        the total size crosses the ANN threshold while the current index is
+        still exact, the index is rebuilt once from all embeddings.  *key*,
+        when given, replaces the content key of the grown index.
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if len(rows) == 0:
+            return stored
+        if len(rows) != embeddings.shape[0]:
+            raise ValueError("rows and embeddings length mismatch")
+
+        faiss = self._get_faiss()
+        old_key = stored.key
+        stored.key = key or old_key
+        stored.segments.append(embeddings)
+        stored.rows.extend(rows)
+        rebuilt = False
+        if (
+            _index_kind(faiss, stored.index) == "flat"
+            and stored.size >= self._ann_threshold
+        ):
+            stored.index = self.build(stored.embeddings)
+            rebuilt = True
+        else:
+            stored.index.add(embeddings)
+
+        if not self._enabled:
+            return stored
+
+        index_dir = self._root / name
+        manifest = self._read_manifest(index_dir)
+        if manifest is None or manifest.get("key") != old_key:
+            # Nothing consistent on disk to append to — persist from scratch.
+            self.save(name, stored.key, stored.embeddings, stored.rows)
+            return stored
+
+        try:
+            seg_name = f"seg-{len(manifest['segments']):05d}.npy"
+            self._write_segment(index_dir / seg_name, embeddings)
+            with open(index_dir / "meta.jsonl", "a", encoding="utf-8") as f:
+                for r in rows:
+                    f.write(json.dumps(r, ensure_ascii=False) + "\n")
+            indexed = manifest.get("indexed", manifest["count"])
+            if rebuilt or stored.size - indexed >= self._flush_rows:
+                self._write_index(index_dir, stored.index)
+                indexed = stored.size
+            self._write_manifest(index_dir, stored.key, embeddings.shape[1],
+                                 manifest["segments"] + [seg_name], stored.size,
+                                 _index_kind(faiss, stored.index), indexed=indexed)
+        except OSError as exc:
+            logger.warning("Failed to append to FAISS cache %s: %s", name, exc)
+        return stored
+
+    def flush(self, stored: StoredIndex, name: str) -> None:
+        """Write ``index.faiss`` for *stored* now, covering every appended row."""
+        if not self._enabled:
+            return
+        index_dir = self._root / name
+        manifest = self._read_manifest(index_dir)
+        if manifest is None or manifest.get("key") != stored.key:
+            return
+        if manifest.get("indexed", manifest["count"]) == manifest["count"]:
+            return
+        try:
+            self._write_index(index_dir, stored.index)
+            self._write_manifest(index_dir, stored.key, manifest["dim"], manifest["segments"],
+                                 manifest["count"], manifest["kind"], indexed=manifest["count"])
+        except OSError as exc:
+            logger.warning("Failed to flush FAISS cache %s: %s", name, exc)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_faiss(self) -> Any:
+        if self._faiss is None:
+            import faiss
+
+            self._faiss = faiss
+        return self._faiss
+
+    @staticmethod
+    def _read_manifest(index_dir: Path) -> dict | None:
+        path = index_dir / "manifest.json"
+        if not path.exists():
+            return None
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return None
+        return manifest
+
+    @staticmethod
+    def _read_rows(path: Path, count: int) -> list[dict] | None:
+        rows: list[dict] = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if len(rows) >= count:
+                    break  # trailing rows from an interrupted append
+                line = line.strip()
+                if line:
+                    rows.append(json.loads(line))
+        return rows if len(rows) == count else None
+
+    @staticmethod
+    def _tail(segments: list[np.ndarray], start: int) -> np.ndarray:
+        """Embeddings from row *start* onward, reading only the segments it spans."""
+        parts, offset = [], 0
+        for seg in segments:
+            if offset + len(seg) > start:
+                parts.append(seg[max(0, start - offset):])
+            offset += len(seg)
+        return np.concatenate(parts, axis=0) if parts else np.zeros((0, 0), dtype=np.float32)
+
+    @staticmethod
+    def _write_segment(path: Path, embeddings: np.ndarray) -> None:
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, embeddings)
+            os.replace(tmp, str(path))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _write_index(self, index_dir: Path, index: Any) -> None:
+        tmp = index_dir / "index.faiss.tmp"
+        self._get_faiss().write_index(index, str(tmp))
+        os.replace(tmp, index_dir / "index.faiss")
+
+    @staticmethod
+    def _write_manifest(
+        index_dir: Path,
+        key: str,
+        dim: int,
+        segments: list[str],
+        count: int,
+        kind: str,
+        indexed: int,
+    ) -> None:
+        manifest = {
+            "version": _MANIFEST_VERSION,
+            "key": key,
+            "dim": dim,
+            "kind": kind,
+            "segments": segments,
+            "count": count,
+            "indexed": indexed,
+        }
+        _atomic_write(index_dir / "manifest.json", json.dumps(manifest, indent=2))
+
+
+# ---------------------------------------------------------------------------
+# Singleton factory
+# ---------------------------------------------------------------------------
+_store: FaissIndexStore | None = None
+
+
+def get_index_store() -> FaissIndexStore:
+    """Return the process-wide FaissIndexStore (configured from env)."""
+    global _store  # noqa: PLW0603
+    if _store is None:
+        _store = FaissIndexStore()
+    return _store
@@ -0,0 +1,285 @@
+"""ImagePrep — process-wide preparation of images for VLM requests.
+
+Shared by every call site that sends a candidate image to a VLM (VLMCritic,
+agentic vision rounds, AgentRuntime ReAct steps, skill executors) so each
+image is read, decoded, downscaled and base64-encoded once per process
+instead of once per call, and every request carries the smaller payload.
+
+Payloads are keyed by the SHA-256 of the image bytes plus the output
+settings, so the same content reached through different paths (or a
+rewritten file at the same path) resolves correctly.  A ``(path, mtime,
+size)`` index in front of it skips re-reading unchanged files.
+
+Images whose longer edge exceeds the max edge are downscaled and re-encoded
+as JPEG or WebP; smaller JPEG/PNG/WebP/GIF images are sent as-is.  Without
+Pillow, or for bytes Pillow cannot decode, the original bytes are sent.
+
+Environment variables:
+- ``VULCA_IMAGE_MAX_EDGE``: longest edge in pixels (default 1536; 0 keeps
+  the original size)
+- ``VULCA_IMAGE_FORMAT``: ``jpeg`` (default) or ``webp``
+- ``VULCA_IMAGE_QUALITY``: encoder quality 1-100 (default 85)
+- ``VULCA_IMAGE_CACHE_SIZE``: max cached payloads (default 64)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ImagePrep",
+    "PreparedImage",
+    "detect_mime",
+    "get_image_prep",
+]
+
+_DEFAULT_MAX_EDGE = 1536
+_DEFAULT_FORMAT = "jpeg"
+_DEFAULT_QUALITY = 85
+_DEFAULT_MAX_ENTRIES = 64
+
+# Formats every VLM provider accepts as-is
+_PASSTHROUGH_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+_SUFFIX_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
+def detect_mime(data: bytes, suffix: str = "") -> str:
+    """MIME type from magic bytes, then file suffix; ``image/png`` otherwise."""
+    if data[:4] == b"\x89PNG":
+        return "image/png"
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:4] == b"GIF8":
+        return "image/gif"
+    return _SUFFIX_MIME.get(suffix.lower(), "image/png")
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """An encoded VLM payload (immutable, shared between callers)."""
+
+    b64: str
+    mime_type: str
+    digest: str
+    width: int = 0
+    height: int = 0
+    resized: bool = False
+
+    @property
+    def data_uri(self) -> str:
+        return f"data:{self.mime_type};base64,{self.b64}"
+
+    def content_block(self) -> dict:
+        """OpenAI/LiteLLM ``image_url`` content block."""
+        return {"type": "image_url", "image_url": {"url": self.data_uri}}
+
+
+class ImagePrep:
+    """Thread-safe, size-bounded LRU of prepared image payloads.
+
+    Usage::
+
+        prep = get_image_prep()
+        img = prep.prepare_path("/tmp/candidate.png")
+        messages = [{"role": "user", "content": [img.content_block(), ...]}]
+    """
+
+    def __init__(
+        self,
+        max_edge: int = _DEFAULT_MAX_EDGE,
+        fmt: str = _DEFAULT_FORMAT,
+        quality: int = _DEFAULT_QUALITY,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        fmt = fmt.lower()
+        if fmt not in ("jpeg", "webp"):
+            raise ValueError(f"Unsupported image format {fmt!r} (use 'jpeg' or 'webp')")
+        self.max_edge = max(0, max_edge)
+        self.fmt = fmt
+        self.quality = min(100, max(1, quality))
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple, PreparedImage] = OrderedDict()
+        # (resolved path, mtime_ns, size) -> content digest
+        self._path_index: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    # ------------------------------------------------------------------
+    # Preparation
+    # ------------------------------------------------------------------
+
+    def prepare_path(self, path: str | Path) -> PreparedImage:
+        """Prepared payload for an image file.
+
+        Raises ``FileNotFoundError`` / ``OSError`` if the file can't be read.
+        """
+        p = Path(path)
+        st = p.stat()
+        stat_key = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            digest = self._path_index.get(stat_key)
+            if digest is not None:
+                prepared = self._lookup((digest, *self._settings))
+                if prepared is not None:
+                    self._path_index.move_to_end(stat_key)
+                    return prepared
+
+        prepared = self.prepare_bytes(p.read_bytes(), suffix=p.suffix)
+        with self._lock:
+            self._path_index[stat_key] = prepared.digest
+            self._path_index.move_to_end(stat_key)
+            while len(self._path_index) > self._max_entries:
+                self._path_index.popitem(last=False)
+        return prepared
+
+    def prepare_bytes(self, data: bytes, suffix: str = "") -> PreparedImage:
+        """Prepared payload for raw image bytes."""
+        digest = hashlib.sha256(data).hexdigest()
+        key = (digest, *self._settings)
+        with self._lock:
+            prepared = self._lookup(key)
+            if prepared is not None:
+                return prepared
+            self._misses += 1
+
+        prepared = self._encode(data, digest, suffix)
+        with self._lock:
+            self._bytes_in += len(data)
+            self._bytes_out += len(prepared.b64) * 3 // 4
+            self._entries[key] = prepared
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return prepared
+
+    @property
+    def _settings(self) -> tuple:
+        return (self.max_edge, self.fmt, self.quality)
+
+    def _lookup(self, key: tuple) -> PreparedImage | None:
+        # Caller holds self._lock
+        prepared = self._entries.get(key)
+        if prepared is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return prepared
+
+    def _encode(self, data: bytes, digest: str, suffix: str) -> PreparedImage:
+        def original(width: int = 0, height: int = 0) -> PreparedImage:
+            return PreparedImage(
+                b64=base64.b64encode(data).decode("ascii"),
+                mime_type=detect_mime(data, suffix),
+                digest=digest,
+                width=width,
+                height=height,
+            )
+
+        try:
+            from PIL import Image
+        except ImportError:
+            return original()
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                width, height = img.size
+                needs_resize = self.max_edge and max(width, height) > self.max_edge
+                if not needs_resize and img.format in _PASSTHROUGH_FORMATS:
+                    return original(width, height)
+
+                img.load()
+                if needs_resize:
+                    img.thumbnail((self.max_edge, self.max_edge), Image.Resampling.LANCZOS)
+                if self.fmt == "jpeg":
+                    img = img.convert("RGB")
+                elif img.mode not in ("RGB", "RGBA"):
+                    has_alpha = "A" in img.getbands() or "transparency" in img.info
+                    img = img.convert("RGBA" if has_alpha else "RGB")
+                out = io.BytesIO()
+                img.save(out, format=self.fmt.upper(), quality=self.quality)
+                width, height = img.size
+        except Exception as exc:  # noqa: BLE001 — undecodable bytes are sent unchanged
+            logger.debug("Image not decodable (%s), sending original bytes", exc)
+            return original()
+
+        return PreparedImage(
+            b64=base64.b64encode(out.getvalue()).decode("ascii"),
+            mime_type=f"image/{self.fmt}",
+            digest=digest,
+            width=width,
+            height=height,
+            resized=bool(needs_resize),
+        )
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+                "bytes_in": self._bytes_in,
+                "bytes_out": self._bytes_out,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._path_index.clear()
+            self._hits = self._misses = self._evictions = 0
+            self._bytes_in = self._bytes_out = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ---------------------------------------------------------------------------
+# Singleton factory
+# ---------------------------------------------------------------------------
+_shared: ImagePrep | None = None
+_shared_lock = threading.Lock()
+
+
+def get_image_prep() -> ImagePrep:
+    """Return the process-wide ImagePrep (configured from env)."""
+    global _shared  # noqa: PLW0603
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = ImagePrep(
+                    max_edge=int(os.environ.get("VULCA_IMAGE_MAX_EDGE", _DEFAULT_MAX_EDGE)),
+                    fmt=os.environ.get("VULCA_IMAGE_FORMAT", _DEFAULT_FORMAT),
+                    quality=int(os.environ.get("VULCA_IMAGE_QUALITY", _DEFAULT_QUALITY)),
+                    max_entries=int(os.environ.get("VULCA_IMAGE_CACHE_SIZE", _DEFAULT_MAX_ENTRIES)),
+                )
+    return _shared
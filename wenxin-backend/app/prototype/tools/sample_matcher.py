@@ -47,7 +47,13 @@ class SampleMatcher:
         cultural_tradition: str,
         top_k: int = 3,
         mode: str = "jaccard",
+        semantic_hits: list | None = None,
     ) -> list[SampleMatchResult]:
+        """Return up to *top_k* sample matches for *subject*.
+
+        *semantic_hits* lets a caller pass FAISS hits it already fetched in a
+        batch (``FaissIndexService.search_many``) instead of searching again.
+        """
         if not isinstance(top_k, int):
             raise TypeError("top_k must be an int")
         if top_k <= 0:
@@ -61,7 +67,7 @@ class SampleMatcher:
             use_faiss = self._faiss_service is not None and self._faiss_service.available
 
         if use_faiss and self._faiss_service is not None:
-            return self._match_semantic(subject, cultural_tradition, top_k)
+            return self._match_semantic(subject, cultural_tradition, top_k, semantic_hits)
 
         query_tokens = _tokenize(subject)
         if not query_tokens:
@@ -100,10 +106,13 @@ class SampleMatcher:
         subject: str,
         cultural_tradition: str,
         top_k: int,
+        hits: list | None = None,
     ) -> list[SampleMatchResult]:
-        """Semantic search via FAISS."""
+        """Semantic search via FAISS (or pre-fetched *hits*)."""
         assert self._faiss_service is not None
-        hits = self._faiss_service.search_samples(subject, cultural_tradition, top_k=top_k)
+        if hits is None:
+            hits = self._faiss_service.search_samples(subject, cultural_tradition, top_k=top_k)
+        hits = hits[:top_k]
         results: list[SampleMatchResult] = []
         for hit in hits:
             # Look up source from sample data
@@ -31,6 +31,25 @@ from app.prototype.tools.terminology_loader import TerminologyLoader
 
 logger = logging.getLogger(__name__)
 
+_SAMPLE_TOP_K = 3
+_TERM_TOP_K = 5
+_SUPPLEMENTARY_TOP_K = 3
+
+
+def _load_scout_notes() -> list[str]:
+    """Load evolved scout insight as evidence notes (zero regression on failure)."""
+    scout_notes: list[str] = []
+    try:
+        from app.prototype.cultural_pipelines.cultural_weights import get_agent_insight
+        scout_insight = get_agent_insight("scout")
+        if scout_insight:
+            # Cap at 200 chars for evidence brevity
+            scout_notes.append(f"[Scout insight] {scout_insight[:200]}")
+            logger.debug("Scout evolved insight loaded (%d chars)", len(scout_insight))
+    except Exception:
+        pass  # Zero regression
+    return scout_notes
+
 
 class ScoutService:
     """Gather evidence from all Scout tools and return a unified ScoutEvidence.
@@ -84,47 +103,82 @@ class ScoutService:
         subject: str,
         cultural_tradition: str,
     ) -> ScoutEvidence:
-        cache_key = f"{subject}::{cultural_tradition}"
-        if cache_key in self._evidence_cache:
-            logger.debug("Scout cache HIT: %s", cache_key)
-            return copy.deepcopy(self._evidence_cache[cache_key])
-
-        # Load evolved scout insight (zero regression on failure)
-        scout_notes: list[str] = []
-        try:
-            from app.prototype.cultural_pipelines.cultural_weights import get_agent_insight
-            scout_insight = get_agent_insight("scout")
-            if scout_insight:
-                # Cap at 200 chars for evidence brevity
-                scout_notes.append(f"[Scout insight] {scout_insight[:200]}")
-                logger.debug("Scout evolved insight loaded (%d chars)", len(scout_insight))
-        except Exception:
-            pass  # Zero regression
+        return self.gather_evidence_many([subject], cultural_tradition)[0]
+
+    def gather_evidence_many(
+        self,
+        subjects: list[str],
+        cultural_tradition: str,
+    ) -> list[ScoutEvidence]:
+        """Gather evidence for several subjects with one batched FAISS search.
+
+        Uncached subjects are encoded together via
+        ``FaissIndexService.search_many`` (one MiniLM forward pass, one search
+        per partition), so benchmark sweeps over hundreds of subjects do not
+        pay per-subject encoder overhead.
+        """
+        cache_keys = [f"{subject}::{cultural_tradition}" for subject in subjects]
+        missing = [
+            subject for subject, key in zip(subjects, cache_keys)
+            if key not in self._evidence_cache
+        ]
+        missing = list(dict.fromkeys(missing))
 
+        prefetched: dict[str, list[list]] = {}
+        if missing and self._faiss_service is not None:
+            prefetched = self._faiss_service.search_many(
+                missing, ("samples", "terms"), cultural_tradition,
+                top_k=max(_SAMPLE_TOP_K, _TERM_TOP_K),
+            )
+
+        if missing:
+            scout_notes = _load_scout_notes()
+            for i, subject in enumerate(missing):
+                self._evidence_cache[f"{subject}::{cultural_tradition}"] = self._build_evidence(
+                    subject,
+                    cultural_tradition,
+                    scout_notes,
+                    sample_hits=prefetched["samples"][i] if prefetched else None,
+                    term_hits=prefetched["terms"][i] if prefetched else None,
+                )
+                logger.debug("Scout cache MISS, stored: %s::%s", subject, cultural_tradition)
+
+        results: list[ScoutEvidence] = []
+        for key in cache_keys:
+            results.append(copy.deepcopy(self._evidence_cache[key]))
+        return results
+
+    def _build_evidence(
+        self,
+        subject: str,
+        cultural_tradition: str,
+        scout_notes: list[str],
+        sample_hits: list | None = None,
+        term_hits: list | None = None,
+    ) -> ScoutEvidence:
         sample_matches = self._sample_matcher.match(
             subject=subject,
             cultural_tradition=cultural_tradition,
-            top_k=3,
+            top_k=_SAMPLE_TOP_K,
             mode=self._sample_mode,
+            semantic_hits=sample_hits,
         )
         terminology_hits = self._terminology_loader.match(
             text=subject,
             cultural_tradition=cultural_tradition,
             mode=self._term_mode,
+            semantic_hits=term_hits,
         )
         taboo_violations = self._taboo_engine.check(
             text=subject,
             cultural_tradition=cultural_tradition,
         )
-        evidence = ScoutEvidence(
+        return ScoutEvidence(
             sample_matches=sample_matches,
             terminology_hits=terminology_hits,
             taboo_violations=taboo_violations,
-            notes=scout_notes,
+            notes=list(scout_notes),
         )
-        self._evidence_cache[cache_key] = evidence
-        logger.debug("Scout cache MISS, stored: %s", cache_key)
-        return copy.deepcopy(evidence)
 
     def clear_cache(self) -> None:
         """Clear the evidence cache."""
@@ -290,14 +344,13 @@ class ScoutService:
         existing_terms = {a.term.lower() for a in existing_pack.anchors}
         new_anchors: list[TerminologyAnchor] = []
 
-        for query in need.suggested_queries:
-            # Try FAISS semantic search if available
-            if self._faiss_service is not None and self._faiss_service.available:
-                hits = self._faiss_service.search_terms(
-                    query=query,
-                    tradition=existing_pack.tradition,
-                    top_k=3,
-                )
+        queries = list(need.suggested_queries)
+        if queries and self._faiss_service is not None and self._faiss_service.available:
+            # One batched encode + search for all suggested queries
+            batch = self._faiss_service.search_many(
+                queries, ("terms",), existing_pack.tradition, top_k=_SUPPLEMENTARY_TOP_K,
+            )
+            for hits in batch["terms"]:
                 for hit in hits:
                     entry = self._terminology_loader.get_term_entry_by_id(hit.doc_id)
                     if entry is None:
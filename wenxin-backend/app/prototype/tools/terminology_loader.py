@@ -57,7 +57,13 @@ class TerminologyLoader:
         text: str,
         cultural_tradition: str,
         mode: str = "string",
+        semantic_hits: list | None = None,
     ) -> list[TerminologyHitResult]:
+        """Match *text* against the dictionary.
+
+        *semantic_hits* lets a caller pass FAISS term hits it already fetched
+        in a batch (``FaissIndexService.search_many``) instead of searching again.
+        """
         # Resolve mode
         use_faiss = False
         if mode == "semantic":
@@ -69,7 +75,9 @@ class TerminologyLoader:
         string_results = self._match_string(text, cultural_tradition)
 
         if use_faiss and self._faiss_service is not None:
-            return self._merge_with_semantic(string_results, text, cultural_tradition)
+            return self._merge_with_semantic(
+                string_results, text, cultural_tradition, semantic_hits,
+            )
 
         return string_results
 
@@ -108,6 +116,7 @@ class TerminologyLoader:
         string_results: list[TerminologyHitResult],
         text: str,
         cultural_tradition: str,
+        faiss_hits: list | None = None,
     ) -> list[TerminologyHitResult]:
         """Merge string matches with FAISS semantic results, deduplicating by term_id."""
         assert self._faiss_service is not None
@@ -125,7 +134,8 @@ class TerminologyLoader:
             merged.append(hit)
 
         # Add FAISS results that are not already present
-        faiss_hits = self._faiss_service.search_terms(text, cultural_tradition, top_k=5)
+        if faiss_hits is None:
+            faiss_hits = self._faiss_service.search_terms(text, cultural_tradition, top_k=5)
         for fhit in faiss_hits:
             if fhit.doc_id in seen_term_ids:
                 continue
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Collection
 from pathlib import Path
 
 from app.prototype.trajectory.trajectory_types import (
@@ -138,12 +139,21 @@ class TrajectoryRecorder:
 
     def load_all(self) -> list[TrajectoryRecord]:
         """Load all trajectory records from storage."""
-        records: list[TrajectoryRecord] = []
+        return list(self.load_by_name().values())
+
+    def load_by_name(self, skip: Collection[str] = ()) -> dict[str, TrajectoryRecord]:
+        """Load trajectory records keyed by file name, skipping names in *skip*.
+
+        Lets incremental readers load only the files they have not seen yet.
+        """
+        records: dict[str, TrajectoryRecord] = {}
         for json_path in sorted(self._storage_dir.glob("*.json")):
+            if json_path.name in skip:
+                continue
             try:
                 with open(json_path, encoding="utf-8") as f:
                     data = json.load(f)
-                records.append(TrajectoryRecord.from_dict(data))
+                records[json_path.name] = TrajectoryRecord.from_dict(data)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Failed to load trajectory %s: %s", json_path.name, exc)
         return records
@@ -1,81 +1,144 @@
-from typing import Any, Optional
-from datetime import datetime, timedelta
-import json
+import copy
+import fnmatch
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Values of these types are immutable, so they are stored and returned as-is
+_IMMUTABLE = (str, bytes, int, float, bool, type(None))
+
+
+def _copy(value: Any) -> Any:
+    """Detach a value from the caller at the cache boundary"""
+    if isinstance(value, _IMMUTABLE):
+        return value
+    return copy.deepcopy(value)
 
 
 class InMemoryCache:
-    """Simple in-memory cache implementation to replace Redis during development"""
-    
-    def __init__(self):
-        self._cache = {}
-        self._expiry = {}
-    
-    def _is_expired(self, key: str) -> bool:
-        """Check if a key has expired"""
-        if key not in self._expiry:
-            return False
-        return datetime.now() > self._expiry[key]
-    
-    def _clean_expired(self):
-        """Remove expired keys"""
-        expired_keys = [k for k in self._cache if self._is_expired(k)]
-        for key in expired_keys:
-            del self._cache[key]
-            del self._expiry[key]
-    
+    """In-memory TTL + LRU cache used in place of Redis during development
+
+    Every operation is O(1) amortized in the number of keys:
+    - expiry deadlines sit in a min-heap, so each call pops only the entries
+      that actually expired (lazily skipping superseded deadlines) instead of
+      scanning every key
+    - recency is an ``OrderedDict``; past ``max_size`` the least recently
+      used key is evicted
+
+    Values are Python objects (no JSON round-trip); mutable values are deep
+    copied on ``set`` and ``get`` so callers never share state with the cache.
+    """
+
+    def __init__(self, max_size: int = 10000, copy_values: bool = True):
+        self.max_size = max(1, max_size)
+        self.copy_values = copy_values
+        # key -> (value, expires_at or None)
+        self._cache: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop entries whose deadline passed (caller holds the lock)"""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip deadlines superseded by a later set() or delete()
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+                self._expirations += 1
+        # Rebuild when superseded deadlines dominate the heap
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (expires_at, i, key)
+                for i, (key, (_, expires_at)) in enumerate(self._cache.items())
+                if expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        self._clean_expired()
-        if key in self._cache and not self._is_expired(key):
-            value = self._cache[key]
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
-        return None
-    
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            value = entry[0]
+        return _copy(value) if self.copy_values else value
+
     async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
-        """Set value in cache with optional expiration (in seconds)"""
-        try:
-            if not isinstance(value, str):
-                value = json.dumps(value)
-            self._cache[key] = value
-            if expire > 0:
-                self._expiry[key] = datetime.now() + timedelta(seconds=expire)
-            return True
-        except Exception:
-            return False
-    
+        """Set value in cache with optional expiration (in seconds, <= 0 never expires)"""
+        if self.copy_values:
+            value = _copy(value)
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+            expires_at = now + expire if expire > 0 else None
+            self._cache[key] = (value, expires_at)
+            self._cache.move_to_end(key)
+            if expires_at is not None:
+                self._seq += 1
+                heapq.heappush(self._expiry_heap, (expires_at, self._seq, key))
+            self._sets += 1
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return True
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
-        if key in self._cache:
-            del self._cache[key]
-            if key in self._expiry:
-                del self._expiry[key]
-            return True
-        return False
-    
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return self._cache.pop(key, None) is not None
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
-        self._clean_expired()
-        return key in self._cache and not self._is_expired(key)
-    
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return key in self._cache
+
     async def clear(self) -> bool:
         """Clear all cache"""
-        self._cache.clear()
-        self._expiry.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
         return True
-    
+
     async def keys(self, pattern: str = "*") -> list:
-        """Get all keys matching pattern (simplified - only supports * for all)"""
-        self._clean_expired()
-        if pattern == "*":
-            return list(self._cache.keys())
-        # Simple pattern matching for prefix
-        if pattern.endswith("*"):
-            prefix = pattern[:-1]
-            return [k for k in self._cache.keys() if k.startswith(prefix)]
-        return []
+        """Get all keys matching a glob pattern (``*``, ``?``, ``[...]``)"""
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            if pattern == "*":
+                return list(self._cache.keys())
+            if not any(c in pattern for c in "*?["):
+                return [pattern] if pattern in self._cache else []
+            return [k for k in self._cache.keys() if fnmatch.fnmatchcase(k, pattern)]
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss/eviction/expiration counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "sets": self._sets,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
 
 
 # Global cache instance
@@ -84,4 +147,4 @@ cache = InMemoryCache()
 
 def get_cache() -> InMemoryCache:
     """Get cache instance"""
-    return cache
\ No newline at end of file
+    return cache
@@ -1,105 +1,443 @@
-"""Redis cache service for VULCA and Rankings data"""
+"""Redis cache service for VULCA and Rankings data
 
+Async two-tier cache: a small in-process L1 in front of Redis (``redis.asyncio``),
+with an in-memory stand-in when Redis is disabled or unreachable. Entries carry
+tags; invalidating a tag bumps its version counter, so everything stored under
+an older version reads as a miss - no KEYS/SCAN, no pattern deletes.
+``get_or_compute`` adds single-flight recomputation and stale-while-revalidate.
+"""
+
+import asyncio
 import json
-from typing import Optional, Any, Dict
-from datetime import timedelta
 import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
 from app.core.config import settings
+from app.services.cache import InMemoryCache
 
 try:
     import redis
+    import redis.asyncio as aioredis
     HAS_REDIS = True
 except ImportError:
     HAS_REDIS = False
 
 logger = logging.getLogger(__name__)
 
+# Tag version counters live next to the entries under this prefix
+TAG_VERSION_PREFIX = "tagv:"
+
+# L1 bounds: hot keys are served without a network round-trip for up to
+# L1_TTL seconds, which also bounds how long an invalidation made by another
+# process can go unseen here (local invalidations apply immediately)
+L1_MAX_SIZE = int(os.getenv("VULCA_CACHE_L1_SIZE", 1024))
+L1_TTL = int(os.getenv("VULCA_CACHE_L1_TTL", 5))
+
+
+def _tag_key(tag: str) -> str:
+    return f"{TAG_VERSION_PREFIX}{tag}"
+
+
+def _is_stale(envelope: Dict[str, Any]) -> bool:
+    return "e" in envelope and envelope["e"] <= time.time()
+
+
+class LocalCacheBackend:
+    """In-process stand-in for Redis (development, tests, Redis unavailable)"""
+
+    name = "memory"
+
+    def __init__(self, max_size: int = 10000):
+        # Entries are JSON strings, so no defensive copies are needed
+        self._entries = InMemoryCache(max_size=max_size, copy_values=False)
+        # Tag versions are never evicted
+        self._versions: Dict[str, int] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        values = []
+        for key in keys:
+            if key.startswith(TAG_VERSION_PREFIX):
+                version = self._versions.get(key)
+                values.append(None if version is None else str(version))
+            else:
+                values.append(await self._entries.get(key))
+        return values
+
+    async def set_many(self, items: Sequence[Tuple[str, str]], ttl_seconds: int) -> None:
+        for key, value in items:
+            await self._entries.set(key, value, expire=ttl_seconds)
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        deleted = 0
+        for key in keys:
+            deleted += await self._entries.delete(key)
+        return deleted
+
+    async def incr(self, keys: Sequence[str]) -> List[int]:
+        for key in keys:
+            self._versions[key] = self._versions.get(key, 0) + 1
+        return [self._versions[key] for key in keys]
+
+    async def flush(self) -> None:
+        await self._entries.clear()
+        self._versions.clear()
+
+
+class RedisCacheBackend:
+    """``redis.asyncio`` backend; multi-key operations go out as one MGET or pipeline"""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        self.client = aioredis.Redis.from_url(
+            url,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+
+    async def ping(self) -> bool:
+        return await self.client.ping()
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return await self.client.mget(keys) if keys else []
+
+    async def set_many(self, items: Sequence[Tuple[str, str]], ttl_seconds: int) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items:
+                pipe.set(key, value, ex=ttl_seconds)
+            await pipe.execute()
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        return await self.client.delete(*keys) if keys else 0
+
+    async def incr(self, keys: Sequence[str]) -> List[int]:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+            return await pipe.execute()
+
+    async def flush(self) -> None:
+        await self.client.flushdb()
+
+
 class CacheService:
-    """统一的缓存服务管理"""
+    """统一的缓存服务管理
 
-    def __init__(self):
+    ``get``/``set`` take the entry's tags: every stored entry records the
+    version of each of its tags, and reads compare those against the current
+    versions fetched in the same MGET. Pass the same tags to ``get`` and
+    ``set``; tags missing from a ``get`` still work but cost a second round-trip.
+    """
+
+    def __init__(self, backend: Any = None, l1_size: int = L1_MAX_SIZE, l1_ttl: int = L1_TTL):
+        # Connected lazily on first use (see _get_backend)
+        self._backend = backend
+        self.l1_ttl = l1_ttl
+        self.l1 = InMemoryCache(max_size=l1_size, copy_values=False) if l1_ttl > 0 else None
+        # Versions of tags invalidated through this instance; L1 entries hold
+        # the versions they were stored under
+        self._local_versions: Dict[str, int] = {}
+        # In-flight recomputations, keyed by (key, local tag versions)
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, int], ...]], "asyncio.Future"] = {}
+
+    @property
+    def use_redis(self) -> bool:
+        return isinstance(self._backend, RedisCacheBackend)
+
+    async def _get_backend(self):
+        if self._backend is None:
+            backend = await self._connect()
+            if self._backend is None:
+                self._backend = backend
+        return self._backend
+
+    async def _connect(self):
         """初始化Redis连接"""
-        if not HAS_REDIS:
-            logger.info("Redis package not installed, using memory cache")
-            self.use_redis = False
-            self.memory_cache: Dict[str, Any] = {}
-            return
+        if not HAS_REDIS or not settings.USE_REDIS:
+            logger.info("Redis disabled or not installed, using memory cache")
+            return LocalCacheBackend()
+        backend = RedisCacheBackend(settings.REDIS_URL)
         try:
-            self.redis_client = redis.Redis(
-                host=getattr(settings, 'REDIS_HOST', 'localhost'),
-                port=getattr(settings, 'REDIS_PORT', 6379),
-                db=getattr(settings, 'REDIS_DB', 0),
-                decode_responses=True,
-                socket_connect_timeout=2,
-                socket_timeout=2
-            )
-            self.redis_client.ping()
-            self.use_redis = True
+            await backend.ping()
             logger.info("Redis cache connected successfully")
-        except (redis.ConnectionError, redis.TimeoutError, AttributeError) as e:
+            return backend
+        except (redis.ConnectionError, redis.TimeoutError, OSError) as e:
             logger.warning(f"Redis not available, using memory cache: {e}")
-            self.use_redis = False
-            self.memory_cache: Dict[str, Any] = {}
-    
-    def get(self, key: str) -> Optional[Any]:
+            return LocalCacheBackend()
+
+    # ------------------------------------------------------------------
+    # L1
+    # ------------------------------------------------------------------
+
+    def _local_snapshot(self, tags: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        # Taken before any await, so an invalidation racing a fill wins
+        return tuple((tag, self._local_versions.get(tag, 0)) for tag in tags)
+
+    async def _l1_get(self, key: str) -> Optional[str]:
+        if self.l1 is None:
+            return None
+        entry = await self.l1.get(key)
+        if entry is None:
+            return None
+        raw, versions = entry
+        if any(self._local_versions.get(tag, 0) != version for tag, version in versions):
+            await self.l1.delete(key)
+            return None
+        return raw
+
+    async def _l1_set(self, key: str, raw: str, versions: Tuple[Tuple[str, int], ...],
+                      ttl_seconds: int) -> None:
+        if self.l1 is not None:
+            await self.l1.set(key, (raw, versions), expire=min(self.l1_ttl, ttl_seconds))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str, tags: Sequence[str] = ()) -> Optional[Any]:
         """获取缓存值"""
+        return (await self.get_many([key], tags)).get(key)
+
+    async def get_many(self, keys: Sequence[str], tags: Sequence[str] = ()) -> Dict[str, Any]:
+        """Cached values of ``keys`` (fresh hits only), fetched with one MGET past L1"""
+        envelopes = await self._get_envelopes(keys, tags)
+        return {key: envelope["v"] for key, envelope in envelopes.items() if not _is_stale(envelope)}
+
+    async def _get_envelopes(self, keys: Sequence[str], tags: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
         try:
-            if self.use_redis:
-                value = self.redis_client.get(key)
-                if value:
-                    return json.loads(value)
-            else:
-                return self.memory_cache.get(key)
+            pending = []
+            for key in keys:
+                raw = await self._l1_get(key)
+                if raw is None:
+                    pending.append(key)
+                else:
+                    found[key] = json.loads(raw)
+            if not pending:
+                return found
+
+            snapshot = dict(self._local_versions)
+            backend = await self._get_backend()
+            tags = list(tags)
+            values = await backend.mget(pending + [_tag_key(tag) for tag in tags])
+            current = dict(zip(tags, values[len(pending):]))
+            for key, raw in zip(pending, values[:len(pending)]):
+                if raw is None:
+                    continue
+                envelope = json.loads(raw)
+                if await self._is_current(backend, envelope["t"], current):
+                    versions = tuple((tag, snapshot.get(tag, 0)) for tag in envelope["t"])
+                    await self._l1_set(key, raw, versions, self.l1_ttl)
+                    found[key] = envelope
         except Exception as e:
-            logger.error(f"Cache get error for key {key}: {e}")
-        return None
-    
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
+            logger.error(f"Cache get error for keys {list(keys)}: {e}")
+        return found
+
+    @staticmethod
+    async def _is_current(backend: Any, stored: Dict[str, int], current: Dict[str, Optional[str]]) -> bool:
+        unknown = [tag for tag in stored if tag not in current]
+        if unknown:
+            current = {**current, **dict(zip(unknown, await backend.mget([_tag_key(t) for t in unknown])))}
+        # A missing version (never bumped, or evicted) never matches
+        return all(
+            current[tag] is not None and int(current[tag]) == version
+            for tag, version in stored.items()
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 300, tags: Sequence[str] = ()) -> bool:
         """设置缓存值"""
         try:
-            if self.use_redis:
-                return self.redis_client.setex(
-                    key, 
-                    timedelta(seconds=ttl_seconds),
-                    json.dumps(value, default=str)
-                )
-            else:
-                self.memory_cache[key] = value
-                return True
+            snapshot = self._local_snapshot(dict.fromkeys(tags))
+            backend = await self._get_backend()
+            versions = await self._tag_versions(backend, tags)
+            await self._write(backend, key, value, ttl_seconds, versions, snapshot)
+            return True
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
-    
-    def delete(self, key: str) -> bool:
+
+    async def _write(self, backend: Any, key: str, value: Any, ttl_seconds: int,
+                     versions: Dict[str, int], snapshot: Tuple[Tuple[str, int], ...],
+                     stale_seconds: int = 0) -> None:
+        meta = {"t": versions}
+        if stale_seconds > 0:
+            # Fresh until "e"; kept stale_seconds longer to serve while refreshing
+            meta["e"] = time.time() + ttl_seconds
+        raw = '%s, "v": %s}' % (json.dumps(meta)[:-1], json.dumps(value, default=str))
+        await backend.set_many([(key, raw)], ttl_seconds + stale_seconds)
+        await self._l1_set(key, raw, snapshot, ttl_seconds + stale_seconds)
+
+    # ------------------------------------------------------------------
+    # Single-flight / stale-while-revalidate
+    # ------------------------------------------------------------------
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                             ttl_seconds: int = 300, tags: Sequence[str] = (),
+                             stale_seconds: Optional[int] = None) -> Any:
+        """
+        Cached value of ``key``, computing it with ``compute()`` on a miss
+
+        Concurrent misses in this worker share one ``compute()`` call. Once
+        ``ttl_seconds`` pass, the old value is still served for up to
+        ``stale_seconds`` more (default: another ``ttl_seconds``) while a single
+        background task recomputes it, so an expiring hot key is recomputed
+        at most once and no request waits for it. Tag invalidation is a hard
+        miss, never served stale. ``compute`` may outlive the request that
+        triggered it, so it must not use request-scoped resources.
+        """
+        if stale_seconds is None:
+            stale_seconds = ttl_seconds
+        envelope = (await self._get_envelopes([key], tags)).get(key)
+        if envelope is not None:
+            if _is_stale(envelope):
+                refresh = self._recompute(key, compute, ttl_seconds, tags, stale_seconds)
+                refresh.add_done_callback(self._log_refresh_failure)
+            return envelope["v"]
+        # shield: a cancelled request must not cancel the computation others await
+        return await asyncio.shield(self._recompute(key, compute, ttl_seconds, tags, stale_seconds))
+
+    def _recompute(self, key: str, compute: Callable[[], Awaitable[Any]], ttl_seconds: int,
+                   tags: Sequence[str], stale_seconds: int) -> "asyncio.Future":
+        snapshot = self._local_snapshot(dict.fromkeys(tags))
+        # A local invalidation changes the snapshot, so it never joins a
+        # computation that started before it
+        flight = (key, snapshot)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._compute_and_store(key, compute, ttl_seconds, tags, stale_seconds, snapshot)
+            )
+            self._inflight[flight] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight, None))
+        return task
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]],
+                                 ttl_seconds: int, tags: Sequence[str], stale_seconds: int,
+                                 snapshot: Tuple[Tuple[str, int], ...]) -> Any:
+        # Versions are read before computing, so an invalidation elsewhere
+        # that lands mid-computation leaves the result already stale
+        try:
+            backend = await self._get_backend()
+            versions = await self._tag_versions(backend, tags)
+        except Exception as e:
+            logger.error(f"Cache set error for key {key}: {e}")
+            backend = None
+        value = await compute()
+        # Superseded by a local invalidation: serve it to the callers that
+        # asked before it, but never store it
+        if backend is not None and self._local_snapshot(tag for tag, _ in snapshot) == snapshot:
+            try:
+                await self._write(backend, key, value, ttl_seconds, versions, snapshot, stale_seconds)
+            except Exception as e:
+                logger.error(f"Cache set error for key {key}: {e}")
+        return value
+
+    @staticmethod
+    def _log_refresh_failure(task: "asyncio.Future") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+    @staticmethod
+    async def _tag_versions(backend: Any, tags: Sequence[str]) -> Dict[str, int]:
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return {}
+        values = await backend.mget([_tag_key(tag) for tag in tags])
+        missing = [tag for tag, value in zip(tags, values) if value is None]
+        # Start unseen tags at 1 so a later eviction of the counter (back to
+        # "missing") invalidates rather than resurrects old entries
+        started = dict(zip(missing, await backend.incr([_tag_key(t) for t in missing]))) if missing else {}
+        return {tag: int(value) if value is not None else started[tag] for tag, value in zip(tags, values)}
+
+    async def delete(self, *keys: str) -> int:
         """删除缓存"""
         try:
-            if self.use_redis:
-                return bool(self.redis_client.delete(key))
-            else:
-                self.memory_cache.pop(key, None)
-                return True
+            if self.l1 is not None:
+                for key in keys:
+                    await self.l1.delete(key)
+            backend = await self._get_backend()
+            return await backend.delete(list(keys))
         except Exception as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
+            logger.error(f"Cache delete error for keys {keys}: {e}")
+            return 0
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Invalidate every entry stored under any of ``tags`` (one pipelined INCR per tag)"""
+        for tag in tags:
+            self._local_versions[tag] = self._local_versions.get(tag, 0) + 1
+        try:
+            backend = await self._get_backend()
+            await backend.incr([_tag_key(tag) for tag in tags])
+        except Exception as e:
+            logger.error(f"Cache tag invalidation error for {tags}: {e}")
+
+    async def clear(self) -> None:
+        """Drop every entry, local and remote"""
+        if self.l1 is not None:
+            await self.l1.clear()
+        backend = await self._get_backend()
+        await backend.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self._backend.name if self._backend is not None else None,
+            "l1": self.l1.stats() if self.l1 is not None else None,
+        }
+
+
+class SyncCacheService:
+    """Blocking Redis client for synchronous callers (e.g. VULCA worker threads/processes)
+
+    Only useful when Redis is enabled; without it ``get`` always misses and
+    ``set`` is a no-op, since there is nothing to share across processes.
+    """
+
+    def __init__(self):
+        self.redis_client = None
+        if not HAS_REDIS or not settings.USE_REDIS:
+            return
+        try:
+            client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2
+            )
+            client.ping()
+            self.redis_client = client
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            logger.warning(f"Redis not available for synchronous cache: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.redis_client is None:
+            return None
+        try:
+            value = self.redis_client.get(key)
+            if value:
+                return json.loads(value)
+        except Exception as e:
+            logger.error(f"Cache get error for key {key}: {e}")
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
+        if self.redis_client is None:
             return False
-    
-    def delete_pattern(self, pattern: str) -> int:
-        """删除匹配模式的所有键"""
         try:
-            if self.use_redis:
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    return self.redis_client.delete(*keys)
-            else:
-                # 内存缓存的简单模式匹配
-                import fnmatch
-                keys_to_delete = [k for k in self.memory_cache.keys() 
-                                if fnmatch.fnmatch(k, pattern)]
-                for key in keys_to_delete:
-                    del self.memory_cache[key]
-                return len(keys_to_delete)
+            return bool(self.redis_client.set(key, json.dumps(value, default=str), ex=ttl_seconds))
         except Exception as e:
-            logger.error(f"Cache delete pattern error for {pattern}: {e}")
-        return 0
+            logger.error(f"Cache set error for key {key}: {e}")
+            return False
+
 
 # 全局缓存实例
 cache_service = CacheService()
@@ -110,21 +448,33 @@ class CacheKeys:
     # Rankings缓存（5分钟）
     RANKINGS_LIST = "rankings:list"
     RANKINGS_MODEL = "rankings:model:{model_id}"
-    
+
     # VULCA缓存（1小时）
     VULCA_EVALUATION = "vulca:eval:{model_id}"
     VULCA_COMPARISON = "vulca:compare:{model1_id}:{model2_id}"
     VULCA_DIMENSIONS = "vulca:dimensions"
     VULCA_PERSPECTIVES = "vulca:perspectives"
-    
+
     # 模型列表缓存（10分钟）
     MODELS_ALL = "models:all"
     MODELS_WITH_VULCA = "models:with_vulca"
 
+# 缓存标签（失效单位）
+class CacheTags:
+    """缓存标签定义"""
+    # Every cached model list
+    MODELS = "models"
+    # Every rankings entry
+    RANKINGS = "rankings"
+    # Everything derived from one model's row
+    MODEL = "model:{model_id}"
+    # Everything derived from one model's VULCA evaluation (including comparisons)
+    VULCA = "vulca:{model_id}"
+
 # 缓存TTL配置（秒）
 class CacheTTL:
     """缓存过期时间配置"""
     RANKINGS = 300  # 5分钟
     VULCA = 3600  # 1小时
     MODELS = 600  # 10分钟
-    STATIC = 86400  # 1天（静态数据）
\ No newline at end of file
+    STATIC = 86400  # 1天（静态数据）
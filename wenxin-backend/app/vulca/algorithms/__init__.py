@@ -5,14 +5,19 @@ Production-ready implementation of VULCA 47-dimension evaluation system
 
 from .vulca_core import VULCACore, VULCAResult
 from .emnlp2025 import VULCAAlgorithmV2, VULCA_47_DIMENSIONS, VULCADimension, DimensionCategory
+from .batch_engine import VULCABatchEngine
 from .correlation_matrix import CorrelationMatrix, DimensionRelationship
+from .result_cache import VULCAResultCache, get_result_cache
 
 __all__ = [
     # Core classes
     'VULCACore',
     'VULCAResult',
     'VULCAAlgorithmV2',
+    'VULCABatchEngine',
     'CorrelationMatrix',
+    'VULCAResultCache',
+    'get_result_cache',
     
     # Data structures
     'VULCADimension',
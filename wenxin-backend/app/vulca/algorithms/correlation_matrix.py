@@ -5,11 +5,15 @@ Defines relationships between dimensions for intelligent expansion
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import json
 
 
+# Fraction of a seed score passed on per unit of correlation
+PROPAGATION_DAMPING = 0.3
+
+
 @dataclass
 class DimensionRelationship:
     """Represents a relationship between two dimensions"""
@@ -24,9 +28,16 @@ class CorrelationMatrix:
     Manages the semantic correlation matrix for 47 VULCA dimensions
     """
     
-    def __init__(self):
+    def __init__(self, seed: int = 47):
+        # Private generator: the same matrix in every process, so results
+        # (and result-cache entries) agree across workers
+        self._rng = np.random.RandomState(seed)
         self.dimensions = self._initialize_dimensions()
+        self.index = {dim: i for i, dim in enumerate(self.dimensions)}
         self.matrix = self._build_full_correlation_matrix()
+        # Propagation operator: a dimension never propagates into itself
+        self._propagation_matrix = self.matrix.copy()
+        np.fill_diagonal(self._propagation_matrix, 0.0)
         
     def _initialize_dimensions(self) -> List[str]:
         """Initialize all 47 dimension names"""
@@ -91,7 +102,7 @@ class CorrelationMatrix:
             for j in range(start, end):
                 if i != j:
                     # Random correlation within range
-                    correlation = np.random.uniform(min_corr, max_corr)
+                    correlation = self._rng.uniform(min_corr, max_corr)
                     matrix[i, j] = correlation
     
     def _set_cross_category_correlations(self, matrix: np.ndarray):
@@ -130,19 +141,36 @@ class CorrelationMatrix:
     
     def get_correlation(self, dim1: str, dim2: str) -> float:
         """Get correlation between two dimensions"""
-        if dim1 not in self.dimensions or dim2 not in self.dimensions:
+        i = self.index.get(dim1)
+        j = self.index.get(dim2)
+        if i is None or j is None:
             return 0.0
-        
-        i = self.dimensions.index(dim1)
-        j = self.dimensions.index(dim2)
         return self.matrix[i, j]
     
+    def mean_pairwise_correlation(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Mean absolute correlation among each row's dimensions
+        
+        Args:
+            indices: (N×k) dimension indices, one set per row
+            
+        Returns:
+            (N,) mean |correlation| over the k·(k-1)/2 distinct pairs (0 if k < 2)
+        """
+        indices = np.atleast_2d(indices)
+        k = indices.shape[1]
+        if k < 2:
+            return np.zeros(indices.shape[0])
+        pairs = self.matrix[indices[:, :, None], indices[:, None, :]]
+        upper_i, upper_j = np.triu_indices(k, 1)
+        return np.abs(pairs[:, upper_i, upper_j]).mean(axis=1)
+    
     def get_strongest_correlations(self, dimension: str, top_n: int = 5) -> List[Tuple[str, float]]:
         """Get the top N strongest correlations for a dimension"""
-        if dimension not in self.dimensions:
+        idx = self.index.get(dimension)
+        if idx is None:
             return []
         
-        idx = self.dimensions.index(dimension)
         correlations = []
         
         for j, other_dim in enumerate(self.dimensions):
@@ -153,30 +181,75 @@ class CorrelationMatrix:
         correlations.sort(key=lambda x: abs(x[1]), reverse=True)
         return correlations[:top_n]
     
-    def apply_correlation_propagation(self, initial_scores: Dict[str, float]) -> Dict[str, float]:
+    def apply_correlation_propagation(self,
+                                      initial_scores: Dict[str, float],
+                                      steps: int = 1) -> Dict[str, float]:
         """
         Propagate scores through the correlation matrix
         This simulates how strength in one dimension affects others
+        
+        Args:
+            initial_scores: Seed scores; seeds keep their values
+            steps: Propagation rounds (see ``propagate``)
+            
+        Returns:
+            Scores for all 47 dimensions (plus any unknown seed keys), clipped to 0-100
         """
-        # Initialize all scores
-        propagated_scores = {dim: 0.0 for dim in self.dimensions}
-        propagated_scores.update(initial_scores)
+        seeds = np.zeros(len(self.dimensions))
+        mask = np.zeros(len(self.dimensions), dtype=bool)
+        for dim, score in initial_scores.items():
+            idx = self.index.get(dim)
+            if idx is not None:
+                seeds[idx] = score
+                mask[idx] = True
         
-        # Apply one round of propagation
-        for dim1 in initial_scores:
-            if dim1 in self.dimensions:
-                idx1 = self.dimensions.index(dim1)
-                for idx2, dim2 in enumerate(self.dimensions):
-                    if dim2 not in initial_scores:  # Don't override initial scores
-                        correlation = self.matrix[idx1, idx2]
-                        influence = initial_scores[dim1] * correlation * 0.3  # Damping factor
-                        propagated_scores[dim2] += influence
+        propagated = self.propagate(seeds, mask, steps=steps)[0]
+        propagated_scores = dict(zip(self.dimensions, propagated.tolist()))
+        for dim, score in initial_scores.items():
+            if dim not in self.index:
+                propagated_scores[dim] = float(np.clip(score, 0, 100))
+        return propagated_scores
+    
+    def propagate(self,
+                  seeds: np.ndarray,
+                  mask: Optional[np.ndarray] = None,
+                  steps: int = 1,
+                  damping: float = PROPAGATION_DAMPING) -> np.ndarray:
+        """
+        Batched correlation propagation as masked matrix products
         
-        # Normalize to 0-100 range
-        for dim in propagated_scores:
-            propagated_scores[dim] = np.clip(propagated_scores[dim], 0, 100)
+        Each round, the scores reached in the previous round flow to every
+        non-seed dimension in proportion to their correlation: with seed
+        vector ``s`` the first round adds ``damping · s @ C`` and round ``t``
+        adds ``damping · f_{t-1} @ C`` for the previous round's increments
+        ``f_{t-1}`` (``C`` without its diagonal). One round is the classic
+        single-hop propagation.
         
-        return propagated_scores
+        Args:
+            seeds: (N×47) or (47,) scores in ``dimensions`` order; entries
+                outside ``mask`` are ignored
+            mask: Which entries are seeds; defaults to the nonzero entries
+            steps: Number of propagation rounds (>= 1)
+            damping: Fraction passed on per unit of correlation
+            
+        Returns:
+            (N×47) propagated scores clipped to 0-100; seeds keep their values
+        """
+        if steps < 1:
+            raise ValueError("steps must be at least 1")
+        seeds = np.atleast_2d(np.asarray(seeds, dtype=float))
+        mask = seeds != 0 if mask is None else np.atleast_2d(np.asarray(mask, dtype=bool))
+        seeds = np.where(mask, seeds, 0.0)
+        
+        operator = damping * self._propagation_matrix
+        frontier = seeds
+        total = seeds.copy()
+        for _ in range(steps):
+            # Seeds are never overwritten, so they don't accumulate influence
+            frontier = np.where(mask, 0.0, frontier @ operator)
+            total += frontier
+        
+        return np.clip(total, 0, 100)
     
     def export_to_json(self, filepath: str):
         """Export correlation matrix to JSON for visualization"""
@@ -5,7 +5,6 @@ Extracted and adapted for 47-dimension AI model evaluation
 """
 
 from typing import Dict, List, Tuple
-import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 
@@ -131,6 +130,44 @@ VULCA_47_DIMENSIONS = [
 ]
 
 
+# The six source dimensions of the 6D evaluation, in batch-array column order
+BASE_DIMENSIONS = ['creativity', 'technique', 'emotion', 'context', 'innovation', 'impact']
+
+# Cultural adjustment factors (stronger impact)
+CULTURAL_ADJUSTMENTS = {
+    'western': {
+        'innovation_index': 1.25,
+        'creative_synthesis': 1.20,
+        'logical_reasoning': 1.15,
+        'divergent_thinking': 1.18,
+        'originality_score': 1.22,
+        'hypothesis_generation': 1.12,
+        # Slightly reduce social dimensions
+        'social_appropriateness': 0.92,
+        'collaborative_ability': 0.95,
+    },
+    'eastern': {
+        'cultural_awareness': 1.30,
+        'social_appropriateness': 1.25,
+        'collaborative_ability': 1.22,
+        'contextual_understanding': 1.18,
+        'empathy_modeling': 1.20,
+        'perspective_taking': 1.15,
+        # Slightly reduce individual creative dimensions
+        'originality_score': 0.90,
+        'divergent_thinking': 0.93,
+    },
+    'global': {
+        'diversity_handling': 1.20,
+        'fairness_assessment': 1.18,
+        'ethical_reasoning': 1.15,
+        'cultural_awareness': 1.12,
+        'communication_clarity': 1.10,
+        'social_impact_awareness': 1.08,
+    }
+}
+
+
 class VULCAAlgorithmV2:
     """
     VULCA Algorithm Version 2.0
@@ -140,6 +177,15 @@ class VULCAAlgorithmV2:
     def __init__(self):
         self.dimensions = VULCA_47_DIMENSIONS
         self._build_correlation_matrix()
+        self._engine = None
+
+    @property
+    def engine(self):
+        """Vectorized batch form of this algorithm (built on first use)"""
+        if self._engine is None:
+            from .batch_engine import VULCABatchEngine
+            self._engine = VULCABatchEngine(self)
+        return self._engine
         
     def _build_correlation_matrix(self):
         """Build the correlation matrix between 6D and 47D"""
@@ -241,41 +287,11 @@ class VULCAAlgorithmV2:
         Returns:
             Dictionary with 47 dimension scores (0-100)
         """
-        scores_47d = {}
-        
-        # Initialize all dimensions with base values
-        for dim in self.dimensions:
-            scores_47d[dim.name] = 0.0
-        
-        # Apply correlation matrix
-        for source_dim, source_score in scores_6d.items():
-            if source_dim in self.correlation_matrix:
-                correlations = self.correlation_matrix[source_dim]
-                for target_dim, weight in correlations.items():
-                    if target_dim in scores_47d:
-                        # Add weighted contribution
-                        scores_47d[target_dim] += source_score * weight
-        
-        # Add noise and normalize
-        np.random.seed(42)  # For reproducibility
-        for dim in self.dimensions:
-            # Add small random variation (±5%)
-            noise = np.random.normal(0, 2.5)
-            scores_47d[dim.name] = np.clip(scores_47d[dim.name] + noise, 0, 100)
-        
-        # Normalize to reasonable range while maintaining relative differences
-        max_score = max(scores_47d.values()) if scores_47d else 1
-        avg_6d = sum(scores_6d.values()) / 6
-        
-        for dim in scores_47d:
-            # Normalize and scale based on original average
-            normalized = (scores_47d[dim] / max_score) * avg_6d
-            # Add variation based on dimension weight
-            dim_obj = next(d for d in self.dimensions if d.name == dim)
-            variation = np.random.normal(0, 5) * dim_obj.weight * 10
-            scores_47d[dim] = np.clip(normalized + variation, 0, 100)
-        
-        return scores_47d
+        engine = self.engine
+        row = engine.to_array([scores_6d])
+        # Dimensions outside the 6D set still count towards the average
+        mean_6d = sum(scores_6d.values()) / 6
+        return engine.to_dicts(engine.expand(row, mean_6d=[mean_6d]))[0]
     
     def calculate_overall_score(self, scores_47d: Dict[str, float]) -> float:
         """Calculate weighted overall score from 47D scores"""
@@ -304,42 +320,8 @@ class VULCAAlgorithmV2:
         """
         adjusted_scores = scores_47d.copy()
         
-        # Cultural adjustment factors (stronger impact)
-        adjustments = {
-            'western': {
-                'innovation_index': 1.25,
-                'creative_synthesis': 1.20,
-                'logical_reasoning': 1.15,
-                'divergent_thinking': 1.18,
-                'originality_score': 1.22,
-                'hypothesis_generation': 1.12,
-                # Slightly reduce social dimensions
-                'social_appropriateness': 0.92,
-                'collaborative_ability': 0.95,
-            },
-            'eastern': {
-                'cultural_awareness': 1.30,
-                'social_appropriateness': 1.25,
-                'collaborative_ability': 1.22,
-                'contextual_understanding': 1.18,
-                'empathy_modeling': 1.20,
-                'perspective_taking': 1.15,
-                # Slightly reduce individual creative dimensions
-                'originality_score': 0.90,
-                'divergent_thinking': 0.93,
-            },
-            'global': {
-                'diversity_handling': 1.20,
-                'fairness_assessment': 1.18,
-                'ethical_reasoning': 1.15,
-                'cultural_awareness': 1.12,
-                'communication_clarity': 1.10,
-                'social_impact_awareness': 1.08,
-            }
-        }
-        
-        if perspective in adjustments:
-            for dim_name, factor in adjustments[perspective].items():
+        if perspective in CULTURAL_ADJUSTMENTS:
+            for dim_name, factor in CULTURAL_ADJUSTMENTS[perspective].items():
                 if dim_name in adjusted_scores:
                     adjusted_scores[dim_name] = min(100, adjusted_scores[dim_name] * factor)
         
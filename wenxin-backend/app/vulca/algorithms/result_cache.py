@@ -0,0 +1,150 @@
+"""
+VULCA Result Cache - Bounded, content-addressed cache of VULCAResult objects
+Size- and TTL-bounded LRU with hit/miss/eviction counters and optional SyncCacheService backing
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+
+# Key prefix in the shared backend
+BACKEND_PREFIX = "vulca:result:"
+
+
+class VULCAResultCache:
+    """
+    Thread-safe LRU of immutable VULCAResult objects
+
+    Keys are canonical input hashes (see ``VULCACore._generate_cache_key``),
+    so entries never need invalidating: they only leave through LRU eviction
+    or TTL expiry. With a ``backend`` (anything with the SyncCacheService
+    ``get``/``set(key, value, ttl_seconds)`` API) misses fall through to it
+    and stores are written through, so results survive restarts and are
+    shared across workers.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 backend: Any = None):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._backend_hits = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached result for ``key``, or None (counts hit/miss)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result
+                del self._entries[key]
+                self._expirations += 1
+
+        result = self._backend_get(key)
+        with self._lock:
+            if result is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._backend_hits += 1
+            self._insert(key, result, now)
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """Store an (immutable) result, writing through to the backend"""
+        with self._lock:
+            self._insert(key, result, time.monotonic())
+        if self.backend is not None:
+            self.backend.set(BACKEND_PREFIX + key, result.to_dict(), ttl_seconds=int(self.ttl_seconds))
+
+    def clear(self) -> None:
+        """Drop every local entry (backend entries expire on their own)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'backend': type(self.backend).__name__ if self.backend is not None else None,
+                'backend_hits': self._backend_hits,
+            }
+
+    def _insert(self, key: str, result: Any, now: float) -> None:
+        # Caller holds the lock
+        self._entries[key] = (now + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _backend_get(self, key: str) -> Optional[Any]:
+        if self.backend is None:
+            return None
+        data = self.backend.get(BACKEND_PREFIX + key)
+        if not data:
+            return None
+        try:
+            from .vulca_core import VULCAResult
+            return VULCAResult.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed cached VULCA result {key}: {e}")
+            return None
+
+
+_shared_cache: Optional[VULCAResultCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_result_cache() -> VULCAResultCache:
+    """
+    Process-wide result cache used by VULCACore by default
+
+    Sized by ``VULCA_RESULT_CACHE_SIZE`` / ``VULCA_RESULT_CACHE_TTL``; set
+    ``VULCA_RESULT_CACHE_SHARED=1`` to back it with Redis (SyncCacheService).
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            backend = None
+            if os.getenv('VULCA_RESULT_CACHE_SHARED', '').lower() in ('1', 'true', 'yes'):
+                from app.services.cache_service import SyncCacheService
+                backend = SyncCacheService()
+            _shared_cache = VULCAResultCache(
+                max_entries=int(os.getenv('VULCA_RESULT_CACHE_SIZE', DEFAULT_MAX_ENTRIES)),
+                ttl_seconds=float(os.getenv('VULCA_RESULT_CACHE_TTL', DEFAULT_TTL_SECONDS)),
+                backend=backend,
+            )
+        return _shared_cache
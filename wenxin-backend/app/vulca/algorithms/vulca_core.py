@@ -5,38 +5,50 @@ Integrates EMNLP2025 research with correlation matrix for intelligent 6D→47D e
 
 import time
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, replace
 import json
 import hashlib
 from datetime import datetime
+from types import MappingProxyType
 
 from .emnlp2025 import VULCAAlgorithmV2, VULCA_47_DIMENSIONS
 from .correlation_matrix import CorrelationMatrix
+from .result_cache import VULCAResultCache, get_result_cache
 
+# Part of every result-cache key: bump when scoring changes
+ALGORITHM_VERSION = "EMNLP2025-v2.0"
 
-@dataclass
+
+@dataclass(frozen=True)
 class VULCAResult:
-    """Complete VULCA evaluation result"""
+    """Complete VULCA evaluation result (immutable, so cached results can be shared)"""
     model_id: str
     timestamp: datetime
     version: str = "2.0"
     
     # Core scores
-    scores_6d: Dict[str, float] = field(default_factory=dict)
-    scores_47d: Dict[str, float] = field(default_factory=dict)
+    scores_6d: Mapping[str, float] = field(default_factory=dict)
+    scores_47d: Mapping[str, float] = field(default_factory=dict)
     overall_score: float = 0.0
     
     # Metadata
-    algorithm_version: str = "EMNLP2025-v2.0"
+    algorithm_version: str = ALGORITHM_VERSION
     processing_time_ms: float = 0.0
     correlation_strength: float = 0.0
     confidence_level: float = 0.0
     
     # Additional analysis
-    top_dimensions: List[Tuple[str, float]] = field(default_factory=list)
-    weakest_dimensions: List[Tuple[str, float]] = field(default_factory=list)
-    category_scores: Dict[str, float] = field(default_factory=dict)
+    top_dimensions: Tuple[Tuple[str, float], ...] = field(default_factory=tuple)
+    weakest_dimensions: Tuple[Tuple[str, float], ...] = field(default_factory=tuple)
+    category_scores: Mapping[str, float] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        # Copy containers into read-only views so no holder can mutate a shared result
+        for name in ('scores_6d', 'scores_47d', 'category_scores'):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+        for name in ('top_dimensions', 'weakest_dimensions'):
+            object.__setattr__(self, name, tuple(tuple(item) for item in getattr(self, name)))
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -44,17 +56,25 @@ class VULCAResult:
             'model_id': self.model_id,
             'timestamp': self.timestamp.isoformat(),
             'version': self.version,
-            'scores_6d': self.scores_6d,
-            'scores_47d': self.scores_47d,
+            'scores_6d': dict(self.scores_6d),
+            'scores_47d': dict(self.scores_47d),
             'overall_score': self.overall_score,
             'algorithm_version': self.algorithm_version,
             'processing_time_ms': self.processing_time_ms,
             'correlation_strength': self.correlation_strength,
             'confidence_level': self.confidence_level,
-            'top_dimensions': self.top_dimensions,
-            'weakest_dimensions': self.weakest_dimensions,
-            'category_scores': self.category_scores
+            'top_dimensions': list(self.top_dimensions),
+            'weakest_dimensions': list(self.weakest_dimensions),
+            'category_scores': dict(self.category_scores)
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'VULCAResult':
+        """Rebuild a result from ``to_dict`` output (e.g. a shared cache entry)"""
+        return cls(**{
+            **data,
+            'timestamp': datetime.fromisoformat(data['timestamp']),
+        })
 
 
 class VULCACore:
@@ -63,19 +83,38 @@ class VULCACore:
     Combines EMNLP2025 research with correlation matrix for accurate evaluation
     """
     
-    def __init__(self, enable_correlation: bool = True, cache_enabled: bool = True):
+    def __init__(self,
+                 enable_correlation: bool = True,
+                 cache_enabled: bool = True,
+                 propagation_steps: int = 1,
+                 result_cache: Optional[VULCAResultCache] = None):
         """
         Initialize VULCA Core
         
         Args:
             enable_correlation: Whether to use correlation matrix for propagation
             cache_enabled: Whether to cache results for performance
+            propagation_steps: Correlation propagation rounds (1 = direct neighbours only)
+            result_cache: Cache to use (default: the process-wide ``get_result_cache()``)
         """
         self.algorithm = VULCAAlgorithmV2()
         self.correlation_matrix = CorrelationMatrix() if enable_correlation else None
         self.enable_correlation = enable_correlation
         self.cache_enabled = cache_enabled
-        self._cache = {}
+        self.propagation_steps = propagation_steps
+        self._cache = result_cache if result_cache is not None else get_result_cache()
+        # Everything besides the inputs that shapes a result, for cache keys
+        config = hashlib.sha256(f"{ALGORITHM_VERSION}:{propagation_steps}".encode())
+        if self.correlation_matrix:
+            config.update(self.correlation_matrix.matrix.tobytes())
+        self._config_digest = config.hexdigest()
+        # Correlation-matrix column of each engine dimension
+        self._correlation_order = None
+        if self.correlation_matrix:
+            self._correlation_order = np.array([
+                self.correlation_matrix.index[name]
+                for name in self.algorithm.engine.dimension_names
+            ])
         
     def evaluate(self, 
                  model_id: str,
@@ -97,87 +136,159 @@ class VULCACore:
         start_time = time.time()
         
         # Check cache if enabled
-        cache_key = self._generate_cache_key(model_id, scores_6d, cultural_perspective)
-        if self.cache_enabled and cache_key in self._cache:
-            cached_result = self._cache[cache_key]
-            cached_result.processing_time_ms = 0.1  # Cache hit
-            return cached_result
+        cache_key = self._generate_cache_key(
+            model_id, scores_6d, cultural_perspective, use_correlation_propagation
+        )
+        cached_result = self._cache.get(cache_key) if self.cache_enabled else None
+        if cached_result is not None:
+            return replace(cached_result, processing_time_ms=0.1)  # Cache hit
         
         # Validate input
         self._validate_6d_scores(scores_6d)
         
-        # Step 1: Initial 6D to 47D expansion
-        scores_47d = self.algorithm.expand_6d_to_47d(scores_6d)
-        
-        # Step 2: Apply correlation propagation if enabled
-        if self.enable_correlation and use_correlation_propagation and self.correlation_matrix:
-            # Select top scoring dimensions for propagation
-            top_initial = self._select_propagation_seeds(scores_47d, top_n=5)
-            propagated = self.correlation_matrix.apply_correlation_propagation(top_initial)
-            
-            # Blend propagated scores with initial expansion
-            scores_47d = self._blend_scores(scores_47d, propagated, blend_factor=0.3)
-        
-        # Step 3: Apply cultural perspective if specified
-        if cultural_perspective:
-            scores_47d = self.algorithm.apply_cultural_perspective(scores_47d, cultural_perspective)
-        
-        # Step 4: Calculate overall score and metrics
-        overall_score = self.algorithm.calculate_overall_score(scores_47d)
-        
-        # Step 5: Analyze results
-        category_scores = self._calculate_category_scores(scores_47d)
-        top_dims = self._get_top_dimensions(scores_47d, n=5)
-        weak_dims = self._get_weakest_dimensions(scores_47d, n=5)
-        
-        # Step 6: Calculate confidence and correlation strength
-        confidence = self._calculate_confidence(scores_47d)
-        correlation_strength = self._calculate_correlation_strength(scores_47d)
-        
-        # Create result
-        result = VULCAResult(
-            model_id=model_id,
-            timestamp=datetime.now(),
-            scores_6d=scores_6d,
-            scores_47d=scores_47d,
-            overall_score=overall_score,
-            processing_time_ms=(time.time() - start_time) * 1000,
-            correlation_strength=correlation_strength,
-            confidence_level=confidence,
-            top_dimensions=top_dims,
-            weakest_dimensions=weak_dims,
-            category_scores=category_scores
-        )
+        result = self._evaluate_rows(
+            [model_id], [scores_6d], cultural_perspective, use_correlation_propagation, start_time
+        )[0]
         
         # Cache result if enabled
         if self.cache_enabled:
-            self._cache[cache_key] = result
+            self._cache.put(cache_key, result)
         
         return result
     
     def batch_evaluate(self, 
                       evaluations: List[Dict],
-                      cultural_perspective: Optional[str] = None) -> List[VULCAResult]:
+                      cultural_perspective: Optional[str] = None,
+                      use_correlation_propagation: bool = True) -> List[VULCAResult]:
         """
         Evaluate multiple models in batch
         
+        Cache misses are scored together as one (N×6) → (N×47) array pass,
+        so re-scoring a whole catalog costs a few array operations.
+        
         Args:
             evaluations: List of dicts with 'model_id' and 'scores_6d'
             cultural_perspective: Optional perspective to apply to all
+            use_correlation_propagation: Whether to apply correlation propagation
             
         Returns:
-            List of VULCAResult objects
+            List of VULCAResult objects, in input order
         """
-        results = []
-        for eval_data in evaluations:
-            result = self.evaluate(
-                model_id=eval_data['model_id'],
-                scores_6d=eval_data['scores_6d'],
-                cultural_perspective=cultural_perspective
+        start_time = time.time()
+        results: List[Optional[VULCAResult]] = [None] * len(evaluations)
+        pending: List[Tuple[int, str]] = []
+        
+        for i, eval_data in enumerate(evaluations):
+            cache_key = self._generate_cache_key(
+                eval_data['model_id'], eval_data['scores_6d'],
+                cultural_perspective, use_correlation_propagation
             )
-            results.append(result)
+            cached_result = self._cache.get(cache_key) if self.cache_enabled else None
+            if cached_result is not None:
+                results[i] = replace(cached_result, processing_time_ms=0.1)  # Cache hit
+                continue
+            self._validate_6d_scores(eval_data['scores_6d'])
+            pending.append((i, cache_key))
+        
+        if pending:
+            fresh = self._evaluate_rows(
+                [evaluations[i]['model_id'] for i, _ in pending],
+                [evaluations[i]['scores_6d'] for i, _ in pending],
+                cultural_perspective,
+                use_correlation_propagation,
+                start_time,
+            )
+            for (i, cache_key), result in zip(pending, fresh):
+                results[i] = result
+                if self.cache_enabled:
+                    self._cache.put(cache_key, result)
+        
         return results
     
+    def _evaluate_rows(self,
+                       model_ids: List[str],
+                       scores_6d: List[Dict[str, float]],
+                       cultural_perspective: Optional[str],
+                       use_correlation_propagation: bool,
+                       start_time: float) -> List[VULCAResult]:
+        """Score validated 6D inputs as one (N×47) array"""
+        engine = self.algorithm.engine
+        
+        # Step 1: Initial 6D to 47D expansion
+        scores = engine.expand(
+            engine.to_array(scores_6d),
+            mean_6d=[sum(s.values()) / 6 for s in scores_6d],
+        )
+        
+        # Step 2: Apply correlation propagation if enabled
+        if self.enable_correlation and use_correlation_propagation and self.correlation_matrix:
+            scores = self._propagate_rows(scores)
+        
+        # Step 3: Apply cultural perspective if specified
+        if cultural_perspective:
+            scores = engine.apply_perspective(scores, cultural_perspective)
+        
+        # Step 4: Calculate overall score and metrics
+        overall = engine.overall_scores(scores).tolist()
+        
+        # Step 5: Analyze results
+        categories = engine.category_scores(scores).tolist()
+        top_dims = engine.ranked_dimensions(scores, n=5)
+        weak_dims = engine.ranked_dimensions(scores, n=5, highest=False)
+        
+        # Step 6: Calculate confidence and correlation strength
+        confidence = engine.confidence(scores).tolist()
+        correlation_strength = self._correlation_strengths(scores).tolist()
+        
+        timestamp = datetime.now()
+        # Batch time is shared evenly by the rows scored in it
+        processing_time_ms = (time.time() - start_time) * 1000 / len(model_ids)
+        results = []
+        for i, scores_47d in enumerate(engine.to_dicts(scores)):
+            results.append(VULCAResult(
+                model_id=model_ids[i],
+                timestamp=timestamp,
+                scores_6d=scores_6d[i],
+                scores_47d=scores_47d,
+                overall_score=overall[i],
+                processing_time_ms=processing_time_ms,
+                correlation_strength=correlation_strength[i],
+                confidence_level=confidence[i],
+                top_dimensions=top_dims[i],
+                weakest_dimensions=weak_dims[i],
+                category_scores=dict(zip(engine.categories, categories[i])),
+            ))
+        return results
+    
+    def _propagate_rows(self, scores_47d: np.ndarray) -> np.ndarray:
+        """Blend correlation-propagated scores into every (N×47) row at once"""
+        order = self._correlation_order
+        # Select top scoring dimensions of each row as propagation seeds
+        seed_idx = self.algorithm.engine.rank(scores_47d, n=5)
+        mask = np.zeros(scores_47d.shape, dtype=bool)
+        np.put_along_axis(mask, seed_idx, True, axis=1)
+        
+        # Reorder columns into correlation-matrix order and back
+        seeds = np.zeros_like(scores_47d)
+        seed_mask = np.zeros_like(mask)
+        seeds[:, order] = np.where(mask, scores_47d, 0.0)
+        seed_mask[:, order] = mask
+        propagated = self.correlation_matrix.propagate(
+            seeds, seed_mask, steps=self.propagation_steps
+        )[:, order]
+        
+        # Blend propagated scores with initial expansion
+        blend_factor = 0.3
+        return np.clip(scores_47d * (1 - blend_factor) + propagated * blend_factor, 0, 100)
+    
+    def _correlation_strengths(self, scores_47d: np.ndarray) -> np.ndarray:
+        """Calculate how well each row's top dimensions correlate"""
+        if not self.correlation_matrix:
+            return np.zeros(len(scores_47d))
+        # Sample correlations between top dimensions
+        top_idx = self._correlation_order[self.algorithm.engine.rank(scores_47d, n=10)]
+        return self.correlation_matrix.mean_pairwise_correlation(top_idx) * 100
+    
     def compare_models(self, 
                       result1: VULCAResult, 
                       result2: VULCAResult) -> Dict:
@@ -244,87 +355,30 @@ class VULCACore:
             if not 0 <= scores_6d[dim] <= 100:
                 raise ValueError(f"Score for {dim} must be between 0 and 100")
     
-    def _generate_cache_key(self, model_id: str, scores_6d: Dict, perspective: Optional[str]) -> str:
-        """Generate cache key for results"""
-        key_data = f"{model_id}:{json.dumps(scores_6d, sort_keys=True)}:{perspective}"
-        return hashlib.md5(key_data.encode()).hexdigest()
-    
-    def _select_propagation_seeds(self, scores_47d: Dict[str, float], top_n: int) -> Dict[str, float]:
-        """Select top scoring dimensions as propagation seeds"""
-        sorted_dims = sorted(scores_47d.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_dims[:top_n])
-    
-    def _blend_scores(self, 
-                     original: Dict[str, float], 
-                     propagated: Dict[str, float], 
-                     blend_factor: float) -> Dict[str, float]:
-        """Blend original and propagated scores"""
-        blended = {}
-        for dim in original:
-            orig_score = original[dim]
-            prop_score = propagated.get(dim, orig_score)
-            blended[dim] = orig_score * (1 - blend_factor) + prop_score * blend_factor
-            blended[dim] = np.clip(blended[dim], 0, 100)
-        return blended
-    
-    def _calculate_category_scores(self, scores_47d: Dict[str, float]) -> Dict[str, float]:
-        """Calculate average scores for each category"""
-        categories = {
-            'cognitive': [],
-            'creative': [],
-            'social': []
-        }
-        
-        for dim in VULCA_47_DIMENSIONS:
-            if dim.name in scores_47d:
-                categories[dim.category.value].append(scores_47d[dim.name])
-        
-        return {
-            cat: np.mean(scores) if scores else 0
-            for cat, scores in categories.items()
-        }
-    
-    def _get_top_dimensions(self, scores_47d: Dict[str, float], n: int) -> List[Tuple[str, float]]:
-        """Get top scoring dimensions"""
-        sorted_dims = sorted(scores_47d.items(), key=lambda x: x[1], reverse=True)
-        return [(name.replace('_', ' ').title(), score) for name, score in sorted_dims[:n]]
-    
-    def _get_weakest_dimensions(self, scores_47d: Dict[str, float], n: int) -> List[Tuple[str, float]]:
-        """Get weakest scoring dimensions"""
-        sorted_dims = sorted(scores_47d.items(), key=lambda x: x[1])
-        return [(name.replace('_', ' ').title(), score) for name, score in sorted_dims[:n]]
-    
-    def _calculate_confidence(self, scores_47d: Dict[str, float]) -> float:
-        """Calculate confidence level based on score distribution"""
-        scores = list(scores_47d.values())
-        std_dev = np.std(scores)
-        # Lower std dev means more consistent scores, higher confidence
-        confidence = max(0, min(100, 100 - std_dev * 2))
-        return confidence
-    
-    def _calculate_correlation_strength(self, scores_47d: Dict[str, float]) -> float:
-        """Calculate how well dimensions correlate"""
-        if not self.correlation_matrix:
-            return 0.0
-        
-        # Sample correlations between top dimensions
-        top_dims = self._get_top_dimensions(scores_47d, n=10)
-        correlations = []
-        
-        for i, (dim1, _) in enumerate(top_dims):
-            for dim2, _ in top_dims[i+1:]:
-                # Convert back to snake_case for lookup
-                dim1_key = dim1.lower().replace(' ', '_')
-                dim2_key = dim2.lower().replace(' ', '_')
-                corr = self.correlation_matrix.get_correlation(dim1_key, dim2_key)
-                correlations.append(abs(corr))
-        
-        return np.mean(correlations) * 100 if correlations else 0.0
+    def _generate_cache_key(self,
+                            model_id: str,
+                            scores_6d: Dict,
+                            perspective: Optional[str],
+                            use_correlation_propagation: bool = True) -> str:
+        """Canonical hash of the inputs and algorithm configuration"""
+        key_data = json.dumps({
+            'config': self._config_digest,
+            'model_id': str(model_id),
+            # float() so 85 and 85.0 address the same entry
+            'scores_6d': {k: float(v) for k, v in scores_6d.items()},
+            'perspective': perspective,
+            'propagation': bool(use_correlation_propagation and self.enable_correlation),
+        }, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(key_data.encode()).hexdigest()
     
     def clear_cache(self):
         """Clear the result cache"""
         self._cache.clear()
     
+    def cache_stats(self) -> Dict:
+        """Hit/miss/eviction counters of the result cache"""
+        return self._cache.stats()
+    
     def get_dimension_metadata(self) -> List[Dict]:
         """Get metadata for all 47 dimensions"""
         return [
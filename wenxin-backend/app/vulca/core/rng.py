@@ -0,0 +1,40 @@
+"""
+VULCA deterministic randomness
+Per-call NumPy generators seeded from a stable hash of the inputs
+"""
+
+import hashlib
+from typing import Any
+
+import numpy as np
+
+
+def stable_seed(*parts: Any) -> int:
+    """
+    Derive a 64-bit seed from the given parts
+
+    Strings hash by their UTF-8 bytes, everything else as float64 values,
+    so ``85`` and ``85.0`` (or a list and an array of the same scores) give
+    the same seed. Unlike ``hash()``, the result is identical across
+    processes and Python runs.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            data = b's' + part.encode('utf-8')
+        else:
+            # + 0.0 folds -0.0 into 0.0
+            data = b'f' + (np.asarray(part, dtype=np.float64) + 0.0).tobytes()
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return int.from_bytes(digest.digest()[:8], 'little')
+
+
+def input_rng(*parts: Any) -> np.random.Generator:
+    """
+    Private generator for one computation over the given inputs
+
+    Never touches the process-global NumPy RNG, so concurrent evaluations
+    neither interfere with each other nor with other NumPy code.
+    """
+    return np.random.default_rng(stable_seed(*parts))
@@ -8,6 +8,7 @@ from typing import Dict, List, Tuple, Optional
 import json
 import os
 from .model_profiles import ModelProfileRegistry, ModelProfile
+from .rng import input_rng
 
 class VULCACoreAdapter:
     """VULCA 6D to 47D intelligent extension adapter with model profile integration"""
@@ -31,7 +32,7 @@ class VULCACoreAdapter:
     def _initialize_correlation_matrix(self) -> np.ndarray:
         """Initialize 6x47 correlation matrix for dimension expansion"""
         # Create a sophisticated correlation matrix
-        np.random.seed(42)  # For reproducibility
+        rs = np.random.RandomState(42)  # For reproducibility, without touching the global RNG
         
         # Base correlation patterns
         matrix = np.zeros((6, 47))
@@ -41,12 +42,12 @@ class VULCACoreAdapter:
             # Primary correlations (7-8 dimensions per base)
             start_idx = i * 7
             end_idx = min(start_idx + 8, 47)
-            matrix[i, start_idx:end_idx] = np.random.uniform(0.7, 0.9, end_idx - start_idx)
+            matrix[i, start_idx:end_idx] = rs.uniform(0.7, 0.9, end_idx - start_idx)
             
             # Secondary correlations (weaker connections)
             for j in range(47):
                 if matrix[i, j] == 0:
-                    matrix[i, j] = np.random.uniform(0.1, 0.3)
+                    matrix[i, j] = rs.uniform(0.1, 0.3)
         
         # Normalize columns to sum to 1
         matrix = matrix / matrix.sum(axis=0)
@@ -129,9 +130,9 @@ class VULCACoreAdapter:
         
         # Convert patterns to weight vectors
         for perspective, pattern in cultural_patterns.items():
-            # Generate weights based on cultural values
-            np.random.seed(hash(perspective) % 2**32)
-            weight_vector = np.random.uniform(0.5, 1.0, 47)
+            # Generate weights based on cultural values (stable across processes,
+            # unlike the per-process salted hash())
+            weight_vector = input_rng('cultural_weights', perspective).uniform(0.5, 1.0, 47)
             
             # Adjust weights based on cultural emphasis
             for i, value in enumerate(pattern.values()):
@@ -166,9 +167,8 @@ class VULCACoreAdapter:
         # Apply correlation matrix transformation
         vec_47d_base = np.dot(vec_6d, self.correlation_matrix)
         
-        # Add controlled variation
-        np.random.seed(int(sum(vec_6d) * 100))  # Deterministic but input-dependent
-        noise = np.random.normal(0, 2, 47)  # Small noise (std=2)
+        # Add controlled variation, deterministic but input-dependent
+        noise = input_rng('adapter_expand', vec_6d).normal(0, 2, 47)  # Small noise (std=2)
         vec_47d = vec_47d_base + noise
         
         # Apply non-linear transformation for more realistic distribution
@@ -354,6 +354,7 @@ class VULCACoreAdapter:
         
         # Apply profile-specific adjustments
         enhanced_47d = {}
+        rng = input_rng('adapter_profile', model_id, [scores_6d[dim] for dim in self.base_dims])
         
         for i, (dim_key, base_score) in enumerate(base_47d.items()):
             # Calculate profile-based adjustment
@@ -369,7 +370,7 @@ class VULCACoreAdapter:
             )
             
             # Add model-specific variance
-            variance = np.random.normal(0, enhanced_score * profile.variance_tendency * 0.1)
+            variance = rng.normal(0, enhanced_score * profile.variance_tendency * 0.1)
             final_score = max(0, min(100, enhanced_score + variance))
             
             enhanced_47d[dim_key] = final_score
@@ -3,10 +3,12 @@ VULCA Service Layer - Business Logic Implementation
 Handles VULCA evaluation operations and database interactions
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
+import os
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete
@@ -16,6 +18,53 @@ from ..core.vulca_core_adapter import VULCACoreAdapter
 from ..models.vulca_model import VULCAEvaluation, VULCADimension
 from ...core.database import get_db
 
+# Pool size for batch evaluation (VULCA_EVAL_WORKERS overrides)
+DEFAULT_EVAL_WORKERS = min(4, os.cpu_count() or 1)
+
+# Adapter of a process-pool worker, built on its first chunk
+_worker_adapter: Optional[VULCACoreAdapter] = None
+
+
+def _build_evaluation(
+    adapter: VULCACoreAdapter,
+    model_id: int,
+    scores_6d: Dict[str, float],
+    model_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Score one model; a pure function of its inputs (no evaluation date)"""
+    # Expand to 47 dimensions
+    scores_47d = adapter.expand_6d_to_47d(scores_6d)
+    
+    # Calculate cultural perspectives
+    cultural_scores = adapter.calculate_cultural_scores(scores_47d)
+    
+    return {
+        'model_id': model_id,
+        'model_name': model_name or f'Model_{model_id}',
+        'scores_6d': scores_6d,
+        'scores_47d': scores_47d,
+        'cultural_perspectives': cultural_scores,
+        'metadata': {
+            'algorithm_version': '2.0',
+            'expansion_method': 'correlation_matrix',
+            'cultural_perspectives_count': len(cultural_scores)
+        }
+    }
+
+
+def _evaluate_chunk(
+    items: List[Tuple[int, Dict[str, float], Optional[str]]],
+    adapter: Optional[VULCACoreAdapter] = None
+) -> List[Dict[str, Any]]:
+    """Score a chunk of (model_id, scores_6d, model_name) in a pool worker"""
+    global _worker_adapter
+    if adapter is None:
+        if _worker_adapter is None:
+            _worker_adapter = VULCACoreAdapter()
+        adapter = _worker_adapter
+    return [_build_evaluation(adapter, *item) for item in items]
+
+
 class VULCAService:
     """VULCA business logic service"""
     
@@ -41,26 +90,8 @@ class VULCAService:
             Complete evaluation results including 47D scores and cultural perspectives
         """
         try:
-            # Expand to 47 dimensions
-            scores_47d = self.adapter.expand_6d_to_47d(scores_6d)
-            
-            # Calculate cultural perspectives
-            cultural_scores = self.adapter.calculate_cultural_scores(scores_47d)
-            
-            # Prepare evaluation result
-            evaluation_result = {
-                'model_id': model_id,
-                'model_name': model_name or f'Model_{model_id}',
-                'scores_6d': scores_6d,
-                'scores_47d': scores_47d,
-                'cultural_perspectives': cultural_scores,
-                'evaluation_date': datetime.now(timezone.utc).isoformat(),
-                'metadata': {
-                    'algorithm_version': '2.0',
-                    'expansion_method': 'correlation_matrix',
-                    'cultural_perspectives_count': len(cultural_scores)
-                }
-            }
+            evaluation_result = _build_evaluation(self.adapter, model_id, scores_6d, model_name)
+            evaluation_result['evaluation_date'] = datetime.now(timezone.utc).isoformat()
             
             # Save to database if session available
             if self.db:
@@ -70,21 +101,92 @@ class VULCAService:
             
         except Exception as e:
             raise RuntimeError(f"Evaluation failed: {str(e)}")
+    
+    async def evaluate_models_batch(
+        self,
+        evaluations: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many models on a worker pool
+        
+        Every evaluation seeds its own generator from its inputs, so results
+        are bit-identical to sequential evaluate_model calls regardless of
+        pool type, worker count or chunking.
+        
+        Args:
+            evaluations: Dicts with 'model_id', 'scores_6d' and optional 'model_name'
+            max_workers: Pool size (default VULCA_EVAL_WORKERS or min(4, CPUs))
+            use_processes: Use a process pool instead of threads (for large
+                batches; each worker builds its own adapter once)
+            
+        Returns:
+            Evaluation results in input order, sharing one evaluation date
+        """
+        items = [
+            (e['model_id'], e['scores_6d'], e.get('model_name'))
+            for e in evaluations
+        ]
+        if not items:
+            return []
+        for _, scores_6d, _ in items:
+            missing = [dim for dim in self.adapter.base_dims if dim not in scores_6d]
+            if missing:
+                raise ValueError(f"Missing dimension: {missing[0]}")
+        
+        workers = max_workers or int(os.getenv('VULCA_EVAL_WORKERS', DEFAULT_EVAL_WORKERS))
+        workers = max(1, min(workers, len(items)))
+        chunk_size = -(-len(items) // workers)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        
+        try:
+            if len(chunks) == 1:
+                chunk_results = [_evaluate_chunk(chunks[0], self.adapter)]
+            else:
+                loop = asyncio.get_running_loop()
+                pool: Executor = (
+                    ProcessPoolExecutor(max_workers=workers) if use_processes
+                    else ThreadPoolExecutor(max_workers=workers, thread_name_prefix='vulca-eval')
+                )
+                with pool:
+                    # Threads share the (read-only) service adapter
+                    adapter = None if use_processes else self.adapter
+                    chunk_results = await asyncio.gather(*[
+                        loop.run_in_executor(pool, _evaluate_chunk, chunk, adapter)
+                        for chunk in chunks
+                    ])
+        except Exception as e:
+            raise RuntimeError(f"Batch evaluation failed: {str(e)}")
+        
+        evaluation_date = datetime.now(timezone.utc).isoformat()
+        results = [result for chunk in chunk_results for result in chunk]
+        for result in results:
+            result['evaluation_date'] = evaluation_date
+        
+        if self.db:
+            await self._save_evaluations(results)
+        
+        return results
             
     async def _save_evaluation(self, evaluation_result: Dict[str, Any]):
         """Save evaluation to database"""
+        await self._save_evaluations([evaluation_result])
+    
+    async def _save_evaluations(self, evaluation_results: List[Dict[str, Any]]):
+        """Save evaluations to database in one commit"""
         try:
-            evaluation = VULCAEvaluation(
-                model_id=evaluation_result['model_id'],
-                model_name=evaluation_result['model_name'],
-                original_6d_scores=json.dumps(evaluation_result['scores_6d']),
-                extended_47d_scores=json.dumps(evaluation_result['scores_47d']),
-                cultural_perspectives=json.dumps(evaluation_result['cultural_perspectives']),
-                evaluation_metadata=json.dumps(evaluation_result['metadata']),
-                evaluation_date=datetime.fromisoformat(evaluation_result['evaluation_date'])
-            )
+            for evaluation_result in evaluation_results:
+                self.db.add(VULCAEvaluation(
+                    model_id=evaluation_result['model_id'],
+                    model_name=evaluation_result['model_name'],
+                    original_6d_scores=json.dumps(evaluation_result['scores_6d']),
+                    extended_47d_scores=json.dumps(evaluation_result['scores_47d']),
+                    cultural_perspectives=json.dumps(evaluation_result['cultural_perspectives']),
+                    evaluation_metadata=json.dumps(evaluation_result['metadata']),
+                    evaluation_date=datetime.fromisoformat(evaluation_result['evaluation_date'])
+                ))
             
-            self.db.add(evaluation)
             await self.db.commit()
             
         except Exception as e:
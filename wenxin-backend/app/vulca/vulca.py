@@ -201,14 +201,14 @@ async def get_sample_evaluation(model_id: int):
     import numpy as np
     
     # Generate random 6D scores
-    np.random.seed(model_id)  # Consistent samples for same model ID
+    rs = np.random.RandomState(model_id)  # Consistent samples for same model ID
     scores_6d = {
-        'creativity': float(np.random.uniform(70, 95)),
-        'technique': float(np.random.uniform(75, 92)),
-        'emotion': float(np.random.uniform(68, 90)),
-        'context': float(np.random.uniform(72, 88)),
-        'innovation': float(np.random.uniform(70, 93)),
-        'impact': float(np.random.uniform(73, 91))
+        'creativity': float(rs.uniform(70, 95)),
+        'technique': float(rs.uniform(75, 92)),
+        'emotion': float(rs.uniform(68, 90)),
+        'context': float(rs.uniform(72, 88)),
+        'innovation': float(rs.uniform(70, 93)),
+        'impact': float(rs.uniform(73, 91))
     }
     
     # Create service without database
@@ -255,6 +255,17 @@ async def get_demo_comparison():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Demo generation failed: {str(e)}")
 
+@router.get("/cache/stats")
+async def get_result_cache_stats():
+    """
+    Get VULCA result cache statistics
+    
+    Returns size, hit/miss/eviction/expiration counters and backend info of
+    the process-wide VULCACore result cache
+    """
+    from .algorithms.result_cache import get_result_cache
+    return get_result_cache().stats()
+
 @router.get("/models")
 async def get_vulca_models(
     db: AsyncSession = Depends(get_db),
@@ -0,0 +1,232 @@
+"""Tests for the async two-tier CacheService and tag-based invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services import cache as cache_module
+from app.services import cache_invalidation
+from app.services import cache_service as cache_service_module
+from app.services.cache_invalidation import CacheInvalidator
+from app.services.cache_service import CacheService, CacheTags, LocalCacheBackend
+
+
+class _CountingBackend(LocalCacheBackend):
+    """Local stand-in that counts round-trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[tuple[str, int]] = []
+
+    async def mget(self, keys):
+        self.calls.append(("mget", len(keys)))
+        return await super().mget(keys)
+
+    async def incr(self, keys):
+        self.calls.append(("incr", len(keys)))
+        return await super().incr(keys)
+
+
+@pytest.fixture()
+def backend():
+    return _CountingBackend()
+
+
+async def test_roundtrip_and_miss(backend):
+    svc = CacheService(backend=backend)
+    assert await svc.get("missing") is None
+    assert await svc.set("k", {"a": [1, 2]}, ttl_seconds=60)
+    assert await svc.get("k") == {"a": [1, 2]}
+
+
+async def test_l1_serves_hot_keys_without_backend(backend):
+    svc = CacheService(backend=backend)
+    await svc.set("k", [1], tags=["models"])
+    backend.calls.clear()
+    for _ in range(5):
+        assert await svc.get("k", ["models"]) == [1]
+    assert backend.calls == []
+
+
+async def test_l1_values_are_not_shared(backend):
+    svc = CacheService(backend=backend)
+    await svc.set("k", {"a": [1]})
+    (await svc.get("k"))["a"].append(2)
+    assert await svc.get("k") == {"a": [1]}
+
+
+async def test_get_many_is_one_mget(backend):
+    svc = CacheService(backend=backend, l1_ttl=0)
+    for i in range(3):
+        await svc.set(f"k{i}", i, tags=["models", "rankings"])
+    backend.calls.clear()
+    found = await svc.get_many(["k0", "k1", "k2", "nope"], tags=["models", "rankings"])
+    assert found == {"k0": 0, "k1": 1, "k2": 2}
+    assert backend.calls == [("mget", 6)]
+
+
+async def test_invalidate_tags_drops_tagged_entries_only(backend):
+    svc = CacheService(backend=backend)
+    await svc.set("a", 1, tags=["model:1"])
+    await svc.set("b", 2, tags=["model:2"])
+    await svc.invalidate_tags("model:1")
+    assert await svc.get("a", ["model:1"]) is None
+    assert await svc.get("b", ["model:2"]) == 2
+
+
+async def test_invalidation_from_other_process_after_l1_ttl(backend, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    reader = CacheService(backend=backend, l1_ttl=5)
+    writer = CacheService(backend=backend)
+
+    await reader.set("k", "v", tags=["rankings"])
+    await writer.invalidate_tags("rankings")
+    # L1 may serve the old value until its short TTL runs out ...
+    assert await reader.get("k", ["rankings"]) == "v"
+    now[0] += 5
+    # ... after which the bumped version turns the shared entry into a miss
+    assert await reader.get("k", ["rankings"]) is None
+
+
+async def test_get_without_tags_still_checks_stored_tags(backend):
+    svc = CacheService(backend=backend, l1_ttl=0)
+    await svc.set("k", 1, tags=["models"])
+    await svc.invalidate_tags("models")
+    assert await svc.get("k") is None
+
+
+async def test_lost_tag_version_invalidates(backend):
+    svc = CacheService(backend=backend, l1_ttl=0)
+    await svc.set("k", 1, tags=["models"])
+    backend._versions.clear()  # e.g. the counter was evicted
+    assert await svc.get("k", ["models"]) is None
+
+
+async def test_invalidator_uses_tags(backend, monkeypatch):
+    svc = CacheService(backend=backend)
+    monkeypatch.setattr(cache_invalidation, "cache_service", svc)
+    model_tag = CacheTags.MODEL.format(model_id="m1")
+    vulca_tag = CacheTags.VULCA.format(model_id="m1")
+    await svc.set("rankings:model:m1:True", {"id": "m1"}, tags=[CacheTags.RANKINGS, model_tag, vulca_tag])
+    await svc.set("models:all:0:100:None:True:False", [], tags=[CacheTags.MODELS])
+    await svc.set("rankings:model:m2:True", {"id": "m2"},
+                  tags=[CacheTags.RANKINGS, CacheTags.MODEL.format(model_id="m2")])
+
+    await CacheInvalidator.invalidate_vulca_cache("m1")
+    assert await svc.get("rankings:model:m1:True") is None
+    assert await svc.get("models:all:0:100:None:True:False") is None
+    assert await svc.get("rankings:model:m2:True") == {"id": "m2"}
+
+    await CacheInvalidator.invalidate_all()
+    assert await svc.get("rankings:model:m2:True") is None
+
+
+class TestGetOrCompute:
+    async def test_concurrent_misses_compute_once(self, backend):
+        svc = CacheService(backend=backend)
+        calls = []
+        gate = asyncio.Event()
+
+        async def compute():
+            calls.append(1)
+            await gate.wait()
+            return {"rows": [1, 2]}
+
+        waiters = [asyncio.ensure_future(svc.get_or_compute("k", compute, 60, ["models"])) for _ in range(10)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*waiters) == [{"rows": [1, 2]}] * 10
+        assert len(calls) == 1
+        assert await svc.get_or_compute("k", compute, 60, ["models"]) == {"rows": [1, 2]}
+        assert len(calls) == 1
+
+    async def test_stale_value_served_while_refreshing_once(self, backend, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_service_module.time, "time", lambda: now[0])
+        svc = CacheService(backend=backend)
+        version = [0]
+        gate = asyncio.Event()
+
+        async def compute():
+            version[0] += 1
+            if version[0] > 1:
+                await gate.wait()
+            return version[0]
+
+        assert await svc.get_or_compute("k", compute, 60) == 1
+        now[0] += 61  # past the TTL, inside the stale window
+        results = [await svc.get_or_compute("k", compute, 60) for _ in range(5)]
+        assert results == [1] * 5
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert version[0] == 2
+        assert await svc.get_or_compute("k", compute, 60) == 2
+
+    async def test_invalidation_does_not_join_older_flight(self, backend):
+        svc = CacheService(backend=backend)
+        gate = asyncio.Event()
+        values = iter(["before", "after"])
+
+        async def compute():
+            value = next(values)
+            if value == "before":
+                await gate.wait()
+            return value
+
+        first = asyncio.ensure_future(svc.get_or_compute("k", compute, 60, ["model:1"]))
+        await asyncio.sleep(0)
+        await svc.invalidate_tags("model:1")
+        assert await svc.get_or_compute("k", compute, 60, ["model:1"]) == "after"
+        gate.set()
+        assert await first == "before"
+        # The computation that straddled the invalidation was not stored
+        assert await svc.get("k", ["model:1"]) == "after"
+
+    async def test_errors_propagate_and_are_not_cached(self, backend):
+        svc = CacheService(backend=backend)
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await svc.get_or_compute("k", fail, 60)
+
+        async def ok():
+            return 1
+
+        assert await svc.get_or_compute("k", ok, 60) == 1
+
+
+async def test_models_endpoint_session_factory_is_overridable(backend, monkeypatch):
+    from fastapi import FastAPI
+    from httpx import ASGITransport, AsyncClient
+
+    from app.api.v1 import models
+    from app.core.database import get_session_factory
+
+    sessions: list[object] = []
+
+    class _Session:
+        async def __aenter__(self):
+            sessions.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def fake_load(db, *args):
+        assert db is sessions[-1]
+        return []
+
+    monkeypatch.setattr(models, "cache_service", CacheService(backend=backend))
+    monkeypatch.setattr(models, "_load_models", fake_load)
+    app = FastAPI()
+    app.include_router(models.router, prefix="/models")
+    app.dependency_overrides[get_session_factory] = lambda: _Session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/models/")
+    assert response.status_code == 200 and response.json() == []
+    assert len(sessions) == 1
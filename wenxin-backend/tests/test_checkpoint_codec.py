@@ -0,0 +1,160 @@
+"""Tests for the compact pipeline checkpoint codec."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.prototype.checkpoints import codec, pipeline_checkpoint
+from app.prototype.checkpoints.codec import (
+    CheckpointDecodeError,
+    LazyCheckpoint,
+    decode_checkpoint,
+    encode_checkpoint,
+)
+
+
+def _evidence(n: int = 60) -> dict:
+    return {
+        "sample_matches": [
+            {"sample_id": f"vulca-bench-{i:04d}", "similarity": 0.1 + i / 1000, "source": "VULCA-Bench-v1"}
+            for i in range(n)
+        ],
+        "terminology_hits": [{"term": "留白", "definition": "reserved white space"}],
+    }
+
+
+@pytest.fixture
+def ckpt_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_checkpoint, "_CHECKPOINT_ROOT", tmp_path)
+    monkeypatch.delenv("VULCA_CHECKPOINT_FORMAT", raising=False)
+    return tmp_path
+
+
+class TestCodec:
+    @pytest.mark.parametrize("compression", [codec._COMP_NONE, codec._COMP_ZLIB])
+    def test_roundtrip(self, tmp_path, compression):
+        data = {"evidence": _evidence(), "latency_ms": 12, "note": "水墨"}
+        raw = encode_checkpoint(data, tmp_path, compression=compression)
+        assert decode_checkpoint(raw, tmp_path).to_dict() == data
+
+    def test_smaller_than_indented_json(self, tmp_path):
+        data = {"evidence": _evidence(), "evidence_pack": _evidence(40)}
+        raw = encode_checkpoint(data, None)
+        assert len(raw) * 4 < len(json.dumps(data, indent=2, ensure_ascii=False).encode())
+
+    def test_large_values_deduplicated_across_saves(self, tmp_path):
+        evidence = _evidence()
+        encode_checkpoint({"evidence": evidence, "round": 1}, tmp_path)
+        encode_checkpoint({"evidence": evidence, "round": 2}, tmp_path)
+        encode_checkpoint({"evidence": _evidence(61), "round": 3}, tmp_path)
+        assert len(list(tmp_path.glob("*.bin"))) == 2
+
+    def test_small_values_stay_inline(self, tmp_path):
+        encode_checkpoint({"candidates": [{"id": "c0"}]}, tmp_path)
+        assert list(tmp_path.glob("*.bin")) == []
+
+    def test_blob_fields_load_lazily(self, tmp_path):
+        raw = encode_checkpoint({"evidence": _evidence(), "latency_ms": 5}, tmp_path)
+        ckpt = decode_checkpoint(raw, tmp_path)
+        assert isinstance(ckpt, LazyCheckpoint)
+        assert ckpt["latency_ms"] == 5
+        assert not ckpt.is_loaded("evidence")
+        assert len(ckpt["evidence"]["sample_matches"]) == 60
+        assert ckpt.is_loaded("evidence")
+
+    def test_corrupted_input_rejected(self, tmp_path):
+        with pytest.raises(CheckpointDecodeError):
+            decode_checkpoint(b"{}", tmp_path)
+        raw = encode_checkpoint({"x": 1}, None, compression=codec._COMP_ZLIB)
+        with pytest.raises(CheckpointDecodeError):
+            decode_checkpoint(raw[:-4], tmp_path)
+
+    def test_corrupted_zstd_body_rejected(self, tmp_path):
+        pytest.importorskip("zstandard")
+        raw = encode_checkpoint({"evidence": _evidence()}, None, compression=codec._COMP_ZSTD)
+        with pytest.raises(CheckpointDecodeError):
+            decode_checkpoint(raw[:5] + b"\x00" * 16 + raw[21:], tmp_path)
+
+    def test_tampered_blob_detected(self, tmp_path):
+        raw = encode_checkpoint({"evidence": _evidence()}, tmp_path, compression=codec._COMP_NONE)
+        blob = next(tmp_path.glob("*.bin"))
+        blob.write_bytes(blob.read_bytes().replace(b"0001", b"9999"))
+        with pytest.raises(CheckpointDecodeError):
+            decode_checkpoint(raw, tmp_path)["evidence"]
+
+
+class TestPipelineStageCheckpoints:
+    def test_save_and_load(self, ckpt_root):
+        data = {"candidates": [{"candidate_id": "c0"}], "evidence": _evidence()}
+        path = pipeline_checkpoint.save_pipeline_stage("task-1", "draft", data)
+        assert path.endswith("stage_draft.ckpt")
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "draft") == data
+        assert pipeline_checkpoint.has_pipeline_stage("task-1", "draft")
+        assert not pipeline_checkpoint.has_pipeline_stage("task-1", "critic")
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "critic") is None
+
+    def test_open_is_lazy(self, ckpt_root):
+        pipeline_checkpoint.save_pipeline_stage(
+            "task-1", "draft", {"candidates": [{"candidate_id": "c0"}], "evidence": _evidence()},
+        )
+        ckpt = pipeline_checkpoint.open_pipeline_stage("task-1", "draft")
+        assert ckpt.get("candidates") == [{"candidate_id": "c0"}]
+        assert not ckpt.is_loaded("evidence")
+
+    def test_reads_legacy_json(self, ckpt_root):
+        task_dir = ckpt_root / "task-1"
+        task_dir.mkdir()
+        (task_dir / "stage_scout.json").write_text(json.dumps({"sample_matches": []}))
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "scout") == {"sample_matches": []}
+
+        pipeline_checkpoint.save_pipeline_stage("task-1", "scout", {"sample_matches": [1]})
+        assert not (task_dir / "stage_scout.json").exists()
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "scout") == {"sample_matches": [1]}
+
+    def test_json_format_opt_out(self, ckpt_root, monkeypatch):
+        monkeypatch.setenv("VULCA_CHECKPOINT_FORMAT", "json")
+        path = pipeline_checkpoint.save_pipeline_stage("task-1", "queen", {"decision": "accept"})
+        assert path.endswith("stage_queen.json")
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "queen") == {"decision": "accept"}
+
+    def test_corrupted_checkpoint_returns_none(self, ckpt_root):
+        pipeline_checkpoint.save_pipeline_stage("task-1", "critic", {"x": 1})
+        (ckpt_root / "task-1" / "stage_critic.ckpt").write_bytes(b"garbage")
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "critic") is None
+
+    def test_verify_rejects_corrupt_header_and_missing_blob(self, ckpt_root):
+        pipeline_checkpoint.save_pipeline_stage("task-1", "scout", {"evidence": _evidence()})
+        pipeline_checkpoint.save_pipeline_stage("task-1", "draft", {"x": 1})
+        assert pipeline_checkpoint.verify_pipeline_stage("task-1", "scout")
+        assert not pipeline_checkpoint.verify_pipeline_stage("task-1", "critic")
+
+        (ckpt_root / "task-1" / "stage_draft.ckpt").write_bytes(b"garbage")
+        assert pipeline_checkpoint.has_pipeline_stage("task-1", "draft")
+        assert not pipeline_checkpoint.verify_pipeline_stage("task-1", "draft")
+
+        next((ckpt_root / "task-1" / "blobs").glob("*.bin")).unlink()
+        assert not pipeline_checkpoint.verify_pipeline_stage("task-1", "scout")
+
+
+class TestBlobCollection:
+    def test_output_save_collects_orphaned_blobs(self, ckpt_root):
+        shared = _evidence()
+        pipeline_checkpoint.save_pipeline_stage("task-1", "scout", {"evidence": shared})
+        pipeline_checkpoint.save_pipeline_stage("task-1", "critic", {"evidence": shared, "scores": _evidence(61)})
+        pipeline_checkpoint.save_pipeline_stage("task-1", "critic", {"evidence": shared, "scores": _evidence(62)})
+        blob_dir = ckpt_root / "task-1" / "blobs"
+        assert len(list(blob_dir.glob("*.bin"))) == 3
+
+        pipeline_checkpoint.save_pipeline_output("task-1", {"status": "completed"})
+        assert len(list(blob_dir.glob("*.bin"))) == 2
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "scout") == {"evidence": shared}
+        assert pipeline_checkpoint.load_pipeline_stage("task-1", "critic")["scores"] == _evidence(62)
+
+    def test_unreadable_checkpoint_blocks_collection(self, ckpt_root):
+        pipeline_checkpoint.save_pipeline_stage("task-1", "scout", {"evidence": _evidence()})
+        (ckpt_root / "task-1" / "stage_draft.ckpt").write_bytes(b"garbage")
+        pipeline_checkpoint.save_pipeline_stage("task-1", "scout", {"evidence": _evidence(61)})
+        assert pipeline_checkpoint.collect_pipeline_blobs("task-1") == 0
+        assert len(list((ckpt_root / "task-1" / "blobs").glob("*.bin"))) == 2
@@ -0,0 +1,145 @@
+"""Tests for batched cross-layer Critic escalation."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.prototype.agents.agent_runtime import AgentRuntime
+from app.prototype.agents.critic_llm import CriticLLM
+from app.prototype.agents.critic_types import CritiqueInput
+from app.prototype.agents.layer_state import init_layer_states
+
+_DIMS = ["visual_perception", "cultural_context", "philosophical_aesthetic"]
+
+
+@pytest.fixture()
+def llm(monkeypatch):
+    """Fake _call_llm: answers batched prompts with *batch*, ReAct steps with a submit."""
+    state = {"batch": {}, "calls": [], "messages": []}
+
+    async def fake_call_llm(self, model_spec, messages, tools=None, tool_choice="auto"):
+        state["messages"].append(messages)
+        if tools is None:
+            state["calls"].append("batch")
+            return {"message": {"role": "assistant", "content": json.dumps(state["batch"])}}
+        layer = messages[1]["content"].split("**Layer**: ")[1].split(" ")[0]
+        state["calls"].append(layer)
+        args = {"score": 0.9, "confidence": 0.9, "rationale": f"agent {layer}", "evidence_refs": []}
+        return {"message": {"role": "assistant", "content": None, "tool_calls": [{
+            "id": "1", "type": "function",
+            "function": {"name": "submit_evaluation", "arguments": json.dumps(args)},
+        }]}}
+
+    monkeypatch.setattr(AgentRuntime, "_call_llm", fake_call_llm)
+    return state
+
+
+def _run(critic: CriticLLM, layer_states=None):
+    layer_states = layer_states or init_layer_states()
+    for dim in _DIMS:
+        layer_states[dim].record_score(0.4)
+    critique_input = CritiqueInput(
+        task_id="t1", subject="misty mountains", cultural_tradition="chinese_xieyi",
+        evidence={}, candidates=[],
+    )
+    return critic._run_agent_evaluations(_DIMS, layer_states, {"prompt": "p"}, critique_input)
+
+
+def test_one_call_scores_all_confident_dimensions(llm):
+    llm["batch"] = {
+        "L1": {"score": 0.7, "confidence": 0.8, "rationale": "balanced"},
+        "L3": {"score": 0.6, "confidence": 0.9, "rationale": "grounded"},
+        "L5": {"score": 0.5, "confidence": 0.7, "rationale": "quiet"},
+    }
+    results = _run(CriticLLM(batched=True))
+    assert llm["calls"] == ["batch"]
+    assert {d: r.score for d, r in results.items()} == {
+        "visual_perception": 0.7, "cultural_context": 0.6, "philosophical_aesthetic": 0.5,
+    }
+    assert all(r.batch_size == 3 and not r.fallback_used for r in results.values())
+
+
+def test_low_confidence_and_missing_dimensions_fall_back_to_agents(llm):
+    llm["batch"] = {
+        "L1": {"score": 0.7, "confidence": 0.8},
+        "L3": {"score": 0.2, "confidence": 0.3},
+    }
+    results = _run(CriticLLM(batched=True, batch_min_confidence=0.6))
+    assert llm["calls"] == ["batch", "L3", "L5"]
+    assert results["visual_perception"].score == 0.7
+    assert results["cultural_context"].score == 0.9
+    assert results["cultural_context"].batch_size == 0
+    assert results["philosophical_aesthetic"].rationale == "agent L5"
+
+
+def test_rejected_batch_score_is_not_recorded(llm):
+    llm["batch"] = {
+        "L1": {"score": 0.7, "confidence": 0.8},
+        "L3": {"score": 0.2, "confidence": 0.3},
+        "L5": {"score": 0.5, "confidence": 0.9},
+    }
+    layer_states = init_layer_states()
+    _run(CriticLLM(batched=True, batch_min_confidence=0.6), layer_states)
+    assert llm["calls"] == ["batch", "L3"]
+    # The retried agent saw the rule score, not the rejected batched one
+    assert "Score: 0.4000" in llm["messages"][1][1]["content"]
+    assert layer_states["cultural_context"]._score_history == [0.4, 0.9]
+    assert layer_states["visual_perception"]._score_history == [0.4, 0.7]
+
+
+def test_batch_prompt_carries_evolved_tradition_context(llm, monkeypatch):
+    from app.prototype.cultural_pipelines import cultural_weights
+
+    seen = []
+
+    def fake_context(tradition, max_tokens=200, layer_id=None):
+        seen.append(tradition)
+        return "\n\n[Evolved Context]\nPattern: wet ink"
+
+    monkeypatch.setattr(cultural_weights, "get_evolved_prompt_context", fake_context)
+    llm["batch"] = {label: {"score": 0.6, "confidence": 0.9} for label in ("L1", "L3", "L5")}
+    _run(CriticLLM(batched=True))
+    assert llm["messages"][0][0]["content"].endswith("[Evolved Context]\nPattern: wet ink")
+    assert seen == ["chinese_xieyi"]
+
+
+def test_unparseable_batch_answer_falls_back_everywhere(llm):
+    llm["batch"] = "not a per-layer object"
+    results = _run(CriticLLM(batched=True))
+    assert llm["calls"] == ["batch", "L1", "L3", "L5"]
+    assert all(r.score == 0.9 for r in results.values())
+
+
+def test_per_layer_mode_skips_batch(llm):
+    _run(CriticLLM(batched=False))
+    assert llm["calls"] == ["L1", "L3", "L5"]
+
+
+def test_batched_is_the_default(monkeypatch):
+    monkeypatch.delenv("VULCA_CRITIC_BATCHED", raising=False)
+    assert CriticLLM()._batched
+    monkeypatch.setenv("VULCA_CRITIC_BATCHED", "0")
+    assert not CriticLLM()._batched
+
+
+async def test_arun_awaits_escalation_without_the_sync_bridge(llm, monkeypatch):
+    def _no_bridge(coro):
+        coro.close()
+        raise AssertionError("run_async_from_sync used by arun")
+
+    monkeypatch.setattr(CriticLLM, "_run_async", staticmethod(_no_bridge))
+    llm["batch"] = {
+        f"L{i}": {"score": 0.9, "confidence": 0.9, "rationale": "batched"} for i in range(1, 6)
+    }
+    critic = CriticLLM(batched=True)
+    critic._has_api_key = True
+    output = await critic.arun(CritiqueInput(
+        task_id="t1", subject="misty mountains", cultural_tradition="chinese_xieyi",
+        evidence={}, candidates=[{"candidate_id": "c0", "prompt": "p"}],
+    ))
+    assert output.success
+    assert llm["calls"][0] == "batch"
+    modes = {ds.agent_metadata.get("mode") for ds in output.scored_candidates[0].dimension_scores if ds.agent_metadata}
+    assert modes == {"agent_batched"}
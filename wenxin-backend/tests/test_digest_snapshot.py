@@ -0,0 +1,94 @@
+"""Tests for the shared columnar DigestSnapshot used by one digestion cycle."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from app.prototype.digestion.aggregator import DigestAggregator
+from app.prototype.digestion.context_evolver import ContextEvolver
+from app.prototype.digestion.few_shot_updater import FewShotUpdater
+from app.prototype.digestion.preference_learner import PreferenceLearner
+from app.prototype.digestion.snapshot import DigestSnapshot
+from app.prototype.feedback.feedback_store import FeedbackStore
+from app.prototype.session.store import SessionStore
+from app.prototype.session.types import SessionDigest
+
+
+def _sessions() -> list[SessionDigest]:
+    sessions = []
+    for i in range(6):
+        sessions.append(SessionDigest(
+            mode="create" if i % 2 else "evaluate",
+            tradition="chinese_xieyi",
+            final_scores={"L1": 0.3 + i * 0.01, "L5": 0.9},
+            final_weighted_total=0.8,
+            feedback=[{"rating": "thumbs_up" if i < 4 else "thumbs_down"}],
+            created_at=1000.0 + i,
+        ))
+    sessions.append(SessionDigest(tradition="watercolor", final_scores={"L2": 0.5}))
+    return sessions
+
+
+@pytest.fixture()
+def store(tmp_path):
+    s = SessionStore(str(tmp_path / "sessions.jsonl"))
+    for digest in _sessions():
+        s.append(digest)
+    return s
+
+
+def test_columns_are_aligned_and_read_only(store):
+    snap = DigestSnapshot.from_sessions(store.get_all())
+    assert len(snap) == 7
+    assert list(snap.tradition_groups) == ["chinese_xieyi", "watercolor"]
+    assert np.isnan(snap.dim_scores["L2"][:6]).all()
+    assert snap.dim_scores["L2"][6] == 0.5
+    assert snap.thumbs_up.sum() == 4 and snap.thumbs_down.sum() == 2
+    with pytest.raises(ValueError):
+        snap.weighted_total[0] = 1.0
+
+
+def test_consumers_match_store_backed_results(store):
+    snap = DigestSnapshot.from_sessions(store.get_all())
+    from_store = DigestAggregator(store).aggregate()
+    from_snap = DigestAggregator(store).aggregate(snap)
+    assert {k: v.to_dict() for k, v in from_snap.items()} == {
+        k: v.to_dict() for k, v in from_store.items()
+    }
+    stats = from_snap["chinese_xieyi"]
+    assert stats.mode_counts == {"evaluate": 3, "create": 3}
+    assert stats.avg_scores_by_dim["L5"] == pytest.approx(0.9)
+
+    prefs = PreferenceLearner(store).learn(snap)
+    assert prefs["chinese_xieyi"].total_positive == 4
+    assert prefs["chinese_xieyi"].total_negative == 2
+    assert "watercolor" not in prefs
+
+
+def test_evolve_reads_sessions_once(store, tmp_path, monkeypatch):
+    calls = []
+    original = store.get_all
+
+    def _counting_get_all():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(store, "get_all", _counting_get_all)
+    evolver = ContextEvolver(store=store, context_path=str(tmp_path / "ctx.json"))
+    result = evolver.evolve()
+    assert result.sessions_analyzed == 7
+    assert len(calls) == 1
+
+
+def test_shared_snapshot_feeds_feedback_and_few_shot(store, tmp_path):
+    snap = DigestSnapshot.from_sessions(store.get_all())
+    feedback = FeedbackStore(str(tmp_path / "feedback.jsonl"))
+    assert feedback.sync_from_sessions(snap.sessions) == 6
+
+    evolved = tmp_path / "evolved.json"
+    updater = FewShotUpdater(sessions_path=str(tmp_path / "missing.jsonl"), evolved_path=str(evolved))
+    assert updater.update(snap) == 3
+    assert len(json.loads(evolved.read_text())["few_shot_examples"]) == 3
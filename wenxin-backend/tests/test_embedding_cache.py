@@ -0,0 +1,99 @@
+"""Tests for the shared query-embedding LRU cache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.prototype.tools.embedding_cache import EmbeddingCache, normalize_text
+
+
+class _CountingModel:
+    def __init__(self, dim: int = 4) -> None:
+        self.calls: list[list[str]] = []
+        self._dim = dim
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([[len(t)] * self._dim for t in texts], dtype=np.float32)
+
+
+def test_normalize_text_collapses_whitespace():
+    assert normalize_text("  ink   wash\n painting ") == "ink wash painting"
+
+
+def test_encode_batches_misses_and_counts():
+    cache = EmbeddingCache()
+    model = _CountingModel()
+    out = cache.encode("m", model, ["a", "bb", "a"])
+    assert out.shape == (3, 4)
+    assert model.calls == [["a", "bb"]]
+    assert cache.stats()["misses"] == 2
+
+    cache.encode("m", model, ["bb", "ccc"])
+    assert model.calls[-1] == ["ccc"]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["size"] == 3
+
+
+def test_keys_separate_models_and_flags():
+    cache = EmbeddingCache()
+    model = _CountingModel()
+    cache.encode("clip", model, ["x"], convert_to_numpy=True)
+    cache.encode("minilm", model, ["x"], convert_to_numpy=True)
+    cache.encode("clip", model, ["x"], normalize_embeddings=True)
+    assert len(model.calls) == 3
+
+
+def test_lru_eviction():
+    cache = EmbeddingCache(max_entries=2)
+    model = _CountingModel()
+    cache.encode("m", model, ["a", "b"])
+    cache.encode("m", model, ["a"])  # touch a
+    cache.encode("m", model, ["c"])  # evicts b
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_vectors_are_read_only():
+    cache = EmbeddingCache()
+    out = cache.encode("m", _CountingModel(), ["a"])
+    cached = cache.get("m", "a")
+    with pytest.raises(ValueError):
+        cached[0] = 1.0
+    out[0, 0] = 99.0  # returned batch is a copy
+    assert cache.get("m", "a")[0] != 99.0
+
+
+def test_warm_then_score_needs_no_encode():
+    cache = EmbeddingCache()
+    model = _CountingModel()
+    assert cache.warm("m", model, ["r1", "r2", "r1"]) == 2
+    cache.encode("m", model, ["r2", "r1"])
+    assert len(model.calls) == 1
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = tmp_path / "emb.npz"
+    cache = EmbeddingCache(persist_path=path)
+    cache.encode("clip", _CountingModel(dim=4), ["水墨", "oil"], convert_to_numpy=True)
+    cache.encode("minilm", _CountingModel(dim=2), ["oil"])
+    assert cache.save()
+
+    fresh = EmbeddingCache(persist_path=path)
+    assert fresh.load() == 3
+    model = _CountingModel()
+    fresh.encode("clip", model, ["水墨"], convert_to_numpy=True)
+    assert model.calls == []
+    assert fresh.get("minilm", "oil").shape == (2,)
+
+
+def test_rejects_malformed_encoder_output():
+    class _Bad:
+        def encode(self, texts, **kwargs):
+            return np.zeros(3)
+
+    with pytest.raises(ValueError):
+        EmbeddingCache().encode("m", _Bad(), ["a", "b"])
@@ -0,0 +1,102 @@
+"""Tests for the push-based pipeline EventBus."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from app.prototype.orchestrator.event_bus import EventBus, RunEventChannel
+from app.prototype.orchestrator.events import EventType, PipelineEvent
+
+
+def _event(stage: str) -> PipelineEvent:
+    return PipelineEvent(event_type=EventType.STAGE_STARTED, stage=stage)
+
+
+_DONE = PipelineEvent(event_type=EventType.PIPELINE_COMPLETED)
+
+
+async def _collect(channel: RunEventChannel, cursor: int = 0, timeout: float = 5) -> list[tuple[int, str]]:
+    return [(seq, ev.stage or ev.event_type.value) async for seq, ev in channel.subscribe(cursor, timeout)]
+
+
+class TestRunEventChannel:
+    async def test_late_subscriber_replays_from_cursor(self):
+        channel = RunEventChannel()
+        for stage in ("scout", "draft", "critic"):
+            channel.publish(_event(stage))
+        channel.publish(_DONE)
+        assert await _collect(channel) == [
+            (0, "scout"), (1, "draft"), (2, "critic"), (3, "pipeline_completed"),
+        ]
+        assert await _collect(channel, cursor=2) == [(2, "critic"), (3, "pipeline_completed")]
+
+    async def test_live_events_pushed_to_all_subscribers(self):
+        channel = RunEventChannel()
+        subscribers = [asyncio.ensure_future(_collect(channel)) for _ in range(3)]
+        await asyncio.sleep(0)
+        channel.publish(_event("scout"))
+        await asyncio.sleep(0)
+        channel.publish(_DONE)
+        results = await asyncio.gather(*subscribers)
+        assert results == [[(0, "scout"), (1, "pipeline_completed")]] * 3
+
+    async def test_publish_from_another_thread_wakes_subscriber(self):
+        channel = RunEventChannel()
+
+        def _publish() -> None:
+            channel.publish(_event("draft"))
+            channel.publish(_DONE)
+
+        subscriber = asyncio.ensure_future(_collect(channel))
+        await asyncio.sleep(0)
+        threading.Thread(target=_publish).start()
+        assert await asyncio.wait_for(subscriber, timeout=5) == [
+            (0, "draft"), (1, "pipeline_completed"),
+        ]
+
+    async def test_retention_is_bounded(self):
+        channel = RunEventChannel(max_events=2)
+        for stage in ("a", "b", "c", "d"):
+            channel.publish(_event(stage))
+        channel.close()
+        assert [e.stage for e in channel.snapshot()] == ["c", "d"]
+        # A cursor that fell out of the window resumes at the oldest retained event
+        assert await _collect(channel, cursor=1) == [(2, "c"), (3, "d")]
+
+    async def test_timeout_ends_idle_subscription(self):
+        channel = RunEventChannel()
+        assert await _collect(channel, timeout=0.01) == []
+        assert channel._waiters == set()
+
+    async def test_close_releases_waiting_subscriber(self):
+        channel = RunEventChannel()
+        subscriber = asyncio.ensure_future(_collect(channel))
+        await asyncio.sleep(0)
+        channel.close()
+        assert await asyncio.wait_for(subscriber, timeout=1) == []
+
+
+class TestEventBus:
+    def test_publish_opens_channel_and_snapshot_reads_it(self):
+        bus = EventBus()
+        bus.publish("run-1", _event("scout"))
+        assert "run-1" in bus
+        assert [e.stage for e in bus.snapshot("run-1")] == ["scout"]
+        assert bus.snapshot("missing") == []
+
+    async def test_discard_ends_live_subscribers(self):
+        bus = EventBus()
+        channel = bus.open("run-1")
+        subscriber = asyncio.ensure_future(_collect(channel))
+        await asyncio.sleep(0)
+        bus.discard("run-1")
+        assert await asyncio.wait_for(subscriber, timeout=1) == []
+        assert "run-1" not in bus
+
+    def test_closed_channels_pruned_after_ttl(self):
+        bus = EventBus(closed_ttl_sec=0)
+        bus.open("old").publish(_DONE)
+        bus.open("new")
+        assert "old" not in bus
+        assert "new" in bus
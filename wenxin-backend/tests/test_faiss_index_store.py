@@ -0,0 +1,288 @@
+"""Tests for the on-disk FAISS index store and its use by FaissIndexService."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from app.prototype.tools.embedding_cache import EmbeddingCache
+from app.prototype.tools.faiss_index_service import FaissIndexService
+from app.prototype.tools.faiss_index_store import (
+    FaissIndexStore,
+    PartitionedIndex,
+    build_faiss_index,
+)
+from app.prototype.trajectory.trajectory_types import TrajectoryRecord
+
+
+def _unit(n: int, dim: int = 8, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal((n, dim)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _rows(n: int, start: int = 0) -> list[dict]:
+    return [{"id": f"d{i}", "tradition": "default", "text": f"t{i}"} for i in range(start, start + n)]
+
+
+class _FakeModel:
+    """Deterministic stand-in for SentenceTransformer that counts encoded texts."""
+
+    def __init__(self) -> None:
+        self.encoded = 0
+        self._slots: dict[str, int] = {}
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.encoded += len(texts)
+        out = np.zeros((len(texts), 16), dtype=np.float32)
+        for i, t in enumerate(texts):
+            out[i, self._slots.setdefault(t, len(self._slots)) % 16] = 1.0
+        return out
+
+
+class TestFaissIndexStore:
+    def test_content_key_changes_with_source(self, tmp_path):
+        src = tmp_path / "index.v1.json"
+        src.write_text('{"samples": []}')
+        k1 = FaissIndexStore.content_key(src, model_name="m")
+        assert k1 == FaissIndexStore.content_key(src, model_name="m")
+        assert k1 != FaissIndexStore.content_key(src, model_name="other")
+        src.write_text('{"samples": [1]}')
+        assert k1 != FaissIndexStore.content_key(src, model_name="m")
+
+    def test_save_then_load_roundtrip(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, enabled=True)
+        emb = _unit(20)
+        store.save("s", "k1", emb, _rows(20))
+
+        loaded = store.load("s", "k1")
+        assert loaded is not None
+        assert loaded.size == 20
+        assert loaded.column("id")[3] == "d3"
+        assert isinstance(loaded.segments[0], np.memmap)
+        _, idx = loaded.index.search(emb[5:6], 1)
+        assert idx[0][0] == 5
+
+    def test_load_with_stale_key_misses(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, enabled=True)
+        store.save("s", "k1", _unit(4), _rows(4))
+        assert store.load("s", "k2") is None
+
+    def test_append_writes_new_segment(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, enabled=True)
+        stored = store.save("t", "k", _unit(5), _rows(5))
+        store.append(stored, "t", _unit(3, seed=1), _rows(3, start=5))
+
+        loaded = store.load("t", "k")
+        assert loaded is not None
+        assert loaded.size == 8
+        assert len(loaded.segments) == 2
+        assert loaded.index.ntotal == 8
+        assert loaded.column("id")[-1] == "d7"
+
+    def test_append_defers_index_rewrite_until_flush(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, enabled=True, flush_rows=4)
+        stored = store.save("t", "k", _unit(5), _rows(5))
+        index_file = tmp_path / "t" / "index.faiss"
+        written = index_file.stat().st_mtime_ns
+        store.append(stored, "t", _unit(3, seed=1), _rows(3, start=5))
+        assert index_file.stat().st_mtime_ns == written
+        loaded = store.load("t", "k")
+        assert loaded.index.ntotal == 8
+        _, idx = loaded.index.search(_unit(3, seed=1)[2:3], 1)
+        assert idx[0][0] == 7
+
+        store.append(stored, "t", _unit(1, seed=2), _rows(1, start=8), key="k2")
+        assert faiss.read_index(str(index_file)).ntotal == 9
+        assert store.load("t", "k") is None
+        assert store.load("t", "k2").size == 9
+
+    def test_flush_writes_pending_rows(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, enabled=True, flush_rows=100)
+        stored = store.save("t", "k", _unit(5), _rows(5))
+        store.append(stored, "t", _unit(3, seed=1), _rows(3, start=5))
+        store.flush(stored, "t")
+        assert faiss.read_index(str(tmp_path / "t" / "index.faiss")).ntotal == 8
+        assert store.stored_ids("t")[-1] == "d7"
+
+    def test_disabled_store_never_writes(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path / "cache", enabled=False)
+        stored = store.save("s", "k", _unit(4), _rows(4))
+        assert stored.index.ntotal == 4
+        assert not (tmp_path / "cache").exists()
+        assert store.load("s", "k") is None
+
+    @pytest.mark.parametrize("kind,cls", [("hnsw", "IndexHNSWFlat"), ("ivf", "IndexIVFFlat")])
+    def test_ann_above_threshold(self, kind, cls):
+        emb = _unit(64)
+        index = build_faiss_index(faiss, emb, ann_threshold=32, ann_kind=kind)
+        assert type(index).__name__ == cls
+        assert index.ntotal == 64
+
+    def test_flat_below_threshold(self):
+        index = build_faiss_index(faiss, _unit(10), ann_threshold=32)
+        assert isinstance(index, faiss.IndexFlatIP)
+
+    def test_append_crossing_threshold_switches_to_ann(self, tmp_path):
+        store = FaissIndexStore(root=tmp_path, ann_threshold=16, enabled=True)
+        stored = store.save("t", "k", _unit(10), _rows(10))
+        assert isinstance(stored.index, faiss.IndexFlatIP)
+        store.append(stored, "t", _unit(10, seed=2), _rows(10, start=10))
+        assert isinstance(stored.index, faiss.IndexHNSWFlat)
+        assert stored.index.ntotal == 20
+
+
+class TestTrajectoryIncremental:
+    def _service(self, tmp_path, model):
+        svc = FaissIndexService(
+            store=FaissIndexStore(root=tmp_path, enabled=True),
+            embedding_cache=EmbeddingCache(),
+        )
+        svc._available = True
+        svc._initialized = True
+        svc._model = model
+        return svc
+
+    def test_warm_start_only_encodes_new_records(self, tmp_path):
+        records = [TrajectoryRecord(subject=f"s{i}", tradition="default") for i in range(4)]
+        first = _FakeModel()
+        assert self._service(tmp_path, first).build_trajectory_index(records) == 4
+        assert first.encoded == 4
+
+        records.append(TrajectoryRecord(subject="new", tradition="default"))
+        second = _FakeModel()
+        svc = self._service(tmp_path, second)
+        assert svc.build_trajectory_index(records) == 5
+        assert second.encoded == 1
+        assert [r.trajectory_id for r in svc._trajectory_records] == [
+            r.trajectory_id for r in records
+        ]
+
+    def test_add_trajectories_extends_index(self, tmp_path):
+        svc = self._service(tmp_path, _FakeModel())
+        svc.build_trajectory_index([TrajectoryRecord(subject="a")])
+        assert svc.add_trajectories([TrajectoryRecord(subject="b")]) == 1
+        assert svc._trajectory_index.ntotal == 2
+        assert len(svc.search_trajectories("b", top_k=2)) == 2
+
+
+    def test_edited_record_invalidates_cache(self, tmp_path):
+        records = [TrajectoryRecord(subject=f"s{i}", tradition="default") for i in range(3)]
+        self._service(tmp_path, _FakeModel()).build_trajectory_index(records)
+
+        records[1].subject = "edited"
+        model = _FakeModel()
+        assert self._service(tmp_path, model).build_trajectory_index(records) == 3
+        assert model.encoded == 3
+
+    def test_duplicate_ids_are_indexed_once(self, tmp_path):
+        a, b = TrajectoryRecord(subject="a"), TrajectoryRecord(subject="b")
+        svc = self._service(tmp_path, _FakeModel())
+        assert svc.build_trajectory_index([a, a]) == 1
+        assert svc.add_trajectories([a, b, b]) == 1
+        assert svc.add_trajectories([b]) == 0
+        assert svc._trajectory_index.ntotal == 2
+
+        model = _FakeModel()
+        assert self._service(tmp_path, model).build_trajectory_index([a, b]) == 2
+        assert model.encoded == 0
+
+
+class TestPartitionedIndex:
+    def _stored(self, tmp_path, traditions):
+        store = FaissIndexStore(root=tmp_path, enabled=False)
+        emb = _unit(len(traditions), seed=3)
+        rows = [{"id": f"d{i}", "tradition": t} for i, t in enumerate(traditions)]
+        return store, store.save("p", "k", emb, rows), emb
+
+    def test_rare_tradition_returns_full_top_k(self, tmp_path):
+        # 40 common vectors would crowd out the 3 rare ones under over-fetch-and-filter.
+        traditions = ["common"] * 40 + ["rare"] * 3 + ["default"] * 2
+        store, stored, emb = self._stored(tmp_path, traditions)
+        parts = PartitionedIndex(stored, store.build)
+
+        scores, ids = parts.search(emb[:1], "rare", top_k=5)
+        got = [traditions[i] for i in ids[0] if i >= 0]
+        assert len(got) == 5
+        assert set(got) == {"rare", "default"}
+        assert list(scores[0]) == sorted(scores[0], reverse=True)
+
+    def test_default_query_searches_everything(self, tmp_path):
+        traditions = ["a"] * 5 + ["b"] * 5
+        store, stored, emb = self._stored(tmp_path, traditions)
+        parts = PartitionedIndex(stored, store.build)
+        _, ids = parts.search(emb[7:8], "default", top_k=3)
+        assert ids[0][0] == 7
+
+    def test_unknown_tradition_falls_back_to_default_partition(self, tmp_path):
+        store, stored, emb = self._stored(tmp_path, ["a", "a", "default"])
+        parts = PartitionedIndex(stored, store.build)
+        _, ids = parts.search(emb[:1], "zzz", top_k=3)
+        assert [i for i in ids[0] if i >= 0] == [2]
+
+    def test_batched_queries(self, tmp_path):
+        store, stored, emb = self._stored(tmp_path, ["a"] * 6 + ["default"] * 2)
+        parts = PartitionedIndex(stored, store.build)
+        _, ids = parts.search(emb[:4], "a", top_k=1)
+        assert ids[:, 0].tolist() == [0, 1, 2, 3]
+
+
+class TestSearchMany:
+    def _service(self, tmp_path, model):
+        svc = FaissIndexService(
+            store=FaissIndexStore(root=tmp_path, enabled=False),
+            embedding_cache=EmbeddingCache(),
+        )
+        svc._available = True
+        svc._initialized = True
+        svc._clip_initialized = True
+        svc._model = model
+        texts = ["ink wash", "lotus pond", "mountain mist", "oil portrait"]
+        svc._sample_ids = [f"s{i}" for i in range(4)]
+        svc._sample_traditions = ["chinese_xieyi", "chinese_xieyi", "default", "western_academic"]
+        svc._sample_texts = texts
+        stored = svc._load_or_build(
+            "samples", tmp_path / "none.json", "fake", model,
+            svc._sample_ids, svc._sample_traditions, svc._sample_texts,
+        )
+        svc._sample_parts = PartitionedIndex(stored, svc._get_store().build)
+        return svc
+
+    def test_one_encode_for_all_queries(self, tmp_path):
+        model = _FakeModel()
+        svc = self._service(tmp_path, model)
+        model.encoded = 0
+        out = svc.search_many(["ink wash", "lotus pond", "ink wash"], ("samples",), "chinese_xieyi", top_k=2)
+        assert model.encoded == 2  # duplicates collapsed, one batch
+        assert len(out["samples"]) == 3
+        assert out["samples"][0][0].doc_id == "s0"
+        assert out["samples"][1][0].doc_id == "s1"
+        assert [h.doc_id for h in out["samples"][2]] == [h.doc_id for h in out["samples"][0]]
+        assert all(h.tradition != "western_academic" for hits in out["samples"] for h in hits)
+
+    def test_matches_single_query_api(self, tmp_path):
+        svc = self._service(tmp_path, _FakeModel())
+        batch = svc.search_many(["mountain mist"], ("samples",), "chinese_xieyi", top_k=3)
+        single = svc.search_samples("mountain mist", "chinese_xieyi", top_k=3)
+        assert [h.doc_id for h in batch["samples"][0]] == [h.doc_id for h in single]
+
+    def test_unavailable_kind_returns_empty_lists(self, tmp_path):
+        svc = self._service(tmp_path, _FakeModel())
+        out = svc.search_many(["x", "y"], ("terms", "visual"), "default")
+        assert out == {"terms": [[], []], "visual": [[], []]}
+
+    def test_unknown_kind_rejected(self, tmp_path):
+        svc = self._service(tmp_path, _FakeModel())
+        with pytest.raises(ValueError):
+            svc.search_many(["x"], ("images",))
+
+    def test_repeated_queries_served_from_cache(self, tmp_path):
+        model = _FakeModel()
+        svc = self._service(tmp_path, model)
+        model.encoded = 0
+        svc.search_samples("ink wash", "chinese_xieyi")
+        svc.search_many(["ink wash", "lotus pond"], ("samples",), "chinese_xieyi")
+        assert model.encoded == 2
+        assert svc._embedding_cache.stats()["hits"] == 1
@@ -27,8 +27,7 @@ import pytest_asyncio
 from fastapi import FastAPI
 
 from app.prototype.api.routes import (
-    _buffer_lock,
-    _event_buffers,
+    _event_bus,
     _guest_runs_today,
     _idempotency_map,
     _orchestrators,
@@ -56,7 +55,7 @@ async def client() -> AsyncIterator[httpx.AsyncClient]:
     """Isolated in-process API client per test."""
     _orchestrators.clear()
     _run_metadata.clear()
-    _event_buffers.clear()
+    _event_bus.clear()
     _idempotency_map.clear()
     _guest_runs_today.clear()
 
@@ -146,8 +145,7 @@ async def wait_for_human_required_event(
     """
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
-        with _buffer_lock:
-            buffer = list(_event_buffers.get(task_id, []))
+        buffer = _event_bus.snapshot(task_id)
         for i, ev in enumerate(buffer):
             if i < after_index:
                 continue
@@ -175,8 +173,7 @@ async def submit_action(
 
 async def collect_events(task_id: str) -> list[dict]:
     """Return all events currently in the buffer (non-blocking snapshot)."""
-    with _buffer_lock:
-        return [ev.to_dict() for ev in _event_buffers.get(task_id, [])]
+    return [ev.to_dict() for ev in _event_bus.snapshot(task_id)]
 
 
 async def approve_through_stages(
@@ -0,0 +1,171 @@
+"""Tests for the shared VLM image-preparation service (ImagePrep)."""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from app.prototype.tools.image_prep import ImagePrep, detect_mime
+
+
+def _png(size=(64, 32), mode="RGB", color=(200, 30, 30)) -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _decode(b64: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(b64)))
+
+
+class TestImagePrep:
+    def test_large_image_downscaled_to_max_edge(self):
+        prep = ImagePrep(max_edge=512)
+        data = _png((3000, 1000))
+        img = prep.prepare_bytes(data)
+        assert img.resized and img.mime_type == "image/jpeg"
+        assert (img.width, img.height) == (512, 171)
+        assert _decode(img.b64).size == (512, 171)
+        assert len(img.b64) < len(base64.b64encode(data))
+
+    def test_small_image_sent_unchanged(self):
+        prep = ImagePrep(max_edge=512)
+        data = _png((64, 32))
+        img = prep.prepare_bytes(data)
+        assert not img.resized
+        assert base64.b64decode(img.b64) == data
+        assert img.mime_type == "image/png" and (img.width, img.height) == (64, 32)
+
+    def test_webp_variant_keeps_alpha(self):
+        prep = ImagePrep(max_edge=100, fmt="webp")
+        img = prep.prepare_bytes(_png((400, 400), mode="RGBA", color=(0, 0, 255, 128)))
+        assert img.mime_type == "image/webp"
+        decoded = _decode(img.b64)
+        assert decoded.size == (100, 100) and decoded.mode == "RGBA"
+
+    def test_jpeg_variant_drops_alpha(self):
+        prep = ImagePrep(max_edge=100)
+        img = prep.prepare_bytes(_png((400, 400), mode="RGBA", color=(0, 0, 255, 128)))
+        assert _decode(img.b64).mode == "RGB"
+
+    def test_undecodable_bytes_fall_back_to_original(self):
+        prep = ImagePrep(max_edge=100)
+        data = b"\x89PNG not really an image"
+        img = prep.prepare_bytes(data)
+        assert base64.b64decode(img.b64) == data
+        assert img.mime_type == "image/png"
+
+    def test_same_content_encoded_once(self, tmp_path):
+        prep = ImagePrep(max_edge=256)
+        data = _png((1024, 1024))
+        a, b = tmp_path / "a.png", tmp_path / "b.png"
+        a.write_bytes(data)
+        b.write_bytes(data)
+        first = prep.prepare_path(a)
+        assert prep.prepare_path(a) is first
+        assert prep.prepare_path(b) is first
+        assert prep.prepare_bytes(data) is first
+        stats = prep.stats()
+        assert stats["misses"] == 1 and stats["hits"] == 3
+        assert stats["bytes_out"] < stats["bytes_in"]
+
+    def test_rewritten_file_is_re_prepared(self, tmp_path):
+        prep = ImagePrep(max_edge=256)
+        path = tmp_path / "c.png"
+        path.write_bytes(_png((32, 32), color=(1, 2, 3)))
+        first = prep.prepare_path(path)
+        path.write_bytes(_png((48, 48), color=(4, 5, 6)))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        second = prep.prepare_path(path)
+        assert second.digest != first.digest and second.width == 48
+
+    def test_lru_bound(self):
+        prep = ImagePrep(max_entries=2)
+        for color in ((1, 0, 0), (2, 0, 0), (3, 0, 0)):
+            prep.prepare_bytes(_png(color=color))
+        assert len(prep) == 2 and prep.stats()["evictions"] == 1
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ImagePrep().prepare_path(tmp_path / "missing.png")
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            ImagePrep(fmt="gif")
+
+
+def test_detect_mime():
+    assert detect_mime(b"\xff\xd8\xff\xe0") == "image/jpeg"
+    assert detect_mime(b"RIFF\x00\x00\x00\x00WEBP") == "image/webp"
+    assert detect_mime(b"????", ".jpg") == "image/jpeg"
+    assert detect_mime(b"????") == "image/png"
+
+
+def test_call_sites_share_one_payload(tmp_path):
+    from app.prototype.agents.agent_runtime import AgentRuntime
+    from app.prototype.agents.agentic_vision import _load_image_b64
+    from app.prototype.agents.vlm_critic import VLMCritic
+
+    path = tmp_path / "candidate.png"
+    path.write_bytes(_png((4000, 3000)))
+    b64, mime = VLMCritic._encode_image(str(path))
+    assert (b64, mime) == _load_image_b64(str(path))
+    block = AgentRuntime._encode_image_content(str(path))
+    assert block["image_url"]["url"] == f"data:{mime};base64,{b64}"
+    assert max(_decode(b64).size) <= 1536
+
+
+async def test_vulca_loader_uses_registered_prep(tmp_path):
+    from vulca._image import load_image_base64, register_image_prep
+
+    path = tmp_path / "candidate.png"
+    data = _png((2000, 1000))
+    path.write_bytes(data)
+    register_image_prep(ImagePrep(max_edge=256))
+    try:
+        b64, mime = await load_image_base64(str(path))
+        assert mime == "image/jpeg" and _decode(b64).size == (256, 128)
+    finally:
+        register_image_prep(None)
+    assert await load_image_base64(str(path)) == (base64.b64encode(data).decode(), "image/png")
+
+
+async def test_runtime_encodes_image_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+    from types import SimpleNamespace
+
+    from app.prototype.agents.agent_runtime import AgentContext, AgentRuntime
+    from app.prototype.agents.layer_state import LayerState
+    from app.prototype.agents.tool_registry import ToolRegistry
+
+    path = tmp_path / "candidate.png"
+    path.write_bytes(_png())
+    router = SimpleNamespace(
+        select_model=lambda layer_id, requires_vlm=False: SimpleNamespace(litellm_id="m", cost_per_call_usd=0.0),
+        record_cost=lambda cost: None,
+    )
+    runtime = AgentRuntime(tool_registry=ToolRegistry(), model_router=router, max_steps=1)
+    encode = AgentRuntime._encode_image_content
+    threads = []
+
+    def _spy(image_url):
+        threads.append(threading.get_ident())
+        return encode(image_url)
+
+    async def fake_call_llm(model_spec, messages, tools=None, tool_choice="auto"):
+        return None
+
+    monkeypatch.setattr(AgentRuntime, "_encode_image_content", staticmethod(_spy))
+    monkeypatch.setattr(runtime, "_call_llm", fake_call_llm)
+    ctx = AgentContext(
+        task_id="t", layer_id="visual_perception", layer_label="L1", subject="s",
+        cultural_tradition="default", candidate_summary="", evidence_summary="",
+        layer_state=LayerState(), image_url=str(path),
+    )
+    await runtime.evaluate(ctx)
+    await runtime.evaluate_batch([ctx])
+    assert len(threads) == 2 and threading.get_ident() not in threads
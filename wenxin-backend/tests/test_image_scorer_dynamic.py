@@ -172,3 +172,183 @@ class TestImageScorerLoadFailed:
 
         assert scorer._load_failed is True
         assert scorer._model is None
+
+
+class _FakeClip:
+    """Stand-in CLIP model: records text and image encode calls separately."""
+
+    def __init__(self):
+        self.text_calls: list[list[str]] = []
+        self.image_calls: list[int] = []
+
+    def encode(self, x, convert_to_numpy=True, batch_size=None):
+        import numpy as np
+
+        if isinstance(x, list) and x and isinstance(x[0], str):
+            self.text_calls.append(list(x))
+            return np.ones((len(x), 4), dtype=np.float32)
+        if isinstance(x, list):
+            self.image_calls.append(len(x))
+            # Vary per image by brightness so rows are distinguishable
+            return np.array(
+                [[1.0, 1.0, 1.0, 1.0 + img.getpixel((0, 0))[0] / 255.0] for img in x],
+                dtype=np.float32,
+            )
+        self.image_calls.append(1)
+        return np.ones(4, dtype=np.float32)
+
+
+def _scorer_with(model):
+    scorer = ImageScorer()
+    scorer._model = model
+    scorer._available = True
+    return scorer
+
+
+def _write_images(tmp_path, n):
+    from PIL import Image
+
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"c{i}.png"
+        Image.new("RGB", (8, 8), (40 * i, 0, 0)).save(p)
+        paths.append(str(p))
+    return paths
+
+
+class TestImageScorerReferenceCache:
+    """Reference texts are precomputed at model load and never re-encoded."""
+
+    def test_score_image_needs_no_text_encode_after_warmup(self, tmp_path):
+        from app.prototype.tools.embedding_cache import EmbeddingCache
+
+        model = _FakeClip()
+        scorer = _scorer_with(model)
+        img_path = _write_images(tmp_path, 1)[0]
+
+        cache = EmbeddingCache()
+        with patch("app.prototype.agents.image_scorer.get_embedding_cache", return_value=cache):
+            scorer._warm_reference_embeddings()
+            assert len(model.text_calls) == 1
+            result = scorer.score_image(img_path, "subject", "chinese_xieyi")
+
+        assert result is not None
+        assert result["_L1_raw"] == 1.0
+        assert len(model.text_calls) == 1  # no text pass during scoring
+        assert cache.stats()["hits"] == 4
+
+
+class TestBatchedImageScoring:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        from app.prototype.tools.embedding_cache import EmbeddingCache
+
+        with patch("app.prototype.agents.image_scorer.get_embedding_cache", return_value=EmbeddingCache()):
+            yield
+
+    def test_one_forward_pass_for_all_candidates(self, tmp_path):
+        model = _FakeClip()
+        scorer = _scorer_with(model)
+        paths = _write_images(tmp_path, 4)
+
+        results = scorer.score_images(paths, "chinese_xieyi")
+        assert model.image_calls == [4]
+        assert len(model.text_calls) == 1
+        assert all(r is not None for r in results)
+        # Different images give different L5 similarities
+        assert len({r["_L5_raw"] for r in results}) == 4
+
+    def test_matches_single_image_scoring(self, tmp_path):
+        paths = _write_images(tmp_path, 3)
+        batch = _scorer_with(_FakeClip()).score_images(paths, "default")
+        single = [_scorer_with(_FakeClip()).score_image(p, "", "default") for p in paths]
+        assert batch == single
+
+    def test_memoized_across_calls(self, tmp_path):
+        model = _FakeClip()
+        scorer = _scorer_with(model)
+        paths = _write_images(tmp_path, 2)
+        scorer.score_images(paths, "default")
+        scorer.score_image(paths[1], "", "default")
+        assert model.image_calls == [2]
+
+    def test_missing_image_yields_none(self, tmp_path):
+        scorer = _scorer_with(_FakeClip())
+        paths = _write_images(tmp_path, 1) + [str(tmp_path / "missing.png")]
+        results = scorer.score_images(paths, "default")
+        assert results[0] is not None
+        assert results[1] is None
+
+    def test_concurrent_callers_share_in_flight_batch(self, tmp_path):
+        import threading
+
+        started, release = threading.Event(), threading.Event()
+
+        class _SlowClip(_FakeClip):
+            def encode(self, x, convert_to_numpy=True, batch_size=None):
+                if isinstance(x, list) and x and not isinstance(x[0], str):
+                    started.set()
+                    release.wait(5)
+                return super().encode(x, convert_to_numpy, batch_size)
+
+        model = _SlowClip()
+        scorer = _scorer_with(model)
+        paths = _write_images(tmp_path, 3)
+        out: dict[str, list] = {}
+        first = threading.Thread(target=lambda: out.update(a=scorer.score_images(paths[:2], "default")))
+        first.start()
+        assert started.wait(5)
+
+        # The forward pass does not hold the lock that batch registration needs
+        scorer.register_batch(paths, "default")
+        assert scorer.batch_for(paths[0], "default") == paths
+
+        second = threading.Thread(target=lambda: out.update(b=scorer.score_images(paths, "default")))
+        second.start()
+        second.join(0.2)
+        assert second.is_alive()  # waiting on the first batch for paths[1]
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert sorted(model.image_calls) == [1, 2]  # paths[1] encoded once
+        assert out["b"][:2] == out["a"]
+
+    def test_blend_uses_registered_batch(self, tmp_path):
+        from app.prototype.agents.critic_rules import CriticRules
+        from app.prototype.agents.critic_types import DimensionScore
+
+        model = _FakeClip()
+        scorer = _scorer_with(model)
+        paths = _write_images(tmp_path, 3)
+        scores = [DimensionScore(dimension=f"d{i}", score=0.5, rationale="r") for i in range(5)]
+
+        with patch.object(ImageScorer, "get", return_value=scorer):
+            CriticRules.register_image_batch(
+                [{"image_path": p} for p in paths], "default",
+            )
+            for p in paths:
+                blended = CriticRules._blend_image_scores(scores, p, "subject", "default")
+                assert "CLIP_L1" in blended[0].rationale
+
+        assert model.image_calls == [3]
+
+    def test_multi_candidate_critique_succeeds(self):
+        import time
+
+        from app.prototype.agents.critic_agent import build_critique_output
+        from app.prototype.agents.critic_config import CriticConfig
+        from app.prototype.agents.critic_types import DimensionScore
+
+        def score_fn(**kwargs):
+            return [DimensionScore(dimension="visual_perception", score=0.8, rationale="r")]
+
+        candidates = [
+            {"candidate_id": f"c{i}", "image_path": f"/nonexistent/{i}.png"} for i in range(2)
+        ]
+        with patch("app.prototype.agents.critic_agent.save_critic_checkpoint"):
+            output = build_critique_output(
+                "t", candidates, {}, "default", "s", CriticConfig(), score_fn, time.monotonic(),
+            )
+        assert output.success
+        assert output.scored_candidates
@@ -0,0 +1,225 @@
+"""Tests for incremental (delta) digestion: store watermarks, running aggregates, evolver."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.prototype.digestion.aggregator import DigestAggregator
+from app.prototype.digestion.context_evolver import ContextEvolver
+from app.prototype.digestion.preference_learner import PreferenceLearner
+from app.prototype.digestion.running_aggregates import RunningAggregates
+from app.prototype.digestion.snapshot import DigestSnapshot
+from app.prototype.session.store import SessionStore
+from app.prototype.session.types import SessionDigest
+
+
+def _digest(i: int, tradition: str = "chinese_xieyi") -> SessionDigest:
+    return SessionDigest(
+        session_id=f"s{i}",
+        mode="create" if i % 2 else "evaluate",
+        tradition=tradition,
+        final_scores={"L1": 0.2 + 0.05 * (i % 4), "L5": 0.85},
+        final_weighted_total=0.6,
+        feedback=[{"rating": "thumbs_down" if i % 3 else "thumbs_up"}],
+        time_to_select_ms=40000 if i % 5 == 0 else 0,
+    )
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return SessionStore(str(tmp_path / "sessions.jsonl"))
+
+
+class TestStoreSince:
+    def test_returns_only_appended_sessions(self, store):
+        store.append(_digest(0))
+        first = store.since(None)
+        assert not first.is_delta and [r["session_id"] for r in first.records] == ["s0"]
+
+        store.append(_digest(1))
+        store.append(_digest(2))
+        delta = store.since(first.watermark)
+        assert delta.is_delta
+        assert [r["session_id"] for r in delta.records] == ["s1", "s2"]
+        assert store.since(delta.watermark).records == []
+
+    def test_update_of_covered_session_is_a_delta(self, store):
+        store.append(_digest(0))
+        store.append(_digest(1))
+        mark = store.since(None).watermark
+        store.update("s0", subject="changed")
+        store.update("s0", subject="changed again")
+        delta = store.since(mark)
+        assert delta.is_delta and delta.records == []
+        assert [r["subject"] for r in delta.updated] == ["changed again"]
+        assert [r.get("subject", "") for r in delta.replaced] == [""]
+        assert store.since(delta.watermark).updated == []
+
+    def test_pruned_revisions_invalidate_watermark(self, store, monkeypatch):
+        monkeypatch.setattr("app.prototype.session.index._MAX_REVISIONS", 1)
+        store.append(_digest(0))
+        mark = store.since(None).watermark
+        store.update("s0", subject="a")
+        store.update("s0", subject="b")
+        full = store.since(mark)
+        assert not full.is_delta and full.updated == []
+        assert full.records[0]["subject"] == "b"
+
+    def test_update_of_unread_session_keeps_delta(self, store):
+        store.append(_digest(0))
+        mark = store.since(None).watermark
+        store.append(_digest(1))
+        store.update("s1", subject="backfilled")
+        delta = store.since(mark)
+        assert delta.is_delta
+        assert [r["subject"] for r in delta.records] == ["backfilled"]
+
+    def test_external_rewrite_invalidates_watermark(self, store, tmp_path):
+        store.append(_digest(0))
+        mark = store.since(None).watermark
+        path = tmp_path / "sessions.jsonl"
+        path.write_text(path.read_text().replace('"s0"', '"s9"'))
+        full = store.since(mark)
+        assert not full.is_delta and full.records[0]["session_id"] == "s9"
+
+
+class TestRunningAggregates:
+    def test_batched_folds_match_full_aggregation(self, tmp_path):
+        sessions = [_digest(i).to_dict() for i in range(12)]
+        sessions += [_digest(i, "watercolor").to_dict() for i in range(12, 15)]
+        path = tmp_path / "agg.json"
+
+        running = RunningAggregates(path)
+        running.fold(DigestSnapshot.from_sessions(sessions[:5]))
+        running.watermark = "w1"
+        running.save()
+        running = RunningAggregates.load(path)
+        assert running.watermark == "w1"
+        running.fold(DigestSnapshot.from_sessions(sessions[5:]))
+
+        full = DigestSnapshot.from_sessions(sessions)
+        expected = DigestAggregator().aggregate(full)
+        assert {k: v.to_dict() for k, v in running.tradition_stats().items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+        profiles = {k: v.to_dict() for k, v in running.preference_profiles().items()}
+        assert profiles == {k: v.to_dict() for k, v in PreferenceLearner().learn(full).items()}
+        assert running.session_count == 15
+
+    def test_unfold_of_old_version_matches_full_aggregation(self):
+        sessions = [_digest(i).to_dict() for i in range(6)]
+        running = RunningAggregates().fold(DigestSnapshot.from_sessions(sessions))
+        updated = {**sessions[2], "tradition": "watercolor", "feedback": [{"rating": "thumbs_up"}]}
+        running.unfold(DigestSnapshot.from_sessions([sessions[2]]))
+        running.fold(DigestSnapshot.from_sessions([updated]))
+
+        full = DigestSnapshot.from_sessions([*sessions[:2], updated, *sessions[3:]])
+        expected = DigestAggregator().aggregate(full)
+        stats = running.tradition_stats()
+        assert stats.keys() == expected.keys()
+        for tradition, want in expected.items():
+            got, want = stats[tradition].to_dict(), want.to_dict()
+            for key in ("avg_scores_by_dim", "std_scores_by_dim"):
+                assert got.pop(key) == pytest.approx(want.pop(key), abs=1e-6)
+            assert got == want
+        profiles = {k: v.to_dict() for k, v in running.preference_profiles().items()}
+        assert profiles == {k: v.to_dict() for k, v in PreferenceLearner().learn(full).items()}
+
+    def test_std_from_sums_of_squares(self):
+        sessions = [{"tradition": "t", "final_scores": {"L1": v}} for v in (0.2, 0.4, 0.6)]
+        stats = RunningAggregates().fold(DigestSnapshot.from_sessions(sessions)).tradition_stats()
+        assert stats["t"].std_scores_by_dim["L1"] == pytest.approx(np.std([0.2, 0.4, 0.6]))
+
+
+def test_snapshot_concat_matches_single_build():
+    sessions = [_digest(i).to_dict() for i in range(4)]
+    sessions.append({"tradition": "watercolor", "final_scores": {"L2": 0.5}})
+    merged = DigestSnapshot.from_sessions(sessions[:3]).concat(DigestSnapshot.from_sessions(sessions[3:]))
+    whole = DigestSnapshot.from_sessions(sessions)
+    assert merged.sessions == whole.sessions
+    assert {t: r.tolist() for t, r in merged.tradition_groups.items()} == {
+        t: r.tolist() for t, r in whole.tradition_groups.items()
+    }
+    for dim in whole.dim_scores:
+        np.testing.assert_array_equal(merged.dim_scores[dim], whole.dim_scores[dim])
+    np.testing.assert_array_equal(merged.thumbs_down, whole.thumbs_down)
+
+
+def test_snapshot_replace_matches_single_build():
+    sessions = [_digest(i).to_dict() for i in range(4)]
+    updated = {**sessions[1], "final_scores": {"L3": 0.4}, "feedback": [{"rating": "thumbs_up"}]}
+    replaced = DigestSnapshot.from_sessions(sessions).replace([updated, {"session_id": "unknown"}])
+    whole = DigestSnapshot.from_sessions([sessions[0], updated, *sessions[2:]])
+    assert replaced.sessions == whole.sessions
+    for dim in whole.dim_scores:
+        np.testing.assert_array_equal(replaced.dim_scores[dim], whole.dim_scores[dim])
+    np.testing.assert_array_equal(replaced.thumbs_up, whole.thumbs_up)
+    assert {t: r.tolist() for t, r in replaced.tradition_groups.items()} == {
+        t: r.tolist() for t, r in whole.tradition_groups.items()
+    }
+
+
+class TestIncrementalEvolver:
+    def test_folds_only_new_sessions_and_skips_idle_cycles(self, store, tmp_path, monkeypatch):
+        for i in range(6):
+            store.append(_digest(i))
+        evolver = ContextEvolver(store=store, context_path=str(tmp_path / "ctx.json"), incremental=True)
+
+        first = evolver.evolve()
+        assert first.skipped_reason == ""
+        assert (tmp_path / "digest_aggregates.json").exists()
+
+        idle = evolver.evolve()
+        assert idle.skipped_reason == "No new sessions since last digestion"
+
+        folded: list[int] = []
+        original_fold = RunningAggregates.fold
+
+        def _spy(self, snapshot):
+            folded.append(len(snapshot))
+            return original_fold(self, snapshot)
+
+        monkeypatch.setattr(RunningAggregates, "fold", _spy)
+        store.append(_digest(6))
+        store.append(_digest(7))
+        second = evolver.evolve()
+        assert second.skipped_reason == ""
+        assert folded == [2]
+        assert len(evolver.snapshot) == 8
+
+    def test_refresh_snapshot_reuses_unchanged_snapshot(self, store, tmp_path):
+        store.append(_digest(0))
+        evolver = ContextEvolver(store=store, context_path=str(tmp_path / "ctx.json"), incremental=True)
+        snap = evolver.refresh_snapshot()
+        assert evolver.refresh_snapshot() is snap
+        store.append(_digest(1))
+        assert [s["session_id"] for s in evolver.refresh_snapshot().sessions] == ["s0", "s1"]
+
+    def test_feedback_update_is_applied_as_a_delta(self, store, tmp_path, monkeypatch):
+        for i in range(6):
+            store.append(_digest(i))
+        evolver = ContextEvolver(store=store, context_path=str(tmp_path / "ctx.json"), incremental=True)
+        evolver.evolve()
+        snap = evolver.snapshot
+
+        built: list[int] = []
+        original = DigestSnapshot.from_sessions.__func__
+
+        def _spy(cls, sessions, *args, **kwargs):
+            sessions = list(sessions)
+            built.append(len(sessions))
+            return original(cls, sessions, *args, **kwargs)
+
+        monkeypatch.setattr(RunningAggregates, "reset", lambda self: pytest.fail("full refold"))
+        monkeypatch.setattr(DigestSnapshot, "from_sessions", classmethod(_spy))
+        store.update("s1", feedback=[{"rating": "thumbs_up"}], downloaded=True)
+        result = evolver.evolve()
+        assert result.skipped_reason == ""
+        assert max(built) == 1  # only the changed session was parsed, never all six
+        assert evolver.snapshot.sessions[1]["downloaded"] and len(evolver.snapshot) == len(snap)
+
+        running = RunningAggregates.load(tmp_path / "digest_aggregates.json")
+        full = DigestSnapshot.from_sessions(store.get_all())
+        profiles = {k: v.to_dict() for k, v in running.preference_profiles().items()}
+        assert profiles == {k: v.to_dict() for k, v in PreferenceLearner().learn(full).items()}
@@ -0,0 +1,113 @@
+"""Tests for the in-memory TTL + LRU cache (app.services.cache)."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services import cache as cache_module
+from app.services.cache import InMemoryCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+async def test_entries_expire_after_ttl(clock):
+    c = InMemoryCache()
+    await c.set("a", 1, expire=10)
+    await c.set("b", 2, expire=0)
+    clock.now += 9
+    assert await c.get("a") == 1
+    clock.now += 1
+    assert await c.get("a") is None
+    assert not await c.exists("a")
+    assert await c.get("b") == 2
+    assert c.stats()["expirations"] == 1
+
+
+async def test_reset_replaces_previous_deadline(clock):
+    c = InMemoryCache()
+    await c.set("k", "old", expire=5)
+    await c.set("k", "new", expire=60)
+    clock.now += 10
+    assert await c.get("k") == "new"
+
+    await c.set("k", "forever", expire=0)
+    clock.now += 100
+    assert await c.get("k") == "forever"
+
+
+async def test_expiry_only_touches_expired_entries(clock):
+    c = InMemoryCache()
+    for i in range(500):
+        await c.set(f"long:{i}", i, expire=3600)
+    await c.set("short", 0, expire=1)
+    assert len(c._expiry_heap) == 501
+    clock.now += 2
+    assert await c.get("long:0") == 0
+    # Only the expired deadline was popped; the rest stay queued untouched
+    assert len(c._expiry_heap) == 500
+    assert c.stats()["size"] == 500
+
+
+async def test_superseded_deadlines_are_compacted(clock):
+    c = InMemoryCache()
+    for _ in range(200):
+        await c.set("k", 1, expire=3600)
+    assert len(c._expiry_heap) <= 2 * 1 + 64 + 1
+
+
+async def test_lru_eviction_past_max_size():
+    c = InMemoryCache(max_size=2)
+    await c.set("a", 1)
+    await c.set("b", 2)
+    assert await c.get("a") == 1  # "b" is now least recently used
+    await c.set("c", 3)
+    assert await c.keys() == ["a", "c"]
+    assert c.stats()["evictions"] == 1
+
+
+async def test_keys_glob_patterns():
+    c = InMemoryCache()
+    for key in ("rankings:model:1", "rankings:model:2", "rankings:all", "abc", "axc"):
+        await c.set(key, key)
+    assert sorted(await c.keys("rankings:model:*")) == ["rankings:model:1", "rankings:model:2"]
+    assert sorted(await c.keys("a?c")) == ["abc", "axc"]
+    assert await c.keys("abc") == ["abc"]
+    assert await c.keys("missing") == []
+    assert len(await c.keys()) == 5
+
+
+async def test_values_are_isolated_from_callers():
+    c = InMemoryCache()
+    value = {"scores": [1, 2]}
+    await c.set("k", value)
+    value["scores"].append(3)
+    got = await c.get("k")
+    assert got == {"scores": [1, 2]}
+    got["scores"].clear()
+    assert await c.get("k") == {"scores": [1, 2]}
+
+
+async def test_stats_and_delete():
+    c = InMemoryCache()
+    await c.set("k", 1)
+    await c.get("k")
+    await c.get("missing")
+    assert await c.delete("k")
+    assert not await c.delete("k")
+    stats = c.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["sets"] == 1 and stats["size"] == 0
@@ -0,0 +1,129 @@
+"""Tests for the record/replay LLM transport (cassettes)."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import litellm
+import pytest
+
+from app.prototype.agents import llm_cassette
+from app.prototype.agents.llm_cassette import Cassette, CassetteMiss, get_cassette, install_cassette
+from app.prototype.agents.llm_gateway import LLMGateway
+
+
+def _response(text: str):
+    return litellm.ModelResponse(
+        model="gemini/gemini-2.5-flash",
+        choices=[{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}],
+    )
+
+
+def _req(text: str = "score this"):
+    return {"model": "gemini/gemini-2.5-flash", "messages": [{"role": "user", "content": text}], "temperature": 0.1}
+
+
+@pytest.fixture()
+def live(monkeypatch):
+    calls = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        return _response(f"live:{kwargs['messages'][0]['content']}")
+
+    def completion(**kwargs):
+        calls.append(kwargs)
+        return _response(f"sync:{kwargs['messages'][0]['content']}")
+
+    monkeypatch.setattr(litellm, "acompletion", acompletion)
+    monkeypatch.setattr(litellm, "completion", completion)
+    return calls
+
+
+@pytest.fixture()
+def installed():
+    previous = install_cassette(None)
+    yield install_cassette
+    install_cassette(previous)
+
+
+async def test_record_then_replay_offline(tmp_path, live, installed, monkeypatch):
+    installed(Cassette(tmp_path, mode="record"))
+    recorded = await LLMGateway().acompletion(**_req(), api_key="secret")
+    assert len(live) == 1
+    assert "secret" not in next(tmp_path.iterdir()).read_text()
+
+    async def offline(**kwargs):
+        raise AssertionError("network used during replay")
+
+    monkeypatch.setattr(litellm, "acompletion", offline)
+    cassette = Cassette(tmp_path)
+    installed(cassette)
+    replayed = await LLMGateway().acompletion(**_req(), api_key="other", timeout=5)
+    assert replayed.choices[0].message.content == recorded.choices[0].message.content == "live:score this"
+    assert cassette.stats()["hits"] == 1
+
+
+async def test_replay_miss_raises(tmp_path, live, installed):
+    installed(Cassette(tmp_path))
+    with pytest.raises(CassetteMiss):
+        await LLMGateway().acompletion(**_req("never recorded"))
+    assert live == []
+
+
+async def test_recorded_latency_is_replayed(tmp_path, live, installed, monkeypatch):
+    installed(Cassette(tmp_path, mode="record"))
+    await LLMGateway().acompletion(**_req())
+    path = next(tmp_path.iterdir())
+    entry = json.loads(path.read_text())
+    path.write_text(json.dumps({**entry, "latency_ms": 50.0}))
+
+    installed(Cassette(tmp_path, latency="recorded"))
+    t0 = time.monotonic()
+    await LLMGateway().acompletion(**_req())
+    assert time.monotonic() - t0 >= 0.045
+
+    installed(Cassette(tmp_path, latency=0.0))
+    t0 = time.monotonic()
+    await LLMGateway().acompletion(**_req())
+    assert time.monotonic() - t0 < 0.045
+
+
+def test_blocking_completion_round_trip(tmp_path, live, installed):
+    installed(Cassette(tmp_path, mode="record"))
+    LLMGateway().completion(**_req("queen"))
+    installed(Cassette(tmp_path))
+    assert LLMGateway().completion(**_req("queen")).choices[0].message.content == "sync:queen"
+    assert len(live) == 1
+
+
+def test_nb2_images_replay(tmp_path, installed, monkeypatch):
+    from app.prototype.agents.nb2_provider import NB2Provider
+
+    provider = NB2Provider(api_key="k")
+    monkeypatch.setattr(provider, "_call_api", lambda *a: (b"\x89PNG fake", "thoughts"))
+    installed(Cassette(tmp_path, mode="record"))
+    provider.generate("ink bamboo", "", 0, 1024, 1024, 20, "", str(tmp_path / "out" / "a.png"))
+
+    def offline(*a):
+        raise AssertionError("network used during replay")
+
+    monkeypatch.setattr(provider, "_call_api", offline)
+    installed(Cassette(tmp_path))
+    out = provider.generate("ink bamboo", "", 0, 1024, 1024, 20, "", str(tmp_path / "out" / "b.png"))
+    assert (tmp_path / "out" / "b.png").read_bytes() == b"\x89PNG fake"
+    assert out.endswith("b.png")
+
+
+def test_configured_from_env(tmp_path, installed, monkeypatch):
+    monkeypatch.setenv("VULCA_LLM_CASSETTE", str(tmp_path))
+    monkeypatch.setenv("VULCA_LLM_REPLAY_LATENCY", "250")
+    monkeypatch.setattr(llm_cassette, "_cassette_loaded", False)
+    cassette = get_cassette()
+    assert cassette.mode == "replay" and cassette.latency == 0.25
+
+
+def test_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(tmp_path, mode="rewind")
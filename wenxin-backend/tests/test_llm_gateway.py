@@ -0,0 +1,164 @@
+"""Tests for the LLM gateway (caching, coalescing, per-provider limits)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import litellm
+import pytest
+
+from app.prototype.agents.llm_gateway import LLMGateway, provider_of, request_key
+
+
+def _response(text: str = "ok", finish_reason: str = "stop"):
+    return SimpleNamespace(choices=[
+        SimpleNamespace(message=SimpleNamespace(content=text), finish_reason=finish_reason),
+    ])
+
+
+class _FakeLLM:
+    """Stand-in for ``litellm.acompletion`` that records concurrency."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.finish_reason = "stop"
+        self.calls: list[dict] = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("provider error")
+            return _response(kwargs["messages"][0]["content"], self.finish_reason)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture()
+def fake(monkeypatch):
+    llm = _FakeLLM()
+    monkeypatch.setattr(litellm, "acompletion", llm)
+    return llm
+
+
+def _req(text: str = "hi", **extra):
+    return {"model": "gemini/gemini-2.5-flash", "messages": [{"role": "user", "content": text}], **extra}
+
+
+async def test_uncached_by_default(fake):
+    gw = LLMGateway()
+    await gw.acompletion(**_req())
+    await gw.acompletion(**_req())
+    assert len(fake.calls) == 2
+    assert fake.calls[0]["timeout"] == 60
+
+
+async def test_cached_request_hits(fake):
+    gw = LLMGateway()
+    first = await gw.acompletion(cache=True, **_req(temperature=0.1))
+    second = await gw.acompletion(cache=True, **_req(temperature=0.1))
+    assert second is first and len(fake.calls) == 1
+    await gw.acompletion(cache=True, **_req(temperature=0.2))
+    assert len(fake.calls) == 2
+    assert gw.stats()["cache_hits"] == 1
+
+
+async def test_concurrent_identical_requests_coalesce(fake):
+    fake.delay = 0.02
+    gw = LLMGateway()
+    results = await asyncio.gather(*(gw.acompletion(cache=True, **_req()) for _ in range(5)))
+    assert len(fake.calls) == 1
+    assert all(r is results[0] for r in results)
+    assert gw.stats()["coalesced"] == 4
+
+
+async def test_errors_are_not_cached(fake):
+    fake.fail = True
+    gw = LLMGateway()
+    with pytest.raises(RuntimeError):
+        await gw.acompletion(cache=True, **_req())
+    fake.fail = False
+    assert (await gw.acompletion(cache=True, **_req())).choices
+    assert len(fake.calls) == 2 and gw.stats()["errors"] == 1
+
+
+@pytest.mark.parametrize(("text", "finish_reason"), [("", "stop"), ("cut off", "length")])
+async def test_incomplete_answers_are_not_cached(fake, text, finish_reason):
+    fake.finish_reason = finish_reason
+    gw = LLMGateway()
+    await gw.acompletion(cache=True, **_req(text))
+    await gw.acompletion(cache=True, **_req(text))
+    assert len(fake.calls) == 2 and gw.stats()["cache_size"] == 0
+
+
+async def test_cache_expires(fake, monkeypatch):
+    from app.prototype.agents import llm_gateway
+
+    now = [100.0]
+    monkeypatch.setattr(llm_gateway.time, "monotonic", lambda: now[0])
+    gw = LLMGateway(cache_ttl=10)
+    await gw.acompletion(cache=True, **_req())
+    now[0] += 10
+    await gw.acompletion(cache=True, **_req())
+    assert len(fake.calls) == 2
+
+
+async def test_provider_concurrency_limit(fake):
+    fake.delay = 0.01
+    gw = LLMGateway(concurrency=2, provider_concurrency={"openai": 1})
+    await asyncio.gather(*(gw.acompletion(**_req(str(i))) for i in range(6)))
+    assert fake.peak == 2
+    fake.peak = 0
+    await asyncio.gather(*(gw.acompletion(model="gpt-4o", messages=[{"content": str(i)}]) for i in range(3)))
+    assert fake.peak == 1
+    assert gw.stats()["in_flight"] == {"gemini": 0, "openai": 0}
+
+
+def test_limit_holds_across_event_loops(fake):
+    fake.delay = 0.02
+    gw = LLMGateway(concurrency=1)
+    peak = []
+
+    async def run(i):
+        await gw.acompletion(**_req(str(i)))
+        peak.append(fake.peak)
+
+    threads = [threading.Thread(target=asyncio.run, args=(run(i),)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(fake.calls) == 3 and max(peak) == 1
+
+
+async def test_cancelled_waiter_releases_its_place(fake):
+    fake.delay = 0.02
+    gw = LLMGateway(concurrency=1)
+    running = asyncio.ensure_future(gw.acompletion(**_req("a")))
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(gw.acompletion(**_req("b")))
+    await asyncio.sleep(0)
+    queued.cancel()
+    await running
+    assert (await gw.acompletion(**_req("c"))).choices
+    assert gw.limit_for("gemini").active == 0
+
+
+def test_request_key_ignores_transport_arguments():
+    base = _req(temperature=0.1)
+    assert request_key(base) == request_key({**base, "api_key": "k", "timeout": 5, "api_base": None})
+    assert request_key(base) != request_key({**base, "temperature": 0.2})
+
+
+def test_provider_of():
+    assert provider_of("gemini/gemini-2.5-pro") == "gemini"
+    assert provider_of("Anthropic/claude") == "anthropic"
+    assert provider_of("gpt-4o") == "openai"
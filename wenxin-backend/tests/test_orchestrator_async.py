@@ -0,0 +1,223 @@
+"""Tests for the async-native PipelineOrchestrator.arun_stream driver."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.prototype.agents.critic_config import CriticConfig
+from app.prototype.agents.draft_config import DraftConfig
+from app.prototype.agents.queen_config import QueenConfig
+from app.prototype.orchestrator.events import EventType
+from app.prototype.orchestrator.orchestrator import PipelineOrchestrator
+from app.prototype.orchestrator.run_state import HumanAction, RunState
+from app.prototype.pipeline.pipeline_types import PipelineInput
+
+
+def _orchestrator(enable_hitl: bool = False) -> PipelineOrchestrator:
+    return PipelineOrchestrator(
+        draft_config=DraftConfig(provider="mock", n_candidates=2, seed_base=42),
+        critic_config=CriticConfig(use_vlm=False),
+        queen_config=QueenConfig(max_rounds=1),
+        enable_hitl=enable_hitl,
+        enable_archivist=False,
+    )
+
+
+def _input() -> PipelineInput:
+    return PipelineInput(
+        task_id=f"async-{uuid.uuid4().hex[:8]}",
+        subject="Dong Yuan landscape",
+        cultural_tradition="chinese_xieyi",
+    )
+
+
+def _shape(events) -> list[tuple[str, str]]:
+    return [(e.event_type.value, e.stage) for e in events]
+
+
+class TestArunStream:
+    async def test_matches_sync_event_sequence(self):
+        sync_events = list(_orchestrator().run_stream(_input()))
+        async_events = [e async for e in _orchestrator().arun_stream(_input())]
+        assert _shape(async_events) == _shape(sync_events)
+        assert async_events[-1].event_type == EventType.PIPELINE_COMPLETED
+
+    async def test_hitl_pauses_without_parking_a_thread(self):
+        orch = _orchestrator(enable_hitl=True)
+        pipeline_input = _input()
+        stages_paused: list[str] = []
+
+        async def _approve_when_waiting() -> None:
+            while not orch.submit_action(pipeline_input.task_id, "approve"):
+                await asyncio.sleep(0.01)
+
+        async for event in orch.arun_stream(pipeline_input):
+            if event.event_type == EventType.HUMAN_REQUIRED:
+                stages_paused.append(event.stage)
+                asyncio.ensure_future(_approve_when_waiting())
+        assert stages_paused[:3] == ["scout", "draft", "critic"]
+        assert event.event_type == EventType.PIPELINE_COMPLETED
+
+    async def test_concurrent_runs_share_one_loop(self):
+        async def _drive() -> str:
+            events = [e async for e in _orchestrator().arun_stream(_input())]
+            return events[-1].event_type.value
+
+        results = await asyncio.gather(*(_drive() for _ in range(4)))
+        assert results == ["pipeline_completed"] * 4
+
+    async def test_stage_error_becomes_pipeline_failed(self, monkeypatch):
+        def _boom(*args, **kwargs):
+            raise RuntimeError("scout exploded")
+
+        monkeypatch.setattr(
+            "app.prototype.orchestrator.orchestrator.get_scout_service", _boom,
+        )
+        events = [e async for e in _orchestrator().arun_stream(_input())]
+        assert events[-1].event_type == EventType.PIPELINE_FAILED
+        assert "scout exploded" in events[-1].payload["error"]
+
+    async def test_checkpoint_io_runs_off_the_event_loop(self, monkeypatch):
+        from app.prototype.orchestrator import orchestrator as orch_module
+
+        loop_thread = threading.get_ident()
+        io_threads: list[int] = []
+
+        def _recording(fn):
+            def wrapper(*args, **kwargs):
+                io_threads.append(threading.get_ident())
+                return fn(*args, **kwargs)
+            return wrapper
+
+        for name in ("save_pipeline_stage", "save_pipeline_output", "update_runs_index", "create_agent"):
+            monkeypatch.setattr(orch_module, name, _recording(getattr(orch_module, name)))
+        events = [e async for e in _orchestrator().arun_stream(_input())]
+        assert events[-1].event_type == EventType.PIPELINE_COMPLETED
+        assert io_threads and loop_thread not in io_threads
+
+
+class TestAsyncStageEntryPoints:
+    async def test_critic_is_awaited_on_the_loop(self, monkeypatch):
+        from app.prototype.agents.critic_agent import CriticAgent
+
+        loop_thread = threading.get_ident()
+        critic_threads: list[int] = []
+        original = CriticAgent.arun
+
+        async def _arun(self, critique_input):
+            critic_threads.append(threading.get_ident())
+            return await original(self, critique_input)
+
+        def _sync_run(self, critique_input):
+            raise AssertionError("sync CriticAgent.run used by arun_stream")
+
+        monkeypatch.setattr(CriticAgent, "arun", _arun)
+        monkeypatch.setattr(CriticAgent, "run", _sync_run)
+        events = [e async for e in _orchestrator().arun_stream(_input())]
+        assert events[-1].event_type == EventType.PIPELINE_COMPLETED
+        assert critic_threads == [loop_thread]
+
+    async def test_queen_llm_adecide_awaits_the_gateway(self, monkeypatch):
+        from app.prototype.agents import llm_gateway
+        from app.prototype.agents.queen_llm import QueenLLMAgent, QueenLLMConfig
+        from app.prototype.agents.queen_types import PlanState
+
+        models: list[str] = []
+
+        async def _acompletion(**kwargs):
+            models.append(kwargs["model"])
+            content = json.dumps({
+                "action": "rerun", "rerun_dimensions": ["cultural_context"],
+                "confidence": 0.8, "reason": "weak cultural grounding",
+            })
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+        def _completion(**kwargs):
+            raise AssertionError("sync gateway used by adecide")
+
+        monkeypatch.setattr(llm_gateway, "acompletion", _acompletion)
+        monkeypatch.setattr(llm_gateway, "completion", _completion)
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        queen = QueenLLMAgent(config=QueenConfig(max_rounds=3), llm_config=QueenLLMConfig(enable_rag=False))
+        critique = {
+            "scored_candidates": [{"candidate_id": "c0", "weighted_total": 0.55, "gate_passed": False}],
+            "best_candidate_id": None,
+            "rerun_hint": [],
+        }
+        output = await queen.adecide(critique, PlanState(task_id="t"))
+        assert len(models) == 1
+        assert output.decision.action == "rerun"
+        assert output.decision.rerun_dimensions == ["cultural_context"]
+        assert output.plan_state.history[-1]["queen_mode"] == "llm"
+
+
+class TestCreateStreamFailure:
+    async def test_driver_error_fails_and_closes_the_channel(self, monkeypatch, tmp_path):
+        from app.prototype.api import create_routes
+        from app.prototype.checkpoints import pipeline_checkpoint
+
+        monkeypatch.setattr(pipeline_checkpoint, "_CHECKPOINT_ROOT", tmp_path)
+
+        async def _broken(self, pipeline_input):
+            yield create_routes.PipelineEvent(event_type=EventType.STAGE_STARTED, stage="scout")
+            raise RuntimeError("driver crashed")
+
+        monkeypatch.setattr(PipelineOrchestrator, "arun_stream", _broken)
+        session_id = f"stream-{uuid.uuid4().hex[:8]}"
+        create_routes._run_create_mode_stream(
+            create_routes.CreateRequest(intent="ink bamboo", provider="mock"), session_id,
+        )
+        await asyncio.gather(*create_routes._create_background_runs)
+
+        channel = create_routes._create_event_bus.get(session_id)
+        events = channel.snapshot()
+        assert channel.closed
+        assert events[-1].event_type == EventType.PIPELINE_FAILED
+        assert "driver crashed" in events[-1].payload["error"]
+        assert pipeline_checkpoint.load_runs_index()[session_id]["status"] == "failed"
+
+
+class TestAwaitHuman:
+    async def test_returns_presubmitted_action(self):
+        rs = RunState(task_id="t")
+        rs.submit_human_action(HumanAction(action="approve"))
+        action = await rs.await_human(timeout=1)
+        assert action is not None and action.action == "approve"
+
+    async def test_woken_from_another_thread(self):
+        rs = RunState(task_id="t")
+
+        def _submit() -> None:
+            time.sleep(0.05)
+            rs.submit_human_action(HumanAction(action="reject"))
+
+        threading.Thread(target=_submit).start()
+        action = await rs.await_human(timeout=5)
+        assert action is not None and action.action == "reject"
+
+    async def test_timeout_returns_none(self):
+        rs = RunState(task_id="t")
+        assert await rs.await_human(timeout=0.01) is None
+        assert rs.status.value == "running"
+
+    def test_sync_wait_still_works(self):
+        rs = RunState(task_id="t")
+        rs.submit_human_action(HumanAction(action="approve"))
+        assert rs.wait_for_human(timeout=0).action == "approve"
+
+    @pytest.mark.parametrize("n", [3])
+    async def test_many_waiters_on_one_loop(self, n):
+        states = [RunState(task_id=f"t{i}") for i in range(n)]
+        waits = [asyncio.ensure_future(s.await_human(timeout=5)) for s in states]
+        await asyncio.sleep(0)
+        for i, s in enumerate(states):
+            s.submit_human_action(HumanAction(action=f"a{i}"))
+        actions = await asyncio.gather(*waits)
+        assert [a.action for a in actions] == [f"a{i}" for i in range(n)]
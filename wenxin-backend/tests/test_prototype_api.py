@@ -19,7 +19,7 @@ import pytest_asyncio
 from fastapi import FastAPI
 
 from app.prototype.api.routes import (
-    _event_buffers,
+    _event_bus,
     _guest_runs_today,
     _idempotency_map,
     _orchestrators,
@@ -35,7 +35,7 @@ async def client() -> AsyncIterator[httpx.AsyncClient]:
     """Isolated in-process API client per test."""
     _orchestrators.clear()
     _run_metadata.clear()
-    _event_buffers.clear()
+    _event_bus.clear()
     _idempotency_map.clear()
     _guest_runs_today.clear()
 
@@ -176,6 +176,31 @@ class TestPipelineRuns:
         assert res1.json()["task_id"] == res2.json()["task_id"]
 
 
+    @pytest.mark.asyncio
+    async def test_list_runs_pages_the_runs_index(self, client: httpx.AsyncClient, tmp_path, monkeypatch):
+        """GET /runs pages through the runs index with a cursor."""
+        from app.prototype.checkpoints import pipeline_checkpoint
+
+        monkeypatch.setattr(pipeline_checkpoint, "_CHECKPOINT_ROOT", tmp_path)
+        for i, status in enumerate(["completed", "failed", "completed"]):
+            pipeline_checkpoint.update_runs_index(f"run-{i}", {
+                "status": status, "created_at": f"2026-01-0{i + 1}T00:00:00+00:00",
+            })
+
+        res = await client.get(f"{API}/runs", params={"limit": 2})
+        assert res.status_code == 200
+        first = res.json()
+        assert [e["task_id"] for e in first["items"]] == ["run-2", "run-1"]
+        res = await client.get(f"{API}/runs", params={"limit": 2, "cursor": first["next_cursor"]})
+        assert [e["task_id"] for e in res.json()["items"]] == ["run-0"]
+        assert res.json()["next_cursor"] is None
+
+        res = await client.get(f"{API}/runs", params={"status": "completed"})
+        assert [e["task_id"] for e in res.json()["items"]] == ["run-2", "run-0"]
+        res = await client.get(f"{API}/runs", params={"cursor": "not-a-cursor"})
+        assert res.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Tests: SSE event stream
 # ---------------------------------------------------------------------------
@@ -212,6 +237,36 @@ class TestSSEStream:
         assert "stage_started" in event_types
         assert any(t in event_types for t in ("pipeline_completed", "pipeline_failed"))
 
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_sse_resumes_after_last_event_id(self, client: httpx.AsyncClient):
+        """Reconnecting with Last-Event-ID skips events already received."""
+        data = await create_run(client, n_candidates=2, max_rounds=1)
+        task_id = data["task_id"]
+
+        async def _consume_ids(headers: dict) -> list[int]:
+            ids = []
+            async with client.stream("GET", f"{API}/runs/{task_id}/events", headers=headers) as stream:
+                async for line in stream.aiter_lines():
+                    if line.startswith("id: "):
+                        ids.append(int(line[4:]))
+                    elif line.startswith("data: ") and json.loads(line[6:]).get(
+                        "event_type"
+                    ) in ("pipeline_completed", "pipeline_failed"):
+                        break
+            return ids
+
+        try:
+            first = await asyncio.wait_for(_consume_ids({}), timeout=15)
+        except asyncio.TimeoutError:
+            pytest.skip("SSE stream did not complete within 15s (mock pipeline may be slow)")
+
+        assert first == list(range(len(first)))
+        resumed = await asyncio.wait_for(
+            _consume_ids({"Last-Event-ID": str(first[1])}), timeout=5,
+        )
+        assert resumed == first[2:]
+
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_sse_draft_candidates_include_image_url(self, client: httpx.AsyncClient):
@@ -0,0 +1,119 @@
+"""Tests for the SQLite-backed pipeline runs index."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from app.prototype.checkpoints import pipeline_checkpoint
+from app.prototype.checkpoints.runs_index import RunsIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = RunsIndex(tmp_path / "runs_index.db")
+    yield idx
+    idx.close()
+
+
+def test_upsert_and_get(index):
+    index.upsert("t1", {"status": "running", "tradition": "chinese_xieyi"})
+    index.upsert("t1", {"status": "completed", "total_rounds": 2})
+    assert index.get("t1") == {"status": "completed", "total_rounds": 2}
+    assert index.get("missing") is None
+    # Tradition recorded on the first write survives an update without one
+    assert index.count(tradition="chinese_xieyi") == 1
+
+
+def test_filters_by_status_and_tradition(index):
+    for i in range(6):
+        index.upsert(f"t{i}", {
+            "status": "completed" if i % 2 else "failed",
+            "tradition": "a" if i < 3 else "b",
+        })
+    assert index.count() == 6
+    assert index.count(status="failed") == 3
+    assert index.count(status="completed", tradition="b") == 2
+    ids = {e["task_id"] for e in index.query(tradition="a").entries}
+    assert ids == {"t0", "t1", "t2"}
+
+
+def test_keyset_pagination_visits_every_run_once(index):
+    for i in range(25):
+        index.upsert(f"t{i:02d}", {"status": "completed"})
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = index.query(limit=10, cursor=cursor)
+        seen.extend(e["task_id"] for e in page.entries)
+        pages += 1
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert pages == 3
+    assert sorted(seen) == [f"t{i:02d}" for i in range(25)]
+    assert len(seen) == len(set(seen))
+    assert [e["task_id"] for e in index.iter_all(page_size=7)] == seen
+
+
+def test_date_range(index):
+    index.upsert("old", {"status": "completed"})
+    page = index.query()
+    stamp = page.entries[0]["created_at"]
+    assert index.count(since=stamp) == 1
+    assert index.count(until=stamp) == 0
+
+
+def test_invalid_cursor_rejected(index):
+    with pytest.raises(ValueError):
+        index.query(cursor="not-json")
+
+
+def test_concurrent_writers(tmp_path):
+    db = tmp_path / "runs_index.db"
+    RunsIndex(db)
+
+    def _writer(n: int) -> None:
+        idx = RunsIndex(db)
+        for i in range(20):
+            idx.upsert(f"w{n}-{i}", {"status": "completed"})
+        idx.close()
+
+    threads = [threading.Thread(target=_writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert RunsIndex(db).count() == 80
+
+
+def test_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "runs_index.json"
+    legacy.write_text(json.dumps({"old-1": {"status": "completed"}, "old-2": {"status": "failed"}}))
+    idx = RunsIndex(tmp_path / "runs_index.db", legacy_json=legacy)
+    assert idx.count() == 2
+    assert idx.get("old-2") == {"status": "failed"}
+
+    legacy.write_text(json.dumps({"old-3": {"status": "completed"}}))
+    assert RunsIndex(tmp_path / "runs_index.db", legacy_json=legacy).count() == 2
+
+
+def test_pipeline_checkpoint_helpers(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_checkpoint, "_CHECKPOINT_ROOT", tmp_path)
+    pipeline_checkpoint.update_runs_index("a", {"status": "completed", "tradition": "x"})
+    pipeline_checkpoint.update_runs_index("b", {"status": "failed", "tradition": "x"})
+
+    full = pipeline_checkpoint.load_runs_index()
+    assert set(full) == {"a", "b"}
+    assert full["a"]["status"] == "completed"
+    assert set(pipeline_checkpoint.load_runs_index(status="failed")) == {"b"}
+    assert len(pipeline_checkpoint.load_runs_index(limit=1)) == 1
+
+    page = pipeline_checkpoint.query_runs_index(tradition="x", limit=1)
+    assert len(page.entries) == 1
+    assert page.next_cursor is not None
+    assert (tmp_path / "runs_index.db").exists()
@@ -51,3 +51,57 @@ class TestStyleDynamic:
     def test_style_constraints_returns_objects(self):
         constraints = _get_style_constraints("chinese_xieyi")
         assert all(hasattr(c, "attribute") for c in constraints)
+
+
+class TestBatchedScout:
+    def _scout(self, faiss_svc):
+        from app.prototype.tools.faiss_index_service import _FaissHit
+        from app.prototype.tools.scout_service import ScoutService
+
+        scout = ScoutService(search_mode="jaccard")
+        scout._faiss_service = faiss_svc
+        scout._sample_matcher._faiss_service = faiss_svc
+        scout._terminology_loader._faiss_service = faiss_svc
+        scout._sample_mode = "auto"
+        scout._term_mode = "auto"
+        faiss_svc.available = True
+        faiss_svc.search_many.side_effect = lambda queries, kinds, tradition, top_k: {
+            kind: [
+                [_FaissHit("vulca-bench-0001", 0.9, "chinese_xieyi", "")]
+                if kind == "samples"
+                else [_FaissHit("term-chinese_xieyi-001", 0.9, "chinese_xieyi", "")]
+                for _ in queries
+            ]
+            for kind in kinds
+        }
+        return scout
+
+    def test_gather_evidence_many_uses_one_batched_search(self):
+        faiss_svc = MagicMock()
+        scout = self._scout(faiss_svc)
+        results = scout.gather_evidence_many(["ink bamboo", "misty peaks"], "chinese_xieyi")
+        assert len(results) == 2
+        assert faiss_svc.search_many.call_count == 1
+        faiss_svc.search_samples.assert_not_called()
+        faiss_svc.search_terms.assert_not_called()
+        assert results[0].sample_matches[0].sample_id == "vulca-bench-0001"
+
+        # Cached subjects do not trigger another search
+        scout.gather_evidence("ink bamboo", "chinese_xieyi")
+        assert faiss_svc.search_many.call_count == 1
+
+    def test_gather_supplementary_batches_queries(self):
+        from app.prototype.agents.need_more_evidence import NeedMoreEvidence
+        from app.prototype.tools.evidence_pack import EvidencePack
+
+        faiss_svc = MagicMock()
+        scout = self._scout(faiss_svc)
+        need = NeedMoreEvidence(
+            gaps=[], suggested_queries=["q1", "q2", "q3"], target_layers=[],
+            urgency="low", evidence_coverage_before=0.0,
+        )
+        pack = EvidencePack(subject="s", tradition="chinese_xieyi")
+        updated = scout.gather_supplementary(need, pack)
+        assert faiss_svc.search_many.call_count == 1
+        faiss_svc.search_terms.assert_not_called()
+        assert len(updated.anchors) == 1  # same term from each query is deduplicated
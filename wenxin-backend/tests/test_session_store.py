@@ -121,3 +121,96 @@ def test_store_handles_malformed_lines():
         assert len(records) == 2
 
         SessionStore._instance = None
+
+
+# ---------------------------------------------------------------------------
+# Indexed lookups (sidecar offset index)
+# ---------------------------------------------------------------------------
+
+
+def _indexed_store(tmp_path: Path) -> SessionStore:
+    store = SessionStore(str(tmp_path / "sessions.jsonl"))
+    assert (tmp_path / "sessions.idx.db").exists()
+    return store
+
+
+def test_store_get_session_and_traditions(tmp_path):
+    store = _indexed_store(tmp_path)
+    store.append(SessionDigest(session_id="s1", tradition="watercolor"))
+    store.append(SessionDigest(session_id="s2", tradition="chinese_xieyi"))
+
+    assert store.get_session("s2")["tradition"] == "chinese_xieyi"
+    assert store.get_session("missing") is None
+    assert store.traditions() == ["chinese_xieyi", "watercolor"]
+    assert store.count(tradition="watercolor") == 1
+
+
+def test_store_query_keyset_pagination(tmp_path):
+    store = _indexed_store(tmp_path)
+    for i in range(7):
+        tradition = "watercolor" if i % 2 else "chinese_xieyi"
+        store.append(SessionDigest(session_id=f"s{i}", tradition=tradition, created_at=1000.0 + i))
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = store.query(limit=3, cursor=cursor)
+        seen.extend(r["session_id"] for r in page.records)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert seen == [f"s{i}" for i in range(6, -1, -1)]
+
+    page = store.query(tradition="watercolor", since=1002.0, until=1006.0)
+    assert [r["session_id"] for r in page.records] == ["s5", "s3"]
+
+
+def test_store_update_in_place_and_relocated(tmp_path):
+    store = _indexed_store(tmp_path)
+    store.append(SessionDigest(session_id="s1", intent="a" * 40))
+    store.append(SessionDigest(session_id="s2"))
+    path = tmp_path / "sessions.jsonl"
+    size_before = path.stat().st_size
+
+    # Shorter value: rewritten in place, file size unchanged
+    assert store.update("s1", intent="short")["intent"] == "short"
+    assert path.stat().st_size == size_before
+    assert [r["session_id"] for r in store.get_all()] == ["s1", "s2"]
+
+    # Longer value: old line blanked, new version appended
+    store.update("s1", intent="b" * 200)
+    assert store.get_session("s1")["intent"] == "b" * 200
+    assert store.count() == 2
+    raw_records = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    assert [r["session_id"] for r in raw_records] == ["s2", "s1"]
+    assert store.update("missing", intent="x") is None
+
+
+def test_store_picks_up_external_appends_and_rewrites(tmp_path):
+    store = _indexed_store(tmp_path)
+    store.append(SessionDigest(session_id="s1", tradition="watercolor"))
+    path = tmp_path / "sessions.jsonl"
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"session_id": "ext", "tradition": "watercolor"}) + "\n")
+    assert [r["session_id"] for r in store.get_by_tradition("watercolor")] == ["s1", "ext"]
+
+    path.write_text(json.dumps({"session_id": "rewritten", "tradition": "persian"}) + "\n")
+    assert store.count() == 1
+    assert store.get_session("s1") is None
+    assert store.traditions() == ["persian"]
+
+
+def test_store_list_scored_sorts_and_paginates(tmp_path):
+    (tmp_path / "sessions.jsonl").write_text(json.dumps({"session_id": "unscored"}) + "\n")
+    store = _indexed_store(tmp_path)
+    for sid, total, rounds in [("a", 0.6, 2), ("b", 0.9, 1), ("c", 0.6, 3)]:
+        store.append(SessionDigest(
+            session_id=sid, final_scores={"L1": total}, final_weighted_total=total, total_rounds=rounds,
+        ))
+
+    items, total = store.list_scored(sort_by="weighted_total")
+    assert total == 3
+    assert [r["session_id"] for r in items] == ["b", "a", "c"]  # ties keep file order
+    items, _ = store.list_scored(sort_by="total_rounds", descending=False, limit=2, offset=1)
+    assert [r["session_id"] for r in items] == ["a", "c"]
@@ -0,0 +1,205 @@
+"""Tests for Draft→Critic pipelining (streaming critic with early accept)."""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+
+from app.prototype.agents import draft_agent as draft_agent_mod
+from app.prototype.agents.critic_agent import StreamingCritique, build_critique_output
+from app.prototype.agents.critic_config import DIMENSIONS, CriticConfig
+from app.prototype.agents.critic_types import DimensionScore
+from app.prototype.agents.draft_agent import DraftAgent
+from app.prototype.agents.draft_config import DraftConfig
+from app.prototype.agents.draft_types import DraftInput
+from app.prototype.agents.queen_config import QueenConfig
+from app.prototype.orchestrator.events import EventType
+from app.prototype.orchestrator.orchestrator import PipelineOrchestrator
+from app.prototype.pipeline.pipeline_types import PipelineInput
+
+
+@pytest.fixture(autouse=True)
+def _no_checkpoints(monkeypatch):
+    monkeypatch.setattr("app.prototype.agents.critic_agent.save_critic_checkpoint", lambda output: None)
+    monkeypatch.setattr("app.prototype.agents.draft_agent.save_draft_checkpoint", lambda output: None)
+
+
+def _score_fn(scores: dict[str, float]):
+    """Fake scorer: every dimension of candidate X scores ``scores[X]``."""
+
+    def _score(candidate, evidence, cultural_tradition, subject, use_vlm):
+        value = scores[candidate["candidate_id"]]
+        return [DimensionScore(dimension=d, score=value, rationale="fake") for d in DIMENSIONS]
+
+    return _score
+
+
+def _candidates(n: int) -> list[dict]:
+    return [{"candidate_id": f"c{i}", "prompt": "p", "image_path": ""} for i in range(n)]
+
+
+class _SlowProvider:
+    """Candidate 0 returns immediately; the others take a while."""
+
+    model_ref = "fake-slow"
+
+    def generate(self, prompt, negative_prompt, seed, width, height, steps, sampler, output_path):
+        if seed != 0:
+            time.sleep(0.2)
+        return output_path
+
+
+class TestStreamingCritique:
+    def test_matches_batched_critique(self):
+        scores = {"c0": 0.5, "c1": 0.7, "c2": 0.6}
+        cfg = CriticConfig(top_k=3)
+        batched = build_critique_output(
+            task_id="t", candidates=_candidates(3), evidence={}, cultural_tradition="default",
+            subject="s", cfg=cfg, score_fn=_score_fn(scores), t0=time.monotonic(),
+        )
+        stream = StreamingCritique(
+            task_id="t", evidence={}, cultural_tradition="default", subject="s",
+            cfg=cfg, score_fn=_score_fn(scores),
+        )
+        for cand in reversed(_candidates(3)):  # arrival order must not matter
+            assert stream.submit(cand)
+        streamed = stream.finish(_candidates(3))
+
+        assert not stream.early_accepted
+        assert streamed.best_candidate_id == batched.best_candidate_id == "c1"
+        assert [s.candidate_id for s in streamed.scored_candidates] == ["c1", "c2", "c0"]
+        assert streamed.to_dict()["scored_candidates"] == batched.to_dict()["scored_candidates"]
+
+    def test_early_accept_stops_submissions(self):
+        stream = StreamingCritique(
+            task_id="t", evidence={}, cultural_tradition="default", subject="s",
+            cfg=CriticConfig(), score_fn=_score_fn({"c0": 0.95, "c1": 0.5}),
+            early_accept_threshold=0.93, max_workers=1,
+        )
+        assert stream.submit(_candidates(1)[0])
+        output = stream.finish(_candidates(2))
+        assert stream.early_accepted and stream.early_accepted_id == "c0"
+        assert stream.submit(_candidates(2)[1]) is False
+        assert output.best_candidate_id == "c0"
+
+    def test_below_gate_never_early_accepts(self):
+        stream = StreamingCritique(
+            task_id="t", evidence={}, cultural_tradition="default", subject="s",
+            cfg=CriticConfig(), score_fn=_score_fn({"c0": 0.3, "c1": 0.35}),
+            early_accept_threshold=0.3,
+        )
+        for cand in _candidates(2):
+            assert stream.submit(cand)
+        output = stream.finish(_candidates(2))
+        # 0.35 is above the early-accept threshold but fails the Critic gate
+        assert not stream.early_accepted
+        assert output.best_candidate_id is None
+
+
+class TestDraftOnCandidate:
+    def test_stop_cancels_candidates_not_started(self, monkeypatch):
+        monkeypatch.setattr(draft_agent_mod, "_get_provider", lambda name, config=None: _SlowProvider())
+        seen: list[str] = []
+
+        def _on_candidate(cand) -> bool:
+            seen.append(cand.candidate_id)
+            return False  # accept the first image that arrives
+
+        cfg = DraftConfig(provider="mock", n_candidates=6, seed_base=0)
+        output = DraftAgent(cfg).run(
+            DraftInput(task_id="t", subject="s", cultural_tradition="default", evidence={}, config=cfg),
+            on_candidate=_on_candidate,
+        )
+        assert seen == ["draft-t-0"]
+        assert [c.candidate_id for c in output.candidates] == ["draft-t-0"]
+        assert output.success
+
+
+class TestOrchestratorStreamingCritic:
+    def test_pipeline_completes_with_same_event_sequence(self):
+        def _orch(streaming: bool) -> PipelineOrchestrator:
+            return PipelineOrchestrator(
+                draft_config=DraftConfig(provider="mock", n_candidates=2, seed_base=42),
+                critic_config=CriticConfig(use_vlm=False),
+                queen_config=QueenConfig(max_rounds=1),
+                enable_archivist=False,
+                enable_streaming_critic=streaming,
+            )
+
+        def _input() -> PipelineInput:
+            return PipelineInput(
+                task_id=f"stream-{uuid.uuid4().hex[:8]}",
+                subject="Dong Yuan landscape",
+                cultural_tradition="chinese_xieyi",
+            )
+
+        batched = list(_orch(False).run_stream(_input()))
+        streamed = list(_orch(True).run_stream(_input()))
+        shape = lambda events: [(e.event_type, e.stage) for e in events]  # noqa: E731
+        assert shape(streamed) == shape(batched)
+        assert streamed[-1].event_type == EventType.PIPELINE_COMPLETED
+
+        critic_done = next(
+            e for e in streamed
+            if e.event_type == EventType.STAGE_COMPLETED and e.stage == "critic"
+        )
+        assert critic_done.payload["critique"]["scored_candidates"]
+
+    def test_early_accept_with_candidates_in_flight(self, monkeypatch):
+        from app.prototype.agents.critic_rules import CriticRules
+
+        monkeypatch.setattr(draft_agent_mod, "_get_provider", lambda name, config=None: _SlowProvider())
+        scores = {f"draft-t-{i}": 0.5 for i in range(4)}
+        scores["draft-t-0"] = 0.97
+        monkeypatch.setattr(CriticRules, "score", lambda self, *a, **kw: _score_fn(scores)(*a, **kw))
+
+        orch = PipelineOrchestrator(
+            draft_config=DraftConfig(provider="mock", n_candidates=4, seed_base=0),
+            critic_config=CriticConfig(use_vlm=False),
+            queen_config=QueenConfig(max_rounds=1),
+            enable_archivist=False,
+            enable_streaming_critic=True,
+        )
+        cfg = DraftConfig(provider="mock", n_candidates=4, seed_base=0)
+        # Candidate 0 is accepted while the three slow ones are still generating
+        draft_output, critique = orch._draft_with_streaming_critic(
+            DraftAgent(cfg),
+            DraftInput(task_id="t", subject="s", cultural_tradition="default", evidence={}, config=cfg),
+            None, CriticConfig(use_vlm=False), {}, "s",
+        )
+        scored = {s.candidate_id for s in critique.scored_candidates}
+        assert critique.best_candidate_id == "draft-t-0"
+        assert [c.candidate_id for c in draft_output.candidates] == ["draft-t-0"]
+        assert scored == {"draft-t-0"}
+        # The three late finishers are dropped but were still generated
+        assert draft_output.images_generated == 4
+
+    def test_early_accept_bills_late_finishers(self, monkeypatch, tmp_path):
+        from app.prototype.agents.critic_rules import CriticRules
+        from app.prototype.checkpoints import pipeline_checkpoint
+        from app.prototype.orchestrator import orchestrator as orchestrator_mod
+
+        monkeypatch.setattr(pipeline_checkpoint, "_CHECKPOINT_ROOT", tmp_path)
+        monkeypatch.setitem(orchestrator_mod._COST_PER_IMAGE, "mock", 0.25)
+        monkeypatch.setattr(draft_agent_mod, "_get_provider", lambda name, config=None: _SlowProvider())
+        task_id = f"bill-{uuid.uuid4().hex[:8]}"
+        scores = {f"draft-{task_id}-{i}": 0.5 for i in range(4)}
+        scores[f"draft-{task_id}-0"] = 0.97
+        monkeypatch.setattr(CriticRules, "score", lambda self, *a, **kw: _score_fn(scores)(*a, **kw))
+
+        orch = PipelineOrchestrator(
+            draft_config=DraftConfig(provider="mock", n_candidates=4, seed_base=0),
+            critic_config=CriticConfig(use_vlm=False),
+            queen_config=QueenConfig(max_rounds=1),
+            enable_archivist=False,
+            enable_streaming_critic=True,
+        )
+        events = list(orch.run_stream(PipelineInput(
+            task_id=task_id, subject="s", cultural_tradition="default",
+        )))
+        done = events[-1]
+        assert done.event_type == EventType.PIPELINE_COMPLETED
+        assert done.payload["images_generated"] == 4
+        assert done.payload["total_cost_usd"] == pytest.approx(1.0)
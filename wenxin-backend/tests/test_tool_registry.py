@@ -0,0 +1,166 @@
+"""Tests for concurrent tool execution and per-run tool memoization."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from app.prototype.agents.agent_runtime import AgentContext, AgentRuntime
+from app.prototype.agents.layer_state import LayerState
+from app.prototype.agents.tool_registry import ToolDef, ToolRegistry, build_critic_tool_registry
+
+
+def _registry(**tools) -> ToolRegistry:
+    registry = ToolRegistry()
+    for name, (fn, memoize) in tools.items():
+        registry.register(ToolDef(name=name, description="", parameters={}, executor=fn, memoize=memoize))
+    return registry
+
+
+class TestExecuteMany:
+    async def test_sync_tools_run_concurrently_off_the_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def slow(tag: str) -> dict:
+            threads.append(threading.get_ident())
+            time.sleep(0.1)
+            return {"tag": tag}
+
+        registry = _registry(slow=(slow, False))
+        t0 = time.monotonic()
+        results = await registry.execute_many([("slow", {"tag": str(i)}) for i in range(3)])
+        assert time.monotonic() - t0 < 0.25
+        assert results == [{"tag": "0"}, {"tag": "1"}, {"tag": "2"}]
+        assert loop_thread not in threads
+
+    async def test_results_keep_call_order_with_mixed_tools(self):
+        async def late(x: int) -> int:
+            await asyncio.sleep(0.02)
+            return x
+
+        registry = _registry(late=(late, False), quick=(lambda x: -x, False))
+        results = await registry.execute_many([("late", {"x": 1}), ("quick", {"x": 2}), ("missing", {})])
+        assert results[:2] == [1, -2]
+        assert "Unknown tool" in results[2]["error"]
+
+    async def test_memoized_tools_run_once_per_registry(self):
+        calls = []
+
+        def lookup(term: str, tradition: str) -> dict:
+            calls.append(term)
+            return {"term": term}
+
+        registry = _registry(lookup=(lookup, True), fresh=(lambda: calls.append("fresh"), False))
+        await registry.execute("lookup", {"term": "留白", "tradition": "chinese_xieyi"})
+        await registry.execute("lookup", {"tradition": "chinese_xieyi", "term": "留白"})
+        await registry.execute("lookup", {"term": "皴法", "tradition": "chinese_xieyi"})
+        await registry.execute("fresh", {})
+        await registry.execute("fresh", {})
+        assert calls == ["留白", "皴法", "fresh", "fresh"]
+        assert registry.memo_stats() == {"hits": 1, "coalesced": 0, "size": 2}
+
+    async def test_identical_in_flight_calls_share_one_execution(self):
+        calls = []
+
+        def lookup(term: str) -> dict:
+            calls.append(term)
+            time.sleep(0.05)
+            return {"term": term}
+
+        registry = _registry(lookup=(lookup, True))
+        results = await registry.execute_many([("lookup", {"term": "留白"})] * 3 + [("lookup", {"term": "皴法"})])
+        assert len(calls) == 2 and set(calls) == {"留白", "皴法"}
+        assert results[0] is results[1] is results[2]
+        assert registry.memo_stats() == {"hits": 0, "coalesced": 2, "size": 2}
+
+    async def test_failures_are_not_memoized(self):
+        attempts = []
+
+        def flaky() -> dict:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("index not loaded")
+            return {"ok": True}
+
+        registry = _registry(flaky=(flaky, True))
+        assert "error" in await registry.execute("flaky", {})
+        assert await registry.execute("flaky", {}) == {"ok": True}
+        assert await registry.execute("flaky", {}) == {"ok": True}
+        assert len(attempts) == 2
+
+    def test_critic_registry_memoizes_lookups_only(self):
+        registry = build_critic_tool_registry()
+        memoized = {name for name in registry.tool_names() if registry.get(name).memoize}
+        assert memoized == {"search_cultural_references", "lookup_terminology", "check_cultural_sensitivity"}
+        inline = {name for name in registry.tool_names() if registry.get(name).inline}
+        assert inline == {"read_layer_analysis", "submit_evaluation"}
+
+    async def test_inline_tools_run_on_the_loop(self):
+        threads = []
+        registry = ToolRegistry()
+        registry.register(ToolDef(
+            name="submit", description="", parameters={},
+            executor=lambda: threads.append(threading.get_ident()), inline=True,
+        ))
+        await registry.execute("submit", {})
+        assert threads == [threading.get_ident()]
+
+
+class _Router:
+    def select_model(self, layer_id, requires_vlm=False):
+        return SimpleNamespace(litellm_id="test/model", cost_per_call_usd=0.0)
+
+    def record_cost(self, cost):
+        pass
+
+
+def _tool_call(call_id: str, name: str, **args) -> dict:
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": json.dumps(args)}}
+
+
+async def test_runtime_runs_step_tools_concurrently_in_order(monkeypatch):
+    async def slow_search(query: str, tradition: str) -> dict:
+        await asyncio.sleep(0.1)
+        return {"query": query}
+
+    def lookup(term: str, tradition: str) -> dict:
+        time.sleep(0.1)
+        return {"term": term}
+
+    registry = build_critic_tool_registry()
+    registry.register(ToolDef(name="search_cultural_references", description="", parameters={}, executor=slow_search))
+    registry.register(ToolDef(name="lookup_terminology", description="", parameters={}, executor=lookup))
+    runtime = AgentRuntime(tool_registry=registry, model_router=_Router(), max_steps=3)
+
+    seen_messages = []
+    responses = iter([
+        {"message": {"role": "assistant", "content": None, "tool_calls": [
+            _tool_call("a", "search_cultural_references", query="ink", tradition="chinese_xieyi"),
+            _tool_call("b", "lookup_terminology", term="留白", tradition="chinese_xieyi"),
+        ]}},
+        {"message": {"role": "assistant", "content": None, "tool_calls": [
+            _tool_call("c", "submit_evaluation", score=0.8, confidence=0.7, rationale="r", evidence_refs=[]),
+        ]}},
+    ])
+
+    async def fake_call_llm(model_spec, messages, tools=None, tool_choice="auto"):
+        seen_messages.append((time.monotonic(), list(messages)))
+        return next(responses)
+
+    monkeypatch.setattr(runtime, "_call_llm", fake_call_llm)
+    ctx = AgentContext(
+        task_id="t", layer_id="cultural_context", layer_label="L3", subject="s",
+        cultural_tradition="chinese_xieyi", candidate_summary="", evidence_summary="",
+        layer_state=LayerState(),
+    )
+    result = await runtime.evaluate(ctx)
+    assert result.score == 0.8 and result.tool_calls_made == 3
+    (t_first, _), (t_second, messages) = seen_messages
+    assert t_second - t_first < 0.18  # both 0.1s tools ran at once
+    tool_messages = [m for m in messages if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["a", "b"]
+    assert json.loads(tool_messages[1]["content"]) == {"term": "留白"}
@@ -110,7 +110,7 @@ class TestVideoHandlerStubs:
         # Force LLM to fail
         async def _fail(*a, **kw):
             raise RuntimeError("no LLM")
-        monkeypatch.setattr(video_handlers.litellm, "acompletion", _fail)
+        monkeypatch.setattr(video_handlers.llm_gateway, "acompletion", _fail)
 
         result = asyncio.run(video_handlers.handle_script(script_stage, base_context))
         assert isinstance(result, SubStageArtifact)
@@ -159,7 +159,7 @@ class TestVideoHandlerStubs:
 
         async def _fail(*a, **kw):
             raise RuntimeError("no LLM")
-        monkeypatch.setattr(video_handlers.litellm, "acompletion", _fail)
+        monkeypatch.setattr(video_handlers.llm_gateway, "acompletion", _fail)
 
         async def _no_render(*a, **kw):
             return ""
@@ -177,7 +177,7 @@ class TestVideoHandlerStubs:
 
         async def _fail(*a, **kw):
             raise RuntimeError("no LLM")
-        monkeypatch.setattr(video_handlers.litellm, "acompletion", _fail)
+        monkeypatch.setattr(video_handlers.llm_gateway, "acompletion", _fail)
 
         result = asyncio.run(video_handlers.handle_final_compose(final_compose_stage, base_context))
         assert isinstance(result, SubStageArtifact)
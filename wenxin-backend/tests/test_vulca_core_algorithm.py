@@ -19,9 +19,13 @@ from app.vulca.algorithms.emnlp2025 import (
     VULCADimension,
     generate_dimension_metadata,
 )
+from app.vulca.algorithms.batch_engine import VULCABatchEngine
 from app.vulca.algorithms.correlation_matrix import CorrelationMatrix
+from app.vulca.algorithms.result_cache import VULCAResultCache
 from app.vulca.algorithms.vulca_core import VULCACore, VULCAResult
+from app.vulca.core.rng import stable_seed
 from app.vulca.core.vulca_core_adapter import VULCACoreAdapter
+from app.vulca.services.vulca_service import VULCAService
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -288,6 +292,48 @@ class TestCorrelationMatrix:
         for dim, score in propagated.items():
             assert 0 <= score <= 100, f"{dim}={score} out of [0,100]"
 
+    def test_propagate_batch_matches_per_dict_propagation(self):
+        seeds = [
+            {"logical_reasoning": 85.0, "creative_synthesis": 90.0},
+            {"empathy_modeling": 75.0, "humor_generation": 40.0, "ethical_reasoning": 60.0},
+        ]
+        batch = np.zeros((2, 47))
+        mask = np.zeros((2, 47), dtype=bool)
+        for row, initial in enumerate(seeds):
+            for dim, score in initial.items():
+                batch[row, self.cm.index[dim]] = score
+                mask[row, self.cm.index[dim]] = True
+        propagated = self.cm.propagate(batch, mask)
+        for row, initial in enumerate(seeds):
+            expected = {dim: 0.0 for dim in self.cm.dimensions}
+            for dim1, score in initial.items():
+                for dim2 in self.cm.dimensions:
+                    if dim2 not in initial:
+                        expected[dim2] += score * self.cm.get_correlation(dim1, dim2) * 0.3
+            expected.update(initial)
+            np.testing.assert_allclose(
+                propagated[row], np.clip([expected[d] for d in self.cm.dimensions], 0, 100)
+            )
+
+    def test_multi_step_propagation_reaches_further(self):
+        initial = {"logical_reasoning": 20.0}
+        one = self.cm.apply_correlation_propagation(initial)
+        two = self.cm.apply_correlation_propagation(initial, steps=2)
+        assert two["logical_reasoning"] == 20.0
+        assert all(two[d] >= one[d] for d in self.cm.dimensions)
+        assert sum(two.values()) > sum(one.values())
+        with pytest.raises(ValueError):
+            self.cm.propagate(np.zeros(47), steps=0)
+
+    def test_mean_pairwise_correlation(self):
+        names = ["logical_reasoning", "problem_decomposition", "empathy_modeling"]
+        idx = np.array([[self.cm.index[n] for n in names]])
+        expected = np.mean([
+            abs(self.cm.get_correlation(a, b))
+            for i, a in enumerate(names) for b in names[i + 1:]
+        ])
+        assert self.cm.mean_pairwise_correlation(idx)[0] == pytest.approx(expected)
+
     def test_within_category_correlations_higher(self):
         """Intra-category correlations should generally be stronger than cross-category."""
         # Average within cognitive (indices 0-15)
@@ -451,6 +497,74 @@ class TestVULCACore:
             assert "cultural_sensitivity" in item
 
 
+class _DictBackend:
+    """Stand-in for CacheService (get / set with ttl_seconds)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds=300):
+        self.data[key] = value
+        return True
+
+
+class TestVULCAResultCache:
+    """Bounded, content-addressed result cache."""
+
+    def test_cached_results_are_immutable_copies(self):
+        core = VULCACore(enable_correlation=True, result_cache=VULCAResultCache())
+        first = core.evaluate("m", TYPICAL_SCORES_6D)
+        hit = core.evaluate("m", dict(TYPICAL_SCORES_6D))
+        assert hit is not first
+        assert first.processing_time_ms != pytest.approx(0.1)
+        with pytest.raises(TypeError):
+            hit.scores_47d["logical_reasoning"] = 0.0
+        with pytest.raises(AttributeError):
+            hit.overall_score = 0.0
+        assert core.cache_stats()["hits"] == 1
+
+    def test_key_is_canonical_and_covers_propagation(self):
+        core = VULCACore(enable_correlation=True, result_cache=VULCAResultCache())
+        ints = {k: int(v) for k, v in TYPICAL_SCORES_6D.items()}
+        assert core._generate_cache_key("m", ints, None) == core._generate_cache_key(
+            "m", dict(reversed(list(TYPICAL_SCORES_6D.items()))), None
+        )
+        assert core._generate_cache_key("m", ints, None) != core._generate_cache_key(
+            "m", ints, None, use_correlation_propagation=False
+        )
+
+    def test_lru_eviction_and_ttl(self, monkeypatch):
+        cache = VULCAResultCache(max_entries=2, ttl_seconds=10)
+        core = VULCACore(enable_correlation=False, result_cache=cache)
+        for model in ("a", "b"):
+            core.evaluate(model, TYPICAL_SCORES_6D)
+        core.evaluate("a", TYPICAL_SCORES_6D)  # refresh "a"
+        core.evaluate("c", TYPICAL_SCORES_6D)  # evicts "b"
+        stats = cache.stats()
+        assert stats["size"] == 2 and stats["evictions"] == 1
+
+        import app.vulca.algorithms.result_cache as rc
+        now = rc.time.monotonic()
+        monkeypatch.setattr(rc.time, "monotonic", lambda: now + 60)
+        core.evaluate("a", TYPICAL_SCORES_6D)
+        assert cache.stats()["expirations"] == 1
+
+    def test_backend_shares_results_across_instances(self):
+        backend = _DictBackend()
+        first = VULCACore(result_cache=VULCAResultCache(backend=backend))
+        result = first.evaluate("m", MIXED_6D, cultural_perspective="global")
+        second_cache = VULCAResultCache(backend=backend)
+        second = VULCACore(result_cache=second_cache)
+        hit = second.evaluate("m", MIXED_6D, cultural_perspective="global")
+        assert second_cache.stats()["backend_hits"] == 1
+        assert hit.scores_47d == result.scores_47d
+        assert hit.top_dimensions == result.top_dimensions
+        assert hit.timestamp == result.timestamp
+
+
 # =========================================================================
 # 5. VULCACoreAdapter tests
 # =========================================================================
@@ -560,6 +674,145 @@ class TestVULCACoreAdapter:
             assert w.max() <= 1.0
 
 
+# =========================================================================
+# 5b. VULCABatchEngine (batch_engine.py) tests
+# =========================================================================
+
+
+class TestVULCABatchEngine:
+    """The vectorized engine must agree with the per-dict algorithm."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.algo = VULCAAlgorithmV2()
+        self.engine = self.algo.engine
+        self.inputs = [TYPICAL_SCORES_6D, ALL_ZEROS_6D, ALL_MAX_6D, MIXED_6D]
+
+    def test_mapping_is_dense_6_by_47(self):
+        assert self.engine.mapping.shape == (6, 47)
+        row = self.engine.source_dimensions.index("technique")
+        col = self.engine.index["logical_reasoning"]
+        assert self.engine.mapping[row, col] == pytest.approx(0.12)
+
+    def test_batch_expand_matches_per_call_expand(self):
+        batch = self.engine.expand(self.engine.to_array(self.inputs))
+        assert batch.shape == (4, 47)
+        for row, scores_6d in zip(self.engine.to_dicts(batch), self.inputs):
+            single = self.algo.expand_6d_to_47d(scores_6d)
+            assert list(row) == list(single)
+            for dim in single:
+                assert row[dim] == pytest.approx(single[dim], abs=1e-9)
+
+    def test_perspective_and_overall_match_dict_helpers(self):
+        scores = self.engine.expand(self.engine.to_array(self.inputs))
+        adjusted = self.engine.apply_perspective(scores, "eastern")
+        overall = self.engine.overall_scores(adjusted)
+        for i, row in enumerate(self.engine.to_dicts(scores)):
+            expected = self.algo.apply_cultural_perspective(row, "eastern")
+            np.testing.assert_allclose(
+                adjusted[i], [expected[n] for n in self.engine.dimension_names]
+            )
+            assert overall[i] == pytest.approx(self.algo.calculate_overall_score(expected))
+        assert self.engine.apply_perspective(scores, "martian") is scores
+
+    def test_rank_keeps_dimension_order_on_ties(self):
+        scores = np.full((1, 47), 50.0)
+        scores[0, 3] = 90.0
+        assert self.engine.rank(scores, 3).tolist() == [[3, 0, 1]]
+        assert self.engine.rank(scores, 2, highest=False).tolist() == [[0, 1]]
+
+    def test_batch_evaluate_matches_evaluate(self):
+        core = VULCACore(enable_correlation=True, cache_enabled=False)
+        batch = core.batch_evaluate(
+            [{"model_id": f"m{i}", "scores_6d": s} for i, s in enumerate(self.inputs)],
+            cultural_perspective="western",
+        )
+        for i, scores_6d in enumerate(self.inputs):
+            single = core.evaluate(f"m{i}", scores_6d, cultural_perspective="western")
+            assert batch[i].model_id == f"m{i}"
+            assert batch[i].overall_score == pytest.approx(single.overall_score)
+            assert batch[i].confidence_level == pytest.approx(single.confidence_level)
+            for ranked in ("top_dimensions", "weakest_dimensions"):
+                got, want = getattr(batch[i], ranked), getattr(single, ranked)
+                assert [name for name, _ in got] == [name for name, _ in want]
+                assert [s for _, s in got] == pytest.approx([s for _, s in want])
+            assert batch[i].category_scores == pytest.approx(single.category_scores)
+
+    def test_batch_evaluate_reuses_cache_and_validates(self):
+        core = VULCACore(enable_correlation=False, cache_enabled=True, result_cache=VULCAResultCache())
+        first = core.evaluate("m0", TYPICAL_SCORES_6D)
+        results = core.batch_evaluate([
+            {"model_id": "m0", "scores_6d": TYPICAL_SCORES_6D},
+            {"model_id": "m1", "scores_6d": MIXED_6D},
+        ])
+        assert results[0].scores_47d == first.scores_47d
+        assert results[0].processing_time_ms == pytest.approx(0.1)
+        assert len(core._cache) == 2
+        with pytest.raises(ValueError, match="Missing required dimension"):
+            core.batch_evaluate([{"model_id": "bad", "scores_6d": {"creativity": 1}}])
+
+
+# =========================================================================
+# 5c. Deterministic per-call RNG and parallel batch evaluation
+# =========================================================================
+
+
+class TestDeterministicRNG:
+    """Expansion must not reseed or consume the global NumPy RNG."""
+
+    def test_stable_seed_normalizes_numeric_inputs(self):
+        assert stable_seed("x", [85, 0]) == stable_seed("x", np.array([85.0, -0.0]))
+        assert stable_seed("x", [85, 0]) != stable_seed("y", [85, 0])
+
+    def test_expansions_leave_global_rng_untouched(self):
+        np.random.seed(123)
+        expected = np.random.random(3)
+        np.random.seed(123)
+        VULCAAlgorithmV2().expand_6d_to_47d(TYPICAL_SCORES_6D)
+        VULCACoreAdapter(use_model_profiles=True).expand_6d_to_47d_with_profile(
+            TYPICAL_SCORES_6D, "gpt-4o"
+        )
+        np.testing.assert_array_equal(np.random.random(3), expected)
+
+    def test_noise_depends_on_inputs_only(self):
+        algo = VULCAAlgorithmV2()
+        first = algo.expand_6d_to_47d(TYPICAL_SCORES_6D)
+        algo.expand_6d_to_47d(MIXED_6D)
+        assert algo.expand_6d_to_47d(TYPICAL_SCORES_6D) == first
+        assert VULCAAlgorithmV2().expand_6d_to_47d(TYPICAL_SCORES_6D) == first
+
+    def test_cultural_weights_are_stable(self):
+        a = VULCACoreAdapter(use_model_profiles=False).cultural_weights
+        b = VULCACoreAdapter(use_model_profiles=False).cultural_weights
+        for perspective in a:
+            np.testing.assert_array_equal(a[perspective], b[perspective])
+
+    @pytest.mark.parametrize("use_processes", [False, True], ids=["threads", "processes"])
+    async def test_service_batch_is_bit_identical_to_sequential(self, use_processes):
+        rng = np.random.default_rng(5)
+        evaluations = [
+            {"model_id": i, "scores_6d": dict(zip(BASE_DIMS, rng.uniform(0, 100, 6).tolist()))}
+            for i in range(9)
+        ]
+        service = VULCAService(None)
+        sequential = [
+            await service.evaluate_model(e["model_id"], e["scores_6d"]) for e in evaluations
+        ]
+        parallel = await service.evaluate_models_batch(
+            evaluations, max_workers=3, use_processes=use_processes
+        )
+        for seq, par in zip(sequential, parallel):
+            assert par["model_id"] == seq["model_id"]
+            assert par["scores_47d"] == seq["scores_47d"]
+            assert par["cultural_perspectives"] == seq["cultural_perspectives"]
+
+    async def test_service_batch_validates_inputs(self):
+        with pytest.raises(ValueError, match="Missing dimension"):
+            await VULCAService(None).evaluate_models_batch(
+                [{"model_id": 1, "scores_6d": {"creativity": 50.0}}]
+            )
+
+
 # =========================================================================
 # 6. Cross-module integration tests
 # =========================================================================
@@ -127,3 +127,12 @@ def test_vulca_sync_status():
         assert model["vulca_sync_status"] in [
             "pending", "syncing", "completed", "failed", "no_data", None,
         ]
+
+
+def test_vulca_result_cache_stats():
+    """GET /api/v1/vulca/cache/stats exposes the result cache counters."""
+    response = client.get("/api/v1/vulca/cache/stats")
+    assert response.status_code == 200
+    data = response.json()
+    for key in ("size", "max_entries", "hits", "misses", "evictions", "expirations"):
+        assert key in data
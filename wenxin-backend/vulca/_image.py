@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import mimetypes
 from pathlib import Path
 
 import httpx
 
+# Optional image preparer (``prepare_path`` / ``prepare_bytes`` returning an
+# object with ``b64`` and ``mime_type``), set by a host application
+_prep = None
+
+
+def register_image_prep(prep) -> None:
+    """Route image loading through *prep* (``None`` restores the local encoder).
+
+    wenxin-backend registers its shared ImagePrep at startup so payloads are
+    downscaled and cached per process; standalone use sends images as-is.
+    """
+    global _prep  # noqa: PLW0603
+    _prep = prep
+
 
 async def load_image_base64(image: str) -> tuple[str, str]:
     """Load an image and return ``(base64_string, mime_type)``.
@@ -29,6 +44,10 @@ async def load_image_base64(image: str) -> tuple[str, str]:
             resp.raise_for_status()
             content_type = resp.headers.get("content-type", "image/jpeg")
             mime = content_type.split(";")[0].strip()
+            prep = _prep
+            if prep is not None:
+                prepared = await asyncio.to_thread(prep.prepare_bytes, resp.content)
+                return prepared.b64, prepared.mime_type
             b64 = base64.b64encode(resp.content).decode()
             return b64, mime
 
@@ -37,6 +56,12 @@ async def load_image_base64(image: str) -> tuple[str, str]:
     if not path.exists():
         raise FileNotFoundError(f"Image not found: {path}")
 
+    prep = _prep
+    if prep is not None:
+        prepared = await asyncio.to_thread(prep.prepare_path, path)
+        return prepared.b64, prepared.mime_type
+
     mime = mimetypes.guess_type(str(path))[0] or "image/jpeg"
     b64 = base64.b64encode(path.read_bytes()).decode()
     return b64, mime
+